@@ -0,0 +1,10 @@
+"""Compatibility shim for core.resilience.
+
+The canonical implementation lives in ``src.core.resilience``; this module
+re-exports it so ``from core.resilience import retry_with_backoff`` resolves
+next to the other ``core.settings`` shims.
+"""
+
+from __future__ import annotations
+
+from src.core.resilience import *  # noqa: F401,F403
@@ -23,6 +23,8 @@ class RuntimeConfigError(RuntimeError):
 class RuntimePaths:
     marketdata_data_root: Path | None
     trading_artifacts_root: Path | None
+    pipeline_stage_cache_root: Path | None = None
+    dashboard_cache_root: Path | None = None
 
 
 @dataclass(frozen=True)
@@ -107,8 +109,20 @@ def load_runtime_config(
         or os.getenv("TRADERUNNER_ARTIFACTS_ROOT")
     )
 
+    stage_cache_root_raw = (
+        paths_cfg.get("pipeline_stage_cache_root")
+        or os.getenv("PIPELINE_STAGE_CACHE_ROOT")
+    )
+
+    dashboard_cache_root_raw = (
+        paths_cfg.get("dashboard_cache_root")
+        or os.getenv("DASHBOARD_CACHE_ROOT")
+    )
+
     md_root = _to_abs_path(md_root_raw, "paths.marketdata_data_root")
     art_root = _to_abs_path(art_root_raw, "paths.trading_artifacts_root")
+    stage_cache_root = _to_abs_path(stage_cache_root_raw, "paths.pipeline_stage_cache_root")
+    dashboard_cache_root = _to_abs_path(dashboard_cache_root_raw, "paths.dashboard_cache_root")
 
     if strict:
         if md_root is None:
@@ -127,6 +141,8 @@ def load_runtime_config(
         paths=RuntimePaths(
             marketdata_data_root=md_root,
             trading_artifacts_root=art_root,
+            pipeline_stage_cache_root=stage_cache_root,
+            dashboard_cache_root=dashboard_cache_root,
         ),
         services=RuntimeServices(marketdata_stream_url=(str(stream_url).strip() if stream_url else None)),
         runtime=RuntimeFlags(
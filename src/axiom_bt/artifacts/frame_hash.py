@@ -0,0 +1,144 @@
+"""Canonical streaming hash for pipeline DataFrames (SSOT for determinism hashes).
+
+Replaces ``sha256(df.to_csv())``: column buffers are canonicalized and fed to
+the digest chunk by chunk, so no CSV copy of the frame is ever materialized.
+
+Canonical form (FRAME_HASH_VERSION):
+- header: version tag, row count, ordered column names (order-aware)
+- per column: a dtype-family tag, then values in ``chunk_rows`` slices
+  - bool -> uint8; signed/unsigned ints -> int64/uint64 little-endian
+  - floats -> float64 LE with -0.0 folded to 0.0 and a single NaN pattern
+  - datetime64 (any unit, naive/tz) -> int64 ns UTC LE, tz name in the tag
+  - timedelta64 -> int64 ns LE
+  - nullable extension dtypes -> validity mask + filled values
+  - object/string/category -> per-value type-tagged, length-prefixed UTF-8
+
+Widths are normalized (int32 and int64 hash alike) so hashes do not drift
+with platform or intermediate dtype choices; value types still matter
+(1 vs 1.0 vs "1" differ, as they did in CSV).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+FRAME_HASH_VERSION = "frame_sha256_v1"
+FILE_HASH_VERSION = "file_sha256_v1"
+
+_DEFAULT_CHUNK_ROWS = 65_536
+_CANONICAL_NAN = np.array([np.nan], dtype="<f8").view("<u8")[0]
+
+
+def _put_bytes(h: "hashlib._Hash", payload: bytes) -> None:
+    h.update(struct.pack("<Q", len(payload)))
+    h.update(payload)
+
+
+def _encode_object(value: Any) -> bytes:
+    if value is None or value is pd.NA or value is pd.NaT:
+        return b"n"
+    if isinstance(value, str):
+        return b"s" + value.encode("utf-8")
+    if isinstance(value, (bool, np.bool_)):
+        return b"b1" if value else b"b0"
+    if isinstance(value, (int, np.integer)):
+        return b"i" + str(int(value)).encode("ascii")
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if math.isnan(value):
+            return b"n"
+        return b"f" + repr(value + 0.0).encode("ascii")
+    if isinstance(value, pd.Timestamp):
+        return b"t" + value.isoformat().encode("ascii")
+    if isinstance(value, pd.Timedelta):
+        return b"d" + str(value.value).encode("ascii")
+    return b"r" + str(value).encode("utf-8")
+
+
+def _float_chunk(values: np.ndarray) -> np.ndarray:
+    out = values.astype("<f8", copy=True)
+    out += 0.0  # folds -0.0 into 0.0
+    bits = out.view("<u8")
+    bits[np.isnan(out)] = _CANONICAL_NAN
+    return bits
+
+
+def _hash_series(h: "hashlib._Hash", series: pd.Series, chunk_rows: int) -> None:
+    dtype = series.dtype
+    n = len(series)
+
+    if isinstance(dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_dtype(dtype):
+        tz = str(getattr(dtype, "tz", None) or "")
+        h.update(b"M:" + tz.encode("ascii"))
+        index = pd.DatetimeIndex(series)
+        ns_dtype = pd.DatetimeTZDtype("ns", index.tz) if index.tz is not None else "datetime64[ns]"
+        values = index.astype(ns_dtype).asi8
+        for start in range(0, n, chunk_rows):
+            h.update(values[start:start + chunk_rows].astype("<i8", copy=False).tobytes())
+        return
+
+    if pd.api.types.is_timedelta64_dtype(dtype):
+        h.update(b"m:")
+        values = pd.TimedeltaIndex(series).astype("timedelta64[ns]").asi8
+        for start in range(0, n, chunk_rows):
+            h.update(values[start:start + chunk_rows].astype("<i8", copy=False).tobytes())
+        return
+
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and dtype.kind in "biuf" and not isinstance(
+        dtype, pd.CategoricalDtype
+    ):
+        # Nullable Int64/boolean/Float64: validity mask + filled numpy values.
+        h.update(b"X" + dtype.kind.encode("ascii") + b":")
+        mask = series.isna().to_numpy()
+        h.update(np.packbits(mask, bitorder="little").tobytes())
+        numpy_dtype = {"b": "bool", "i": "int64", "u": "uint64", "f": "float64"}[dtype.kind]
+        filled = series.to_numpy(dtype=numpy_dtype, na_value=0)
+        _hash_numpy(h, filled, dtype.kind, chunk_rows)
+        return
+
+    if isinstance(dtype, np.dtype) and dtype.kind in "biuf":
+        h.update(dtype.kind.encode("ascii") + b":")
+        _hash_numpy(h, series.to_numpy(), dtype.kind, chunk_rows)
+        return
+
+    # object / string / category / anything else: per-value encoding
+    h.update(b"O:")
+    values = series.to_numpy(dtype=object)
+    for start in range(0, n, chunk_rows):
+        buf = bytearray()
+        for value in values[start:start + chunk_rows]:
+            payload = _encode_object(value)
+            buf += struct.pack("<Q", len(payload))
+            buf += payload
+        h.update(bytes(buf))
+
+
+def _hash_numpy(h: "hashlib._Hash", values: np.ndarray, kind: str, chunk_rows: int) -> None:
+    for start in range(0, len(values), chunk_rows):
+        chunk = values[start:start + chunk_rows]
+        if kind == "b":
+            h.update(chunk.astype("u1", copy=False).tobytes())
+        elif kind == "i":
+            h.update(chunk.astype("<i8", copy=False).tobytes())
+        elif kind == "u":
+            h.update(chunk.astype("<u8", copy=False).tobytes())
+        else:
+            h.update(_float_chunk(chunk).tobytes())
+
+
+def hash_frame(df: pd.DataFrame, *, chunk_rows: int = _DEFAULT_CHUNK_ROWS) -> str:
+    """Return the canonical, column-order-aware SHA-256 of ``df`` (index ignored)."""
+    h = hashlib.sha256()
+    _put_bytes(h, FRAME_HASH_VERSION.encode("ascii"))
+    h.update(struct.pack("<QQ", len(df), len(df.columns)))
+    for name in df.columns:
+        _put_bytes(h, str(name).encode("utf-8"))
+    for position in range(len(df.columns)):
+        _hash_series(h, df.iloc[:, position], max(1, int(chunk_rows)))
+    return h.hexdigest()
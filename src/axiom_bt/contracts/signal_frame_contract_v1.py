@@ -10,9 +10,11 @@ from __future__ import annotations
 import json
 import hashlib
 import logging
-from dataclasses import dataclass, asdict
-from typing import List, Dict
+import time
+from dataclasses import dataclass, asdict, field
+from typing import List, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -68,34 +70,150 @@ def ensure_timestamp_utc(series: pd.Series, allow_nat: bool = False) -> pd.Serie
     return ts
 
 
+def dtype_matches(series: pd.Series, dtype: str) -> bool:
+    """True if ``series`` already has the contract dtype (no coercion needed).
+
+    ``string`` columns always match: coercion is ``astype(str)``, which cannot
+    fail, and the nullability check does not apply to them.
+    """
+    if dtype.startswith("datetime64"):
+        return isinstance(series.dtype, pd.DatetimeTZDtype) and str(series.dtype.tz) == "UTC"
+    if dtype == "bool":
+        return series.dtype == bool
+    if dtype in {"float64", "float"}:
+        return series.dtype == "float64"
+    if dtype in {"int64", "int"}:
+        return series.dtype == "int64"
+    return dtype in {"string", "str", "object"}
+
+
+def _coerce_column(series: pd.Series, col: ColumnSpec) -> pd.Series:
+    try:
+        if col.dtype.startswith("datetime64"):
+            return ensure_timestamp_utc(series, allow_nat=col.nullable)
+        if col.dtype == "bool":
+            return series.astype(bool)
+        if col.dtype in {"float64", "float"}:
+            return pd.to_numeric(series, errors="coerce").astype(float)
+        if col.dtype in {"int64", "int"}:
+            return pd.to_numeric(series, errors="coerce").astype(int)
+        if col.dtype in {"string", "str", "object"}:
+            return series.astype(str)
+    except SignalFrameContractError:
+        raise
+    except Exception as exc:  # pragma: no cover
+        raise SignalFrameContractError(
+            f"failed to coerce column '{col.name}' to dtype '{col.dtype}': {exc}"
+        ) from exc
+    return series
+
+
 def coerce_dtypes(df: pd.DataFrame, schema: SignalFrameSchemaV1) -> pd.DataFrame:
     """Coerce DataFrame columns to contract dtypes (best-effort).
 
     Supported dtype strings: datetime64[ns, UTC], float64, int64, bool, string.
+    Columns that already carry the contract dtype are left untouched.
     Raises SignalFrameContractError on failure.
     """
     df = df.copy()
     for col in schema.all_columns():
         if col.name not in df.columns:
             continue
-        try:
-            if col.dtype.startswith("datetime64"):
-                df[col.name] = ensure_timestamp_utc(df[col.name], allow_nat=col.nullable)
-            elif col.dtype == "bool":
-                df[col.name] = df[col.name].astype(bool)
-            elif col.dtype in {"float64", "float"}:
-                df[col.name] = pd.to_numeric(df[col.name], errors="coerce").astype(float)
-            elif col.dtype in {"int64", "int"}:
-                df[col.name] = pd.to_numeric(df[col.name], errors="coerce").astype(int)
-            elif col.dtype in {"string", "str", "object"}:
-                df[col.name] = df[col.name].astype(str)
-        except Exception as exc:  # pragma: no cover
-            raise SignalFrameContractError(
-                f"failed to coerce column '{col.name}' to dtype '{col.dtype}': {exc}"
-            ) from exc
+        if col.dtype in {"string", "str", "object"} or not dtype_matches(df[col.name], col.dtype):
+            df[col.name] = _coerce_column(df[col.name], col)
     return df
 
 
+@dataclass(frozen=True)
+class ContractCheck:
+    """Outcome of one contract check."""
+
+    name: str
+    passed: bool
+    seconds: float
+    message: str = ""
+    offending_rows: Tuple = ()
+
+
+@dataclass
+class SignalFrameValidationReport:
+    """Per-check results and timings of validate_signal_frame_v1."""
+
+    strategy_id: str
+    version: str
+    rows: int
+    cols: int
+    checks: List[ContractCheck] = field(default_factory=list)
+    coerced_columns: Tuple[str, ...] = ()
+
+    @property
+    def ok(self) -> bool:
+        return all(check.passed for check in self.checks)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(check.seconds for check in self.checks)
+
+    @property
+    def first_failure(self) -> Optional[ContractCheck]:
+        return next((check for check in self.checks if not check.passed), None)
+
+    def raise_if_failed(self) -> None:
+        failure = self.first_failure
+        if failure is None:
+            return
+        message = failure.message
+        if failure.offending_rows:
+            message = f"{message} (first offending rows: {list(failure.offending_rows)})"
+        raise SignalFrameContractError(message)
+
+    def to_dict(self) -> Dict:
+        return {
+            "strategy_id": self.strategy_id,
+            "version": self.version,
+            "rows": self.rows,
+            "cols": self.cols,
+            "ok": self.ok,
+            "total_seconds": self.total_seconds,
+            "coerced_columns": list(self.coerced_columns),
+            "checks": [
+                {**asdict(check), "offending_rows": [str(r) for r in check.offending_rows]}
+                for check in self.checks
+            ],
+        }
+
+
+class _Checker:
+    """Runs named checks, timing each and collecting the first N offenders."""
+
+    def __init__(self, report: SignalFrameValidationReport, index: pd.Index, max_offenders: int) -> None:
+        self.report = report
+        self.index = index
+        self.max_offenders = max_offenders
+
+    def run(self, name: str, fn) -> bool:
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except SignalFrameContractError as exc:
+            result = (str(exc), None)
+        message, mask = result if result is not None else ("", None)
+        offenders: Tuple = ()
+        if mask is not None:
+            positions = np.flatnonzero(np.asarray(mask, dtype=bool))[: self.max_offenders]
+            offenders = tuple(self.index[positions])
+        passed = not message
+        self.report.checks.append(
+            ContractCheck(name, passed, time.perf_counter() - start, message, offenders)
+        )
+        return passed
+
+
+def _failing(mask: np.ndarray, message: str):
+    """``None`` when ``mask`` has no hits, else ``(message, mask)``."""
+    return (message, mask) if mask.any() else None
+
+
 def _check_required_columns(df: pd.DataFrame, schema: SignalFrameSchemaV1) -> None:
     required = {c.name for c in schema.all_columns()}
     missing = required - set(df.columns)
@@ -105,68 +223,155 @@ def _check_required_columns(df: pd.DataFrame, schema: SignalFrameSchemaV1) -> No
         )
 
 
-def _check_nullability(df: pd.DataFrame, schema: SignalFrameSchemaV1) -> None:
-    for col in schema.all_columns():
-        if not col.nullable and df[col.name].isna().any():
-            raise SignalFrameContractError(f"column '{col.name}' contains NaN but is non-nullable")
+_SIG_FIELDS = ("sig_long", "sig_short", "sig_side")
 
 
-def _check_signal_invariants(df: pd.DataFrame) -> None:
-    if {"sig_long", "sig_short"}.issubset(df.columns):
-        both = (df["sig_long"] & df["sig_short"])
-        if both.any():
-            raise SignalFrameContractError("sig_long and sig_short cannot both be true")
+def _signal_invariant_checks(columns: Dict[str, pd.Series]):
+    """(name, fn) pairs for the sig_long/sig_short/sig_side invariants."""
+    checks = []
+    has_flags = "sig_long" in columns and "sig_short" in columns
+    if has_flags:
+        # Converted inside each check so NA (nullable boolean) cannot raise
+        # outside the checker; a missing flag counts as False here and is
+        # reported by the nullability check instead.
+        def long_():
+            return columns["sig_long"].to_numpy(dtype=bool, na_value=False)
+
+        def short():
+            return columns["sig_short"].to_numpy(dtype=bool, na_value=False)
+
+        checks.append((
+            "sig_long_short_exclusive",
+            lambda: _failing(long_() & short(), "sig_long and sig_short cannot both be true"),
+        ))
 
-    if "sig_side" in df.columns:
+    if "sig_side" in columns:
+        side = columns["sig_side"]
         allowed = {"LONG", "SHORT", "FLAT"}
-        if not df["sig_side"].isin(allowed).all():
-            bad = df.loc[~df["sig_side"].isin(allowed), "sig_side"].unique()
-            raise SignalFrameContractError(f"sig_side contains invalid values: {bad}")
-
-        if {"sig_long", "sig_short"}.issubset(df.columns):
-            for _, row in df.iterrows():
-                side = row["sig_side"]
-                if side == "LONG" and not row["sig_long"]:
-                    raise SignalFrameContractError("sig_side LONG requires sig_long=True")
-                if side == "SHORT" and not row["sig_short"]:
-                    raise SignalFrameContractError("sig_side SHORT requires sig_short=True")
-                if side == "FLAT" and (row["sig_long"] or row["sig_short"]):
-                    raise SignalFrameContractError("sig_side FLAT requires sig_long=False and sig_short=False")
-
-
-def validate_signal_frame_v1(df: pd.DataFrame, schema: SignalFrameSchemaV1, *, strict: bool = True) -> None:
+
+        def _allowed():
+            bad = ~side.isin(allowed).to_numpy()
+            if not bad.any():
+                return None
+            return f"sig_side contains invalid values: {side[bad].unique()}", bad
+
+        checks.append(("sig_side_allowed", _allowed))
+
+        if has_flags:
+            side_values = side.to_numpy(dtype=object)
+            checks.extend([
+                (
+                    "sig_side_long_consistent",
+                    lambda: _failing((side_values == "LONG") & ~long_(), "sig_side LONG requires sig_long=True"),
+                ),
+                (
+                    "sig_side_short_consistent",
+                    lambda: _failing((side_values == "SHORT") & ~short(), "sig_side SHORT requires sig_short=True"),
+                ),
+                (
+                    "sig_side_flat_consistent",
+                    lambda: _failing(
+                        (side_values == "FLAT") & (long_() | short()),
+                        "sig_side FLAT requires sig_long=False and sig_short=False",
+                    ),
+                ),
+            ])
+    return checks
+
+
+def _check_signal_invariants(df: pd.DataFrame) -> None:
+    for _, fn in _signal_invariant_checks({name: df[name] for name in df.columns}):
+        result = fn()
+        if result is not None:
+            raise SignalFrameContractError(result[0])
+
+
+def validate_signal_frame_v1(
+    df: pd.DataFrame,
+    schema: SignalFrameSchemaV1,
+    *,
+    strict: bool = True,
+    max_offenders: int = 5,
+) -> SignalFrameValidationReport:
     """Validate DataFrame against SignalFrame Contract V1.
 
     Steps:
     1) Require all schema columns present.
-    2) Coerce dtypes (datetime to UTC, numeric, bool, str).
-    3) Enforce nullability and signal invariants.
+    2) Coerce dtypes (datetime to UTC, numeric, bool, str); columns already
+       carrying the contract dtype are used as-is (no frame copy).
+    3) Enforce nullability and signal invariants as vectorized masks.
 
     Args:
         df: Signal frame to validate.
         schema: Contract schema for the strategy/version.
         strict: If True, raises on failure; otherwise logs warning.
+        max_offenders: Row index labels recorded per failing check.
+
+    Returns:
+        SignalFrameValidationReport with per-check outcome, timing and the
+        first ``max_offenders`` offending row labels.
 
     Raises:
         SignalFrameContractError on violation when strict=True.
     """
-    try:
-        _check_required_columns(df, schema)
-        df = coerce_dtypes(df, schema)
-        _check_nullability(df, schema)
-        _check_signal_invariants(df)
-    except SignalFrameContractError:
-        if strict:
-            raise
-        logger.warning("actions: signal_frame_contract_violation strategy_id=%s version=%s", schema.strategy_id, schema.version)
-    else:
+    report = SignalFrameValidationReport(schema.strategy_id, schema.version, len(df), df.shape[1])
+    checker = _Checker(report, df.index, max_offenders)
+
+    if checker.run("required_columns", lambda: _check_required_columns(df, schema)):
+        columns: Dict[str, pd.Series] = {}
+        coerced: List[str] = []
+
+        def _coerce():
+            for col in schema.all_columns():
+                series = df[col.name]
+                if not dtype_matches(series, col.dtype):
+                    series = _coerce_column(series, col)
+                    coerced.append(col.name)
+                columns[col.name] = series
+
+        if checker.run("dtypes", _coerce):
+            report.coerced_columns = tuple(coerced)
+            for col in schema.all_columns():
+                if col.nullable or col.dtype in {"string", "str", "object"}:
+                    continue
+                checker.run(
+                    f"non_null:{col.name}",
+                    lambda col=col: _failing(
+                        columns[col.name].isna().to_numpy(), f"column '{col.name}' contains NaN but is non-nullable"
+                    ),
+                )
+            # Signal columns the schema does not declare are checked as-is
+            signal_columns = {
+                name: columns[name] if name in columns else df[name]
+                for name in _SIG_FIELDS
+                if name in columns or name in df.columns
+            }
+            for name in ("sig_long", "sig_short"):
+                if name in signal_columns and name not in columns:
+                    checker.run(
+                        f"non_null:{name}",
+                        lambda name=name: _failing(
+                            signal_columns[name].isna().to_numpy(), f"column '{name}' contains NaN but is non-nullable"
+                        ),
+                    )
+            for name, fn in _signal_invariant_checks(signal_columns):
+                checker.run(name, fn)
+
+    if report.ok:
         logger.info(
-            "actions: signal_frame_contract_valid strategy_id=%s version=%s rows=%d cols=%d",
+            "actions: signal_frame_contract_valid strategy_id=%s version=%s rows=%d cols=%d checks=%d elapsed_ms=%.2f",
             schema.strategy_id,
             schema.version,
-            len(df),
-            df.shape[1],
+            report.rows,
+            report.cols,
+            len(report.checks),
+            report.total_seconds * 1000.0,
         )
+    elif strict:
+        report.raise_if_failed()
+    else:
+        logger.warning("actions: signal_frame_contract_violation strategy_id=%s version=%s", schema.strategy_id, schema.version)
+    return report
 
 def compute_schema_fingerprint(schema: SignalFrameSchemaV1) -> Dict:
     """Compute a stable, deterministic fingerprint of the SignalFrame schema.
@@ -3,13 +3,20 @@ from __future__ import annotations
 import os
 import logging
 import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from core.resilience import CircuitBreaker, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +30,10 @@ __all__ = [
     "resample_m1_to_m5",
     "resample_m1_to_m15",
     "fetch_eod_daily_to_parquet",
+    "EODHDHttpSettings",
+    "TokenBucket",
+    "configure_http",
+    "http_settings",
 ]
 
 """
@@ -238,31 +249,180 @@ def _generate_sample_daily(
     return df
 
 
-def _request(url: str, params: dict) -> list:
-    try:
-        socket.socket()
-    except OSError as exc:
-        if "Operation not permitted" in str(exc):
-            raise NetworkUnavailableError(
-                "Network disabled in this runner (socket blocked). Run backtest outside sandbox or enable offline cache mode."
-            ) from exc
-    safe_params = dict(params)
-    if "api_token" in safe_params:
-        safe_params["api_token"] = "***"
-    try:
-        response = requests.get(url, params=params, timeout=30)
-    except Exception as exc:
-        # Provide transparent network error details (DNS, TLS, proxy, etc.)
-        logger.error(
-            "EODHD request failed: url=%s params=%s error_type=%s error=%r",
-            url,
-            safe_params,
-            type(exc).__name__,
-            exc,
+# ============================================================================
+# HTTP engine: shared keep-alive session, global rate limit, retries
+# ============================================================================
+
+# Statuses worth retrying (rate limited / upstream hiccup); other 4xx are final
+_TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class _TransientHTTPError(requests.HTTPError):
+    """Retryable EODHD response (429/5xx)."""
+
+
+@dataclass(frozen=True)
+class EODHDHttpSettings:
+    """Connection, rate-limit and retry settings shared by all EODHD requests.
+
+    ``requests_per_minute`` is a process-wide budget: every request, from any
+    symbol or chunk, takes a token from one bucket. ``max_workers`` bounds the
+    chunk fetches in flight (and the session's connection pool).
+    """
+
+    base_url: str = "https://eodhd.com/api"
+    requests_per_minute: float = 1000.0
+    burst: int = 10
+    max_workers: int = 8
+    timeout_s: float = 30.0
+    max_retries: int = 3
+    retry_initial_delay_s: float = 1.0
+    retry_max_delay_s: float = 30.0
+    circuit_failure_threshold: int = 5
+    circuit_recovery_timeout_s: float = 60.0
+
+    def __post_init__(self):
+        for name in ("requests_per_minute", "burst", "max_workers", "timeout_s"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be > 0 (got {getattr(self, name)})")
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0 (got {self.max_retries})")
+
+    @classmethod
+    def from_env(cls) -> "EODHDHttpSettings":
+        """Defaults overridden by EODHD_BASE_URL / EODHD_REQUESTS_PER_MINUTE / EODHD_MAX_WORKERS."""
+        overrides: dict = {}
+        if os.environ.get("EODHD_BASE_URL"):
+            overrides["base_url"] = os.environ["EODHD_BASE_URL"].rstrip("/")
+        if os.environ.get("EODHD_REQUESTS_PER_MINUTE"):
+            overrides["requests_per_minute"] = float(os.environ["EODHD_REQUESTS_PER_MINUTE"])
+        if os.environ.get("EODHD_MAX_WORKERS"):
+            overrides["max_workers"] = int(os.environ["EODHD_MAX_WORKERS"])
+        return cls(**overrides)
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, at most ``capacity`` banked.
+
+    acquire() reserves a token immediately (the balance may go negative) and
+    sleeps outside the lock until it is due, so waiters are served in arrival
+    order without holding each other up.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"rate and capacity must be > 0 (got {rate}, {capacity})")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; returns seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class _HttpEngine:
+    """Session, rate limiter, circuit breaker and chunk pool for one settings set."""
+
+    def __init__(self, settings: EODHDHttpSettings):
+        self.settings = settings
+        self.bucket = TokenBucket(settings.requests_per_minute / 60.0, settings.burst)
+        self.circuit = CircuitBreaker(
+            failure_threshold=settings.circuit_failure_threshold,
+            recovery_timeout=settings.circuit_recovery_timeout_s,
+            name="eodhd",
         )
-        raise
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=settings.max_workers, thread_name_prefix="eodhd")
+        self.get = retry_with_backoff(
+            max_retries=settings.max_retries,
+            initial_delay=settings.retry_initial_delay_s,
+            max_delay=settings.retry_max_delay_s,
+            exceptions=(requests.RequestException,),
+            retry_on=_is_transient,
+        )(self._get_once)
+
+    def _get_once(self, url: str, params: dict, safe_params: dict) -> requests.Response:
+        self.bucket.acquire()
+        try:
+            response = self.session.get(url, params=params, timeout=self.settings.timeout_s)
+        except Exception as exc:
+            # Provide transparent network error details (DNS, TLS, proxy, etc.)
+            logger.error(
+                "EODHD request failed: url=%s params=%s error_type=%s error=%r",
+                url,
+                safe_params,
+                type(exc).__name__,
+                exc,
+            )
+            raise
+        if response.status_code in _TRANSIENT_STATUS:
+            raise _TransientHTTPError(
+                f"EODHD transient status {response.status_code} for url: {url}", response=response
+            )
+        return response
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+        self.session.close()
+
+
+def _is_transient(exc: Exception) -> bool:
+    return isinstance(exc, (_TransientHTTPError, requests.ConnectionError, requests.Timeout))
+
+
+_ENGINE: Optional[_HttpEngine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def _engine() -> _HttpEngine:
+    global _ENGINE
+    with _ENGINE_LOCK:
+        if _ENGINE is None:
+            _ENGINE = _HttpEngine(EODHDHttpSettings.from_env())
+        return _ENGINE
+
+
+def http_settings() -> EODHDHttpSettings:
+    """Settings of the shared EODHD HTTP engine."""
+    return _engine().settings
+
+
+def configure_http(**overrides) -> EODHDHttpSettings:
+    """Replace the shared HTTP engine (new session, bucket and breaker).
+
+    Keyword arguments override EODHDHttpSettings fields on top of the
+    environment defaults, e.g. ``configure_http(requests_per_minute=300)``.
+    """
+    global _ENGINE
+    settings = replace(EODHDHttpSettings.from_env(), **overrides)
+    with _ENGINE_LOCK:
+        previous, _ENGINE = _ENGINE, _HttpEngine(settings)
+    if previous is not None:
+        previous.close()
+    return settings
+
+
+def _request(url: str, params: dict) -> list:
     """
-    Make HTTP GET request to EODHD API with 30s timeout.
+    Rate-limited HTTP GET against the EODHD API over the shared session.
+
+    Transient failures (connection errors, timeouts, 429/5xx) are retried with
+    exponential backoff; repeated exhausted retries open the circuit breaker
+    so a dead upstream fails fast instead of stalling every chunk.
 
     Args:
         url: API endpoint URL
@@ -272,9 +432,23 @@ def _request(url: str, params: dict) -> list:
         list: JSON response array
 
     Raises:
-        requests.HTTPError: If status 4xx/5xx
-        requests.Timeout: If exceeds 30s
+        NetworkUnavailableError: If sockets are blocked in this runner
+        requests.HTTPError: If status 4xx/5xx (after retries for 429/5xx)
+        requests.Timeout: If every attempt exceeds the timeout
+        RuntimeError: If the circuit breaker is open
     """
+    try:
+        socket.socket().close()
+    except OSError as exc:
+        if "Operation not permitted" in str(exc):
+            raise NetworkUnavailableError(
+                "Network disabled in this runner (socket blocked). Run backtest outside sandbox or enable offline cache mode."
+            ) from exc
+    safe_params = dict(params)
+    if "api_token" in safe_params:
+        safe_params["api_token"] = "***"
+    engine = _engine()
+    response = engine.circuit.call(engine.get, url, params, safe_params)
     logger.info(
         "EODHD response: url=%s params=%s status=%s",
         url,
@@ -313,7 +487,9 @@ def fetch_intraday_1m_to_parquet(
     Behavior:
         - If start_date/end_date are None: Fetches last 120 days (EODHD default)
         - If start_date/end_date provided: Fetches exact range
-        - Validates range ≤ 120 days (EODHD limit for 1m interval)
+        - Ranges > 120 days are split into 120-day chunks fetched concurrently
+          on the shared rate-limited session (see EODHDHttpSettings) and
+          streamed into the parquet files in time order
 
     EODHD Limitation:
         - 1-minute interval: Maximum 120 days per request
@@ -387,128 +563,211 @@ def fetch_intraday_1m_to_parquet(
         # For sample data, use provided dates or defaults
         sample_start = start_date or "2025-01-01"
         sample_end = end_date or "2025-12-19"
-        df = _generate_sample_intraday(symbol, sample_start, sample_end, tz, interval="1m")
+        frames = iter([_generate_sample_intraday(symbol, sample_start, sample_end, tz, interval="1m")])
+        n_chunks = 1
     else:
-        # Build API request
-        url = f"https://eodhd.com/api/intraday/{symbol}.{exchange}"
-        payload = {
-            "api_token": token,
-            "interval": "1m",
-            "fmt": "json",
-        }
+        url = f"{_engine().settings.base_url}/intraday/{symbol}.{exchange}"
+        windows = _chunk_windows(symbol, start_date, end_date)
+        n_chunks = len(windows)
+        frames = _fetch_chunks(symbol, url, token, windows, tz)
 
-        # Add date range if specified
-        if start_date and end_date:
-            # Convert dates to UTC timestamps
-            start_dt = pd.to_datetime(start_date).tz_localize("UTC")
-            end_dt = pd.to_datetime(end_date).tz_localize("UTC") + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
-
-            # Check 120-day limit and chunk if necessary
-            range_days = (end_dt - start_dt).days
-            EODHD_MAX_DAYS_1M = 120
-            
-            if range_days > EODHD_MAX_DAYS_1M:
-                # Auto-chunking for large ranges
-                logger.info(
-                    f"[{symbol}] Requested {range_days} days exceeds EODHD 120-day limit. "
-                    f"Auto-chunking into multiple requests..."
-                )
-                
-                # Split into chunks
-                chunks = []
-                current_start = start_dt
-                while current_start < end_dt:
-                    chunk_end = min(current_start + pd.Timedelta(days=EODHD_MAX_DAYS_1M), end_dt)
-                    chunks.append((current_start, chunk_end))
-                    current_start = chunk_end + pd.Timedelta(seconds=1)  # Avoid overlap
-                
-                logger.info(f"[{symbol}] Split into {len(chunks)} chunks")
-                
-                # Fetch each chunk
-                chunk_dfs = []
-                for i, (chunk_start, chunk_end) in enumerate(chunks, 1):
-                    chunk_days = (chunk_end - chunk_start).days
-                    logger.info(
-                        f"[{symbol}] Fetching chunk {i}/{len(chunks)}: "
-                        f"{chunk_start.date()} to {chunk_end.date()} ({chunk_days} days)"
-                    )
-                    
-                    chunk_payload = {
-                        "api_token": token,
-                        "interval": "1m",
-                        "fmt": "json",
-                        "from": int(chunk_start.timestamp()),
-                        "to": int(chunk_end.timestamp()),
-                    }
-                    
-                    chunk_rows = _request(url, chunk_payload)
-                    if not chunk_rows:
-                        logger.warning(f"[{symbol}] Chunk {i}/{len(chunks)} returned no data")
-                        continue
-                    
-                    chunk_df = pd.DataFrame(chunk_rows)
-                    chunk_df["timestamp"] = pd.to_datetime(chunk_df["timestamp"], unit="s", utc=True).dt.tz_convert(tz)
-                    chunk_df = chunk_df.rename(
-                        columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
-                    ).set_index("timestamp")[["Open", "High", "Low", "Close", "Volume"]]
-                    
-                    chunk_dfs.append(chunk_df)
-                    logger.info(f"[{symbol}] Chunk {i}/{len(chunks)}: {len(chunk_df):,} rows")
-                
-                # Merge all chunks
-                if not chunk_dfs:
-                    raise SystemExit(f"No data from EODHD for {symbol}.{exchange} (all chunks empty)")
-                
-                df = pd.concat(chunk_dfs)
-                df = df.sort_index()
-                df = df[~df.index.duplicated(keep='first')]  # Remove any duplicate timestamps
-                
-                logger.info(
-                    f"[{symbol}] Merged {len(chunks)} chunks: {len(df):,} total rows "
-                    f"(deduped from {sum(len(c) for c in chunk_dfs):,})"
-                )
-            else:
-                # Single request (≤120 days)
-                from_ts = int(start_dt.timestamp())
-                to_ts = int(end_dt.timestamp())
-                payload["from"] = from_ts
-                payload["to"] = to_ts
-                
-                rows = _request(url, payload)
-                if not rows:
-                    range_info = f"{start_date} to {end_date}"
-                    raise SystemExit(f"No data from EODHD for {symbol}.{exchange} ({range_info})")
-                
-                df = pd.DataFrame(rows)
-                df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s", utc=True).dt.tz_convert(tz)
-                df = df.rename(
-                    columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
-                ).set_index("timestamp")[["Open", "High", "Low", "Close", "Volume"]]
-
-    # Save raw data (all hours) if requested
-    if save_raw:
-        raw_path = out_dir / f"{symbol}_raw.parquet"
-        df.sort_index().to_parquet(raw_path)
-        logger.info(f"[{symbol}] Saved raw data: {raw_path} ({len(df):,} rows, all hours)")
-
-    # Filter to RTH if requested
-    if filter_rth:
-        from axiom_bt.data.session_filter import filter_rth_session
-
-        # Filter to RTH (09:30-16:00 ET)
-        df_rth = filter_rth_session(df, tz="America/New_York")
-        logger.info(
-            f"[{symbol}] Filtered to RTH: {len(df_rth):,} rows "
-            f"({len(df_rth)/len(df)*100:.1f}% of raw data)"
+    path = out_dir / f"{symbol}.parquet"
+    raw_sink = _ParquetSink(out_dir / f"{symbol}_raw.parquet") if save_raw else None
+    final_sink = _ParquetSink(path)
+    raw_rows = 0
+    last_ts = None
+    try:
+        # Chunks arrive in time order and are written as they complete, so at
+        # most the in-flight chunks are held in memory.
+        for df in frames:
+            df = df.sort_index()
+            df = df[~df.index.duplicated(keep="first")]
+            if last_ts is not None:
+                df = df[df.index > last_ts]  # overlap with the previous chunk
+            if df.empty:
+                continue
+            last_ts = df.index[-1]
+            raw_rows += len(df)
+            if raw_sink is not None:
+                raw_sink.write(df)
+            if filter_rth:
+                from axiom_bt.data.session_filter import filter_rth_session
+
+                # Filter to RTH (09:30-16:00 ET)
+                df = filter_rth_session(df, tz="America/New_York")
+            final_sink.write(df)
+
+        if raw_rows == 0:
+            if n_chunks > 1:
+                raise SystemExit(f"No data from EODHD for {symbol}.{exchange} (all chunks empty)")
+            range_info = f"{start_date} to {end_date}"
+            raise SystemExit(f"No data from EODHD for {symbol}.{exchange} ({range_info})")
+
+        if raw_sink is not None:
+            raw_sink.commit()
+            logger.info(f"[{symbol}] Saved raw data: {raw_sink.path} ({raw_rows:,} rows, all hours)")
+        if filter_rth:
+            logger.info(
+                f"[{symbol}] Filtered to RTH: {final_sink.rows:,} rows "
+                f"({final_sink.rows/raw_rows*100:.1f}% of raw data)"
+            )
+        final_sink.commit()
+    finally:
+        for sink in (raw_sink, final_sink):
+            if sink is not None:
+                sink.abort()
+
+    logger.info(f"[{symbol}] Saved final data: {path} ({final_sink.rows:,} rows)")
+    return path
+
+
+# 1m interval: maximum 120 days per request
+EODHD_MAX_DAYS_1M = 120
+
+# (from, to) UTC epoch seconds of one request; None means "EODHD default window"
+ChunkWindow = Tuple[Optional[int], Optional[int]]
+
+
+def _chunk_windows(symbol: str, start_date: Optional[str], end_date: Optional[str]) -> List[ChunkWindow]:
+    """Split [start_date, end_date] into non-overlapping ≤120-day request windows."""
+    if not (start_date and end_date):
+        return [(None, None)]
+
+    # Convert dates to UTC timestamps
+    start_dt = pd.to_datetime(start_date).tz_localize("UTC")
+    end_dt = pd.to_datetime(end_date).tz_localize("UTC") + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)
+
+    range_days = (end_dt - start_dt).days
+    if range_days <= EODHD_MAX_DAYS_1M:
+        return [(int(start_dt.timestamp()), int(end_dt.timestamp()))]
+
+    logger.info(
+        f"[{symbol}] Requested {range_days} days exceeds EODHD 120-day limit. "
+        f"Auto-chunking into multiple requests..."
+    )
+    windows = []
+    current_start = start_dt
+    while current_start < end_dt:
+        chunk_end = min(current_start + pd.Timedelta(days=EODHD_MAX_DAYS_1M), end_dt)
+        windows.append((int(current_start.timestamp()), int(chunk_end.timestamp())))
+        current_start = chunk_end + pd.Timedelta(seconds=1)  # Avoid overlap
+    logger.info(f"[{symbol}] Split into {len(windows)} chunks")
+    return windows
+
+
+def _fetch_chunks(
+    symbol: str,
+    url: str,
+    token: str,
+    windows: List[ChunkWindow],
+    tz: str,
+) -> Iterator[pd.DataFrame]:
+    """Fetch all windows on the shared pool; yield their frames in window order."""
+    engine = _engine()
+    futures = [
+        engine.executor.submit(_fetch_chunk, symbol, url, token, window, tz, i, len(windows))
+        for i, window in enumerate(windows, 1)
+    ]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _fetch_chunk(
+    symbol: str,
+    url: str,
+    token: str,
+    window: ChunkWindow,
+    tz: str,
+    i: int,
+    n: int,
+) -> pd.DataFrame:
+    payload = {
+        "api_token": token,
+        "interval": "1m",
+        "fmt": "json",
+    }
+    if window[0] is not None:
+        payload["from"], payload["to"] = window
+    rows = _request(url, payload)
+    if not rows:
+        logger.warning(f"[{symbol}] Chunk {i}/{n} returned no data")
+        return pd.DataFrame(
+            columns=["Open", "High", "Low", "Close", "Volume"],
+            index=pd.DatetimeIndex([], tz=tz, name="timestamp"),
         )
-        df = df_rth
 
-    # Save final data (RTH-filtered or raw depending on filter_rth)
-    path = out_dir / f"{symbol}.parquet"
-    df.sort_index().to_parquet(path)
-    logger.info(f"[{symbol}] Saved final data: {path} ({len(df):,} rows)")
+    df = pd.DataFrame(rows)
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="s", utc=True).dt.tz_convert(tz)
+    df = df.rename(
+        columns={"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+    ).set_index("timestamp")[["Open", "High", "Low", "Close", "Volume"]]
+    logger.info(f"[{symbol}] Chunk {i}/{n}: {len(df):,} rows")
+    return df
 
-    return path
+
+class _ParquetSink:
+    """Append time-ordered frames to ``path`` through a temp file.
+
+    The file only replaces ``path`` on commit(); abort() drops an uncommitted
+    temp file. The schema is fixed by the first frame; a later frame whose
+    dtypes cannot be cast to it (e.g. fractional volume after an integer one)
+    triggers a one-off rewrite with the promoted dtypes, as concat would.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        self.rows = 0
+        self._writer = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(df)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.tmp, table.schema)
+        elif not table.schema.equals(self._writer.schema):
+            try:
+                table = table.cast(self._writer.schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                self._writer.close()
+                merged = pd.concat([pd.read_parquet(self.tmp), df])
+                self.rows = 0
+                self._writer = None
+                self.write(merged)
+                return
+        self._writer.write_table(table)
+        self.rows += len(df)
+
+    def commit(self) -> None:
+        if self._writer is None:
+            raise ValueError(f"nothing written to {self.path}")
+        self._writer.close()
+        self._writer = None
+        os.replace(self.tmp, self.path)
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.tmp.unlink(missing_ok=True)
+
+
+RESAMPLE_STATE_KEY = b"axiom_bt.resample"
+RESAMPLE_STATE_VERSION = 1
+
+_RESAMPLE_AGG = {
+    "Open": "first",
+    "High": "max",
+    "Low": "min",
+    "Close": "last",
+    "Volume": "sum",
+}
 
 
 def resample_m1(
@@ -517,36 +776,186 @@ def resample_m1(
     interval: str = "5min",
     tz: str | None = None,
     min_m1_rows: int = 200,
+    *,
+    incremental: bool = True,
+    validate: bool = False,
 ) -> Path:
+    """Resample M1 bars to ``interval`` and write ``out_dir/<stem>.parquet``.
+
+    The derived file carries a high-water mark (last emitted bucket plus a
+    fingerprint of the M1 source) in its parquet schema metadata. With
+    ``incremental=True``:
+
+    - unchanged source -> nothing is read or written;
+    - month-partitioned source (see ``m1_partitions``) -> only buckets from the
+      earlier of the last bucket and the first changed partition onward are
+      re-aggregated and merged into the derived file;
+    - anything else (legacy single file changed, interval/tz mismatch, no
+      state) -> full resample.
+
+    ``validate=True`` additionally recomputes the full resample in memory and
+    raises ValueError if the written result differs.
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
     symbol = m1_parquet.stem
-    df_raw = pd.read_parquet(m1_parquet)
-    df = _standardize_ohlcv(df_raw, tz=tz)
+    path = out_dir / f"{symbol}.parquet"
+    fingerprint = _m1_source_fingerprint(m1_parquet)
+
+    state = _read_resample_state(path) if incremental else None
+    compatible = (
+        state is not None
+        and state.get("version") == RESAMPLE_STATE_VERSION
+        and state.get("interval") == interval
+        and state.get("tz") == tz
+        and state.get("source", {}).get("kind") == fingerprint["kind"]
+    )
 
-    if len(df) < min_m1_rows:
-        first = df.index.min()
-        last = df.index.max()
-        raise ValueError(
-            f"[ABORT] {symbol} M1 too small for resample: rows={len(df)} (<{min_m1_rows}). Range: {first}..{last}"
-        )
+    resampled = None
+    if compatible and state["source"] == fingerprint:
+        logger.info("[%s] %s resample up to date (last bucket %s)", symbol, interval, state["last_bucket"])
+        if validate:
+            _validate_resample(pd.read_parquet(path), m1_parquet, interval, tz, symbol)
+        return path
+
+    if compatible and fingerprint["kind"] == "partitioned":
+        recompute_from = _partitioned_recompute_from(m1_parquet, state, fingerprint, interval)
+        if recompute_from is not None:
+            total_rows = sum(meta[0] for meta in fingerprint["partitions"].values())
+            _check_m1_rows(symbol, total_rows, min_m1_rows, None, None)
+            from axiom_bt.data.m1_partitions import M1PartitionStore
+
+            tail = _standardize_ohlcv(M1PartitionStore(m1_parquet).load(start=recompute_from), tz=tz)
+            existing = pd.read_parquet(path)
+            kept = existing[existing.index < recompute_from]
+            resampled = pd.concat([kept, _resample_frame(tail, interval)])
+            logger.info(
+                "[%s] %s incremental resample from %s: kept %d, recomputed %d bucket(s)",
+                symbol,
+                interval,
+                recompute_from.isoformat(),
+                len(kept),
+                len(resampled) - len(kept),
+            )
+
+    if resampled is None:
+        df = _standardize_ohlcv(pd.read_parquet(m1_parquet), tz=tz)
+        _check_m1_rows(symbol, len(df), min_m1_rows, df.index.min(), df.index.max())
+        resampled = _resample_frame(df, interval)
 
-    agg = {
-        "Open": "first",
-        "High": "max",
-        "Low": "min",
-        "Close": "last",
-        "Volume": "sum",
-    }
-    resampled = df.resample(interval).agg(agg).dropna(how="any")
     if len(resampled) < 10:
         raise ValueError(f"[ABORT] {symbol} resample produced only {len(resampled)} rows (interval {interval}).")
 
-    path = out_dir / f"{symbol}.parquet"
-    resampled.to_parquet(path)
+    state = {
+        "version": RESAMPLE_STATE_VERSION,
+        "interval": interval,
+        "tz": tz,
+        "source": fingerprint,
+        "last_bucket": resampled.index[-1].isoformat(),
+    }
+    _write_resampled(resampled, path, state)
+    if validate:
+        _validate_resample(resampled, m1_parquet, interval, tz, symbol)
     print(f"[OK] {symbol}: {len(resampled)} rows → {path}")
     return path
 
 
+def _resample_frame(df: pd.DataFrame, interval: str) -> pd.DataFrame:
+    return df.resample(interval).agg(_RESAMPLE_AGG).dropna(how="any")
+
+
+def _check_m1_rows(symbol: str, rows: int, min_m1_rows: int, first, last) -> None:
+    if rows < min_m1_rows:
+        raise ValueError(
+            f"[ABORT] {symbol} M1 too small for resample: rows={rows} (<{min_m1_rows}). Range: {first}..{last}"
+        )
+
+
+def _m1_source_fingerprint(m1_parquet: Path) -> dict:
+    """Cheap change detector for the M1 source (stat + sidecar index only)."""
+    from axiom_bt.data.m1_partitions import M1PartitionStore, is_partitioned
+
+    if is_partitioned(m1_parquet):
+        index = M1PartitionStore(m1_parquet).read_index()
+        partitions = {}
+        for key, meta in sorted(index["partitions"].items()):
+            st = (m1_parquet / meta["file"]).stat()
+            seq = meta["writes"][-1][0] if meta.get("writes") else 0
+            partitions[key] = [meta["rows"], meta["min_ts"], meta["max_ts"], st.st_size, st.st_mtime_ns, seq]
+        return {"kind": "partitioned", "seq": int(index.get("seq", 0)), "partitions": partitions}
+    st = m1_parquet.stat()
+    return {"kind": "file", "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _partitioned_recompute_from(
+    m1_parquet: Path, state: dict, fingerprint: dict, interval: str
+) -> Optional[pd.Timestamp]:
+    """First bucket start that must be re-aggregated, or None for a full rebuild.
+
+    Partitions rewritten by logged appends since the last resample contribute
+    their earliest appended timestamp; partitions that changed on disk without
+    a logged append contribute their first timestamp.
+    """
+    from axiom_bt.data.m1_partitions import M1PartitionStore
+
+    old = state["source"]["partitions"]
+    new = fingerprint["partitions"]
+    if any(key not in new for key in old):
+        return None
+    old_seq = int(state["source"].get("seq", 0))
+    firsts = []
+    for key, meta in new.items():
+        if old.get(key) == meta:
+            continue
+        if key in old and meta[5] == old[key][5]:
+            firsts.append(pd.Timestamp(min(meta[1], old[key][1])))
+    logged = M1PartitionStore(m1_parquet).changed_since(old_seq)
+    if logged is not None:
+        firsts.append(logged)
+
+    recompute_from = pd.Timestamp(state["last_bucket"])
+    for first in firsts:
+        # Offsets are whole multiples of 15 minutes, so UTC and local
+        # bucket boundaries coincide for 5min/15min intervals.
+        recompute_from = min(recompute_from, first.tz_convert("UTC").floor(interval))
+    return recompute_from
+
+
+def _read_resample_state(path: Path) -> Optional[dict]:
+    import json
+    import pyarrow.parquet as pq
+
+    if not path.exists():
+        return None
+    try:
+        metadata = pq.read_schema(path).metadata or {}
+    except Exception as exc:  # unreadable derived file -> rebuild it
+        logger.warning("Could not read resample state from %s: %s", path, exc)
+        return None
+    raw = metadata.get(RESAMPLE_STATE_KEY)
+    return json.loads(raw) if raw else None
+
+
+def _write_resampled(frame: pd.DataFrame, path: Path, state: dict) -> None:
+    import json
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(frame)
+    metadata = dict(table.schema.metadata or {})
+    metadata[RESAMPLE_STATE_KEY] = json.dumps(state, sort_keys=True).encode("utf-8")
+    tmp = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table.replace_schema_metadata(metadata), tmp)
+    os.replace(tmp, path)
+
+
+def _validate_resample(result: pd.DataFrame, m1_parquet: Path, interval: str, tz: str | None, symbol: str) -> None:
+    expected = _resample_frame(_standardize_ohlcv(pd.read_parquet(m1_parquet), tz=tz), interval)
+    try:
+        pd.testing.assert_frame_equal(result, expected, check_freq=False)
+    except AssertionError as exc:
+        raise ValueError(f"[ABORT] {symbol} incremental {interval} resample diverged from full resample: {exc}") from exc
+
+
 def resample_m1_to_m5(m1_parquet: Path, out_dir: Path, tz: str | None = None) -> Path:
     return resample_m1(m1_parquet, out_dir, interval="5min", tz=tz)
 
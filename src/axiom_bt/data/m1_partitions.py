@@ -0,0 +1,283 @@
+"""Month-partitioned M1 store with a JSON sidecar index.
+
+Layout (one directory per symbol and session mode, e.g. ``data_m1/AAPL_rth/``)::
+
+    2024-11.parquet   # bars whose UTC timestamp falls in that month
+    2024-12.parquet
+    _index.json       # rows + min/max ts per partition, totals, write log
+
+- Appends rewrite only the months they touch; ``replace`` swaps in a full
+  refetch and drops months it no longer covers.
+- ``load(start, end)`` opens only overlapping partitions (memory-mapped) and
+  slices the boundary months without copying.
+- Coverage questions are answered from ``_index.json`` alone.
+- Every append bumps a store-level ``seq``; each partition keeps a short log
+  of ``[seq, earliest appended ts]`` so derived data (resamples) can tell how
+  far back it must recompute via ``changed_since(seq)``.
+
+pyarrow datasets skip files starting with ``_``, so ``pd.read_parquet(<dir>)``
+still returns the full history for callers that expect a single parquet path.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "_index.json"
+INDEX_VERSION = 1
+M1_COLUMNS = ("Open", "High", "Low", "Close", "Volume")
+_MAX_WRITE_LOG = 16
+
+Bound = Optional[pd.Timestamp | datetime | date | str]
+
+
+@dataclass(frozen=True)
+class M1Coverage:
+    """Totals from the sidecar index (no parquet file is opened)."""
+
+    rows: int
+    first_ts: pd.Timestamp
+    last_ts: pd.Timestamp
+    partitions: Tuple[str, ...]
+
+
+def is_partitioned(path: Path) -> bool:
+    """True if ``path`` is a partition directory with a sidecar index."""
+    return (path / INDEX_NAME).is_file()
+
+
+def partition_key(ts: pd.Timestamp) -> str:
+    """Month partition key (``YYYY-MM``) of a timestamp, in UTC."""
+    return _to_utc(ts).strftime("%Y-%m")
+
+
+def _to_utc(value) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        return ts.tz_localize("UTC")
+    return ts.tz_convert("UTC")
+
+
+def canonical_m1_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return ``timestamp`` (UTC ns) + Open/High/Low/Close/Volume float columns.
+
+    Accepts a DatetimeIndex or a ``timestamp`` column and either column case
+    (Title case wins, lowercase fills its NaNs). Rows are sorted and
+    de-duplicated on timestamp; the last occurrence wins.
+    """
+    if "timestamp" in frame.columns:
+        ts = pd.to_datetime(frame["timestamp"], errors="coerce", utc=True)
+    elif isinstance(frame.index, pd.DatetimeIndex):
+        ts = pd.to_datetime(frame.index, errors="coerce", utc=True).to_series(index=frame.index)
+    else:
+        raise ValueError("Frame must have datetime index or 'timestamp' column")
+
+    columns: Dict[str, np.ndarray] = {}
+    for name in M1_COLUMNS:
+        cap, low = name, name.lower()
+        if cap in frame.columns and low in frame.columns:
+            series = frame[cap].fillna(frame[low])
+        elif cap in frame.columns:
+            series = frame[cap]
+        elif low in frame.columns:
+            series = frame[low]
+        else:
+            raise ValueError(f"M1 frame missing required column: {name} (neither {cap} nor {low} found)")
+        columns[name] = series.to_numpy(dtype="float64", na_value=np.nan)
+
+    out = pd.DataFrame({"timestamp": ts.to_numpy(dtype="datetime64[ns]"), **columns})
+    out["timestamp"] = out["timestamp"].dt.tz_localize("UTC")
+    out = out[out["timestamp"].notna()]
+    out = out.sort_values("timestamp", kind="stable")
+    out = out.drop_duplicates("timestamp", keep="last")
+    return out.reset_index(drop=True)
+
+
+class M1PartitionStore:
+    """Month-partitioned M1 bars for one symbol/session mode under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    # ------------------------------------------------------------------ index
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_NAME
+
+    def exists(self) -> bool:
+        return is_partitioned(self.root)
+
+    def read_index(self) -> Dict:
+        if not self.index_path.is_file():
+            return {"version": INDEX_VERSION, "partitions": {}}
+        payload = json.loads(self.index_path.read_text())
+        if payload.get("version") != INDEX_VERSION:
+            raise ValueError(f"{self.index_path}: unsupported index version {payload.get('version')!r}")
+        return payload
+
+    def coverage(self) -> Optional[M1Coverage]:
+        """First/last timestamp and row count, or None if the store is empty."""
+        index = self.read_index()
+        if not index.get("rows"):
+            return None
+        return M1Coverage(
+            rows=int(index["rows"]),
+            first_ts=pd.Timestamp(index["min_ts"]),
+            last_ts=pd.Timestamp(index["max_ts"]),
+            partitions=tuple(sorted(index["partitions"])),
+        )
+
+    def changed_since(self, seq: int) -> Optional[pd.Timestamp]:
+        """Earliest timestamp rewritten by appends after ``seq`` (None if none).
+
+        Falls back to a partition's first timestamp when its write log no
+        longer reaches back to ``seq``.
+        """
+        earliest: Optional[pd.Timestamp] = None
+        for meta in self.read_index()["partitions"].values():
+            writes = meta.get("writes", [])
+            if not writes or writes[-1][0] <= seq:
+                continue
+            if writes[0][0] > seq + 1 and len(writes) >= _MAX_WRITE_LOG:
+                candidate = pd.Timestamp(meta["min_ts"])
+            else:
+                candidate = min(pd.Timestamp(ts) for write_seq, ts in writes if write_seq > seq)
+            earliest = candidate if earliest is None else min(earliest, candidate)
+        return earliest
+
+    def _write_index(self, partitions: Dict[str, Dict], seq: int) -> None:
+        live = {key: meta for key, meta in sorted(partitions.items()) if meta["rows"]}
+        payload: Dict = {
+            "version": INDEX_VERSION,
+            "seq": seq,
+            "rows": sum(m["rows"] for m in live.values()),
+            "partitions": live,
+        }
+        if live:
+            payload["min_ts"] = min(m["min_ts"] for m in live.values())
+            payload["max_ts"] = max(m["max_ts"] for m in live.values())
+        _atomic_write_bytes(self.index_path, json.dumps(payload, indent=2, sort_keys=True).encode("utf-8"))
+
+    # ----------------------------------------------------------------- writes
+    def append(self, frame: pd.DataFrame) -> List[str]:
+        """Merge ``frame`` into the store; returns the partition keys rewritten.
+
+        Only months present in ``frame`` are read and rewritten. On overlapping
+        timestamps the appended rows replace the stored ones.
+        """
+        return self._write(frame, merge=True)
+
+    def replace(self, frame: pd.DataFrame) -> List[str]:
+        """Replace the whole store with ``frame`` (full refetch).
+
+        Months absent from ``frame`` are dropped. ``seq`` keeps increasing, so
+        derived resamples see every month as changed.
+        """
+        return self._write(frame, merge=False)
+
+    def _write(self, frame: pd.DataFrame, *, merge: bool) -> List[str]:
+        bars = canonical_m1_frame(frame)
+        if bars.empty:
+            return []
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        index = self.read_index()
+        previous = dict(index["partitions"])
+        partitions = dict(previous) if merge else {}
+        seq = int(index.get("seq", 0)) + 1
+        ts = bars["timestamp"]
+        month_ids = (ts.dt.year * 12 + ts.dt.month - 1).to_numpy()
+        bounds = np.flatnonzero(np.diff(month_ids)) + 1
+        touched: List[str] = []
+
+        for chunk in np.split(np.arange(len(bars)), bounds):
+            new_rows = bars.iloc[chunk]
+            key = partition_key(new_rows["timestamp"].iloc[0])
+            writes = [[seq, new_rows["timestamp"].iloc[0].isoformat()]]
+            if key in previous:
+                writes = (previous[key].get("writes", []) + writes)[-_MAX_WRITE_LOG:]
+            if key in partitions:
+                stored = self._read_partition(partitions[key]["file"]).to_pandas()
+                new_rows = canonical_m1_frame(pd.concat([stored, new_rows], ignore_index=True))
+            partitions[key] = {**self._write_partition(key, new_rows), "writes": writes}
+            touched.append(key)
+
+        self._write_index(partitions, seq)
+        for key in previous.keys() - partitions.keys():
+            (self.root / previous[key]["file"]).unlink(missing_ok=True)
+        logger.debug("[M1_PARTITIONS] %s: rewrote %s", self.root.name, ", ".join(touched))
+        return touched
+
+    def import_file(self, path: Path) -> List[str]:
+        """Partition a legacy single-file M1 parquet into this store."""
+        return self.append(pd.read_parquet(path))
+
+    def _write_partition(self, key: str, rows: pd.DataFrame) -> Dict:
+        name = f"{key}.parquet"
+        table = pa.Table.from_pandas(rows, preserve_index=False)
+        tmp = self.root / f".{name}.tmp"
+        pq.write_table(table, tmp)
+        os.replace(tmp, self.root / name)
+        return {
+            "file": name,
+            "rows": int(len(rows)),
+            "min_ts": rows["timestamp"].iloc[0].isoformat(),
+            "max_ts": rows["timestamp"].iloc[-1].isoformat(),
+        }
+
+    # ------------------------------------------------------------------ reads
+    def _read_partition(self, name: str) -> pa.Table:
+        return pq.read_table(self.root / name, memory_map=True)
+
+    def load(self, start: Bound = None, end: Bound = None) -> pd.DataFrame:
+        """Bars with ``start <= timestamp <= end`` (UTC index, Title-case columns).
+
+        Naive bounds are taken as UTC. Only partitions whose indexed range
+        overlaps the window are opened.
+        """
+        lo = _to_utc(start) if start is not None else None
+        hi = _to_utc(end) if end is not None else None
+
+        tables: List[pa.Table] = []
+        for key, meta in sorted(self.read_index()["partitions"].items()):
+            p_min, p_max = pd.Timestamp(meta["min_ts"]), pd.Timestamp(meta["max_ts"])
+            if (lo is not None and p_max < lo) or (hi is not None and p_min > hi):
+                continue
+            table = self._read_partition(meta["file"])
+            if (lo is not None and p_min < lo) or (hi is not None and p_max > hi):
+                table = _slice_sorted(table, lo, hi)
+            tables.append(table)
+
+        if not tables:
+            empty = pd.DataFrame({name: pd.Series(dtype="float64") for name in M1_COLUMNS})
+            empty.index = pd.DatetimeIndex([], tz="UTC", name="timestamp")
+            return empty
+
+        frame = pa.concat_tables(tables).to_pandas()
+        return frame.set_index("timestamp")
+
+
+def _slice_sorted(table: pa.Table, lo: Optional[pd.Timestamp], hi: Optional[pd.Timestamp]) -> pa.Table:
+    ts = table.column("timestamp").to_numpy().astype("datetime64[ns]")
+    first = 0 if lo is None else int(np.searchsorted(ts, lo.tz_localize(None).to_datetime64(), side="left"))
+    stop = len(ts) if hi is None else int(np.searchsorted(ts, hi.tz_localize(None).to_datetime64(), side="right"))
+    return table.slice(first, max(0, stop - first))
+
+
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
@@ -1,7 +1,10 @@
+from .ohlcv_cache import OhlcvCache, get_default_ohlcv_cache
 from .replay_engine import Costs, simulate_insidebar_from_orders, simulate_daily_moc_from_orders
 
 __all__ = [
     "Costs",
+    "OhlcvCache",
+    "get_default_ohlcv_cache",
     "simulate_insidebar_from_orders",
     "simulate_daily_moc_from_orders",
 ]
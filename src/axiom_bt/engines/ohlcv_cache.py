@@ -0,0 +1,159 @@
+"""In-process OHLCV array cache for the replay engine.
+
+Each symbol file (or month-partitioned M1 directory) is read, normalized and
+sorted once per (path, mtime, tz); subsequent lookups reuse contiguous NumPy
+columns plus a per-day offset index so per-order windows become
+``searchsorted`` calls instead of frame scans.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from axiom_bt.data.m1_partitions import INDEX_NAME
+
+_NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+@dataclass(frozen=True)
+class OhlcvArrays:
+    """Sorted OHLCV columns for one symbol file in a fixed timezone.
+
+    ``ts`` holds UTC epoch nanoseconds for the first ``n_valid`` rows (NaT rows
+    sort last and are excluded). ``day_keys``/``day_starts`` map each local
+    calendar day (days since epoch, wall clock in ``tz``) to its first row;
+    the day's rows end at the next entry (or ``n_valid``).
+    """
+
+    path: Path
+    tz: str
+    index: pd.DatetimeIndex
+    ts: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    n_valid: int
+    day_keys: np.ndarray
+    day_starts: np.ndarray
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, path: Path, tz: str) -> "OhlcvArrays":
+        """Build arrays from a frame already passed through _ensure_dtindex_and_ohlcv."""
+        index = df.index
+        n_valid = int(index.notna().sum())
+        valid = index[:n_valid]
+        ts = np.ascontiguousarray(valid.to_numpy(dtype="datetime64[ns]").view("int64"))
+        local_days = (
+            valid.tz_localize(None).to_numpy(dtype="datetime64[ns]").view("int64") // _NS_PER_DAY
+        )
+        if n_valid:
+            starts = np.flatnonzero(np.diff(local_days, prepend=local_days[0] - 1))
+        else:
+            starts = np.empty(0, dtype=np.int64)
+        return cls(
+            path=path,
+            tz=tz,
+            index=index,
+            ts=ts,
+            open=np.ascontiguousarray(df["Open"].to_numpy(dtype="float64")),
+            high=np.ascontiguousarray(df["High"].to_numpy(dtype="float64")),
+            low=np.ascontiguousarray(df["Low"].to_numpy(dtype="float64")),
+            close=np.ascontiguousarray(df["Close"].to_numpy(dtype="float64")),
+            n_valid=n_valid,
+            day_keys=np.ascontiguousarray(local_days[starts]),
+            day_starts=starts.astype(np.int64),
+        )
+
+    @property
+    def empty(self) -> bool:
+        return self.n_valid == 0
+
+    @property
+    def last_ts(self) -> Optional[pd.Timestamp]:
+        return self.index[self.n_valid - 1] if self.n_valid else None
+
+    def window(self, start: pd.Timestamp, end: pd.Timestamp) -> Tuple[int, int]:
+        """Return [lo, hi) row positions with start <= ts <= end."""
+        lo = int(np.searchsorted(self.ts, start.value, side="left"))
+        hi = int(np.searchsorted(self.ts, end.value, side="right"))
+        return lo, max(lo, hi)
+
+    def day_range(self, day) -> Tuple[int, int]:
+        """Return [lo, hi) row positions for a local calendar date (in ``tz``)."""
+        key = pd.Timestamp(day).value // _NS_PER_DAY
+        pos = int(np.searchsorted(self.day_keys, key, side="left"))
+        if pos >= len(self.day_keys) or self.day_keys[pos] != key:
+            return 0, 0
+        lo = int(self.day_starts[pos])
+        hi = int(self.day_starts[pos + 1]) if pos + 1 < len(self.day_starts) else self.n_valid
+        return lo, hi
+
+
+class OhlcvCache:
+    """Bounded LRU of OhlcvArrays keyed by (resolved path, mtime_ns, tz)."""
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[Tuple[str, int, str], OhlcvArrays]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path, tz: str) -> OhlcvArrays:
+        path = Path(path)
+        key = (str(path.resolve()), _mtime_ns(path), tz)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+        arrays = self._load(path, tz)
+        with self._lock:
+            self.misses += 1
+            # Drop stale generations of the same file before inserting.
+            for stale in [k for k in self._entries if k[0] == key[0] and k[2] == tz]:
+                del self._entries[stale]
+            self._entries[key] = arrays
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return arrays
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _load(path: Path, tz: str) -> OhlcvArrays:
+        from .replay_engine import _ensure_dtindex_and_ohlcv
+
+        df = _ensure_dtindex_and_ohlcv(pd.read_parquet(path), tz)
+        return OhlcvArrays.from_frame(df, path, tz)
+
+
+def _mtime_ns(path: Path) -> int:
+    """File mtime; a month-partitioned M1 directory changes with its sidecar index."""
+    if path.is_dir():
+        path = path / INDEX_NAME
+    return path.stat().st_mtime_ns
+
+
+_DEFAULT_CACHE = OhlcvCache()
+
+
+def get_default_ohlcv_cache() -> OhlcvCache:
+    """Process-wide cache shared by replay runs."""
+    return _DEFAULT_CACHE
@@ -4,10 +4,13 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Literal, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from core.settings import DEFAULT_INITIAL_CASH
+from axiom_bt.data.m1_partitions import is_partitioned
 from axiom_bt.portfolio.ledger import PortfolioLedger
+from .ohlcv_cache import OhlcvArrays, OhlcvCache, get_default_ohlcv_cache
 
 Side = Literal["BUY", "SELL"]
 
@@ -145,14 +148,8 @@ def _compute_market_close_deadline(
     """
     Compute the last available bar on the entry day that is <= close_hhmm.
     """
-    # Convert entry_ts to market TZ to find the day
-    local_entry = entry_ts.tz_convert(market_tz)
-    day = local_entry.date()
-    
-    # Define the target close time in market TZ
-    hh, mm = map(int, close_hhmm.split(":"))
-    target_close_local = pd.Timestamp.combine(day, pd.Series([pd.Timestamp(f"{hh:02}:{mm:02}").time()])[0])
-    target_close = pd.Timestamp(target_close_local, tz=market_tz)
+    # Entry day and target close time in market TZ
+    day, target_close = _market_close_target(entry_ts, market_tz, close_hhmm)
     
     # Filter data for this day
     day_data = df.loc[df.index.normalize() == pd.Timestamp(day).tz_localize(market_tz).tz_convert(df.index.tz)]
@@ -173,6 +170,88 @@ def _compute_market_close_deadline(
     return entry_ts
 
 
+def _first_true(mask: np.ndarray) -> int:
+    if mask.size == 0:
+        return -1
+    idx = int(np.argmax(mask))
+    return idx if mask[idx] else -1
+
+
+def _first_touch_entry_arrays(
+    arrays: OhlcvArrays,
+    side: Side,
+    price: float,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+) -> Optional[pd.Timestamp]:
+    """Array twin of _first_touch_entry (same bar, same semantics)."""
+    lo, hi = arrays.window(start, end)
+    if side == "BUY":
+        hit = _first_true(arrays.high[lo:hi] >= price)
+    else:
+        hit = _first_true(arrays.low[lo:hi] <= price)
+    if hit < 0:
+        return None
+    return arrays.index[lo + hit]
+
+
+def _exit_after_entry_arrays(
+    arrays: OhlcvArrays,
+    side: Side,
+    entry_ts: pd.Timestamp,
+    stop_loss: Optional[float],
+    take_profit: Optional[float],
+    exit_deadline: pd.Timestamp,
+):
+    """Array twin of _exit_after_entry (SL wins same-bar conflicts, EOD fallback)."""
+    lo, hi = arrays.window(entry_ts, exit_deadline)
+    if hi <= lo:
+        pos = int(np.searchsorted(arrays.ts, entry_ts.value, side="left"))
+        if pos < arrays.n_valid and arrays.ts[pos] == entry_ts.value:
+            return entry_ts, float(arrays.close[pos]), "EOD"
+        return entry_ts, 0.0, "EOD"  # Should not happen with valid data
+
+    n = hi - lo
+    if side == "BUY":
+        sl_mask = arrays.low[lo:hi] <= stop_loss if stop_loss is not None else np.zeros(n, dtype=bool)
+        tp_mask = arrays.high[lo:hi] >= take_profit if take_profit is not None else np.zeros(n, dtype=bool)
+    else:
+        sl_mask = arrays.high[lo:hi] >= stop_loss if stop_loss is not None else np.zeros(n, dtype=bool)
+        tp_mask = arrays.low[lo:hi] <= take_profit if take_profit is not None else np.zeros(n, dtype=bool)
+    hit = _first_true(sl_mask | tp_mask)
+    if hit >= 0:
+        ts = arrays.index[lo + hit]
+        if sl_mask[hit]:
+            return ts, stop_loss, "SL"
+        return ts, take_profit, "TP"
+    return arrays.index[hi - 1], float(arrays.close[hi - 1]), "EOD"
+
+
+def _market_close_target(entry_ts: pd.Timestamp, market_tz: str, close_hhmm: str):
+    local_entry = entry_ts.tz_convert(market_tz)
+    day = local_entry.date()
+    hh, mm = map(int, close_hhmm.split(":"))
+    target_close_local = pd.Timestamp.combine(day, pd.Series([pd.Timestamp(f"{hh:02}:{mm:02}").time()])[0])
+    return day, pd.Timestamp(target_close_local, tz=market_tz)
+
+
+def _compute_market_close_deadline_arrays(
+    arrays: OhlcvArrays,
+    entry_ts: pd.Timestamp,
+    market_tz: str,
+    close_hhmm: str = "16:00",
+) -> pd.Timestamp:
+    """Array twin of _compute_market_close_deadline using the per-day offset index."""
+    day, target_close = _market_close_target(entry_ts, market_tz, close_hhmm)
+    lo, hi = arrays.day_range(day)
+    if hi <= lo:
+        return entry_ts
+    cut = int(np.searchsorted(arrays.ts[lo:hi], target_close.value, side="right"))
+    if cut > 0:
+        return arrays.index[lo + cut - 1]
+    return arrays.index[hi - 1]
+
+
 def _derive_m1_dir(data_path: Path) -> Optional[Path]:
     name = data_path.name.lower()
     if "m5" in name:
@@ -194,9 +273,13 @@ def _resolve_symbol_path(symbol: str, m1_dir: Optional[Path], fallback_dir: Path
     logger = logging.getLogger(__name__)
 
     # Prefer RTH, then RAW (all sessions), then older ALL-suffix, then legacy unsuffixed.
+    # A month-partitioned M1 store (``{symbol}_rth/``, ``{symbol}_all/``) wins over
+    # the single file of the same session, as in IntradayStore.path_for.
     names = [
+        f"{symbol}_rth",
         f"{symbol}_rth.parquet",
         f"{symbol}_raw.parquet",
+        f"{symbol}_all",
         f"{symbol}_all.parquet",
         f"{symbol}.parquet",
     ]
@@ -204,7 +287,7 @@ def _resolve_symbol_path(symbol: str, m1_dir: Optional[Path], fallback_dir: Path
     def first_existing(base: Path) -> Optional[Path]:
         for name in names:
             p = base / name
-            if p.exists():
+            if is_partitioned(p) if not name.endswith(".parquet") else p.is_file():
                 return p
         return None
 
@@ -233,9 +316,17 @@ def simulate_insidebar_from_orders(
     requested_end: Optional[Union[str, pd.Timestamp]] = None,
     market_tz: Optional[str] = None,
     market_close_hhmm: str = "16:00",
+    ohlcv_cache: Optional[OhlcvCache] = None,
 ) -> Dict[str, Any]:
+    """Replay InsideBar STOP orders against OHLCV files (one OCO fill per group).
+
+    OHLCV files are served from ``ohlcv_cache`` (default: process-wide cache),
+    so each symbol is loaded once per (path, mtime, tz) and per-order lookups
+    are searchsorted windows over cached arrays.
+    """
     import logging
     logger = logging.getLogger(__name__)
+    cache = ohlcv_cache if ohlcv_cache is not None else get_default_ohlcv_cache()
 
     orders = pd.read_csv(orders_csv)
 
@@ -340,12 +431,10 @@ def simulate_insidebar_from_orders(
         file_path, _ = _resolve_symbol_path(symbol, m1_dir, data_path)
         if file_path is None:
             continue
-        ohlcv = pd.read_parquet(file_path)
-        ohlcv = _ensure_dtindex_and_ohlcv(ohlcv, tz)
-        # ensure chronological order when switching between sources
-        ohlcv = ohlcv.sort_index()
+        # Cached, sorted arrays (load-once per path/mtime/tz).
+        ohlcv = cache.get(file_path, tz)
         if not ohlcv.empty:
-            ts_max = ohlcv.index.max()
+            ts_max = ohlcv.last_ts
             if last_data_ts is None or ts_max > last_data_ts:
                 last_data_ts = ts_max
         group = group.sort_values("valid_from")
@@ -356,7 +445,7 @@ def simulate_insidebar_from_orders(
                 entry_price = float(row["price"])
                 valid_from = pd.to_datetime(row["valid_from"]).tz_convert(tz)
                 valid_to = pd.to_datetime(row["valid_to"]).tz_convert(tz)
-                entry_ts = _first_touch_entry(ohlcv, side, entry_price, valid_from, valid_to)
+                entry_ts = _first_touch_entry_arrays(ohlcv, side, entry_price, valid_from, valid_to)
                 if entry_ts is None:
                     continue
 
@@ -368,11 +457,11 @@ def simulate_insidebar_from_orders(
                 stop_loss = float(row["stop_loss"]) if not pd.isna(row["stop_loss"]) else None
                 take_profit = float(row["take_profit"]) if not pd.isna(row["take_profit"]) else None
 
-                exit_deadline = _compute_market_close_deadline(
+                exit_deadline = _compute_market_close_deadline_arrays(
                     ohlcv, entry_ts, market_tz=market_tz or tz, close_hhmm=market_close_hhmm
                 )
 
-                exit_ts, raw_exit_price, exit_reason = _exit_after_entry(
+                exit_ts, raw_exit_price, exit_reason = _exit_after_entry_arrays(
                     ohlcv, side, entry_ts, stop_loss, take_profit, exit_deadline
                 )
 
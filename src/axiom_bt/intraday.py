@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
@@ -9,7 +11,8 @@ from typing import Dict, Iterable, List, Optional
 import pandas as pd
 
 from axiom_bt.fs import DATA_M1, DATA_M5, DATA_M15, DATA_D1, ensure_layout
-from axiom_bt.data.eodhd_fetch import fetch_intraday_1m_to_parquet, resample_m1
+from axiom_bt.data.eodhd_fetch import fetch_intraday_1m_to_parquet, http_settings, resample_m1
+from axiom_bt.data.m1_partitions import M1PartitionStore
 
 import logging
 logger = logging.getLogger(__name__)
@@ -51,6 +54,9 @@ def check_local_m1_coverage(
     range against existing data. It returns precise gap boundaries to avoid re-fetching
     data that already exists.
 
+    For month-partitioned stores the earliest/latest dates come from the sidecar
+    index (no parquet read); legacy single files are still read in full.
+
     Args:
         symbol: Stock symbol (e.g., "AAPL")
         start: Start date ISO format (e.g., "2024-09-28")
@@ -76,8 +82,6 @@ def check_local_m1_coverage(
         >>> result['gaps']
         [{'gap_start': '2024-10-01', 'gap_end': '2024-11-30', 'gap_days': 61}]
     """
-    from datetime import datetime, timedelta
-
     # Use session-aware path (default rth for backward compatibility)
     store = IntradayStore(default_tz="America/New_York")
     m1_path = store.path_for(symbol, timeframe=Timeframe.M1, session_mode="rth")
@@ -86,7 +90,22 @@ def check_local_m1_coverage(
     requested_end = datetime.fromisoformat(end).date()
     requested_days = (requested_end - requested_start).days + 1
 
-    if not m1_path.exists():
+    partitions = store.partitions_for(symbol, session_mode="rth")
+    if partitions.exists():
+        try:
+            indexed = partitions.coverage()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {partitions.index_path} for coverage check: {e}")
+            indexed = None
+        if indexed is not None:
+            return _coverage_result(
+                requested_start,
+                requested_end,
+                indexed.first_ts.tz_convert("UTC").date(),
+                indexed.last_ts.tz_convert("UTC").date(),
+            )
+
+    if not m1_path.exists() or m1_path.is_dir():
         # No data at all - entire range is a gap
         return {
             "available_days": 0,
@@ -129,44 +148,7 @@ def check_local_m1_coverage(
         # IMPORTANT: .date() on UTC time to avoid timezone shift bugs
         earliest = df_index_utc.min().date()
         latest = df_index_utc.max().date()
-        available_days = (latest - earliest).days + 1
-
-        # Identify precise gaps
-        gaps = []
-
-        # Gap 1: Before existing data (if requested_start < earliest)
-        if requested_start < earliest:
-            gap_end = earliest - timedelta(days=1)
-            gap_days = (gap_end - requested_start).days + 1
-            gaps.append({
-                "gap_start": requested_start.isoformat(),
-                "gap_end": gap_end.isoformat(),
-                "gap_days": gap_days,
-                "reason": "before_existing_data"
-            })
-
-        # Gap 2: After existing data (if requested_end > latest)
-        if requested_end > latest:
-            gap_start = latest + timedelta(days=1)
-            gap_days = (requested_end - gap_start).days + 1
-            gaps.append({
-                "gap_start": gap_start.isoformat(),
-                "gap_end": requested_end.isoformat(),
-                "gap_days": gap_days,
-                "reason": "after_existing_data"
-            })
-
-        # Build result
-        result = {
-            "available_days": available_days,
-            "requested_days": requested_days,
-            "has_gap": len(gaps) > 0,
-            "earliest_data": earliest.isoformat(),
-            "latest_data": latest.isoformat(),
-            "gaps": gaps
-        }
-
-        return result
+        return _coverage_result(requested_start, requested_end, earliest, latest)
 
     except Exception as e:
         logger.warning(f"Could not read {m1_path} for coverage check: {e}")
@@ -184,6 +166,48 @@ def check_local_m1_coverage(
         }
 
 
+def _coverage_result(requested_start: date, requested_end: date, earliest: date, latest: date) -> dict:
+    """Build the check_local_m1_coverage result for existing data [earliest, latest]."""
+    from datetime import timedelta
+
+    requested_days = (requested_end - requested_start).days + 1
+    available_days = (latest - earliest).days + 1
+
+    # Identify precise gaps
+    gaps = []
+
+    # Gap 1: Before existing data (if requested_start < earliest)
+    if requested_start < earliest:
+        gap_end = earliest - timedelta(days=1)
+        gap_days = (gap_end - requested_start).days + 1
+        gaps.append({
+            "gap_start": requested_start.isoformat(),
+            "gap_end": gap_end.isoformat(),
+            "gap_days": gap_days,
+            "reason": "before_existing_data"
+        })
+
+    # Gap 2: After existing data (if requested_end > latest)
+    if requested_end > latest:
+        gap_start = latest + timedelta(days=1)
+        gap_days = (requested_end - gap_start).days + 1
+        gaps.append({
+            "gap_start": gap_start.isoformat(),
+            "gap_end": requested_end.isoformat(),
+            "gap_days": gap_days,
+            "reason": "after_existing_data"
+        })
+
+    return {
+        "available_days": available_days,
+        "requested_days": requested_days,
+        "has_gap": len(gaps) > 0,
+        "earliest_data": earliest.isoformat(),
+        "latest_data": latest.isoformat(),
+        "gaps": gaps
+    }
+
+
 class Timeframe(str, Enum):
     """Supported intraday timeframes for the central store."""
 
@@ -239,6 +263,7 @@ class IntradayStore:
         use_sample: bool = False,
         auto_fill_gaps: bool = True,
         allow_legacy_http_backfill: bool = False,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, List[str]]:
         """Ensure required intraday data exists on disk.
 
@@ -250,6 +275,7 @@ class IntradayStore:
             use_sample: Use sample data (testing only)
             auto_fill_gaps: If True, automatically fetch missing data from EODHD
             allow_legacy_http_backfill: Option-B guard. Must be True to permit HTTP fetch.
+            max_workers: Symbols processed concurrently (default: EODHD max_workers)
 
         Returns:
             Dict mapping symbol -> list of actions taken
@@ -263,132 +289,27 @@ class IntradayStore:
         end_str = _to_date_str(spec.end)
         tz = spec.tz or self._default_tz
 
-        actions: Dict[str, List[str]] = {}
-
-        for symbol in symbols:
-            sym_actions: List[str] = []
-            m1_path = self.path_for(symbol, timeframe=Timeframe.M1, session_mode=spec.session_mode)
-
-
-            # NEW: Check coverage before deciding to fetch
-            if not force and auto_fill_gaps:
-                coverage = check_local_m1_coverage(
-                    symbol=symbol,
-                    start=start_str,
-                    end=end_str,
-                    tz=tz
-                )
-
-                if coverage["has_gap"]:
-                    # Gap(s) detected - fetch only missing data
-                    logger.info(
-                        f"[{symbol}] Gap detected: have {coverage['available_days']} days, "
-                        f"need {coverage['requested_days']} days. "
-                        f"Found {len(coverage['gaps'])} gap(s)."
-                    )
-
-                    # Fetch each gap separately
-                    # CRITICAL FIX: Skip weekend/holiday gaps (<=4 days)
-                    # EODHD delivers only TRADING DAYS - weekend/holiday gaps are EXPECTED
-                    # Only fetch gaps > 4 days which indicate actual missing trading data
-                    MAX_EXPECTED_CALENDAR_GAP = 4
-
-                    for gap in coverage["gaps"]:
-                        # Skip small gaps (weekends, 3-day weekends, holiday closures)
-                        if gap["gap_days"] <= MAX_EXPECTED_CALENDAR_GAP:
-                            logger.info(
-                                f"[{symbol}] Skipping gap: {gap['gap_start']} to {gap['gap_end']} "
-                                f"({gap['gap_days']} days) - likely weekend/holiday, within {MAX_EXPECTED_CALENDAR_GAP}d threshold"
-                            )
-                            continue
-
-                        logger.info(
-                            f"[{symbol}] Fetching gap: {gap['gap_start']} to {gap['gap_end']} "
-                            f"({gap['gap_days']} days, reason: {gap.get('reason', 'unknown')})"
-                        )
-
-
-                        # Fetch gap data to temp location first
-                        import tempfile
-                        import shutil
-                        temp_dir = Path(tempfile.mkdtemp(prefix="eodhd_gap_"))
-
-                        try:
-                            gap_path = fetch_intraday_1m_to_parquet(
-                                symbol=symbol,
-                                exchange="US",
-                                start_date=gap['gap_start'],
-                                end_date=gap['gap_end'],
-                                out_dir=temp_dir,
-                                tz=tz,
-                                use_sample=use_sample,
-                                save_raw=True,   # Save raw data with Pre/After-Market
-                                filter_rth=(spec.session_mode == "rth"),  # Dynamic based on session_mode
-                                allow_legacy_http_backfill=allow_legacy_http_backfill,
-                            )
-
-
-                            # Merge with existing data if file exists
-                            if m1_path.exists():
-                                existing_df = pd.read_parquet(m1_path)
-                                gap_df = pd.read_parquet(gap_path)
-
-                                # Merge
-                                merged_df = pd.concat([existing_df, gap_df])
-                                merged_df = merged_df.sort_index().drop_duplicates()
-
-                                # Save merged result
-                                merged_df.to_parquet(m1_path)
-                                logger.info(
-                                    f"[{symbol}] Merged {len(gap_df)} new rows with "
-                                    f"{len(existing_df)} existing → {len(merged_df)} total"
-                                )
-                            else:
-                                # No existing file, just move gap data
-                                shutil.move(str(gap_path), str(m1_path))
-                                logger.info(f"[{symbol}] Created new M1 file with gap data")
-
-                        finally:
-                            # Clean up temp dir
-                            if temp_dir.exists():
-                                shutil.rmtree(temp_dir)
-
-                    sym_actions.append(f"gap_fill_{len(coverage['gaps'])}_gaps_{sum(g['gap_days'] for g in coverage['gaps'])}_days")
-                else:
-                    # Sufficient coverage
-                    logger.info(
-                        f"[{symbol}] Sufficient M1 coverage: {coverage['available_days']} days"
-                    )
-                    sym_actions.append("use_cached_m1")
-
-            elif force or not m1_path.exists():
-                # Original behavior: force rebuild or doesn't exist
-                fetch_intraday_1m_to_parquet(
-                    symbol=symbol,
-                    exchange="US",
-                    start_date=start_str,
-                    end_date=end_str,
-                    out_dir=DATA_M1,
-                    tz=tz,
-                    use_sample=use_sample,
-                    save_raw=True,   # Save raw data with Pre/After-Market
-                    filter_rth=(spec.session_mode == "rth"),  # Dynamic based on session_mode
-                    allow_legacy_http_backfill=allow_legacy_http_backfill,
-                )
-
-                sym_actions.append("fetch_m1")
-            else:
-                sym_actions.append("use_cached_m1")
-
-            # Resample to M5, M15 (existing logic)
-            resample_m1(m1_path, DATA_M5, interval="5min", tz=tz)
-            sym_actions.append("resample_m5")
-
-            if spec.timeframe == Timeframe.M15:
-                resample_m1(m1_path, DATA_M15, interval="15min", tz=tz)
-                sym_actions.append("resample_m15")
-
-            actions[symbol] = sym_actions
+        # Symbols are independent (own files and partitions); HTTP fetches share
+        # the EODHD rate limit, so extra workers only overlap latency.
+        workers = min(len(symbols), max_workers or http_settings().max_workers)
+        ensure_one = functools.partial(
+            self._ensure_symbol,
+            spec=spec,
+            start_str=start_str,
+            end_str=end_str,
+            tz=tz,
+            force=force,
+            use_sample=use_sample,
+            auto_fill_gaps=auto_fill_gaps,
+            allow_legacy_http_backfill=allow_legacy_http_backfill,
+        )
+        actions: Dict[str, List[str]]
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="intraday-ensure") as pool:
+                futures = {symbol: pool.submit(ensure_one, symbol) for symbol in symbols}
+                actions = {symbol: future.result() for symbol, future in futures.items()}
+        else:
+            actions = {symbol: ensure_one(symbol) for symbol in symbols}
 
         # Evidence logging after all symbols processed
         if actions:
@@ -398,7 +319,7 @@ class IntradayStore:
 
                 # Log data quality for symbols that were fetched/filled
                 if any("fetch" in act or "gap_fill" in act for act in acts):
-                    m1_file = DATA_M1 / f"{sym}.parquet"
+                    m1_file = self.path_for(sym, timeframe=Timeframe.M1, session_mode=spec.session_mode)
                     if m1_file.exists():
                         try:
                             df_check = pd.read_parquet(m1_file)
@@ -437,6 +358,141 @@ class IntradayStore:
 
         return actions
 
+    def _ensure_symbol(
+        self,
+        symbol: str,
+        *,
+        spec: IntradaySpec,
+        start_str: str,
+        end_str: str,
+        tz: str,
+        force: bool,
+        use_sample: bool,
+        auto_fill_gaps: bool,
+        allow_legacy_http_backfill: bool,
+    ) -> List[str]:
+        """Fetch/gap-fill and resample one symbol; returns its actions."""
+        sym_actions: List[str] = []
+        m1_path = self.path_for(symbol, timeframe=Timeframe.M1, session_mode=spec.session_mode)
+
+
+        # NEW: Check coverage before deciding to fetch
+        if not force and auto_fill_gaps:
+            coverage = check_local_m1_coverage(
+                symbol=symbol,
+                start=start_str,
+                end=end_str,
+                tz=tz
+            )
+
+            if coverage["has_gap"]:
+                # Gap(s) detected - fetch only missing data
+                logger.info(
+                    f"[{symbol}] Gap detected: have {coverage['available_days']} days, "
+                    f"need {coverage['requested_days']} days. "
+                    f"Found {len(coverage['gaps'])} gap(s)."
+                )
+
+                # Fetch each gap separately
+                # CRITICAL FIX: Skip weekend/holiday gaps (<=4 days)
+                # EODHD delivers only TRADING DAYS - weekend/holiday gaps are EXPECTED
+                # Only fetch gaps > 4 days which indicate actual missing trading data
+                MAX_EXPECTED_CALENDAR_GAP = 4
+
+                for gap in coverage["gaps"]:
+                    # Skip small gaps (weekends, 3-day weekends, holiday closures)
+                    if gap["gap_days"] <= MAX_EXPECTED_CALENDAR_GAP:
+                        logger.info(
+                            f"[{symbol}] Skipping gap: {gap['gap_start']} to {gap['gap_end']} "
+                            f"({gap['gap_days']} days) - likely weekend/holiday, within {MAX_EXPECTED_CALENDAR_GAP}d threshold"
+                        )
+                        continue
+
+                    logger.info(
+                        f"[{symbol}] Fetching gap: {gap['gap_start']} to {gap['gap_end']} "
+                        f"({gap['gap_days']} days, reason: {gap.get('reason', 'unknown')})"
+                    )
+
+
+                    # Fetch gap data to temp location first
+                    import tempfile
+                    import shutil
+                    temp_dir = Path(tempfile.mkdtemp(prefix="eodhd_gap_"))
+
+                    try:
+                        gap_path = fetch_intraday_1m_to_parquet(
+                            symbol=symbol,
+                            exchange="US",
+                            start_date=gap['gap_start'],
+                            end_date=gap['gap_end'],
+                            out_dir=temp_dir,
+                            tz=tz,
+                            use_sample=use_sample,
+                            save_raw=True,   # Save raw data with Pre/After-Market
+                            filter_rth=(spec.session_mode == "rth"),  # Dynamic based on session_mode
+                            allow_legacy_http_backfill=allow_legacy_http_backfill,
+                        )
+
+
+                        # Merge into the month partitions the gap touches
+                        partitions = self._migrate_legacy_m1(symbol, session_mode=spec.session_mode)
+                        gap_df = pd.read_parquet(gap_path)
+                        touched = partitions.append(gap_df)
+                        logger.info(
+                            f"[{symbol}] Merged {len(gap_df)} new rows into "
+                            f"{len(touched)} partition(s): {', '.join(touched)}"
+                        )
+
+                    finally:
+                        # Clean up temp dir
+                        if temp_dir.exists():
+                            shutil.rmtree(temp_dir)
+
+                sym_actions.append(f"gap_fill_{len(coverage['gaps'])}_gaps_{sum(g['gap_days'] for g in coverage['gaps'])}_days")
+                m1_path = self.path_for(symbol, timeframe=Timeframe.M1, session_mode=spec.session_mode)
+            else:
+                # Sufficient coverage
+                logger.info(
+                    f"[{symbol}] Sufficient M1 coverage: {coverage['available_days']} days"
+                )
+                sym_actions.append("use_cached_m1")
+
+        elif force or not m1_path.exists():
+            # Force rebuild or nothing cached: the download replaces the month
+            # partitions readers resolve via path_for (and retires any legacy
+            # single file)
+            fetched_path = fetch_intraday_1m_to_parquet(
+                symbol=symbol,
+                exchange="US",
+                start_date=start_str,
+                end_date=end_str,
+                out_dir=DATA_M1,
+                tz=tz,
+                use_sample=use_sample,
+                save_raw=True,   # Save raw data with Pre/After-Market
+                filter_rth=(spec.session_mode == "rth"),  # Dynamic based on session_mode
+                allow_legacy_http_backfill=allow_legacy_http_backfill,
+            )
+            partitions = self.partitions_for(symbol, session_mode=spec.session_mode)
+            written = partitions.replace(pd.read_parquet(fetched_path))
+            self._retire_legacy_m1(symbol, session_mode=spec.session_mode)
+            logger.info(f"[{symbol}] Stored fetched M1 in {len(written)} partition(s)")
+
+            sym_actions.append("fetch_m1")
+            m1_path = self.path_for(symbol, timeframe=Timeframe.M1, session_mode=spec.session_mode)
+        else:
+            sym_actions.append("use_cached_m1")
+
+        # Resample to M5, M15 (existing logic)
+        resample_m1(m1_path, DATA_M5, interval="5min", tz=tz)
+        sym_actions.append("resample_m5")
+
+        if spec.timeframe == Timeframe.M15:
+            resample_m1(m1_path, DATA_M15, interval="15min", tz=tz)
+            sym_actions.append("resample_m15")
+
+        return sym_actions
+
     def load(
         self,
         symbol: str,
@@ -444,17 +500,29 @@ class IntradayStore:
         timeframe: Timeframe,
         tz: Optional[str] = None,
         session_mode: str = "rth",
+        start: Optional[str | date | pd.Timestamp] = None,
+        end: Optional[str | date | pd.Timestamp] = None,
     ) -> pd.DataFrame:
-        """Load normalized intraday OHLCV for one symbol/timeframe."""
+        """Load normalized intraday OHLCV for one symbol/timeframe.
+
+        ``start``/``end`` are inclusive; naive values are wall clock in ``tz``
+        and a bare date as ``end`` covers that whole day. Partitioned M1 stores
+        only open the months overlapping the window.
+        """
 
         symbol = symbol.strip().upper()
         path = self.path_for(symbol, timeframe=timeframe, session_mode=session_mode)
+        target_tz = tz or self._default_tz
+        lo, hi = _load_bounds(start, end, target_tz)
 
         if not path.exists():
             raise FileNotFoundError(f"Intraday parquet not found: {path}")
 
-        # Load parquet file
-        frame = pd.read_parquet(path)
+        # Load parquet file (or only the needed month partitions)
+        if path.is_dir():
+            frame = M1PartitionStore(path).load(lo, hi)
+        else:
+            frame = pd.read_parquet(path)
         
         # RTH Validation Gate: Enforce RTH-only data for _rth files
         if session_mode == "rth" and "_rth" in path.name:
@@ -482,6 +550,8 @@ class IntradayStore:
 
         # Load and normalize OHLCV
         df = _normalize_ohlcv_frame(frame, target_tz=tz or self._default_tz, symbol=symbol)
+        if (lo is not None or hi is not None) and not path.is_dir():
+            df = df.loc[lo:hi]
 
 
         # v2 Data Contract Validation
@@ -514,8 +584,46 @@ class IntradayStore:
         
         # Separate cache files by session mode to avoid collisions
         suffix = "rth" if session_mode == "rth" else "all"
+        if timeframe == Timeframe.M1:
+            partitions = self.partitions_for(symbol, session_mode=session_mode)
+            if partitions.exists():
+                return partitions.root
         return base / f"{symbol}_{suffix}.parquet"
 
+    def partitions_for(self, symbol: str, *, session_mode: str = "rth") -> M1PartitionStore:
+        """Month-partitioned M1 store (``data_m1/{SYMBOL}_{rth|all}/``).
+
+        When present it takes precedence over the legacy single-file parquet.
+        """
+        symbol = symbol.strip().upper()
+        suffix = "rth" if session_mode == "rth" else "all"
+        return M1PartitionStore(DATA_M1 / f"{symbol}_{suffix}")
+
+    def _legacy_m1_path(self, symbol: str, *, session_mode: str = "rth") -> Path:
+        suffix = "rth" if session_mode == "rth" else "all"
+        return DATA_M1 / f"{symbol.strip().upper()}_{suffix}.parquet"
+
+    def _migrate_legacy_m1(self, symbol: str, *, session_mode: str = "rth") -> M1PartitionStore:
+        """Partition store for ``symbol``, importing the legacy single file once.
+
+        The legacy file is removed after a successful import so no reader can
+        pick up the stale copy.
+        """
+        partitions = self.partitions_for(symbol, session_mode=session_mode)
+        legacy = self._legacy_m1_path(symbol, session_mode=session_mode)
+        if not partitions.exists() and legacy.is_file():
+            migrated = partitions.import_file(legacy)
+            logger.info(f"[{symbol}] Partitioned legacy M1 file {legacy.name} into {len(migrated)} month(s)")
+            self._retire_legacy_m1(symbol, session_mode=session_mode)
+        return partitions
+
+    def _retire_legacy_m1(self, symbol: str, *, session_mode: str = "rth") -> None:
+        """Delete the legacy single-file M1 parquet once the partitions hold its data."""
+        legacy = self._legacy_m1_path(symbol, session_mode=session_mode)
+        if legacy.is_file() and self.partitions_for(symbol, session_mode=session_mode).exists():
+            legacy.unlink()
+            logger.info(f"[{symbol}] Removed legacy M1 file {legacy.name} (superseded by partitions)")
+
 
 
 def _to_date_str(value: str | date) -> str:
@@ -524,6 +632,25 @@ def _to_date_str(value: str | date) -> str:
     return value
 
 
+def _load_bounds(start, end, tz: str):
+    """Inclusive UTC bounds for IntradayStore.load (None = open)."""
+
+    def _bound(value, is_end: bool):
+        if value is None:
+            return None
+        date_only = (isinstance(value, date) and not isinstance(value, datetime)) or (
+            isinstance(value, str) and len(value) == 10
+        )
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize(tz)
+        if is_end and date_only:
+            ts = ts + pd.Timedelta(days=1) - pd.Timedelta(1, "ns")
+        return ts.tz_convert("UTC")
+
+    return _bound(start, False), _bound(end, True)
+
+
 def _normalize_ohlcv_frame(frame: pd.DataFrame, target_tz: str, symbol: str = "UNKNOWN") -> pd.DataFrame:
     """Normalize raw parquet to a standard OHLCV frame.
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 import pandas as pd
 
@@ -16,15 +16,78 @@ class ArtifactError(ValueError):
     """Raised when artifacts cannot be written."""
 
 
+ARTIFACT_FORMATS = ("csv", "parquet")
+
+# Tabular artifacts (stem -> writer kwarg) in manifest order.
+TABULAR_ARTIFACTS = (
+    "signals_frame",
+    "events_intent",
+    "fills",
+    "trades",
+    "equity_curve",
+    "portfolio_ledger",
+)
+
+
+def artifact_filename(stem: str, artifact_format: str = "csv") -> str:
+    """Return the on-disk file name of a tabular artifact for a format."""
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise ArtifactError(
+            f"unknown artifact_format: {artifact_format!r} (allowed: {list(ARTIFACT_FORMATS)})"
+        )
+    return f"{stem}.{artifact_format}"
+
+
+def _dictionary_columns(df: pd.DataFrame) -> list[str]:
+    """Low-cardinality string columns (symbol, side, reasons, ids) to dictionary-encode."""
+    return [
+        str(col)
+        for col in df.columns
+        if pd.api.types.is_object_dtype(df[col])
+        or isinstance(df[col].dtype, (pd.CategoricalDtype, pd.StringDtype))
+    ]
+
+
 def write_frame(df: pd.DataFrame, path: Path) -> None:
-    """Persist a DataFrame to CSV/Parquet (index dropped)."""
+    """Persist a DataFrame to CSV/Parquet (index dropped).
+
+    Parquet artifacts use zstd compression with dictionary encoding limited to
+    string columns; numeric columns stay plain-encoded.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
     if path.suffix == ".parquet":
-        df.to_parquet(path, index=False)
+        try:
+            df.to_parquet(
+                path,
+                index=False,
+                compression="zstd",
+                use_dictionary=_dictionary_columns(df),
+            )
+        except (TypeError, ValueError) as exc:  # pyarrow type errors subclass these
+            raise ArtifactError(f"cannot write parquet artifact {path.name}: {exc}") from exc
     else:
         df.to_csv(path, index=False)
 
 
+def read_frame(path: Path) -> pd.DataFrame:
+    """Read a tabular artifact written by write_frame (format from suffix)."""
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+def find_tabular_artifact(run_dir: Path, stem: str) -> Optional[Path]:
+    """Return ``run_dir/<stem>.parquet`` or ``run_dir/<stem>.csv`` if present.
+
+    Parquet is preferred; legacy runs only have the CSV.
+    """
+    for artifact_format in ("parquet", "csv"):
+        candidate = Path(run_dir) / artifact_filename(stem, artifact_format)
+        if candidate.exists():
+            return candidate
+    return None
+
+
 def write_artifacts(
     out_dir: Path,
     *,
@@ -37,15 +100,21 @@ def write_artifacts(
     manifest_fields: Dict,
     result_fields: Dict,
     metrics: Dict,
+    artifact_format: str = "csv",
 ) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    write_frame(signals_frame, out_dir / "signals_frame.csv")
-    write_frame(events_intent, out_dir / "events_intent.csv")
-    write_frame(fills, out_dir / "fills.csv")
-    write_frame(trades, out_dir / "trades.csv")
-    write_frame(equity_curve, out_dir / "equity_curve.csv")
-    write_frame(ledger, out_dir / "portfolio_ledger.csv")
+    frames = {
+        "signals_frame": signals_frame,
+        "events_intent": events_intent,
+        "fills": fills,
+        "trades": trades,
+        "equity_curve": equity_curve,
+        "portfolio_ledger": ledger,
+    }
+    names = {stem: artifact_filename(stem, artifact_format) for stem in TABULAR_ARTIFACTS}
+    for stem in TABULAR_ARTIFACTS:
+        write_frame(frames[stem], out_dir / names[stem])
 
     (out_dir / "metrics.json").write_text(json.dumps(metrics, indent=2))
 
@@ -53,11 +122,15 @@ def write_artifacts(
     result_path = out_dir / "run_result.json"
     meta_path = out_dir / "run_meta.json"
 
-    artifacts_index = manifest_fields.setdefault("artifacts_index", [])
-    if "signals_frame.csv" not in artifacts_index:
-        artifacts_index.append("signals_frame.csv")
+    # Record actual file names so readers resolve CSV (legacy) and Parquet runs alike.
+    csv_names = {f"{stem}.csv": names[stem] for stem in TABULAR_ARTIFACTS}
+    artifacts_index = [csv_names.get(name, name) for name in manifest_fields.get("artifacts_index", [])]
+    if names["signals_frame"] not in artifacts_index:
+        artifacts_index.append(names["signals_frame"])
+    manifest_fields["artifacts_index"] = artifacts_index
+    manifest_fields["artifact_format"] = artifact_format
     manifest_path.write_text(json.dumps(manifest_fields, indent=2))
     result_path.write_text(json.dumps(result_fields, indent=2))
     meta_path.write_text(json.dumps({"run_id": manifest_fields.get("run_id"), "params": manifest_fields.get("params")}, indent=2))
 
-    logger.info("actions: artifacts_written dir=%s", out_dir)
+    logger.info("actions: artifacts_written dir=%s format=%s", out_dir, artifact_format)
@@ -1,13 +1,26 @@
-"""CLI entry for the modular pipeline."""
+"""CLI entry for the modular pipeline.
+
+    python -m axiom_bt.pipeline.cli --symbol ... --bars-path ...   single-symbol run
+    python -m axiom_bt.pipeline.cli portfolio --symbols ...        portfolio run
+    python -m axiom_bt.pipeline.cli sweep --param ...              parameter sweep
+"""
 
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import sys
 from pathlib import Path
 
+import yaml
+
+from .artifacts import ARTIFACT_FORMATS
+from .portfolio_runner import run_portfolio_pipeline
 from .runner import run_pipeline
+from .stage_cache import DEFAULT_MAX_BYTES, StageCache
 from .strategy_config_loader import load_strategy_params_from_ssot
+from .sweep import run_parameter_sweep
 
 
 def _default_base_config_path() -> Path | None:
@@ -16,16 +29,10 @@ def _default_base_config_path() -> Path | None:
     return candidate if candidate.exists() else None
 
 
-def build_parser() -> argparse.ArgumentParser:
-    """Define CLI arguments for the headless pipeline.
-
-    Required: strategy id/version, symbol, timeframe, output dir, bars path,
-    and either (valid_to/requested_end + lookback_days) or valid_from+valid_to.
-    """
-    p = argparse.ArgumentParser(description="Axiom BT modular pipeline (CLI)")
+def _add_common_args(p: argparse.ArgumentParser) -> None:
+    """Arguments shared by the single-symbol and portfolio entry points."""
     p.add_argument("--run-id", required=True)
     p.add_argument("--out-dir", required=True, type=Path)
-    p.add_argument("--bars-path", required=True, type=Path)
     p.add_argument(
         "--base-config",
         required=False,
@@ -35,7 +42,6 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p.add_argument("--strategy-id", required=True)
     p.add_argument("--strategy-version", required=True)
-    p.add_argument("--symbol", required=True)
     p.add_argument("--timeframe", required=True)
     p.add_argument("--requested-end", required=False, help="End date (ISO) for data window (alias: --valid-to)")
     p.add_argument("--valid-to", required=False, help="End date (ISO) for data window (alias of --requested-end)")
@@ -49,14 +55,103 @@ def build_parser() -> argparse.ArgumentParser:
     # Cost defaults come from base config YAML (SSOT). CLI args are optional overrides.
     p.add_argument("--fees-bps", type=float, default=None)
     p.add_argument("--slippage-bps", type=float, default=None)
+    p.add_argument(
+        "--artifact-format",
+        choices=list(ARTIFACT_FORMATS),
+        default="csv",
+        help="Tabular artifact format (parquet: zstd + dictionary-encoded string columns)",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Define CLI arguments for the headless pipeline.
+
+    Required: strategy id/version, symbol, timeframe, output dir, bars path,
+    and either (valid_to/requested_end + lookback_days) or valid_from+valid_to.
+    """
+    p = argparse.ArgumentParser(
+        description="Axiom BT modular pipeline (CLI)",
+        epilog="Subcommands: 'portfolio' (multi-symbol run), 'sweep' (parameter grid); pass --help after them.",
+    )
+    _add_common_args(p)
+    p.add_argument("--bars-path", required=True, type=Path)
+    p.add_argument("--symbol", required=True)
+    p.add_argument(
+        "--stage-cache-dir",
+        required=False,
+        type=Path,
+        help="Reuse signal/intent/fills/execute results keyed by their inputs (default: runtime config)",
+    )
+    p.add_argument(
+        "--stage-cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // 1024**2,
+        help="Stage cache size limit; least recently used entries are evicted",
+    )
     return p
 
 
-def main(argv=None) -> int:
-    """CLI entry: parse args, load SSOT config, and delegate to run_pipeline."""
-    logging.basicConfig(level=logging.INFO, format="%(message)s")
-    args = build_parser().parse_args(argv)
+def build_portfolio_parser() -> argparse.ArgumentParser:
+    """Define CLI arguments for the multi-symbol portfolio pipeline."""
+    p = argparse.ArgumentParser(prog="axiom_bt.pipeline.cli portfolio", description="Axiom BT portfolio pipeline (CLI)")
+    _add_common_args(p)
+    p.add_argument("--symbols", required=True, help="Comma-separated symbol list (e.g. AAPL,MSFT,TSLA)")
+    p.add_argument(
+        "--bars-dir",
+        required=False,
+        type=Path,
+        help="Optional directory with existing {SYMBOL}.parquet/.csv snapshots; missing ones are ensured",
+    )
+    p.add_argument("--max-workers", required=False, type=int, default=None)
+    return p
+
+
+def build_sweep_parser() -> argparse.ArgumentParser:
+    """Define CLI arguments for a parameter sweep over one bars snapshot."""
+    p = argparse.ArgumentParser(prog="axiom_bt.pipeline.cli sweep", description="Axiom BT parameter sweep (CLI)")
+    _add_common_args(p)
+    p.add_argument("--bars-path", required=True, type=Path)
+    p.add_argument("--symbol", required=True)
+    p.add_argument("--grid", required=False, type=Path, help="YAML/JSON mapping of param -> list of values")
+    p.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="KEY=V1,V2",
+        help="Grid axis (repeatable); values are parsed as YAML scalars",
+    )
+    p.add_argument("--top-k", type=int, default=3, help="Combinations that get full artifacts")
+    p.add_argument("--rank-by", default="net_pnl", help="Metric used to rank combinations (descending)")
+    p.add_argument(
+        "--rank-ascending",
+        action="store_true",
+        help="Rank lowest metric first (for lower-is-better metrics such as max_drawdown_pct)",
+    )
+    p.add_argument("--max-workers", required=False, type=int, default=None)
+    return p
+
+
+def _grid_from_args(args: argparse.Namespace) -> dict:
+    """Merge --grid file and --param axes (--param wins on duplicate keys)."""
+    grid = {}
+    if args.grid:
+        text = args.grid.read_text()
+        loaded = json.loads(text) if args.grid.suffix == ".json" else yaml.safe_load(text)
+        if not isinstance(loaded, dict):
+            raise SystemExit(f"--grid must contain a mapping: {args.grid}")
+        grid.update(loaded)
+    for axis in args.param:
+        key, sep, raw = axis.partition("=")
+        if not sep or not key.strip() or not raw.strip():
+            raise SystemExit(f"invalid --param {axis!r} (expected KEY=V1,V2)")
+        grid[key.strip()] = [yaml.safe_load(v.strip()) for v in raw.split(",") if v.strip()]
+    if not grid:
+        raise SystemExit("--grid or at least one --param is required")
+    return grid
+
 
+def _resolve_window_args(args: argparse.Namespace) -> tuple[str, int]:
+    """Return (requested_end, lookback_days) from --requested-end/--valid-to/--valid-from."""
     requested_end = args.requested_end or args.valid_to
     if not requested_end:
         raise SystemExit("--requested-end or --valid-to is required")
@@ -77,12 +172,20 @@ def main(argv=None) -> int:
 
     if lookback_days is None:
         raise SystemExit("--lookback-days or --valid-from must be provided")
+    return requested_end, lookback_days
 
-    cfg = load_strategy_params_from_ssot(args.strategy_id, args.strategy_version)
+
+def _strategy_params_from_args(
+    args: argparse.Namespace,
+    cfg: dict,
+    requested_end: str,
+    lookback_days: int,
+    symbol: str | None = None,
+) -> dict:
     params = {
         **cfg.get("core", {}),
         **cfg.get("tunable", {}),
-        "symbol": args.symbol,
+        **({"symbol": symbol} if symbol is not None else {}),
         "timeframe": args.timeframe,
         "requested_end": requested_end,
         "lookback_days": lookback_days,
@@ -91,12 +194,43 @@ def main(argv=None) -> int:
         params["valid_from_policy"] = args.valid_from_policy
     if args.order_validity_policy:
         params["order_validity_policy"] = args.order_validity_policy
+    return params
+
+
+def _config_overrides_from_args(args: argparse.Namespace) -> dict:
     cli_backtest_overrides = {"initial_cash": args.initial_cash}
     cli_costs_overrides = {}
     if args.fees_bps is not None:
         cli_costs_overrides["commission_bps"] = args.fees_bps
     if args.slippage_bps is not None:
         cli_costs_overrides["slippage_bps"] = args.slippage_bps
+    return {
+        "ui": {},
+        "cli": {
+            "backtest": cli_backtest_overrides,
+            "costs": cli_costs_overrides,
+        },
+        "spyder": {},
+    }
+
+
+def main(argv=None) -> int:
+    """CLI entry: parse args, load SSOT config, and delegate to run_pipeline.
+
+    A leading ``portfolio`` or ``sweep`` argument dispatches to main_portfolio()
+    or main_sweep() with the remaining arguments.
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in _SUBCOMMANDS:
+        return _SUBCOMMANDS[argv[0]](argv[1:])
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = build_parser().parse_args(argv)
+
+    requested_end, lookback_days = _resolve_window_args(args)
+
+    cfg = load_strategy_params_from_ssot(args.strategy_id, args.strategy_version)
+    params = _strategy_params_from_args(args, cfg, requested_end, lookback_days, symbol=args.symbol)
 
     run_pipeline(
         run_id=args.run_id,
@@ -112,17 +246,104 @@ def main(argv=None) -> int:
         fees_bps=args.fees_bps if args.fees_bps is not None else 0.0,
         slippage_bps=args.slippage_bps if args.slippage_bps is not None else 0.0,
         base_config_path=args.base_config,
-        config_overrides={
-            "ui": {},
-            "cli": {
-                "backtest": cli_backtest_overrides,
-                "costs": cli_costs_overrides,
-            },
-            "spyder": {},
-        },
+        config_overrides=_config_overrides_from_args(args),
+        artifact_format=args.artifact_format,
+        stage_cache=(
+            StageCache(args.stage_cache_dir, max_bytes=args.stage_cache_max_mb * 1024**2)
+            if args.stage_cache_dir
+            else None
+        ),
     )
     return 0
 
 
+def _find_bars_snapshot(bars_dir: Path, symbol: str) -> Path | None:
+    for suffix in (".parquet", ".csv"):
+        candidate = bars_dir / f"{symbol}{suffix}"
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def main_portfolio(argv=None) -> int:
+    """Portfolio CLI entry: one run over --symbols with a shared cash ledger."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = build_portfolio_parser().parse_args(argv)
+
+    requested_end, lookback_days = _resolve_window_args(args)
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    if not symbols:
+        raise SystemExit("--symbols must list at least one symbol")
+
+    bars_paths = {}
+    if args.bars_dir:
+        for symbol in symbols:
+            found = _find_bars_snapshot(args.bars_dir, symbol)
+            if found is not None:
+                bars_paths[symbol] = found
+
+    cfg = load_strategy_params_from_ssot(args.strategy_id, args.strategy_version)
+    params = _strategy_params_from_args(args, cfg, requested_end, lookback_days)
+
+    run_portfolio_pipeline(
+        run_id=args.run_id,
+        out_dir=args.out_dir,
+        symbols=symbols,
+        bars_paths=bars_paths,
+        strategy_id=args.strategy_id,
+        strategy_version=args.strategy_version,
+        strategy_params=params,
+        strategy_meta=cfg,
+        compound_enabled=args.compound_enabled,
+        compound_equity_basis=args.compound_equity_basis,
+        initial_cash=args.initial_cash,
+        base_config_path=args.base_config,
+        config_overrides=_config_overrides_from_args(args),
+        max_workers=args.max_workers,
+        artifact_format=args.artifact_format,
+    )
+    return 0
+
+
+def main_sweep(argv=None) -> int:
+    """Sweep CLI entry: run a parameter grid on one snapshot, artifacts for the top-K."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = build_sweep_parser().parse_args(argv)
+
+    requested_end, lookback_days = _resolve_window_args(args)
+    grid = _grid_from_args(args)
+
+    cfg = load_strategy_params_from_ssot(args.strategy_id, args.strategy_version)
+    params = _strategy_params_from_args(args, cfg, requested_end, lookback_days, symbol=args.symbol)
+
+    run_parameter_sweep(
+        run_id=args.run_id,
+        out_dir=args.out_dir,
+        bars_path=args.bars_path,
+        strategy_id=args.strategy_id,
+        strategy_version=args.strategy_version,
+        strategy_params=params,
+        strategy_meta=cfg,
+        grid=grid,
+        compound_enabled=args.compound_enabled,
+        compound_equity_basis=args.compound_equity_basis,
+        initial_cash=args.initial_cash,
+        base_config_path=args.base_config,
+        config_overrides=_config_overrides_from_args(args),
+        max_workers=args.max_workers,
+        top_k=args.top_k,
+        rank_by=args.rank_by,
+        rank_ascending=args.rank_ascending,
+        artifact_format=args.artifact_format,
+    )
+    return 0
+
+
+_SUBCOMMANDS = {
+    "portfolio": main_portfolio,
+    "sweep": main_sweep,
+}
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -146,11 +146,22 @@ def resolve_config(
             )
         execution["intrabar_probe_timeframe"] = "M1"
 
+    fill_engine = execution.get("fill_engine")
+    if fill_engine is not None:
+        allowed_engines = {"pandas", "numpy"}
+        if str(fill_engine) not in allowed_engines:
+            raise ValueError(
+                f"invalid execution.fill_engine: {fill_engine!r} "
+                f"(allowed: {sorted(allowed_engines)})"
+            )
+        execution["fill_engine"] = str(fill_engine)
+
     allowed_execution = {
         "allow_same_bar_exit",
         "same_bar_resolution_mode",
         "intrabar_probe_timeframe",
         "intrabar_probe_enabled",
+        "fill_engine",
     }
     for key in execution.keys():
         if key not in allowed_execution:
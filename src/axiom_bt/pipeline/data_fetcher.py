@@ -1,21 +1,37 @@
-"""Data fetcher wrapper for pipeline bars snapshots (Option B consumer-only)."""
+"""Data fetcher wrapper for pipeline bars snapshots (Option B consumer-only).
+
+Intraday slices live in a content-addressed snapshot store (default
+``<trading_artifacts_root>/bars_snapshots``), keyed by the derived source
+file fingerprint (path, size, mtime), symbol, timeframe and window. A slice
+is written and hashed once; run directories hardlink it (copy across
+filesystems) together with its hash sidecar. Writing an entry drops the
+entries cut from an earlier version of the same source file, so the store
+holds one source generation per symbol/timeframe (run directories keep their
+hardlinks).
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import math
+import os
 import shutil
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from core.settings.runtime_config import (
     RuntimeConfigError,
     get_marketdata_data_root,
+    get_trading_artifacts_root,
 )
 from axiom_bt.fs import DATA_D1
-from .data_prep import _sha256_file
+from .data_prep import _hash_sidecar, _sha256_file, file_sha256, write_hash_sidecar
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +59,108 @@ def _timeframe_minutes(timeframe: str) -> int:
     raise DataFetcherError(f"unsupported timeframe '{timeframe}' (expected M1/M5/M15/H1/D1)")
 
 
+SNAPSHOT_STORE_VERSION = 1
+
+
+def _default_snapshot_root() -> Optional[Path]:
+    try:
+        return get_trading_artifacts_root() / "bars_snapshots"
+    except RuntimeConfigError:
+        return None
+
+
+def _source_fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _source_record(path: Path) -> Dict:
+    stat = path.stat()
+    return {"path": str(path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _source_sidecar(stored: Path) -> Path:
+    return stored.with_name(f"{stored.stem}.source.json")
+
+
+def _prune_superseded(stored: Path, source: Path) -> List[Path]:
+    """Drop store entries next to ``stored`` cut from an older version of ``source``."""
+    current = _source_record(source)
+    _source_sidecar(stored).write_text(json.dumps(current))
+    removed: List[Path] = []
+    for sidecar in stored.parent.glob("*.source.json"):
+        try:
+            recorded = json.loads(sidecar.read_text())
+        except (OSError, ValueError):
+            continue
+        if recorded.get("path") != current["path"] or recorded == current:
+            continue
+        entry = sidecar.with_name(sidecar.name[: -len(".source.json")] + ".parquet")
+        for path in (entry, _hash_sidecar(entry), sidecar):
+            path.unlink(missing_ok=True)
+        removed.append(entry)
+    if removed:
+        logger.info("actions: bars_snapshot_store_pruned dir=%s entries=%d", stored.parent, len(removed))
+    return removed
+
+
+def _snapshot_key(source: Path, symbol: str, tf: str, start: pd.Timestamp, end: pd.Timestamp) -> str:
+    payload = json.dumps(
+        {
+            "version": SNAPSHOT_STORE_VERSION,
+            "source": _source_fingerprint(source),
+            "symbol": symbol.upper(),
+            "timeframe": tf,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _window_filters(path: Path, start: pd.Timestamp, end: pd.Timestamp) -> Optional[list]:
+    """Parquet predicate on the time column so only overlapping row groups decode."""
+    schema = pq.read_schema(path)
+    if "ts" in schema.names and pa.types.is_integer(schema.field("ts").type):
+        return [("ts", ">=", math.floor(start.timestamp())), ("ts", "<=", math.ceil(end.timestamp()))]
+    pandas_meta = json.loads((schema.metadata or {}).get(b"pandas", b"{}") or b"{}")
+    candidates = ["timestamp"] + [c for c in pandas_meta.get("index_columns", []) if isinstance(c, str)]
+    for name in candidates:
+        if name not in schema.names or not pa.types.is_timestamp(schema.field(name).type):
+            continue
+        if schema.field(name).type.tz is None:
+            return [(name, ">=", start.tz_localize(None)), (name, "<=", end.tz_localize(None))]
+        return [(name, ">=", start), (name, "<=", end)]
+    return None
+
+
+def _read_window(path: Path, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    filters = _window_filters(path, start, end)
+    if filters is None:
+        return pd.read_parquet(path)
+    return pq.read_table(path, filters=filters).to_pandas()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _write_snapshot(frame: pd.DataFrame, target: Path) -> str:
+    """Atomically write ``frame`` to ``target``; hash it once into a sidecar."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    frame.to_parquet(tmp)
+    digest = _sha256_file(tmp)
+    os.replace(tmp, target)
+    write_hash_sidecar(target, digest)
+    return digest
+
+
 def ensure_and_snapshot_bars(
     *,
     run_dir: Path,
@@ -57,6 +175,7 @@ def ensure_and_snapshot_bars(
     force: bool = False,
     auto_fill_gaps: bool = True,
     allow_legacy_http_backfill: bool = False,
+    snapshot_root: Optional[Path] = None,
 ) -> Dict[str, str]:
     """Load producer-built bars and write per-run snapshots.
 
@@ -64,6 +183,10 @@ def ensure_and_snapshot_bars(
     - No HTTP fetch
     - No local gap/backfill logic
     - Producer must have materialized derived timeframe parquet already
+
+    Intraday slices are taken from the snapshot store under ``snapshot_root``
+    (default: trading artifacts root; without one, the slice is written into
+    the run directory directly).
     """
     del use_sample, force, auto_fill_gaps, allow_legacy_http_backfill
 
@@ -127,7 +250,29 @@ def ensure_and_snapshot_bars(
 
     logger.info("actions: pipeline_option_b_source symbol=%s source=%s", symbol, derived_source)
 
-    df = pd.read_parquet(derived_source)
+    if snapshot_root is None:
+        snapshot_root = _default_snapshot_root()
+    if snapshot_root is not None:
+        store_key = _snapshot_key(derived_source, symbol, tf_upper, effective_start, end_ts)
+        stored = snapshot_root / symbol.upper() / tf_upper / f"{store_key}.parquet"
+    else:
+        stored = bars_dir / f"bars_exec_{tf_upper}_rth.parquet"
+    meta = {
+        "market_tz": market_tz,
+        "timeframe": tf_upper,
+        "warmup_days": warmup_days_calc,
+        "lookback_days": lookback_days,
+        "session_mode": session_mode,
+        "rth_only": session_mode == "rth",
+        "option_b_source": str(derived_source),
+        "consumer_only": True,
+        "snapshot_store_path": str(stored) if snapshot_root is not None else None,
+    }
+    if snapshot_root is not None and stored.exists():
+        logger.info("actions: bars_snapshot_store_hit symbol=%s tf=%s path=%s", symbol, tf_upper, stored)
+        return _link_snapshot(stored, file_sha256(stored), bars_dir=bars_dir, symbol=symbol, tf_upper=tf_upper, meta=meta)
+
+    df = _read_window(derived_source, effective_start, end_ts)
     if "ts" in df.columns:
         idx = pd.to_datetime(df["ts"], unit="s", utc=True, errors="coerce")
         df = df.drop(columns=[c for c in ["ts", "timestamp"] if c in df.columns])
@@ -161,35 +306,41 @@ def ensure_and_snapshot_bars(
         len(df_filtered),
     )
 
+    bars_hash = _write_snapshot(df_filtered, stored)
+    if snapshot_root is not None:
+        _prune_superseded(stored, derived_source)
+    return _link_snapshot(stored, bars_hash, bars_dir=bars_dir, symbol=symbol, tf_upper=tf_upper, meta=meta)
+
+
+def _link_snapshot(
+    stored: Path,
+    bars_hash: str,
+    *,
+    bars_dir: Path,
+    symbol: str,
+    tf_upper: str,
+    meta: Dict,
+) -> Dict[str, str]:
+    """Expose a stored slice as the run's exec/signal bars (hardlinks + hash sidecar)."""
     target_exec = bars_dir / f"bars_exec_{tf_upper}_rth.parquet"
     signal_target = target_exec if tf_upper in {"M1", "H1"} else bars_dir / f"bars_signal_{tf_upper}_rth.parquet"
-    df_filtered.to_parquet(target_exec)
-    if signal_target != target_exec:
-        df_filtered.to_parquet(signal_target)
+    for target in {target_exec, signal_target}:
+        if target != stored:
+            _link_or_copy(stored, target)
+        write_hash_sidecar(target, bars_hash)
 
-    bars_hash = _sha256_file(target_exec)
-    meta = {
-        "market_tz": market_tz,
-        "timeframe": tf_upper,
-        "warmup_days": warmup_days_calc,
-        "lookback_days": lookback_days,
-        "exec_bars": target_exec.name,
-        "signal_bars": signal_target.name if signal_target else None,
-        "session_mode": session_mode,
-        "rth_only": session_mode == "rth",
-        "option_b_source": str(derived_source),
-        "consumer_only": True,
-    }
+    meta = {**meta, "exec_bars": target_exec.name, "signal_bars": signal_target.name}
     meta_path = bars_dir / "bars_slice_meta.json"
     meta_path.write_text(json.dumps(meta, indent=2))
 
     logger.info(
-        "actions: pipeline_bars_snapshot_intraday symbol=%s tf=%s exec=%s signal=%s hash=%s",
+        "actions: pipeline_bars_snapshot_intraday symbol=%s tf=%s exec=%s signal=%s hash=%s store=%s",
         symbol,
         tf_upper,
         target_exec,
         signal_target,
         bars_hash,
+        meta.get("snapshot_store_path"),
     )
 
     return {
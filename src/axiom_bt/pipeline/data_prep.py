@@ -6,6 +6,7 @@ Deterministic, read-only: never mutates source data.
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import Tuple
@@ -27,6 +28,36 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
+def _hash_sidecar(path: Path) -> Path:
+    return path.with_name(f"{path.name}.sha256.json")
+
+
+def write_hash_sidecar(path: Path, digest: str) -> None:
+    """Record ``digest`` for ``path`` next to it (valid while size/mtime match)."""
+    stat = path.stat()
+    _hash_sidecar(path).write_text(
+        json.dumps({"sha256": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns})
+    )
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, reusing its hash sidecar when size and mtime still match.
+
+    Hardlinks share size/mtime with the store entry they point to, so run
+    directories that link a stored snapshot never re-hash it.
+    """
+    sidecar = _hash_sidecar(path)
+    if sidecar.exists():
+        try:
+            recorded = json.loads(sidecar.read_text())
+            stat = path.stat()
+            if recorded["size"] == stat.st_size and recorded["mtime_ns"] == stat.st_mtime_ns:
+                return str(recorded["sha256"])
+        except (OSError, ValueError, KeyError):
+            pass
+    return _sha256_file(path)
+
+
 def load_bars_snapshot(path: Path) -> Tuple[pd.DataFrame, str]:
     """Load OHLCV bars snapshot (csv or parquet) and return frame + hash.
 
@@ -70,6 +101,6 @@ def load_bars_snapshot(path: Path) -> Tuple[pd.DataFrame, str]:
     bars["timestamp"] = pd.to_datetime(bars["timestamp"], utc=True, errors="coerce")
     bars = bars.sort_values("timestamp").reset_index(drop=True)
 
-    bars_hash = _sha256_file(path)
+    bars_hash = file_sha256(path)
     logger.info("actions: bars_snapshot_loaded path=%s hash=%s rows=%d", path, bars_hash, len(bars))
     return bars, bars_hash
@@ -5,10 +5,12 @@ Keeps fills immutable; sizing can vary by mode.
 
 from __future__ import annotations
 
+import heapq
 import logging
 from dataclasses import dataclass
-from typing import Tuple
+from typing import List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
 from trade.session_windows import session_end_for_day
@@ -39,6 +41,61 @@ def _apply_sizing(fills: pd.DataFrame, initial_cash: float, compound_enabled: bo
     return fills
 
 
+def _compound_qtys(
+    entry_prices: Sequence[float],
+    exit_prices: Sequence[float],
+    is_buy: Sequence[bool],
+    initial_cash: float,
+    commission_bps: float,
+    slippage_bps: float,
+    entry_ns: Optional[Sequence[int]] = None,
+    exit_ns: Optional[Sequence[int]] = None,
+) -> List[int]:
+    """Event-ordered cash ledger over trades sorted by entry time.
+
+    At entry: qty = max(floor(free_cash / entry_price), 1) and qty * entry_price
+    is reserved; at exit the reservation is released and the net PnL
+    (slippage-adjusted prices minus commission) is realized. Exits at or
+    before an entry's timestamp are realized first, so overlapping trades
+    (multi-symbol runs) never size from cash held by open positions or from
+    PnL of trades that have not exited yet. Without timestamps every trade
+    exits before the next entry. Inputs are plain float/bool sequences so
+    the loop does no pandas work; arithmetic order matches the per-trade PnL
+    columns computed afterwards.
+    """
+    n = len(entry_prices)
+    if entry_ns is None or exit_ns is None:
+        entry_ns = exit_ns = range(n)
+    slip = slippage_bps / 1e4
+    comm = commission_bps / 1e4
+    cash = initial_cash
+    reserved = 0.0
+    open_trades: List[Tuple[int, int, float, float]] = []  # heap of (exit_ns, idx, reserve, net pnl)
+    qtys: List[int] = []
+    for idx, (entry_price, exit_price, buy) in enumerate(zip(entry_prices, exit_prices, is_buy)):
+        while open_trades and open_trades[0][0] <= entry_ns[idx]:
+            _, _, reserve, pnl = heapq.heappop(open_trades)
+            reserved -= reserve
+            cash += pnl
+        if not open_trades:
+            reserved = 0.0  # no float residue once flat
+        qty = int(max((cash - reserved) // entry_price, 1))
+        qtys.append(qty)
+        if buy:
+            entry_exec = entry_price * (1.0 + slip)
+            exit_exec = exit_price * (1.0 - slip)
+            pnl_exec_no_fees = (exit_exec - entry_exec) * qty
+        else:
+            entry_exec = entry_price * (1.0 - slip)
+            exit_exec = exit_price * (1.0 + slip)
+            pnl_exec_no_fees = (entry_exec - exit_exec) * qty
+        reserve = qty * entry_price
+        reserved += reserve
+        pnl = pnl_exec_no_fees - abs(qty) * (entry_exec + exit_exec) * comm
+        heapq.heappush(open_trades, (exit_ns[idx], idx, reserve, pnl))
+    return qtys
+
+
 def _build_trades(
     fills: pd.DataFrame,
     events_intent: pd.DataFrame,
@@ -51,15 +108,16 @@ def _build_trades(
     session_filter: list[str] | None,
     commission_bps: float,
     slippage_bps: float,
+    event_ledger: bool = False,
 ) -> pd.DataFrame:
     """Build trades from fills with proper compound sizing.
     
     CRITICAL FIX FOR COMPOUND SIZING BUG:
     - Track cash through each completed trade
     - Start with initial_cash
-    - For each trade: calculate qty = floor(cash / entry_price)
-    - After trade: cash += PnL
-    - Next trade uses updated cash for sizing
+    - For each trade: calculate qty = floor(free cash / entry_price), reserve its notional
+    - At exit_ts: release the reservation, cash += PnL
+    - Later entries size from cash not held by open trades
     """
     fills = fills.copy()
     fills["fill_ts"] = pd.to_datetime(fills["fill_ts"], utc=True)
@@ -145,8 +203,17 @@ def _build_trades(
         ).fillna("session_end")
 
     if merged["exit_price"].isna().any():
-        bar_idx = bars.set_index("timestamp")["close"]
-        merged["exit_price"] = merged["exit_ts"].map(bar_idx)
+        if "symbol" in bars.columns and bars["symbol"].nunique() > 1:
+            # Portfolio runs pass stacked multi-symbol bars: key closes by (symbol, ts).
+            symbol_col = "symbol_x" if "symbol_x" in merged.columns else "symbol"
+            close_by_key = bars.set_index(["symbol", "timestamp"])["close"]
+            keys = pd.MultiIndex.from_arrays(
+                [merged[symbol_col], pd.to_datetime(merged["exit_ts"], utc=True)]
+            )
+            merged["exit_price"] = close_by_key.reindex(keys).to_numpy()
+        else:
+            bar_idx = bars.set_index("timestamp")["close"]
+            merged["exit_price"] = merged["exit_ts"].map(bar_idx)
     if merged["exit_price"].isna().any():
         raise ValueError("exit_price could not be mapped for one or more exit_ts values")
 
@@ -156,38 +223,20 @@ def _build_trades(
     if compound_enabled:
         # CRITICAL: Sort by entry timestamp to process in chronological order!
         merged = merged.sort_values("entry_ts").reset_index(drop=True)
-        
-        cash = initial_cash
-        qtys = []
-        
-        for idx, row in merged.iterrows():
-            # Calculate position size based on CURRENT available cash
-            qty = int(max(cash // row["entry_price"], 1))
-            qtys.append(qty)
-            
-            # Calculate net PnL for this trade (includes slippage + commissions)
-            side = str(row["side"]).upper()
-            entry_price = float(row["entry_price"])
-            exit_price = float(row["exit_price"])
-
-            entry_exec = entry_price * (1.0 + slippage_bps / 1e4) if side == "BUY" else entry_price * (1.0 - slippage_bps / 1e4)
-            exit_exec = exit_price * (1.0 - slippage_bps / 1e4) if side == "BUY" else exit_price * (1.0 + slippage_bps / 1e4)
-
-            gross_pnl = (exit_price - entry_price) * qty if side == "BUY" else (entry_price - exit_price) * qty
-            pnl_exec_no_fees = (exit_exec - entry_exec) * qty if side == "BUY" else (entry_exec - exit_exec) * qty
-            commission_total = abs(qty) * (entry_exec + exit_exec) * (commission_bps / 1e4)
-            pnl = pnl_exec_no_fees - commission_total
-
-            # Update cash with net PnL for next position
-            # This makes cash available for next position
-            cash += pnl
-            
-            logger.debug(
-                f"Trade {idx}: {row['side']} qty={qty} @ {row['entry_price']:.2f} "
-                f"→ {row['exit_price']:.2f}, pnl={pnl:.2f}, cash_after={cash:.2f}"
-            )
-        
-        merged["qty"] = qtys
+
+        # Each qty depends on cash after all earlier exits, so the ledger
+        # stays sequential; it runs over pre-extracted arrays.
+        merged["qty"] = _compound_qtys(
+            merged["entry_price"].to_numpy(dtype="float64").tolist(),
+            merged["exit_price"].to_numpy(dtype="float64").tolist(),
+            (merged["side"].astype(str).str.upper() == "BUY").tolist(),
+            initial_cash,
+            commission_bps,
+            slippage_bps,
+            entry_ns=_utc_ns(merged["entry_ts"]).tolist() if event_ledger else None,
+            exit_ns=_utc_ns(merged["exit_ts"]).tolist() if event_ledger else None,
+        )
+        logger.debug("actions: compound_sizing_done trades=%d", len(merged))
     else:
         # Fixed sizing: qty=1 for all trades
         merged["qty"] = 1.0
@@ -244,11 +293,6 @@ def _build_trades(
     return merged[cols]
 
 
-def _opposite_side(side: str) -> str:
-    side_up = str(side).upper()
-    return "SELL" if side_up == "BUY" else "BUY"
-
-
 def _build_fill_audit(
     fills: pd.DataFrame,
     trades: pd.DataFrame,
@@ -273,82 +317,122 @@ def _build_fill_audit(
             audited[col] = default
         return audited
 
-    trade_by_tpl = trades.set_index("template_id")
-    entry_reasons = {"signal_fill"}
-    exit_reasons = {"stop_loss", "take_profit", "session_end"}
-
-    fill_side: list = []
-    fill_qty: list = []
-    ideal: list = []
-    exec_price: list = []
-    commission_cost: list = []
-    slippage_cost: list = []
-    total_cost: list = []
-    eff_comm_bps: list = []
-    eff_slip_bps: list = []
-
-    for _, row in audited.iterrows():
-        template_id = row.get("template_id")
-        reason = row.get("reason")
-        trade = trade_by_tpl.loc[template_id] if template_id in trade_by_tpl.index else None
-
-        if trade is None or pd.isna(template_id):
-            raw_price = row.get("fill_price")
-            fill_side.append(row.get("side"))
-            fill_qty.append(0.0)
-            ideal.append(raw_price)
-            exec_price.append(raw_price)
-            commission_cost.append(0.0)
-            slippage_cost.append(0.0)
-            total_cost.append(0.0)
-            eff_comm_bps.append(0.0)
-            eff_slip_bps.append(0.0)
-            continue
-
-        qty = float(trade["qty"])
-        trade_side = str(trade["side"]).upper()
-        if reason in entry_reasons:
-            f_side = trade_side
-            p_ideal = float(trade["entry_price"])
-            p_exec = float(trade["entry_exec_price"])
-        elif reason in exit_reasons:
-            f_side = _opposite_side(trade_side)
-            p_ideal = float(trade["exit_price"])
-            p_exec = float(trade["exit_exec_price"])
-        else:
-            raw_price = row.get("fill_price")
-            f_side = row.get("side")
-            p_ideal = float(raw_price) if pd.notna(raw_price) else float("nan")
-            p_exec = p_ideal
-            qty = 0.0
-
-        comm = abs(qty) * abs(p_exec) * (commission_bps / 1e4)
-        slip = abs(qty) * abs(p_exec - p_ideal)
-        total = comm + slip
-
-        fill_side.append(f_side)
-        fill_qty.append(qty)
-        ideal.append(p_ideal)
-        exec_price.append(p_exec)
-        commission_cost.append(comm)
-        slippage_cost.append(slip)
-        total_cost.append(total)
-        eff_comm_bps.append(float(commission_bps))
-        eff_slip_bps.append(float(slippage_bps))
-
-    audited["fill_side"] = fill_side
-    audited["fill_qty"] = fill_qty
-    audited["fill_price_ideal"] = ideal
-    audited["fill_price_exec"] = exec_price
-    audited["commission_cost"] = commission_cost
-    audited["slippage_cost"] = slippage_cost
-    audited["total_cost"] = total_cost
-    audited["effective_commission_bps"] = eff_comm_bps
-    audited["effective_slippage_bps"] = eff_slip_bps
+    n = len(audited)
+
+    def _column(name: str) -> pd.Series:
+        if name in audited.columns:
+            return audited[name].reset_index(drop=True)
+        return pd.Series([None] * n, dtype=object)
+
+    template_id = _column("template_id")
+    reason = _column("reason")
+    raw_price = _column("fill_price").to_numpy(dtype=object)
+    row_side = _column("side").to_numpy(dtype=object)
+
+    # One left join of fills against trades (template_id is unique per trade).
+    trade_cols = ["qty", "side", "entry_price", "entry_exec_price", "exit_price", "exit_exec_price"]
+    joined = pd.DataFrame({"template_id": template_id}).merge(
+        trades[["template_id", *trade_cols]].rename(columns={c: f"trade_{c}" for c in trade_cols}),
+        on="template_id",
+        how="left",
+        indicator=True,
+        validate="many_to_one",
+    )
+    matched = (joined["_merge"] == "both").to_numpy() & template_id.notna().to_numpy()
+    is_entry = matched & reason.isin(["signal_fill"]).to_numpy()
+    is_exit = matched & ~is_entry & reason.isin(["stop_loss", "take_profit", "session_end"]).to_numpy()
+    is_other = matched & ~is_entry & ~is_exit
+    sized = is_entry | is_exit
+
+    trade_side = joined["trade_side"].astype(str).str.upper().to_numpy(dtype=object)
+    fill_side = row_side.copy()
+    fill_side[is_entry] = trade_side[is_entry]
+    fill_side[is_exit] = np.where(trade_side[is_exit] == "BUY", "SELL", "BUY")
+
+    qty = np.zeros(n, dtype="float64")
+    qty[sized] = joined["trade_qty"].to_numpy(dtype="float64")[sized]
+
+    # Matched fills: ideal/exec prices as floats; unmatched fills keep the raw price.
+    p_ideal = np.full(n, np.nan)
+    p_exec = np.full(n, np.nan)
+    for mask, ideal_col, exec_col in (
+        (is_entry, "trade_entry_price", "trade_entry_exec_price"),
+        (is_exit, "trade_exit_price", "trade_exit_exec_price"),
+    ):
+        p_ideal[mask] = joined[ideal_col].to_numpy(dtype="float64")[mask]
+        p_exec[mask] = joined[exec_col].to_numpy(dtype="float64")[mask]
+    other_price = pd.to_numeric(pd.Series(raw_price[is_other], dtype=object), errors="coerce")
+    p_ideal[is_other] = other_price.to_numpy(dtype="float64", na_value=np.nan)
+    p_exec[is_other] = p_ideal[is_other]
+
+    comm = np.zeros(n, dtype="float64")
+    slip = np.zeros(n, dtype="float64")
+    comm[matched] = np.abs(qty[matched]) * np.abs(p_exec[matched]) * (commission_bps / 1e4)
+    slip[matched] = np.abs(qty[matched]) * np.abs(p_exec[matched] - p_ideal[matched])
+
+    ideal = raw_price.copy()
+    ideal[matched] = p_ideal[matched]
+    exec_price = raw_price.copy()
+    exec_price[matched] = p_exec[matched]
+
+    audited["fill_side"] = fill_side.tolist()
+    audited["fill_qty"] = qty
+    audited["fill_price_ideal"] = ideal.tolist()
+    audited["fill_price_exec"] = exec_price.tolist()
+    audited["commission_cost"] = comm
+    audited["slippage_cost"] = slip
+    audited["total_cost"] = comm + slip
+    audited["effective_commission_bps"] = np.where(matched, float(commission_bps), 0.0)
+    audited["effective_slippage_bps"] = np.where(matched, float(slippage_bps), 0.0)
     audited["price_semantics"] = "exec_price_adjustment"
     return audited
 
 
+def _utc_ns(values: pd.Series) -> np.ndarray:
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=True)).astype("datetime64[ns, UTC]").asi8
+
+
+_EVENT_LEDGER_COLUMNS = ["timestamp", "event", "template_id", "symbol", "pnl", "cash", "reserved", "available", "seq"]
+
+
+def _ledger_from_trades(trades: pd.DataFrame, initial_cash: float) -> pd.DataFrame:
+    """Event-ordered cash ledger: one ENTRY and one EXIT row per trade.
+
+    ENTRY reserves qty * entry_price, EXIT releases it and realizes the net
+    PnL at exit_ts. Exits sort before entries at the same timestamp (the
+    order _compound_qtys sizes in). ``cash`` is the realized balance,
+    ``available`` the part not held by open trades.
+    """
+    n = len(trades)
+    notional = (trades["qty"].abs() * trades["entry_price"]).to_numpy(dtype="float64")
+    pnl = trades["pnl"].to_numpy(dtype="float64")
+    events = pd.DataFrame(
+        {
+            "ns": np.concatenate([_utc_ns(trades["entry_ts"]), _utc_ns(trades["exit_ts"])]),
+            "kind": np.repeat([1, 0], n),  # exits first on ties
+            "trade": np.tile(np.arange(n), 2),
+            "reserve_delta": np.concatenate([notional, -notional]),
+            "pnl": np.concatenate([np.zeros(n), pnl]),
+        }
+    ).sort_values(["ns", "kind", "trade"], kind="mergesort", ignore_index=True)
+
+    trade_idx = events["trade"].to_numpy()
+    ledger = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(events["ns"], utc=True),
+            "event": np.where(events["kind"] == 1, "ENTRY", "EXIT"),
+            "template_id": trades["template_id"].to_numpy(dtype=object)[trade_idx],
+            "symbol": trades["symbol"].to_numpy(dtype=object)[trade_idx],
+            "pnl": events["pnl"],
+            "cash": float(initial_cash) + events["pnl"].cumsum(),
+            "reserved": events["reserve_delta"].cumsum().clip(lower=0.0),
+        }
+    )
+    ledger["available"] = ledger["cash"] - ledger["reserved"]
+    ledger["seq"] = ledger.index
+    return ledger
+
+
 def _equity_from_trades(trades: pd.DataFrame, initial_cash: float) -> pd.DataFrame:
     if trades.empty:
         return pd.DataFrame(columns=["ts", "equity"])
@@ -371,10 +455,17 @@ def execute(
     session_filter: list[str] | None = None,
     commission_bps: float = 0.0,
     slippage_bps: float = 0.0,
+    event_ledger: bool = False,
 ) -> ExecutionArtifacts:
     """Apply sizing and produce trades/ledger/equity.
 
     Fills remain identical; sizing adjusts qty in _build_trades(), then trades/equity/ledger are derived.
+
+    With ``event_ledger`` (portfolio runs) compound sizing reserves cash for
+    open trades and realizes PnL at exit_ts, and portfolio_ledger is the
+    ENTRY/EXIT event ledger from _ledger_from_trades(). Otherwise each trade
+    compounds from the cash after the previous one and portfolio_ledger is
+    the equity curve (timestamp, cash, seq).
     """
     if fills.empty:
         logger.info("actions: execution_skipped_empty_fills")
@@ -406,7 +497,9 @@ def execute(
             ]
         )
         empty_equity = pd.DataFrame(columns=["ts", "equity"])
-        empty_ledger = pd.DataFrame(columns=["timestamp", "cash", "seq"])
+        empty_ledger = pd.DataFrame(
+            columns=_EVENT_LEDGER_COLUMNS if event_ledger else ["timestamp", "cash", "seq"]
+        )
         return ExecutionArtifacts(
             fills=empty_fills,
             trades=empty_trades,
@@ -426,6 +519,7 @@ def execute(
         session_filter=session_filter,
         commission_bps=commission_bps,
         slippage_bps=slippage_bps,
+        event_ledger=event_ledger,
     )
     audited_fills = _build_fill_audit(
         sized_fills,
@@ -435,8 +529,11 @@ def execute(
     )
 
     equity_curve = _equity_from_trades(trades, initial_cash)
-    ledger = equity_curve.rename(columns={"ts": "timestamp", "equity": "cash"}).reset_index(drop=True)
-    ledger["seq"] = ledger.index
+    if event_ledger:
+        ledger = _ledger_from_trades(trades, initial_cash)
+    else:
+        ledger = equity_curve.rename(columns={"ts": "timestamp", "equity": "cash"}).reset_index(drop=True)
+        ledger["seq"] = ledger.index
     logger.info(
         "actions: execution_complete trades=%d compound=%s", len(trades), compound_enabled
     )
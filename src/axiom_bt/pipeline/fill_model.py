@@ -5,17 +5,20 @@ Produces fills from intent + bars; fill timestamp/price/reason are defined here
 
 from __future__ import annotations
 
-import hashlib
 import logging
 from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
 import pandas as pd
 
+from axiom_bt.artifacts.frame_hash import hash_frame
 from trade.session_windows import session_end_for_day
 
 logger = logging.getLogger(__name__)
 
+FILL_ENGINES = ("pandas", "numpy")
+
 
 class FillModelError(ValueError):
     """Raised when fills cannot be generated."""
@@ -28,9 +31,44 @@ class FillArtifacts:
     gap_stats: Dict[str, float | int] | None = None
 
 
-def _hash_dataframe(df: pd.DataFrame) -> str:
-    data = df.to_csv(index=False).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
+@dataclass(frozen=True)
+class _BarArrays:
+    """Contiguous column arrays for the numpy fill engine.
+
+    ``ts`` holds UTC epoch nanoseconds; NaT rows (sorted last) are excluded
+    from ``n_valid`` so searchsorted only sees the monotonic prefix.
+    """
+
+    ts: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    n_valid: int
+
+    @classmethod
+    def from_bars(cls, bars: pd.DataFrame) -> "_BarArrays":
+        ts = bars["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+        n_valid = int(bars["timestamp"].notna().sum())
+        return cls(
+            ts=np.ascontiguousarray(ts),
+            high=np.ascontiguousarray(bars["high"].to_numpy(dtype="float64")),
+            low=np.ascontiguousarray(bars["low"].to_numpy(dtype="float64")),
+            n_valid=n_valid,
+        )
+
+    def window(self, start_ts: pd.Timestamp, end_ts: pd.Timestamp, *, include_start: bool = True) -> Tuple[int, int]:
+        """Return [lo, hi) positions for start <= ts <= end (start < ts if not include_start)."""
+        valid = self.ts[: self.n_valid]
+        lo = int(np.searchsorted(valid, start_ts.value, side="left" if include_start else "right"))
+        hi = int(np.searchsorted(valid, end_ts.value, side="right"))
+        return lo, max(lo, hi)
+
+
+def _first_true(mask: np.ndarray) -> int:
+    """Index of the first True in mask, or -1."""
+    if mask.size == 0:
+        return -1
+    idx = int(np.argmax(mask))
+    return idx if mask[idx] else -1
 
 
 def _entry_fill_stop_cross(
@@ -153,6 +191,7 @@ def generate_fills(
     allow_same_bar_exit: bool = False,
     same_bar_resolution_mode: str = "no_fill",
     intrabar_probe_bars_m1: Optional[pd.DataFrame] = None,
+    fill_engine: str = "pandas",
 ) -> FillArtifacts:
     """Generate deterministic fills by trigger-scanning bars from signal_ts.
 
@@ -160,12 +199,20 @@ def generate_fills(
     - At most one entry fill per group.
     - On first fill, cancel the other leg(s) with reason=order_cancelled_oco.
     - If both legs trigger in the same bar => no fills, emit order_ambiguous_no_fill.
+
+    fill_engine selects the trigger/exit scanner: "pandas" (row scan, reference)
+    or "numpy" (searchsorted windows + first-true over column arrays). Both
+    produce identical fills and fills_hash.
     """
+    if fill_engine not in FILL_ENGINES:
+        raise FillModelError(
+            f"invalid fill_engine: {fill_engine!r} (allowed: {list(FILL_ENGINES)})"
+        )
     if events_intent.empty:
         fills = pd.DataFrame(
             columns=["template_id", "symbol", "fill_ts", "fill_price", "reason"]
         )
-        fills_hash = _hash_dataframe(fills)
+        fills_hash = hash_frame(fills)
         logger.warning("actions: fills_empty_intent fills_hash=%s", fills_hash)
         return FillArtifacts(fills=fills, fills_hash=fills_hash, gap_stats=None)
     if bars.empty:
@@ -176,6 +223,7 @@ def generate_fills(
     bars = bars.sort_values("timestamp").reset_index(drop=True)
     m1_probe = _coerce_bars_with_timestamp(intrabar_probe_bars_m1)
     bar_idx = bars.set_index("timestamp")
+    arrays = _BarArrays.from_bars(bars) if fill_engine == "numpy" else None
     rows: List[Dict] = []
     session_end_snap_count = 0
     same_bar_entry_minute_ambiguous_count = 0
@@ -204,6 +252,15 @@ def generate_fills(
         entry_px = intent_row.get("entry_price")
         if pd.isna(entry_px):
             return None
+        if arrays is not None:
+            lo, hi = arrays.window(start_ts, end_ts)
+            if side == "BUY":
+                hit = _first_true(arrays.high[lo:hi] >= float(entry_px))
+            else:  # SELL
+                hit = _first_true(arrays.low[lo:hi] <= float(entry_px))
+            if hit < 0:
+                return None
+            return bars.iloc[lo + hit]
         window = bars[(bars["timestamp"] >= start_ts) & (bars["timestamp"] <= end_ts)]
         if window.empty:
             return None
@@ -362,7 +419,17 @@ def generate_fills(
                         "reason": "stop_loss",
                     }
                 elif same_bar_resolution_mode == "m1_probe_then_no_fill":
-                    next_rows = bars[bars["timestamp"] > trigger_bar["timestamp"]]["timestamp"]
+                    if arrays is not None:
+                        next_pos = int(
+                            np.searchsorted(
+                                arrays.ts[: arrays.n_valid],
+                                trigger_bar["timestamp"].value,
+                                side="right",
+                            )
+                        )
+                        next_rows = bars["timestamp"].iloc[next_pos : arrays.n_valid]
+                    else:
+                        next_rows = bars[bars["timestamp"] > trigger_bar["timestamp"]]["timestamp"]
                     trigger_end = next_rows.iloc[0] if not next_rows.empty else trigger_bar["timestamp"] + pd.Timedelta(minutes=1)
                     if m1_probe is None:
                         same_bar_result = "missing_m1"
@@ -451,54 +518,77 @@ def generate_fills(
             same_bar_exit_row["reason"] if same_bar_exit_row else "next_bar_scan",
         )
         valid_to = _valid_to_for(intent, signal_ts)
-        if allow_same_bar_exit:
-            scan = bars[
-                (bars["timestamp"] >= trigger_bar["timestamp"])
-                & (bars["timestamp"] <= valid_to)
-            ]
-        else:
-            scan = bars[
-                (bars["timestamp"] > trigger_bar["timestamp"])
-                & (bars["timestamp"] <= valid_to)
-            ]
         exit_row = same_bar_exit_row
-        for _, bar_row in scan.iterrows():
-            if exit_row is not None:
-                break
-            bar_ts = bar_row["timestamp"]
-            if side == "BUY":
-                stop_hit = float(bar_row["low"]) <= stop_price_f
-                tp_hit = float(bar_row["high"]) >= tp_price_f
-            else:  # SELL
-                stop_hit = float(bar_row["high"]) >= stop_price_f
-                tp_hit = float(bar_row["low"]) <= tp_price_f
-            if stop_hit and tp_hit:
-                exit_row = {
-                    "template_id": intent["template_id"],
-                    "symbol": intent.get("symbol", "UNKNOWN"),
-                    "fill_ts": bar_ts,
-                    "fill_price": stop_price_f,
-                    "reason": "stop_loss",
-                }
-                break
-            if stop_hit:
-                exit_row = {
-                    "template_id": intent["template_id"],
-                    "symbol": intent.get("symbol", "UNKNOWN"),
-                    "fill_ts": bar_ts,
-                    "fill_price": stop_price_f,
-                    "reason": "stop_loss",
-                }
-                break
-            if tp_hit:
-                exit_row = {
-                    "template_id": intent["template_id"],
-                    "symbol": intent.get("symbol", "UNKNOWN"),
-                    "fill_ts": bar_ts,
-                    "fill_price": tp_price_f,
-                    "reason": "take_profit",
-                }
-                break
+        if arrays is not None:
+            if exit_row is None:
+                lo, hi = arrays.window(
+                    trigger_bar["timestamp"], valid_to, include_start=allow_same_bar_exit
+                )
+                if side == "BUY":
+                    stop_mask = arrays.low[lo:hi] <= stop_price_f
+                    tp_mask = arrays.high[lo:hi] >= tp_price_f
+                else:  # SELL
+                    stop_mask = arrays.high[lo:hi] >= stop_price_f
+                    tp_mask = arrays.low[lo:hi] <= tp_price_f
+                hit = _first_true(stop_mask | tp_mask)
+                if hit >= 0:
+                    # Stop wins when both levels are reachable inside one bar.
+                    stop_first = bool(stop_mask[hit])
+                    exit_row = {
+                        "template_id": intent["template_id"],
+                        "symbol": intent.get("symbol", "UNKNOWN"),
+                        "fill_ts": bars["timestamp"].iloc[lo + hit],
+                        "fill_price": stop_price_f if stop_first else tp_price_f,
+                        "reason": "stop_loss" if stop_first else "take_profit",
+                    }
+        else:
+            if allow_same_bar_exit:
+                scan = bars[
+                    (bars["timestamp"] >= trigger_bar["timestamp"])
+                    & (bars["timestamp"] <= valid_to)
+                ]
+            else:
+                scan = bars[
+                    (bars["timestamp"] > trigger_bar["timestamp"])
+                    & (bars["timestamp"] <= valid_to)
+                ]
+            for _, bar_row in scan.iterrows():
+                if exit_row is not None:
+                    break
+                bar_ts = bar_row["timestamp"]
+                if side == "BUY":
+                    stop_hit = float(bar_row["low"]) <= stop_price_f
+                    tp_hit = float(bar_row["high"]) >= tp_price_f
+                else:  # SELL
+                    stop_hit = float(bar_row["high"]) >= stop_price_f
+                    tp_hit = float(bar_row["low"]) <= tp_price_f
+                if stop_hit and tp_hit:
+                    exit_row = {
+                        "template_id": intent["template_id"],
+                        "symbol": intent.get("symbol", "UNKNOWN"),
+                        "fill_ts": bar_ts,
+                        "fill_price": stop_price_f,
+                        "reason": "stop_loss",
+                    }
+                    break
+                if stop_hit:
+                    exit_row = {
+                        "template_id": intent["template_id"],
+                        "symbol": intent.get("symbol", "UNKNOWN"),
+                        "fill_ts": bar_ts,
+                        "fill_price": stop_price_f,
+                        "reason": "stop_loss",
+                    }
+                    break
+                if tp_hit:
+                    exit_row = {
+                        "template_id": intent["template_id"],
+                        "symbol": intent.get("symbol", "UNKNOWN"),
+                        "fill_ts": bar_ts,
+                        "fill_price": tp_price_f,
+                        "reason": "take_profit",
+                    }
+                    break
         if exit_row is None:
             requested_valid_to = valid_to
             if requested_valid_to in bar_idx.index:
@@ -547,11 +637,11 @@ def generate_fills(
         fills = pd.DataFrame(
             columns=["template_id", "symbol", "fill_ts", "fill_price", "reason"]
         )
-        fills_hash = _hash_dataframe(fills)
+        fills_hash = hash_frame(fills)
         logger.warning("actions: fills_empty_no_match fills_hash=%s", fills_hash)
         return FillArtifacts(fills=fills, fills_hash=fills_hash, gap_stats=None)
 
-    fills_hash = _hash_dataframe(fills)
+    fills_hash = hash_frame(fills)
     logger.info("actions: fills_generated fills_hash=%s fills=%d", fills_hash, len(fills))
     if same_bar_entry_minute_ambiguous_count:
         logger.info(
@@ -0,0 +1,397 @@
+"""Multi-symbol portfolio pipeline (one run, one shared cash ledger).
+
+Per-symbol work (bars snapshot load, SignalFrame build, intent generation) is
+independent and fans out across a process pool. Fills are generated per symbol
+(each intent only scans its own symbol's bars) and merged chronologically;
+execution then runs once over the merged stream so compound sizing draws from
+a single cash balance across all symbols: entries reserve cash while their
+trade is open and PnL is realized at exit_ts, so overlapping positions never
+size from each other's unrealized results.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from axiom_bt.artifacts.frame_hash import FILE_HASH_VERSION, FRAME_HASH_VERSION, hash_frame
+from axiom_bt.contracts.signal_frame_contract_v1 import compute_schema_fingerprint
+from strategies.intent_registry import get_strategy_adapter
+
+from .artifacts import ARTIFACT_FORMATS, write_artifacts
+from .data_fetcher import DataFetcherError, ensure_and_snapshot_bars
+from .data_prep import load_bars_snapshot
+from .execution import execute
+from .fill_model import generate_fills
+from .metrics import compute_and_write_metrics
+from .runner import (
+    PipelineError,
+    _build_step_tracker,
+    _load_intrabar_probe_bars_m1,
+    _resolve_execution_settings,
+    _resolve_run_window,
+)
+from .signal_frame_factory import build_signal_frame
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SymbolTask:
+    """Picklable unit of per-symbol work for the process pool."""
+
+    run_id: str
+    symbol: str
+    bars_path: Path
+    strategy_id: str
+    strategy_version: str
+    strategy_params: Dict
+
+
+@dataclass(frozen=True)
+class SymbolResult:
+    symbol: str
+    bars: pd.DataFrame
+    bars_hash: str
+    signals_frame: pd.DataFrame
+    events_intent: pd.DataFrame
+    intent_hash: str
+    schema_fingerprint: Dict
+
+
+def _run_symbol_task(task: SymbolTask) -> SymbolResult:
+    """Load one symbol's snapshot and derive its SignalFrame + intents."""
+    params = {**task.strategy_params, "symbol": task.symbol, "run_id": task.run_id}
+    bars, bars_hash = load_bars_snapshot(task.bars_path)
+    signals_frame, schema = build_signal_frame(
+        bars=bars,
+        strategy_id=task.strategy_id,
+        strategy_version=task.strategy_version,
+        strategy_params=params,
+    )
+    intent_art = get_strategy_adapter(task.strategy_id).generate_intent(
+        signals_frame,
+        task.strategy_id,
+        task.strategy_version,
+        params,
+    )
+    return SymbolResult(
+        symbol=task.symbol,
+        bars=bars,
+        bars_hash=bars_hash,
+        signals_frame=intent_art.signals_frame,
+        events_intent=intent_art.events_intent,
+        intent_hash=intent_art.intent_hash,
+        schema_fingerprint=compute_schema_fingerprint(schema),
+    )
+
+
+def _run_symbol_tasks(tasks: List[SymbolTask], max_workers: Optional[int]) -> List[SymbolResult]:
+    """Run tasks in a process pool; results keep the input (symbol) order."""
+    if max_workers == 1 or len(tasks) <= 1:
+        return [_run_symbol_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_run_symbol_task, tasks))
+
+
+def _combined_hash(parts: Dict[str, str]) -> str:
+    """Order-independent hash over per-symbol hashes (sorted by symbol)."""
+    payload = "\n".join(f"{sym}:{parts[sym]}" for sym in sorted(parts))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _merge_chronological(frames: Sequence[pd.DataFrame], sort_cols: Sequence[str]) -> pd.DataFrame:
+    non_empty = [f for f in frames if not f.empty]
+    if not non_empty:
+        return frames[0].iloc[0:0].copy() if frames else pd.DataFrame()
+    merged = pd.concat(non_empty, ignore_index=True, sort=False)
+    cols = [c for c in sort_cols if c in merged.columns]
+    if cols:
+        merged = merged.sort_values(cols, kind="mergesort").reset_index(drop=True)
+    return merged
+
+
+def run_portfolio_pipeline(
+    *,
+    run_id: str,
+    out_dir: Path,
+    symbols: Sequence[str],
+    strategy_id: str,
+    strategy_version: str,
+    strategy_params: Dict,
+    strategy_meta: Dict,
+    compound_enabled: bool,
+    compound_equity_basis: str,
+    initial_cash: float,
+    bars_paths: Optional[Dict[str, Path]] = None,
+    base_config_path: Optional[Path] = None,
+    config_overrides: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    artifact_format: str = "csv",
+) -> Dict:
+    """Run one backtest over a symbol universe with a single shared cash ledger.
+
+    Steps:
+    1) Resolve window/config once (same SSOT rules as run_pipeline).
+    2) Snapshot bars per symbol (reuse bars_paths[symbol] if it exists).
+    3) Fan out SignalFrame + intent generation across a process pool.
+    4) Generate fills per symbol, merge chronologically, execute once.
+    5) Write one consolidated artifact set + manifest.
+
+    Returns the manifest fields written to run_manifest.json.
+    """
+    from axiom_bt.utils.trace import trace_ui
+
+    trace_ui(
+        step="portfolio_run_start",
+        run_id=run_id,
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
+        file=__file__,
+        func="run_portfolio_pipeline",
+        extra={"symbols": len(symbols)},
+    )
+    if not symbols:
+        raise PipelineError("portfolio run requires at least one symbol")
+    symbols = [str(s).upper() for s in symbols]
+    if len(set(symbols)) != len(symbols):
+        raise PipelineError(f"duplicate symbols in portfolio: {symbols}")
+    if compound_equity_basis != "cash_only":
+        raise PipelineError("unsupported compound_equity_basis (only cash_only allowed)")
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise PipelineError(
+            f"unsupported artifact_format: {artifact_format!r} (allowed: {list(ARTIFACT_FORMATS)})"
+        )
+
+    step_tracker = _build_step_tracker(out_dir)
+    window = _resolve_run_window(
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
+        strategy_params=strategy_params,
+        strategy_meta=strategy_meta,
+    )
+    exec_settings = _resolve_execution_settings(base_config_path, config_overrides)
+    timeframe = strategy_params.get("timeframe", "M5")
+
+    # 2) Per-symbol snapshots under <out_dir>/symbols/<SYMBOL>/bars.
+    snapshot_paths: Dict[str, Path] = {}
+    with step_tracker.step("load_or_fetch_bars", {"symbols": len(symbols)}):
+        for symbol in symbols:
+            existing = (bars_paths or {}).get(symbol)
+            if existing is not None and Path(existing).exists():
+                snapshot_paths[symbol] = Path(existing)
+                continue
+            try:
+                snap_info = ensure_and_snapshot_bars(
+                    run_dir=out_dir / "symbols" / symbol,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    requested_end=window.requested_end,
+                    lookback_days=window.lookback_days,
+                    market_tz=window.market_tz,
+                    session_mode=window.session_mode,
+                    warmup_days=window.warmup_days,
+                    auto_fill_gaps=not bool(strategy_params.get("consumer_only", False)),
+                    allow_legacy_http_backfill=bool(
+                        strategy_params.get("allow_legacy_http_backfill", False)
+                    ),
+                )
+            except DataFetcherError as exc:
+                raise PipelineError(f"failed to ensure bars for {symbol}: {exc}") from exc
+            snapshot_paths[symbol] = Path(snap_info["exec_path"])
+
+    # 3) Fan out signal + intent generation.
+    tasks = [
+        SymbolTask(
+            run_id=run_id,
+            symbol=symbol,
+            bars_path=snapshot_paths[symbol],
+            strategy_id=strategy_id,
+            strategy_version=strategy_version,
+            strategy_params=strategy_params,
+        )
+        for symbol in symbols
+    ]
+    with step_tracker.step("generate_intent", {"symbols": len(tasks)}):
+        results = _run_symbol_tasks(tasks, max_workers)
+
+    # 4) Fills per symbol (own bars), then one chronological execute pass.
+    per_symbol_fills: List[pd.DataFrame] = []
+    fills_hash_by_symbol: Dict[str, str] = {}
+    gap_stats_by_symbol: Dict[str, Dict] = {}
+    with step_tracker.step("generate_fills"):
+        for res in results:
+            probe_bars = None
+            if exec_settings.probe_enabled and str(timeframe).upper() != "M1":
+                probe_bars = _load_intrabar_probe_bars_m1(
+                    symbol=res.symbol,
+                    bars=res.bars,
+                    session_timezone=strategy_params.get("session_timezone"),
+                    session_mode=strategy_params.get("session_mode", "rth"),
+                    session_filter=strategy_params.get("session_filter"),
+                )
+            fills_art = generate_fills(
+                res.events_intent,
+                res.bars,
+                order_validity_policy=strategy_params.get("order_validity_policy"),
+                session_timezone=strategy_params.get("session_timezone"),
+                session_filter=strategy_params.get("session_filter"),
+                allow_same_bar_exit=exec_settings.allow_same_bar_exit,
+                same_bar_resolution_mode=exec_settings.same_bar_resolution_mode,
+                intrabar_probe_bars_m1=probe_bars,
+                fill_engine=exec_settings.fill_engine,
+            )
+            per_symbol_fills.append(fills_art.fills)
+            fills_hash_by_symbol[res.symbol] = fills_art.fills_hash
+            gap_stats_by_symbol[res.symbol] = fills_art.gap_stats or {}
+
+    events_intent = _merge_chronological(
+        [r.events_intent for r in results], ("signal_ts", "template_id", "side")
+    )
+    fills = _merge_chronological(per_symbol_fills, ("fill_ts", "symbol", "template_id"))
+    signals_frame = _merge_chronological(
+        [r.signals_frame for r in results], ("timestamp", "symbol")
+    )
+    bars_all = pd.concat(
+        [r.bars.assign(symbol=r.symbol) for r in results], ignore_index=True, sort=False
+    )
+    intent_hash = hash_frame(events_intent)
+    fills_hash = hash_frame(fills)
+    bars_hash_by_symbol = {r.symbol: r.bars_hash for r in results}
+    bars_hash = _combined_hash(bars_hash_by_symbol)
+
+    with step_tracker.step("execute_portfolio"):
+        exec_art = execute(
+            fills,
+            events_intent,
+            bars_all,
+            initial_cash=initial_cash,
+            compound_enabled=compound_enabled,
+            order_validity_policy=strategy_params.get("order_validity_policy"),
+            session_timezone=strategy_params.get("session_timezone"),
+            session_filter=strategy_params.get("session_filter"),
+            commission_bps=exec_settings.commission_bps,
+            slippage_bps=exec_settings.slippage_bps,
+            event_ledger=True,
+        )
+
+    # 5) One consolidated artifact set.
+    with step_tracker.step("compute_metrics"):
+        metrics = compute_and_write_metrics(
+            exec_art.trades, exec_art.equity_curve, initial_cash, out_dir / "metrics.json"
+        )
+
+    base_config_sha256 = None
+    if exec_settings.base_config_path:
+        base_config_sha256 = hashlib.sha256(exec_settings.base_config_path.read_bytes()).hexdigest()
+    overrides_cfg = exec_settings.overrides if isinstance(exec_settings.overrides, dict) else {}
+
+    manifest_fields = {
+        "run_id": run_id,
+        "run_mode": "portfolio",
+        "params": {
+            "strategy_id": strategy_id,
+            "strategy_version": strategy_version,
+            "strategy_params": strategy_params,
+            "strategy_meta": strategy_meta,
+            "symbols": symbols,
+            "compound_enabled": compound_enabled,
+            "compound_equity_basis": compound_equity_basis,
+            "initial_cash": initial_cash,
+            "commission_bps": exec_settings.commission_bps,
+            "fees_bps": exec_settings.commission_bps,
+            "slippage_bps": exec_settings.slippage_bps,
+        },
+        "config": {
+            "base_config_path": str(exec_settings.base_config_path) if exec_settings.base_config_path else None,
+            "base_config_sha256": base_config_sha256,
+            "overrides": {
+                "ui": overrides_cfg.get("ui") or {},
+                "cli": overrides_cfg.get("cli") or {},
+                "spyder": overrides_cfg.get("spyder") or {},
+            },
+            "resolved": exec_settings.resolved.resolved,
+            "sources": exec_settings.resolved.sources,
+            "unknown_keys": exec_settings.resolved.unknown_keys,
+        },
+        "hashes": {
+            "bars_hash": bars_hash,
+            "intent_hash": intent_hash,
+            "fills_hash": fills_hash,
+            "bars_hash_by_symbol": bars_hash_by_symbol,
+            "intent_hash_by_symbol": {r.symbol: r.intent_hash for r in results},
+            "fills_hash_by_symbol": fills_hash_by_symbol,
+        },
+        "hash_versions": {
+            "bars_hash": FILE_HASH_VERSION,
+            "intent_hash": FRAME_HASH_VERSION,
+            "fills_hash": FRAME_HASH_VERSION,
+        },
+        "signal_schema": results[0].schema_fingerprint,
+        "portfolio": {
+            "symbols": symbols,
+            "bars_paths": {sym: str(path) for sym, path in snapshot_paths.items()},
+            "gap_stats_by_symbol": gap_stats_by_symbol,
+            "max_workers": max_workers,
+        },
+        "artifacts_index": [
+            "signals_frame.csv",
+            "events_intent.csv",
+            "fills.csv",
+            "trades.csv",
+            "metrics.json",
+            "equity_curve.csv",
+            "portfolio_ledger.csv",
+        ],
+    }
+    steps_file = out_dir / "run_steps.jsonl"
+    if steps_file.exists():
+        manifest_fields["artifacts_index"].append("run_steps.jsonl")
+
+    trades_by_symbol = (
+        exec_art.trades.groupby("symbol").size().astype(int).to_dict()
+        if not exec_art.trades.empty
+        else {}
+    )
+    result_fields = {
+        "run_id": run_id,
+        "status": "success",
+        "details": {
+            "symbols": len(symbols),
+            "trades": len(exec_art.trades),
+            "fills": len(exec_art.fills),
+            "trades_by_symbol": {str(k): int(v) for k, v in trades_by_symbol.items()},
+        },
+    }
+
+    with step_tracker.step("write_artifacts"):
+        write_artifacts(
+            out_dir,
+            signals_frame=signals_frame,
+            events_intent=events_intent,
+            fills=exec_art.fills,
+            trades=exec_art.trades,
+            equity_curve=exec_art.equity_curve,
+            ledger=exec_art.portfolio_ledger,
+            manifest_fields=manifest_fields,
+            result_fields=result_fields,
+            metrics=metrics,
+            artifact_format=artifact_format,
+        )
+
+    logger.info(
+        "actions: portfolio_pipeline_completed run_id=%s symbols=%d trades=%d intent_hash=%s fills_hash=%s bars_hash=%s",
+        run_id,
+        len(symbols),
+        len(exec_art.trades),
+        intent_hash,
+        fills_hash,
+        bars_hash,
+    )
+    return manifest_fields
@@ -6,8 +6,9 @@ import hashlib
 import logging
 import math
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 import datetime as dt
 
 import pandas as pd
@@ -18,13 +19,16 @@ from .data_fetcher import ensure_and_snapshot_bars, DataFetcherError
 from .warmup_calc import warmup_days_from_bars, WarmupError
 from .signal_frame_factory import build_signal_frame
 from strategies.intent_registry import get_strategy_adapter
+from strategies.registry import get_strategy
 from .fill_model import generate_fills
+from axiom_bt.artifacts.frame_hash import FILE_HASH_VERSION, FRAME_HASH_VERSION, hash_frame
 from axiom_bt.contracts.signal_frame_contract_v1 import compute_schema_fingerprint
 from .execution import execute
 from .metrics import compute_and_write_metrics
-from .artifacts import write_artifacts
-from .config_resolver import load_base_config, resolve_config
+from .artifacts import ARTIFACT_FORMATS, write_artifacts
+from .config_resolver import ResolveResult, load_base_config, resolve_config
 from .marketdata_stream_client import EnsureBarsRequest, MarketdataStreamClient
+from .stage_cache import StageCache, code_checksum, signal_params, stage_key
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +67,15 @@ def _build_step_tracker(run_dir: Path):
         return _NoopStepTracker()
 
 
+def _build_stage_cache() -> Optional[StageCache]:
+    """Stage cache from runtime config (paths.pipeline_stage_cache_root); None if unset."""
+    try:
+        root = get_runtime_config().paths.pipeline_stage_cache_root
+    except RuntimeConfigError:
+        return None
+    return StageCache(root) if root is not None else None
+
+
 def _default_base_config_path() -> Optional[Path]:
     candidate = Path(__file__).resolve().parents[3] / "configs" / "runs" / "backtest_pipeline_defaults.yaml"
     return candidate if candidate.exists() else None
@@ -140,45 +153,26 @@ def _load_intrabar_probe_bars_m1(
     return df[(df["timestamp"] >= ts.min()) & (df["timestamp"] <= ts.max() + pd.Timedelta(days=1))].copy()
 
 
-def run_pipeline(
+@dataclass(frozen=True)
+class RunWindow:
+    """Effective data window resolved from strategy SSOT + run params."""
+
+    requested_end: str
+    lookback_days: int
+    tf_minutes: int
+    market_tz: str
+    session_mode: str
+    warmup_days: int
+
+
+def _resolve_run_window(
     *,
-    run_id: str,
-    out_dir: Path,
-    bars_path: Path,
     strategy_id: str,
     strategy_version: str,
     strategy_params: Dict,
     strategy_meta: Dict,
-    compound_enabled: bool,
-    compound_equity_basis: str,
-    initial_cash: float,
-    fees_bps: float,
-    slippage_bps: float,
-    base_config_path: Optional[Path] = None,
-    config_overrides: Optional[Dict] = None,
-) -> None:
-    """End-to-end pipeline orchestrator (headless/CLI).
-
-    Steps:
-    1) Validate compound basis and time range inputs.
-    2) Build effective config from SSOT (market_tz/session_mode/timeframe_minutes).
-    3) Compute warmup (candles→days) and ensure/snapshot bars if missing.
-    4) Generate intent → fills → execute (sizing, trades, equity/ledger).
-    5) Compute metrics and write artifacts/manifest hashes.
-    """
-    from axiom_bt.utils.trace import trace_ui
-    trace_ui(
-        step="pipeline_run_start",
-        run_id=run_id,
-        strategy_id=strategy_id,
-        strategy_version=strategy_version,
-        file=__file__,
-        func="run_pipeline",
-    )
-    step_tracker = _build_step_tracker(out_dir)
-
-    if compound_equity_basis != "cash_only":
-        raise PipelineError("unsupported compound_equity_basis (only cash_only allowed)")
+) -> RunWindow:
+    """Validate timeframe/session SSOT and derive warmup + lookback days."""
     core = strategy_meta.get("core", {}) if strategy_meta else {}
 
     requested_end = strategy_params.get("requested_end")
@@ -207,7 +201,6 @@ def run_pipeline(
     if not session_mode:
         raise PipelineError("session_mode missing in strategy SSOT; add to configs/strategies/<strategy>.yaml")
 
-    # 3) Compute warmup (candles→days) and ensure/snapshot bars if missing.
     # [Analysis Layer]: Calculate the exact number of calendar days needed to satisfy the strategy's warmup requirement, respecting the session mode.
     required_warmup_bars = int(strategy_meta.get("required_warmup_bars", 0))
     try:
@@ -245,6 +238,158 @@ def run_pipeline(
         warmup_days,
     )
 
+    return RunWindow(
+        requested_end=requested_end,
+        lookback_days=int(lookback_days),
+        tf_minutes=int(tf_minutes),
+        market_tz=market_tz,
+        session_mode=session_mode,
+        warmup_days=warmup_days,
+    )
+
+
+@dataclass(frozen=True)
+class ExecutionSettings:
+    """Resolved costs/execution policy shared by single- and multi-symbol runs."""
+
+    base_config_path: Optional[Path]
+    overrides: Dict
+    resolved: ResolveResult
+    commission_bps: float
+    slippage_bps: float
+    allow_same_bar_exit: bool
+    same_bar_resolution_mode: str
+    probe_enabled: bool
+    fill_engine: str
+
+
+def _resolve_execution_settings(
+    base_config_path: Optional[Path],
+    config_overrides: Optional[Dict],
+) -> ExecutionSettings:
+    """Resolve base config + overrides into costs and fill/execution policy."""
+    defaults_cfg = {}
+    effective_base_config_path = base_config_path or _default_base_config_path()
+    base_cfg = load_base_config(effective_base_config_path) if effective_base_config_path else {}
+    overrides_cfg = config_overrides or {}
+    resolved_cfg = resolve_config(base=base_cfg, overrides=overrides_cfg, defaults=defaults_cfg)
+    costs_cfg = resolved_cfg.resolved.get("costs", {})
+    if "commission_bps" not in costs_cfg or "slippage_bps" not in costs_cfg:
+        raise PipelineError(
+            "resolved costs missing commission_bps/slippage_bps; provide base config YAML or explicit overrides"
+        )
+    execution_cfg = resolved_cfg.resolved.get("execution", {}) or {}
+    raw_allow_same_bar_exit = execution_cfg.get("allow_same_bar_exit", False)
+    if isinstance(raw_allow_same_bar_exit, str):
+        allow_same_bar_exit = raw_allow_same_bar_exit.strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "on",
+        }
+    else:
+        allow_same_bar_exit = bool(raw_allow_same_bar_exit)
+    same_bar_resolution_mode = str(
+        execution_cfg.get("same_bar_resolution_mode", "no_fill")
+    )
+    intrabar_probe_timeframe = str(
+        execution_cfg.get("intrabar_probe_timeframe", "M1")
+    ).upper()
+    probe_enabled = same_bar_resolution_mode == "m1_probe_then_no_fill" and intrabar_probe_timeframe == "M1"
+    return ExecutionSettings(
+        base_config_path=effective_base_config_path,
+        overrides=overrides_cfg,
+        resolved=resolved_cfg,
+        commission_bps=float(costs_cfg["commission_bps"]),
+        slippage_bps=float(costs_cfg["slippage_bps"]),
+        allow_same_bar_exit=allow_same_bar_exit,
+        same_bar_resolution_mode=same_bar_resolution_mode,
+        probe_enabled=probe_enabled,
+        fill_engine=str(execution_cfg.get("fill_engine", "pandas")),
+    )
+
+
+def _memoized_stage(
+    stage_cache: Optional[StageCache],
+    stage: str,
+    key: Optional[str],
+    cache_hits: Dict[str, bool],
+    compute: Callable[[], Any],
+):
+    """Run ``compute`` through the stage cache (if any), recording hit/miss."""
+    if stage_cache is None or key is None:
+        return compute()
+    value, hit = stage_cache.memoize(stage, key, compute)
+    cache_hits[stage] = hit
+    return value
+
+
+def run_pipeline(
+    *,
+    run_id: str,
+    out_dir: Path,
+    bars_path: Path,
+    strategy_id: str,
+    strategy_version: str,
+    strategy_params: Dict,
+    strategy_meta: Dict,
+    compound_enabled: bool,
+    compound_equity_basis: str,
+    initial_cash: float,
+    fees_bps: float,
+    slippage_bps: float,
+    base_config_path: Optional[Path] = None,
+    config_overrides: Optional[Dict] = None,
+    artifact_format: str = "csv",
+    stage_cache: Optional[StageCache] = None,
+) -> None:
+    """End-to-end pipeline orchestrator (headless/CLI).
+
+    Steps:
+    1) Validate compound basis and time range inputs.
+    2) Build effective config from SSOT (market_tz/session_mode/timeframe_minutes).
+    3) Compute warmup (candles→days) and ensure/snapshot bars if missing.
+    4) Generate intent → fills → execute (sizing, trades, equity/ledger).
+    5) Compute metrics and write artifacts/manifest hashes.
+
+    With a stage cache (argument or runtime paths.pipeline_stage_cache_root),
+    signal frame/intent/fills/execute results are reused when their inputs
+    are unchanged; hits and keys are recorded in the manifest.
+    """
+    from axiom_bt.utils.trace import trace_ui
+    trace_ui(
+        step="pipeline_run_start",
+        run_id=run_id,
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
+        file=__file__,
+        func="run_pipeline",
+    )
+    step_tracker = _build_step_tracker(out_dir)
+    if stage_cache is None:
+        stage_cache = _build_stage_cache()
+    cache_hits: Dict[str, bool] = {}
+    stage_keys: Dict[str, str] = {}
+
+    if compound_equity_basis != "cash_only":
+        raise PipelineError("unsupported compound_equity_basis (only cash_only allowed)")
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise PipelineError(
+            f"unsupported artifact_format: {artifact_format!r} (allowed: {list(ARTIFACT_FORMATS)})"
+        )
+    # 2) + 3) Effective config from SSOT and warmup (candles→days).
+    window = _resolve_run_window(
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
+        strategy_params=strategy_params,
+        strategy_meta=strategy_meta,
+    )
+    requested_end = window.requested_end
+    lookback_days = window.lookback_days
+    market_tz = window.market_tz
+    session_mode = window.session_mode
+    warmup_days = window.warmup_days
+
     # Bars snapshot: use existing if present, else ensure & snapshot via IntradayStore
     # [Data Layer]: Check if a pre-cached bars file exists; if not, initiate a 'just-in-time' fetch and snapshot process through the DataFetcher.
     snapshot_path = bars_path
@@ -285,13 +430,44 @@ def run_pipeline(
 
     # 4) Generate intent → fills → execute (sizing, trades, equity/ledger).
     # [Strategy Boundary]: Delegate indicator calculation and signal generation to the decoupled strategy plugin via the abstract registry (SoC).
-    with step_tracker.step("generate_signal_frame"):
-        signals_frame, schema = build_signal_frame(
-            bars=bars,
+    intent_art = None
+    if stage_cache is not None:
+        strategy_code = code_checksum(type(get_strategy(strategy_id)).__module__)
+        stage_keys["signal_frame"] = stage_key(
+            "signal_frame",
+            bars_hash=bars_hash,
             strategy_id=strategy_id,
             strategy_version=strategy_version,
-            strategy_params={**strategy_params, "run_id": run_id},
+            params=signal_params(strategy_params),
+            code=strategy_code,
+            contract=code_checksum("axiom_bt.contracts.signal_frame_contract_v1"),
+        )
+        stage_keys["intent"] = stage_key(
+            "intent",
+            signal_frame=stage_keys["signal_frame"],
+            code=strategy_code,
+            registry=code_checksum("strategies.intent_registry"),
         )
+        # The intent artifact carries the final signals frame; a hit skips both stages.
+        intent_art = stage_cache.get("intent", stage_keys["intent"])
+    with step_tracker.step("generate_signal_frame"):
+        if intent_art is not None:
+            cache_hits.update(signal_frame=True, intent=True)
+            signals_frame = intent_art.signals_frame
+            schema = get_strategy(strategy_id).get_schema(strategy_version)
+        else:
+            signals_frame, schema = _memoized_stage(
+                stage_cache,
+                "signal_frame",
+                stage_keys.get("signal_frame"),
+                cache_hits,
+                lambda: build_signal_frame(
+                    bars=bars,
+                    strategy_id=strategy_id,
+                    strategy_version=strategy_version,
+                    strategy_params={**strategy_params, "run_id": run_id},
+                ),
+            )
     trace_ui(
         step="pipeline_signal_frame_built",
         run_id=run_id,
@@ -314,13 +490,20 @@ def run_pipeline(
 
     # [Framework Layer]: Transform the strategy-specific SignalFrame into a normalized, generic intent stream (events_intent) understood by the execution engine.
     with step_tracker.step("generate_intent"):
-        strategy_adapter = get_strategy_adapter(strategy_id)
-        intent_art = strategy_adapter.generate_intent(
-            signals_frame,
-            strategy_id,
-            strategy_version,
-            {**strategy_params, "symbol": strategy_params.get("symbol")},
-        )
+        if intent_art is None:
+            strategy_adapter = get_strategy_adapter(strategy_id)
+            intent_art = _memoized_stage(
+                stage_cache,
+                "intent",
+                stage_keys.get("intent"),
+                cache_hits,
+                lambda: strategy_adapter.generate_intent(
+                    signals_frame,
+                    strategy_id,
+                    strategy_version,
+                    {**strategy_params, "symbol": strategy_params.get("symbol")},
+                ),
+            )
     trace_ui(
         step="pipeline_intent_generated",
         run_id=run_id,
@@ -331,34 +514,11 @@ def run_pipeline(
         extra={"rows": len(intent_art.events_intent)},
     )
     
-    defaults_cfg = {}
-    effective_base_config_path = base_config_path or _default_base_config_path()
-    base_cfg = load_base_config(effective_base_config_path) if effective_base_config_path else {}
-    overrides_cfg = config_overrides or {}
-    resolved_cfg = resolve_config(base=base_cfg, overrides=overrides_cfg, defaults=defaults_cfg)
-    costs_cfg = resolved_cfg.resolved.get("costs", {})
-    if "commission_bps" not in costs_cfg or "slippage_bps" not in costs_cfg:
-        raise PipelineError(
-            "resolved costs missing commission_bps/slippage_bps; provide base config YAML or explicit overrides"
-        )
-    execution_cfg = resolved_cfg.resolved.get("execution", {}) or {}
-    raw_allow_same_bar_exit = execution_cfg.get("allow_same_bar_exit", False)
-    if isinstance(raw_allow_same_bar_exit, str):
-        allow_same_bar_exit = raw_allow_same_bar_exit.strip().lower() in {
-            "1",
-            "true",
-            "yes",
-            "on",
-        }
-    else:
-        allow_same_bar_exit = bool(raw_allow_same_bar_exit)
-    same_bar_resolution_mode = str(
-        execution_cfg.get("same_bar_resolution_mode", "no_fill")
-    )
-    intrabar_probe_timeframe = str(
-        execution_cfg.get("intrabar_probe_timeframe", "M1")
-    ).upper()
-    probe_enabled = same_bar_resolution_mode == "m1_probe_then_no_fill" and intrabar_probe_timeframe == "M1"
+    exec_settings = _resolve_execution_settings(base_config_path, config_overrides)
+    effective_base_config_path = exec_settings.base_config_path
+    overrides_cfg = exec_settings.overrides
+    resolved_cfg = exec_settings.resolved
+    probe_enabled = exec_settings.probe_enabled
     intrabar_probe_bars_m1 = None
     if probe_enabled and str(strategy_params.get("timeframe", "")).upper() != "M1":
         intrabar_probe_bars_m1 = _load_intrabar_probe_bars_m1(
@@ -370,16 +530,36 @@ def run_pipeline(
         )
 
     # [Engine Layer]: Market Simulation: Match the intent stream against historical bars to generate discrete execution fills (STOP/LIMIT/MARKET).
-    with step_tracker.step("generate_fills"):
-        fills_art = generate_fills(
-            intent_art.events_intent,
-            bars,
+    if stage_cache is not None:
+        stage_keys["fills"] = stage_key(
+            "fills",
+            intent=stage_keys["intent"],
             order_validity_policy=strategy_params.get("order_validity_policy"),
             session_timezone=strategy_params.get("session_timezone"),
             session_filter=strategy_params.get("session_filter"),
-            allow_same_bar_exit=allow_same_bar_exit,
-            same_bar_resolution_mode=same_bar_resolution_mode,
-            intrabar_probe_bars_m1=intrabar_probe_bars_m1,
+            allow_same_bar_exit=exec_settings.allow_same_bar_exit,
+            same_bar_resolution_mode=exec_settings.same_bar_resolution_mode,
+            fill_engine=exec_settings.fill_engine,
+            probe_hash=hash_frame(intrabar_probe_bars_m1) if intrabar_probe_bars_m1 is not None else None,
+            code=code_checksum("axiom_bt.pipeline.fill_model"),
+        )
+    with step_tracker.step("generate_fills"):
+        fills_art = _memoized_stage(
+            stage_cache,
+            "fills",
+            stage_keys.get("fills"),
+            cache_hits,
+            lambda: generate_fills(
+                intent_art.events_intent,
+                bars,
+                order_validity_policy=strategy_params.get("order_validity_policy"),
+                session_timezone=strategy_params.get("session_timezone"),
+                session_filter=strategy_params.get("session_filter"),
+                allow_same_bar_exit=exec_settings.allow_same_bar_exit,
+                same_bar_resolution_mode=exec_settings.same_bar_resolution_mode,
+                intrabar_probe_bars_m1=intrabar_probe_bars_m1,
+                fill_engine=exec_settings.fill_engine,
+            ),
         )
     trace_ui(
         step="pipeline_fills_generated",
@@ -391,16 +571,15 @@ def run_pipeline(
         extra={"rows": len(fills_art.fills), **(fills_art.gap_stats or {})},
     )
     
-    effective_commission_bps = float(costs_cfg["commission_bps"])
-    effective_slippage_bps = float(costs_cfg["slippage_bps"])
+    effective_commission_bps = exec_settings.commission_bps
+    effective_slippage_bps = exec_settings.slippage_bps
 
     # [Engine Layer]: Portfolio Management: Apply position sizing, risk rules, and derive actual trades, equity curve, and the portfolio ledger.
     # Execution: apply sizing (respecting compound_enabled) and derive trades/equity/ledger
-    with step_tracker.step("execute_portfolio"):
-        exec_art = execute(
-            fills_art.fills,
-            intent_art.events_intent,
-            bars,
+    if stage_cache is not None:
+        stage_keys["execute"] = stage_key(
+            "execute",
+            fills=stage_keys["fills"],
             initial_cash=initial_cash,
             compound_enabled=compound_enabled,
             order_validity_policy=strategy_params.get("order_validity_policy"),
@@ -408,6 +587,26 @@ def run_pipeline(
             session_filter=strategy_params.get("session_filter"),
             commission_bps=effective_commission_bps,
             slippage_bps=effective_slippage_bps,
+            code=code_checksum("axiom_bt.pipeline.execution"),
+        )
+    with step_tracker.step("execute_portfolio"):
+        exec_art = _memoized_stage(
+            stage_cache,
+            "execute",
+            stage_keys.get("execute"),
+            cache_hits,
+            lambda: execute(
+                fills_art.fills,
+                intent_art.events_intent,
+                bars,
+                initial_cash=initial_cash,
+                compound_enabled=compound_enabled,
+                order_validity_policy=strategy_params.get("order_validity_policy"),
+                session_timezone=strategy_params.get("session_timezone"),
+                session_filter=strategy_params.get("session_filter"),
+                commission_bps=effective_commission_bps,
+                slippage_bps=effective_slippage_bps,
+            ),
         )
     trace_ui(
         step="pipeline_execution_done",
@@ -459,6 +658,11 @@ def run_pipeline(
             "intent_hash": intent_art.intent_hash,
             "fills_hash": fills_art.fills_hash,
         },
+        "hash_versions": {
+            "bars_hash": FILE_HASH_VERSION,
+            "intent_hash": FRAME_HASH_VERSION,
+            "fills_hash": FRAME_HASH_VERSION,
+        },
         "signal_schema": schema_fp,
         "artifacts_index": [
             "signals_frame.csv",
@@ -470,6 +674,13 @@ def run_pipeline(
             "portfolio_ledger.csv",
         ],
     }
+    if stage_cache is not None:
+        manifest_fields["stage_cache"] = {
+            "root": str(stage_cache.root),
+            "hits": [stage for stage, hit in cache_hits.items() if hit],
+            "misses": [stage for stage, hit in cache_hits.items() if not hit],
+            "keys": stage_keys,
+        }
     steps_file = out_dir / "run_steps.jsonl"
     if steps_file.exists():
         manifest_fields["artifacts_index"].append("run_steps.jsonl")
@@ -504,6 +715,7 @@ def run_pipeline(
             manifest_fields=manifest_fields,
             result_fields=result_fields,
             metrics=metrics,
+            artifact_format=artifact_format,
         )
 
     logger.info(
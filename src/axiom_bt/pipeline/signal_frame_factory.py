@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
@@ -20,6 +20,7 @@ def build_signal_frame(
     strategy_params: Dict,
     *,
     hook_registry=None,
+    enrich_cache: Optional[dict] = None,
 ) -> Tuple[pd.DataFrame, SignalFrameSchemaV1]:
     """Build and validate SignalFrame via strategy discovery.
 
@@ -29,6 +30,8 @@ def build_signal_frame(
         strategy_version: Version string.
         strategy_params: Parameters (passed to strategy builder).
         hook_registry: Deprecated (ignored for backward compatibility).
+        enrich_cache: Optional per-bars indicator cache, forwarded to plugins
+            that declare ``enrich_params`` (ignored otherwise).
 
     Returns:
         Tuple of (Validated SignalFrame DataFrame, SignalFrameSchemaV1).
@@ -64,7 +67,10 @@ def build_signal_frame(
     # We pass strategy_version in params to match expectations in some strategies
     params = {**strategy_params, "strategy_version": strategy_version}
     
-    df = plugin.extend_signal_frame(bars, params)
+    if enrich_cache is not None and getattr(plugin, "enrich_params", None):
+        df = plugin.extend_signal_frame(bars, params, enrich_cache=enrich_cache)
+    else:
+        df = plugin.extend_signal_frame(bars, params)
 
     # Normalize all datetime64[ns, UTC] columns to tz-aware UTC before validation.
     for col in schema.all_columns():
@@ -0,0 +1,139 @@
+"""Content-addressed on-disk cache for pipeline stages.
+
+Each stage result (signal frame, intents, fills, execution) is stored under a
+key derived from everything the stage reads: the upstream stage key (so
+``bars_hash`` flows through the chain), strategy id/version, the params the
+stage consumes and a checksum of the code that computes it. A rerun that only
+changes execution inputs (fees, compounding, initial cash) therefore reuses
+signal/intent/fill results and recomputes execution alone.
+
+Layout::
+
+    <root>/<stage>/<key[:2]>/<key>.pkl
+
+Entries are pickles (exact dtypes, so artifact hashes are unchanged on a hit).
+Reads refresh the entry mtime; after each write, least recently used entries
+are evicted until the cache fits ``max_bytes``. Unreadable entries count as
+misses and are removed.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STAGE_CACHE_VERSION = 1
+DEFAULT_MAX_BYTES = 2 * 1024**3
+STAGES = ("signal_frame", "intent", "fills", "execute")
+
+# Params that select the bars window; they reach stages only via bars_hash.
+WINDOW_PARAMS = ("run_id", "requested_end", "lookback_days", "consumer_only", "allow_legacy_http_backfill")
+
+
+@functools.lru_cache(maxsize=None)
+def code_checksum(module_name: str) -> str:
+    """SHA-256 prefix over a module's source (all ``*.py`` for a package)."""
+    module = importlib.import_module(module_name)
+    path = Path(module.__file__)
+    files = sorted(path.parent.rglob("*.py")) if path.name == "__init__.py" else [path]
+    digest = hashlib.sha256()
+    for file in files:
+        digest.update(file.relative_to(path.parent).as_posix().encode("utf-8"))
+        digest.update(file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def stage_key(stage: str, **inputs: Any) -> str:
+    """Stable key for a stage from its (JSON-serializable) inputs."""
+    if stage not in STAGES:
+        raise ValueError(f"unknown stage: {stage!r} (allowed: {list(STAGES)})")
+    payload = json.dumps(
+        {"stage": stage, "cache_version": STAGE_CACHE_VERSION, **inputs},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def signal_params(strategy_params: Dict) -> Dict:
+    """Strategy params minus the bars-window selectors (covered by bars_hash)."""
+    return {k: v for k, v in strategy_params.items() if k not in WINDOW_PARAMS}
+
+
+class StageCache:
+    """LRU/size-bounded pickle store for stage results under ``root``."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0 (got {max_bytes})")
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.root / stage / key[:2] / f"{key}.pkl"
+
+    def get(self, stage: str, key: str) -> Optional[Any]:
+        """Cached value or None; a hit marks the entry as recently used."""
+        path = self._path(stage, key)
+        try:
+            with path.open("rb") as fh:
+                value = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # corrupt/partial entry: drop it and recompute
+            logger.warning("actions: stage_cache_entry_unreadable path=%s err=%s", path, exc)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return value
+
+    def put(self, stage: str, key: str, value: Any) -> None:
+        path = self._path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self.evict()
+
+    def memoize(self, stage: str, key: str, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return (value, hit); computes and stores the value on a miss."""
+        value = self.get(stage, key)
+        if value is not None:
+            return value, True
+        value = compute()
+        self.put(stage, key, value)
+        return value, False
+
+    def size_bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.root.glob("*/*/*.pkl"))
+
+    def evict(self) -> List[Path]:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        for path in self.root.glob("*/*/*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # concurrent eviction
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        removed: List[Path] = []
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        if removed:
+            logger.info("actions: stage_cache_evicted root=%s entries=%d", self.root, len(removed))
+        return removed
@@ -0,0 +1,350 @@
+"""Parameter sweep over one bars snapshot.
+
+The snapshot is loaded and hashed once; every worker process receives the
+bars frame and the resolved execution settings once (pool initializer) and
+then runs signal → intent → fills → execute per parameter combination. Only
+metrics and hashes come back, collected into one compact results table.
+Full artifact sets are written for the top-K combinations only, via
+run_pipeline against the same snapshot.
+
+Strategies that declare ``enrich_params`` (InsideBar: ATR period and pattern
+rules) share indicator work: each worker keeps an enrichment cache for the
+snapshot, and combinations are dispatched grouped by those params, so e.g. a
+risk_reward_ratio-only sweep computes true range/ATR once per worker.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from axiom_bt.metrics import compose_metrics
+from strategies.intent_registry import get_strategy_adapter
+from strategies.registry import get_strategy
+
+from .artifacts import ARTIFACT_FORMATS, artifact_filename, write_frame
+from .data_fetcher import DataFetcherError, ensure_and_snapshot_bars
+from .data_prep import load_bars_snapshot
+from .execution import execute
+from .fill_model import generate_fills
+from .runner import (
+    ExecutionSettings,
+    PipelineError,
+    _load_intrabar_probe_bars_m1,
+    _resolve_execution_settings,
+    _resolve_run_window,
+    run_pipeline,
+)
+from .signal_frame_factory import build_signal_frame
+
+logger = logging.getLogger(__name__)
+
+# Enriched frames kept per worker before the cache is reset (true range included).
+_MAX_ENRICHED_FRAMES = 8
+
+
+@dataclass(frozen=True)
+class SweepContext:
+    """Everything a worker needs besides the combination itself (sent once)."""
+
+    run_id: str
+    strategy_id: str
+    strategy_version: str
+    base_params: Dict
+    exec_settings: ExecutionSettings
+    compound_enabled: bool
+    initial_cash: float
+    bars: pd.DataFrame
+    probe_bars_m1: Optional[pd.DataFrame] = None
+
+
+# Per-process state installed by _init_worker (bars + enrichment cache).
+_WORKER: Dict = {}
+
+
+def expand_grid(grid: Mapping[str, Sequence]) -> List[Dict]:
+    """Cartesian product of a parameter grid, in key order then value order."""
+    if not grid:
+        raise PipelineError("parameter grid is empty")
+    for key, values in grid.items():
+        if isinstance(values, (str, bytes)) or not isinstance(values, Sequence) or not values:
+            raise PipelineError(f"grid values for {key!r} must be a non-empty list")
+    keys = list(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def _init_worker(ctx: SweepContext) -> None:
+    _WORKER.clear()
+    _WORKER.update(ctx=ctx, enrich_cache={})
+
+
+def _run_combo(item: Tuple[int, Dict]) -> Dict:
+    """Signal → intent → fills → execute → metrics for one combination."""
+    combo_id, overrides = item
+    ctx: SweepContext = _WORKER["ctx"]
+    cache: Dict = _WORKER["enrich_cache"]
+    if len(cache) > _MAX_ENRICHED_FRAMES:
+        cache.clear()
+
+    params = {**ctx.base_params, **overrides}
+    signals_frame, _ = build_signal_frame(
+        bars=ctx.bars,
+        strategy_id=ctx.strategy_id,
+        strategy_version=ctx.strategy_version,
+        strategy_params={**params, "run_id": f"{ctx.run_id}_{combo_id:04d}"},
+        enrich_cache=cache,
+    )
+    intent_art = get_strategy_adapter(ctx.strategy_id).generate_intent(
+        signals_frame, ctx.strategy_id, ctx.strategy_version, params
+    )
+    settings = ctx.exec_settings
+    fills_art = generate_fills(
+        intent_art.events_intent,
+        ctx.bars,
+        order_validity_policy=params.get("order_validity_policy"),
+        session_timezone=params.get("session_timezone"),
+        session_filter=params.get("session_filter"),
+        allow_same_bar_exit=settings.allow_same_bar_exit,
+        same_bar_resolution_mode=settings.same_bar_resolution_mode,
+        intrabar_probe_bars_m1=ctx.probe_bars_m1,
+        fill_engine=settings.fill_engine,
+    )
+    exec_art = execute(
+        fills_art.fills,
+        intent_art.events_intent,
+        ctx.bars,
+        initial_cash=ctx.initial_cash,
+        compound_enabled=ctx.compound_enabled,
+        order_validity_policy=params.get("order_validity_policy"),
+        session_timezone=params.get("session_timezone"),
+        session_filter=params.get("session_filter"),
+        commission_bps=settings.commission_bps,
+        slippage_bps=settings.slippage_bps,
+    )
+    metrics = compose_metrics(exec_art.trades, exec_art.equity_curve, ctx.initial_cash)
+    return {
+        "combo_id": combo_id,
+        "params": overrides,
+        "metrics": metrics,
+        "intents": len(intent_art.events_intent),
+        "fills": len(exec_art.fills),
+        "intent_hash": intent_art.intent_hash,
+        "fills_hash": fills_art.fills_hash,
+    }
+
+
+def _dispatch_order(combos: List[Dict], strategy_id: str) -> List[Tuple[int, Dict]]:
+    """Combinations tagged with their id, grouped by the strategy's enrich params."""
+    enrich_params = getattr(get_strategy(strategy_id), "enrich_params", None) or ()
+    items = list(enumerate(combos))
+    if enrich_params:
+        items.sort(key=lambda item: tuple(repr(item[1].get(name)) for name in enrich_params))
+    return items
+
+
+def _run_combos(
+    ctx: SweepContext, items: List[Tuple[int, Dict]], max_workers: Optional[int]
+) -> List[Dict]:
+    if max_workers == 1 or len(items) <= 1:
+        _init_worker(ctx)
+        try:
+            return [_run_combo(item) for item in items]
+        finally:
+            _WORKER.clear()
+    workers = max_workers or os.cpu_count() or 1
+    # Contiguous chunks keep same-enrichment combos on the same worker.
+    chunksize = max(1, math.ceil(len(items) / (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ctx,)) as pool:
+        return list(pool.map(_run_combo, items, chunksize=chunksize))
+
+
+def _table_value(value):
+    """Grid values as table cells (lists/dicts JSON-encoded)."""
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, sort_keys=True)
+    return value
+
+
+def _results_table(
+    rows: List[Dict], grid_keys: Sequence[str], rank_by: str, rank_ascending: bool = False
+) -> pd.DataFrame:
+    records = []
+    for row in sorted(rows, key=lambda r: r["combo_id"]):
+        record = {"combo_id": row["combo_id"]}
+        record.update({key: _table_value(row["params"][key]) for key in grid_keys})
+        record.update(row["metrics"])
+        record.update({k: row[k] for k in ("intents", "fills", "intent_hash", "fills_hash")})
+        records.append(record)
+    table = pd.DataFrame.from_records(records)
+    if rank_by not in table.columns:
+        raise PipelineError(f"unknown rank_by metric: {rank_by!r}")
+    # NaN metrics (e.g. no trades) rank last in either direction
+    table["rank"] = (
+        table[rank_by].rank(method="first", ascending=rank_ascending, na_option="bottom").astype(int)
+    )
+    return table
+
+
+def run_parameter_sweep(
+    *,
+    run_id: str,
+    out_dir: Path,
+    bars_path: Path,
+    strategy_id: str,
+    strategy_version: str,
+    strategy_params: Dict,
+    strategy_meta: Dict,
+    grid: Mapping[str, Sequence],
+    compound_enabled: bool,
+    compound_equity_basis: str,
+    initial_cash: float,
+    base_config_path: Optional[Path] = None,
+    config_overrides: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    top_k: int = 3,
+    rank_by: str = "net_pnl",
+    rank_ascending: bool = False,
+    artifact_format: str = "csv",
+) -> pd.DataFrame:
+    """Run every combination of ``grid`` (overriding strategy_params) on one snapshot.
+
+    Steps:
+    1) Resolve window/config once (same SSOT rules as run_pipeline).
+    2) Snapshot bars if bars_path is missing; load + hash the snapshot once.
+    3) Run all combinations across a process pool (metrics + hashes only).
+    4) Write sweep_results.<fmt> (one row per combination, ranked by rank_by;
+       highest first unless rank_ascending, e.g. for max_drawdown_pct).
+    5) Run the full pipeline with artifacts for the top_k combinations under
+       <out_dir>/top/combo_<id>, then write sweep_manifest.json.
+
+    Returns the results table.
+    """
+    if compound_equity_basis != "cash_only":
+        raise PipelineError("unsupported compound_equity_basis (only cash_only allowed)")
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise PipelineError(
+            f"unsupported artifact_format: {artifact_format!r} (allowed: {list(ARTIFACT_FORMATS)})"
+        )
+    if top_k < 0:
+        raise PipelineError(f"top_k must be >= 0 (got {top_k})")
+    combos = expand_grid(grid)
+
+    window = _resolve_run_window(
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
+        strategy_params=strategy_params,
+        strategy_meta=strategy_meta,
+    )
+    exec_settings = _resolve_execution_settings(base_config_path, config_overrides)
+    timeframe = strategy_params.get("timeframe", "M5")
+
+    snapshot_path = Path(bars_path)
+    if not snapshot_path.exists():
+        try:
+            snap_info = ensure_and_snapshot_bars(
+                run_dir=out_dir,
+                symbol=strategy_params.get("symbol", "UNKNOWN"),
+                timeframe=timeframe,
+                requested_end=window.requested_end,
+                lookback_days=window.lookback_days,
+                market_tz=window.market_tz,
+                session_mode=window.session_mode,
+                warmup_days=window.warmup_days,
+                auto_fill_gaps=not bool(strategy_params.get("consumer_only", False)),
+                allow_legacy_http_backfill=bool(
+                    strategy_params.get("allow_legacy_http_backfill", False)
+                ),
+            )
+        except DataFetcherError as exc:
+            raise PipelineError(f"failed to ensure bars: {exc}") from exc
+        snapshot_path = Path(snap_info["exec_path"])
+    bars, bars_hash = load_bars_snapshot(snapshot_path)
+
+    probe_bars = None
+    if exec_settings.probe_enabled and str(timeframe).upper() != "M1":
+        probe_bars = _load_intrabar_probe_bars_m1(
+            symbol=strategy_params.get("symbol", "UNKNOWN"),
+            bars=bars,
+            session_timezone=strategy_params.get("session_timezone"),
+            session_mode=strategy_params.get("session_mode", "rth"),
+            session_filter=strategy_params.get("session_filter"),
+        )
+
+    ctx = SweepContext(
+        run_id=run_id,
+        strategy_id=strategy_id,
+        strategy_version=strategy_version,
+        base_params=strategy_params,
+        exec_settings=exec_settings,
+        compound_enabled=compound_enabled,
+        initial_cash=initial_cash,
+        bars=bars,
+        probe_bars_m1=probe_bars,
+    )
+    rows = _run_combos(ctx, _dispatch_order(combos, strategy_id), max_workers)
+    results = _results_table(rows, list(grid), rank_by, rank_ascending)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results_name = artifact_filename("sweep_results", artifact_format)
+    write_frame(results, out_dir / results_name)
+
+    top: List[Dict] = []
+    for combo_id in results.sort_values("rank")["combo_id"].head(top_k):
+        combo_id = int(combo_id)
+        combo_run_id = f"{run_id}_combo_{combo_id:04d}"
+        combo_dir = out_dir / "top" / f"combo_{combo_id:04d}"
+        run_pipeline(
+            run_id=combo_run_id,
+            out_dir=combo_dir,
+            bars_path=snapshot_path,
+            strategy_id=strategy_id,
+            strategy_version=strategy_version,
+            strategy_params={**strategy_params, **combos[combo_id]},
+            strategy_meta=strategy_meta,
+            compound_enabled=compound_enabled,
+            compound_equity_basis=compound_equity_basis,
+            initial_cash=initial_cash,
+            fees_bps=exec_settings.commission_bps,
+            slippage_bps=exec_settings.slippage_bps,
+            base_config_path=base_config_path,
+            config_overrides=config_overrides,
+            artifact_format=artifact_format,
+        )
+        top.append({"combo_id": combo_id, "run_id": combo_run_id, "out_dir": str(combo_dir.relative_to(out_dir))})
+
+    manifest = {
+        "run_id": run_id,
+        "run_mode": "sweep",
+        "strategy_id": strategy_id,
+        "strategy_version": strategy_version,
+        "grid": {key: list(values) for key, values in grid.items()},
+        "combinations": len(combos),
+        "rank_by": rank_by,
+        "rank_ascending": rank_ascending,
+        "top_k": top_k,
+        "top": top,
+        "bars_path": str(snapshot_path),
+        "bars_hash": bars_hash,
+        "results": results_name,
+        "max_workers": max_workers,
+    }
+    (out_dir / "sweep_manifest.json").write_text(json.dumps(manifest, indent=2, default=str))
+
+    logger.info(
+        "actions: parameter_sweep_completed run_id=%s combos=%d top_k=%d rank_by=%s bars_hash=%s",
+        run_id,
+        len(combos),
+        len(top),
+        rank_by,
+        bars_hash,
+    )
+    return results
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional
 import pandas as pd
 
+from axiom_bt.pipeline.artifacts import find_tabular_artifact, read_frame
 from axiom_bt.portfolio.ledger import PortfolioLedger
 
 
@@ -165,7 +166,7 @@ def _cli_main():
     import sys
     
     parser = argparse.ArgumentParser(
-        description="Generate portfolio reporting artifacts from trades.csv",
+        description="Generate portfolio reporting artifacts from trades.csv or trades.parquet",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
@@ -184,7 +185,7 @@ Examples:
         "--run-dir",
         type=Path,
         required=True,
-        help="Path to backtest run directory (contains trades.csv)"
+        help="Path to backtest run directory (contains trades.csv or trades.parquet)"
     )
     parser.add_argument(
         "--out-dir",
@@ -215,17 +216,17 @@ Examples:
         print(f"Error: run_dir does not exist: {run_dir}", file=sys.stderr)
         sys.exit(1)
     
-    # Find trades.csv
-    trades_path = run_dir / "trades.csv"
-    if not trades_path.exists():
-        print(f"Error: trades.csv not found in {run_dir}", file=sys.stderr)
+    # Find trades.parquet / trades.csv
+    trades_path = find_tabular_artifact(run_dir, "trades")
+    if trades_path is None:
+        print(f"Error: trades.csv not found in {run_dir} (no trades.parquet either)", file=sys.stderr)
         sys.exit(1)
     
     # Load trades
     try:
-        trades_df = pd.read_csv(trades_path)
+        trades_df = read_frame(trades_path)
     except Exception as e:
-        print(f"Error loading trades.csv: {e}", file=sys.stderr)
+        print(f"Error loading {trades_path.name}: {e}", file=sys.stderr)
         sys.exit(1)
     
     # Determine initial_cash
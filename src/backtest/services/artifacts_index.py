@@ -27,20 +27,20 @@ def write_artifacts_index(run_dir: Path) -> None:
     """
     artifacts: List[Dict[str, Any]] = []
 
-    # Known artifact patterns (kind, filename)
+    # Known artifact patterns (kind, candidate filenames; Parquet preferred)
     artifact_patterns = [
-        ("equity_curve", "equity_curve.csv"),
-        ("orders", "orders.csv"),
-        ("filled_orders", "filled_orders.csv"),
-        ("trades", "trades.csv"),
-        ("metrics", "metrics.json"),
+        ("equity_curve", ("equity_curve.parquet", "equity_curve.csv")),
+        ("orders", ("orders.csv",)),
+        ("filled_orders", ("filled_orders.csv",)),
+        ("trades", ("trades.parquet", "trades.csv")),
+        ("metrics", ("metrics.json",)),
     ]
 
-    for kind, filename in artifact_patterns:
-        filepath = run_dir / filename
-
-        if not filepath.exists():
+    for kind, candidates in artifact_patterns:
+        filename = next((name for name in candidates if (run_dir / name).exists()), None)
+        if filename is None:
             continue
+        filepath = run_dir / filename
 
         # Base metadata
         entry: Dict[str, Any] = {
@@ -50,10 +50,10 @@ def write_artifacts_index(run_dir: Path) -> None:
             "bytes": filepath.stat().st_size
         }
 
-        # Add rows + schema for CSV files
-        if filename.endswith(".csv"):
+        # Add rows + schema for tabular files
+        if filename.endswith((".csv", ".parquet")):
             try:
-                df = pd.read_csv(filepath)
+                df = pd.read_parquet(filepath) if filename.endswith(".parquet") else pd.read_csv(filepath)
                 entry["rows"] = len(df)
                 entry["schema"] = list(df.columns)
             except Exception as e:
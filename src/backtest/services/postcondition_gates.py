@@ -10,9 +10,10 @@ ARCHITECTURE:
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Optional
-import pandas as pd
 import logging
 
+from axiom_bt.pipeline.artifacts import find_tabular_artifact, read_frame
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,9 +31,9 @@ def check_equity_postcondition(
     execution_mode: str
 ) -> EquityPostcondition:
     """
-    Verify equity_curve.csv exists for full_backtest mode.
+    Verify the equity curve (equity_curve.parquet or .csv) exists for full_backtest mode.
 
-    Rule: If execution_mode=full_backtest, equity_curve.csv MUST exist
+    Rule: If execution_mode=full_backtest, the equity curve MUST exist
           (even if empty/flat - indicates 0 trades is valid)
 
     Args:
@@ -52,11 +53,11 @@ def check_equity_postcondition(
             error_message=None
         )
 
-    equity_path = run_dir / "equity_curve.csv"
+    equity_path = find_tabular_artifact(run_dir, "equity_curve")
 
-    if not equity_path.exists():
+    if equity_path is None:
         error_msg = (
-            f"equity_curve.csv not found in {run_dir}. "
+            f"equity_curve.csv/.parquet not found in {run_dir}. "
             f"Full backtest mode requires equity persistence."
         )
         logger.error(f"[{run_dir.name}] Postcondition FAILED: {error_msg}")
@@ -69,11 +70,11 @@ def check_equity_postcondition(
 
     # Verify file is readable (not corrupted)
     try:
-        df = pd.read_csv(equity_path)
+        df = read_frame(equity_path)
         rows = len(df)
         logger.info(f"[{run_dir.name}] Equity postcondition PASSED ({rows} rows)")
     except Exception as e:
-        error_msg = f"equity_curve.csv exists but is unreadable: {e}"
+        error_msg = f"{equity_path.name} exists but is unreadable: {e}"
         logger.error(f"[{run_dir.name}] Postcondition FAILED: {error_msg}")
         return EquityPostcondition(
             status="fail",
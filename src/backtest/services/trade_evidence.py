@@ -14,6 +14,8 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 
+from axiom_bt.pipeline.artifacts import find_tabular_artifact, read_frame
+
 
 class EvidenceFlag(str, Enum):
     YES = "YES"
@@ -111,12 +113,12 @@ def generate_trade_evidence(run_dir: Path) -> Optional[pd.DataFrame]:
     required inputs are missing.
     """
 
-    trades_path = run_dir / "trades.csv"
-    if not trades_path.exists():
+    trades_path = find_tabular_artifact(run_dir, "trades")
+    if trades_path is None:
         return None
 
     try:
-        trades = pd.read_csv(trades_path)
+        trades = read_frame(trades_path)
     except Exception:
         return None
 
@@ -0,0 +1,121 @@
+"""
+Expected-Bar Calendar for Pre-Paper Runtime History
+
+Regular-session (09:30-16:00 America/New_York) bar open times on NYSE
+trading days. Used by ensure_history() to find every missing bar inside a
+required window, not only gaps at its edges.
+
+Scheduled early closes (13:00) and past ad-hoc closures are modelled. Any
+other closure shows up as a gap that the provider confirms empty; that range
+is persisted in the cache (see runtime_history_loader).
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+from pandas.tseries.offsets import CustomBusinessDay, DateOffset, Day
+from dateutil.relativedelta import TH
+
+MARKET_TZ = "America/New_York"
+SESSION_OPEN = pd.Timedelta(hours=9, minutes=30)
+SESSION_MINUTES = 390
+EARLY_CLOSE_MINUTES = 210  # 09:30-13:00
+
+TF_MINUTES = {
+    "M1": 1,
+    "M5": 5,
+    "M15": 15,
+    "M30": 30,
+    "H1": 60,
+}
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """Full-day NYSE closures (holiday rules plus past ad-hoc closures)."""
+
+    rules = [
+        Holiday("NewYearsDay", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday("Juneteenth", month=6, day=19, start_date="2022-01-01", observance=nearest_workday),
+        Holiday("IndependenceDay", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+        Holiday("HurricaneSandy1", year=2012, month=10, day=29),
+        Holiday("HurricaneSandy2", year=2012, month=10, day=30),
+        Holiday("BushMourning", year=2018, month=12, day=5),
+        Holiday("CarterMourning", year=2025, month=1, day=9),
+    ]
+
+
+class NYSEEarlyCloseCalendar(AbstractHolidayCalendar):
+    """Scheduled 13:00 closes (only on days that are not already holidays)."""
+
+    rules = [
+        Holiday("IndependenceDayEve", month=7, day=3, days_of_week=(0, 1, 2, 3)),
+        Holiday("DayAfterThanksgiving", month=11, day=1, offset=[DateOffset(weekday=TH(4)), Day(1)]),
+        Holiday("ChristmasEve", month=12, day=24, days_of_week=(0, 1, 2, 3)),
+    ]
+
+
+_TRADING_DAY = CustomBusinessDay(calendar=NYSEHolidayCalendar())
+_EARLY_CLOSES = NYSEEarlyCloseCalendar()
+
+
+def tf_minutes(tf: str) -> int:
+    """Bar length in minutes for a pre-paper timeframe code."""
+    try:
+        return TF_MINUTES[tf.upper()]
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {tf} (allowed: {sorted(TF_MINUTES)})") from None
+
+
+@lru_cache(maxsize=64)
+def _session_grid(tf: str, first_day: pd.Timestamp, last_day: pd.Timestamp) -> np.ndarray:
+    days = pd.date_range(first_day, last_day, freq=_TRADING_DAY)
+    step = tf_minutes(tf)
+    early = days.isin(_EARLY_CLOSES.holidays(first_day, last_day))
+    session_minutes = np.where(early, EARLY_CLOSE_MINUTES, SESSION_MINUTES)
+    minutes = np.arange(0, SESSION_MINUTES, step)
+    # Row-major masking keeps the grid sorted; short sessions drop their tail
+    in_session = minutes[None, :] < session_minutes[:, None]
+    opens = days.values + SESSION_OPEN.to_timedelta64()
+    naive = (opens[:, None] + minutes[None, :] * np.timedelta64(1, "m"))[in_session]
+    grid = pd.DatetimeIndex(naive).tz_localize(MARKET_TZ).tz_convert("UTC")
+    return grid.asi8 // 1_000_000_000
+
+
+def expected_bar_seconds(tf: str, start_ts: pd.Timestamp, end_ts: pd.Timestamp) -> np.ndarray:
+    """
+    Sorted UTC epoch seconds of every regular-session bar open in [start, end].
+
+    Args:
+        tf: Timeframe (M1/M5/M15/M30/H1)
+        start_ts: Window start (timezone-aware, inclusive)
+        end_ts: Window end (timezone-aware, inclusive)
+
+    Returns:
+        int64 array (seconds, same unit as the SQLite cache ``ts`` column)
+    """
+    first_day = start_ts.tz_convert(MARKET_TZ).normalize().tz_localize(None)
+    last_day = end_ts.tz_convert(MARKET_TZ).normalize().tz_localize(None)
+    grid = _session_grid(tf.upper(), first_day, last_day)
+    lo = np.searchsorted(grid, int(start_ts.timestamp()), side="left")
+    hi = np.searchsorted(grid, int(end_ts.timestamp()), side="right")
+    return grid[lo:hi]
@@ -8,16 +8,97 @@ CRITICAL INVARIANTS:
 - Monotonic retrieval (ORDER BY ts)
 - TZ normalization (store UTC, document market_tz)
 - Source tracking (historical vs websocket)
+
+PERFORMANCE:
+- WAL journaling with synchronous=NORMAL (commits do not fsync the main db)
+- pooled=True shares one connection per db file across the process
+- transaction() groups many appends into a single commit
+- Appends and reads go through NumPy columns, not per-row Python objects
 """
 
 import sqlite3
 import logging
+import threading
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+MARKET_TZ = "America/New_York"
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+_BAR_DTYPE = np.dtype([("ts", "i8")] + [(name, "f8") for name in OHLCV_COLUMNS])
+_MAX_SYMBOLS_PER_QUERY = 500  # stays below SQLITE_MAX_VARIABLE_NUMBER on old builds
+
+_INSERT_SQL = """
+    INSERT OR REPLACE INTO bars
+    (symbol, tf, ts, market_tz, open, high, low, close, volume, source, inserted_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class _Connection:
+    """sqlite3 connection plus the lock/transaction depth shared by its users."""
+
+    def __init__(self, db_path: Path):
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.RLock()
+        self.depth = 0
+        self.schema_ready = False
+
+
+_POOL: Dict[str, _Connection] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def _pooled_connection(db_path: Path) -> _Connection:
+    key = str(db_path.resolve())
+    with _POOL_LOCK:
+        entry = _POOL.get(key)
+        if entry is None:
+            entry = _POOL[key] = _Connection(db_path)
+        return entry
+
+
+def close_pool() -> None:
+    """Close every pooled connection (process shutdown / tests)."""
+    with _POOL_LOCK:
+        entries = list(_POOL.values())
+        _POOL.clear()
+    for entry in entries:
+        with entry.lock:
+            entry.conn.close()
+
+
+def _utc_seconds(index: pd.DatetimeIndex) -> np.ndarray:
+    return index.tz_convert("UTC").astype("datetime64[ns, UTC]").asi8 // 1_000_000_000
+
+
+def _bounds_sql(start_ts: Optional[pd.Timestamp], end_ts: Optional[pd.Timestamp]) -> tuple:
+    query, params = "", []
+    if start_ts:
+        query += " AND ts >= ?"
+        params.append(int(start_ts.tz_convert('UTC').timestamp()))
+    if end_ts:
+        query += " AND ts <= ?"
+        params.append(int(end_ts.tz_convert('UTC').timestamp()))
+    return query, params
+
+
+def _bars_frame(records: np.ndarray) -> pd.DataFrame:
+    """OHLCV frame (market_tz index) from structured ts/ohlcv records."""
+    if len(records) == 0:
+        # Return empty DataFrame with correct columns
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    index = pd.to_datetime(records["ts"], unit="s", utc=True).tz_convert(MARKET_TZ)
+    index.name = "ts"
+    return pd.DataFrame({name: records[name] for name in OHLCV_COLUMNS}, index=index)
+
 
 class SQLiteCache:
     """
@@ -25,24 +106,59 @@ class SQLiteCache:
 
     Schema:
         bars(symbol, tf, ts, market_tz, open, high, low, close, volume, source, inserted_at)
+        empty_ranges(symbol, tf, start_ts, end_ts, confirmed_at)
 
     Operations:
         - append_bar(): Add single bar (WebSocket stream)
         - append_bars(): Batch insert (backfill)
+        - transaction(): Group appends into one commit
         - get_bars(): Retrieve range
+        - get_bars_many(): Retrieve range for many symbols in one query
+        - get_timestamps(): Cached bar times (UTC seconds) for gap detection
         - get_range(): Get cached min/max
+        - mark_empty(): Record a range the provider confirmed has no bars
+        - get_empty_ranges(): Confirmed-empty ranges (UTC seconds) for gap detection
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, pooled: bool = False):
         """
         Args:
             db_path: Path to pre_paper_cache.db
+            pooled: Share the process-wide connection for this db file;
+                close() then leaves it open for the next user
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pooled = pooled
 
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self._init_schema()
+        self._conn = _pooled_connection(self.db_path) if pooled else _Connection(self.db_path)
+        self.conn = self._conn.conn
+        with self._conn.lock:
+            if not self._conn.schema_ready:
+                self._init_schema()
+                self._conn.schema_ready = True
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Run the enclosed appends in one transaction (nested calls join it).
+
+        Commits when the outermost block exits, rolls back on error.
+        """
+        with self._conn.lock:
+            if self._conn.depth == 0:
+                self.conn.execute("BEGIN")
+            self._conn.depth += 1
+            try:
+                yield
+            except BaseException:
+                self._conn.depth -= 1
+                if self._conn.depth == 0:
+                    self.conn.execute("ROLLBACK")
+                raise
+            self._conn.depth -= 1
+            if self._conn.depth == 0:
+                self.conn.execute("COMMIT")
 
     def _init_schema(self):
         """Initialize database schema."""
@@ -70,7 +186,18 @@ class SQLiteCache:
             ON bars(symbol, tf, ts)
         """)
 
-        self.conn.commit()
+        # Provider-confirmed closures the calendar does not know about
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS empty_ranges (
+                symbol TEXT NOT NULL,
+                tf TEXT NOT NULL,
+                start_ts INTEGER NOT NULL,  -- Unix timestamp (UTC), first bar open
+                end_ts INTEGER NOT NULL,  -- Unix timestamp (UTC), last bar open
+                confirmed_at INTEGER NOT NULL,  -- Unix timestamp
+                PRIMARY KEY (symbol, tf, start_ts, end_ts)
+            )
+        """)
+
         logger.info(f"Initialized SQLite cache: {self.db_path}")
 
     def append_bar(
@@ -91,32 +218,26 @@ class SQLiteCache:
             ohlcv: Dict with open, high, low, close, volume
             source: Data source ('websocket', 'historical', 'backfill')
         """
-        cursor = self.conn.cursor()
-
         # Convert to UTC timestamp
         ts_utc = int(ts.tz_convert('UTC').timestamp())
         inserted_at = int(pd.Timestamp.now(tz='UTC').timestamp())
 
         try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO bars
-                (symbol, tf, ts, market_tz, open, high, low, close, volume, source, inserted_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                symbol,
-                tf,
-                ts_utc,
-                "America/New_York",  # IMMUTABLE
-                ohlcv["open"],
-                ohlcv["high"],
-                ohlcv["low"],
-                ohlcv["close"],
-                ohlcv["volume"],
-                source,
-                inserted_at
-            ))
-
-            self.conn.commit()
+            with self.transaction():
+                self.conn.execute(_INSERT_SQL, (
+                    symbol,
+                    tf,
+                    ts_utc,
+                    MARKET_TZ,  # IMMUTABLE
+                    ohlcv["open"],
+                    ohlcv["high"],
+                    ohlcv["low"],
+                    ohlcv["close"],
+                    ohlcv["volume"],
+                    source,
+                    inserted_at
+                ))
+
             logger.debug(f"Appended bar: {symbol} {tf} {ts} ({source})")
 
         except sqlite3.IntegrityError as e:
@@ -139,38 +260,25 @@ class SQLiteCache:
             df: DataFrame with OHLCV (timezone-aware DatetimeIndex)
             source: Data source
         """
-        cursor = self.conn.cursor()
         inserted_at = int(pd.Timestamp.now(tz='UTC').timestamp())
 
-        # Convert to UTC timestamps
-        df = df.copy()
-        df.index = df.index.tz_convert('UTC')
-
-        rows = [
-            (
-                symbol,
-                tf,
-                int(ts.timestamp()),
-                "America/New_York",
-                row["open"],
-                row["high"],
-                row["low"],
-                row["close"],
-                row["volume"],
-                source,
-                inserted_at
-            )
-            for ts, row in df.iterrows()
-        ]
+        # Columns -> Python scalars once (sqlite3 does not bind NumPy scalars)
+        ts_utc = _utc_seconds(df.index).tolist()
+        values = [df[name].to_numpy(dtype="float64").tolist() for name in OHLCV_COLUMNS]
+        rows = zip(
+            repeat(symbol),
+            repeat(tf),
+            ts_utc,
+            repeat(MARKET_TZ),
+            *values,
+            repeat(source),
+            repeat(inserted_at),
+        )
 
-        cursor.executemany("""
-            INSERT OR REPLACE INTO bars
-            (symbol, tf, ts, market_tz, open, high, low, close, volume, source, inserted_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, rows)
+        with self.transaction():
+            self.conn.executemany(_INSERT_SQL, rows)
 
-        self.conn.commit()
-        logger.info(f"Appended {len(rows)} bars: {symbol} {tf} ({source})")
+        logger.info(f"Appended {len(ts_utc)} bars: {symbol} {tf} ({source})")
 
     def get_bars(
         self,
@@ -191,42 +299,132 @@ class SQLiteCache:
         Returns:
             DataFrame with OHLCV (timezone-aware index in America/New_York)
         """
-        cursor = self.conn.cursor()
-
-        # Build query
-        query = """
+        bounds, bound_params = _bounds_sql(start_ts, end_ts)
+        query = f"""
             SELECT ts, open, high, low, close, volume
             FROM bars
-            WHERE symbol = ? AND tf = ?
+            WHERE symbol = ? AND tf = ?{bounds}
+            ORDER BY ts
         """
-        params = [symbol, tf]
 
-        if start_ts:
-            query += " AND ts >= ?"
-            params.append(int(start_ts.tz_convert('UTC').timestamp()))
+        with self._conn.lock:
+            records = np.fromiter(self.conn.execute(query, [symbol, tf, *bound_params]), dtype=_BAR_DTYPE)
 
-        if end_ts:
-            query += " AND ts <= ?"
-            params.append(int(end_ts.tz_convert('UTC').timestamp()))
+        return _bars_frame(records)
+
+    def get_timestamps(
+        self,
+        symbol: str,
+        tf: str,
+        start_ts: Optional[pd.Timestamp] = None,
+        end_ts: Optional[pd.Timestamp] = None
+    ) -> np.ndarray:
+        """
+        Cached bar timestamps as sorted int64 UTC epoch seconds.
 
-        query += " ORDER BY ts"
+        Served from the (symbol, tf, ts) primary key; used for gap detection.
+        """
+        bounds, bound_params = _bounds_sql(start_ts, end_ts)
+        query = f"SELECT ts FROM bars WHERE symbol = ? AND tf = ?{bounds} ORDER BY ts"
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        with self._conn.lock:
+            rows = self.conn.execute(query, [symbol, tf, *bound_params])
+            return np.fromiter((row[0] for row in rows), dtype=np.int64)
 
-        if not rows:
-            # Return empty DataFrame with correct columns
-            return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+    def get_bars_many(
+        self,
+        symbols: Iterable[str],
+        tf: str,
+        start_ts: Optional[pd.Timestamp] = None,
+        end_ts: Optional[pd.Timestamp] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Retrieve the same range for many symbols with one query per 500 symbols.
 
-        # Convert to DataFrame
-        df = pd.DataFrame(rows, columns=["ts", "open", "high", "low", "close", "volume"])
+        Args:
+            symbols: Stock symbols
+            tf: Timeframe
+            start_ts: Start timestamp (inclusive, optional)
+            end_ts: End timestamp (inclusive, optional)
 
-        # Convert timestamps to DatetimeIndex (market_tz)
-        df["ts"] = pd.to_datetime(df["ts"], unit="s", utc=True)
-        df["ts"] = df["ts"].dt.tz_convert("America/New_York")
-        df.set_index("ts", inplace=True)
+        Returns:
+            {symbol: DataFrame} shaped like get_bars() (empty frame if uncached)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        bounds, bound_params = _bounds_sql(start_ts, end_ts)
+        result: Dict[str, pd.DataFrame] = {}
+
+        for offset in range(0, len(symbols), _MAX_SYMBOLS_PER_QUERY):
+            chunk = symbols[offset:offset + _MAX_SYMBOLS_PER_QUERY]
+            query = f"""
+                SELECT symbol, ts, open, high, low, close, volume
+                FROM bars
+                WHERE tf = ? AND symbol IN ({", ".join("?" * len(chunk))}){bounds}
+                ORDER BY symbol, ts
+            """
+            with self._conn.lock:
+                rows = self.conn.execute(query, [tf, *chunk, *bound_params]).fetchall()
+            names = np.array([row[0] for row in rows], dtype=object)
+            records = np.fromiter((row[1:] for row in rows), dtype=_BAR_DTYPE, count=len(rows))
+
+            # Rows are grouped by symbol: split at the boundaries
+            starts = np.flatnonzero(np.r_[True, names[1:] != names[:-1]]) if len(records) else []
+            for first, stop in zip(starts, [*starts[1:], len(records)]):
+                result[names[first]] = _bars_frame(records[first:stop])
+
+        empty = np.empty(0, dtype=_BAR_DTYPE)
+        return {symbol: result[symbol] if symbol in result else _bars_frame(empty) for symbol in symbols}
+
+    def mark_empty(self, symbol: str, tf: str, start_ts: pd.Timestamp, end_ts: pd.Timestamp):
+        """
+        Record that the provider has no bars in [start_ts, end_ts].
 
-        return df
+        Args:
+            symbol: Stock symbol
+            tf: Timeframe
+            start_ts: First bar open of the range (timezone-aware, inclusive)
+            end_ts: Last bar open of the range (timezone-aware, inclusive)
+        """
+        confirmed_at = int(pd.Timestamp.now(tz='UTC').timestamp())
+        with self.transaction():
+            self.conn.execute(
+                "INSERT OR REPLACE INTO empty_ranges (symbol, tf, start_ts, end_ts, confirmed_at) VALUES (?, ?, ?, ?, ?)",
+                (
+                    symbol,
+                    tf,
+                    int(start_ts.tz_convert('UTC').timestamp()),
+                    int(end_ts.tz_convert('UTC').timestamp()),
+                    confirmed_at,
+                ),
+            )
+
+        logger.debug(f"Marked empty: {symbol} {tf} {start_ts} → {end_ts}")
+
+    def get_empty_ranges(
+        self,
+        symbol: str,
+        tf: str,
+        start_ts: Optional[pd.Timestamp] = None,
+        end_ts: Optional[pd.Timestamp] = None
+    ) -> np.ndarray:
+        """
+        Confirmed-empty ranges overlapping [start_ts, end_ts].
+
+        Returns:
+            int64 array of shape (n, 2): inclusive (start, end) UTC epoch seconds
+        """
+        query = "SELECT start_ts, end_ts FROM empty_ranges WHERE symbol = ? AND tf = ?"
+        params = [symbol, tf]
+        if start_ts:
+            query += " AND end_ts >= ?"
+            params.append(int(start_ts.tz_convert('UTC').timestamp()))
+        if end_ts:
+            query += " AND start_ts <= ?"
+            params.append(int(end_ts.tz_convert('UTC').timestamp()))
+
+        with self._conn.lock:
+            rows = self.conn.execute(query + " ORDER BY start_ts", params).fetchall()
+        return np.array(rows, dtype=np.int64).reshape(-1, 2)
 
     def get_range(self, symbol: str, tf: str) -> Optional[tuple]:
         """
@@ -239,24 +437,23 @@ class SQLiteCache:
         Returns:
             Tuple of (min_ts, max_ts) or None if no data
         """
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            SELECT MIN(ts), MAX(ts)
-            FROM bars
-            WHERE symbol = ? AND tf = ?
-        """, (symbol, tf))
-
-        row = cursor.fetchone()
+        with self._conn.lock:
+            row = self.conn.execute("""
+                SELECT MIN(ts), MAX(ts)
+                FROM bars
+                WHERE symbol = ? AND tf = ?
+            """, (symbol, tf)).fetchone()
 
         if row and row[0] is not None:
-            min_ts = pd.Timestamp(row[0], unit="s", tz="UTC").tz_convert("America/New_York")
-            max_ts = pd.Timestamp(row[1], unit="s", tz="UTC").tz_convert("America/New_York")
+            min_ts = pd.Timestamp(row[0], unit="s", tz="UTC").tz_convert(MARKET_TZ)
+            max_ts = pd.Timestamp(row[1], unit="s", tz="UTC").tz_convert(MARKET_TZ)
             return (min_ts, max_ts)
 
         return None
 
     def close(self):
-        """Close database connection."""
+        """Close database connection (pooled connections stay open)."""
+        if self.pooled:
+            return
         self.conn.close()
         logger.info(f"Closed SQLite cache: {self.db_path}")
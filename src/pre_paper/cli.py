@@ -19,7 +19,7 @@ if _MONOREPO_PATH.exists() and str(_MONOREPO_PATH) not in sys.path:
     sys.path.insert(0, str(_MONOREPO_PATH))
 
 from pre_paper.marketdata_port import PrePaperMarketDataPort
-from pre_paper.plan_writer import PlanWriter
+from pre_paper.plan_writer import PlanWriter, idempotency_key
 from pre_paper.manifest_writer import ManifestWriter
 
 logger = logging.getLogger(__name__)
@@ -103,9 +103,7 @@ async def run_prepaper(
             }
             
             # Deterministic idempotency_key
-            import hashlib
-            canonical = f"{order['ts']}|{order['symbol']}|{order['side']}|{order['strategy_key']}|{order['entry_price']}|{order['sl']}|{order['tp']}"
-            order["idempotency_key"] = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+            order["idempotency_key"] = idempotency_key(order)
             
             orders.append(order)
     
@@ -5,15 +5,34 @@ Writes deterministic plan.json with:
 - Stable sorting (ts, symbol, side, idempotency_key)
 - Canonical JSON (sort_keys, stable separators)
 - Schema versioning
+
+idempotency_key() is the single definition of an order intent's
+idempotency key; every producer of order intents (replay CLI, runtime)
+must use it so the same signal always dedupes to the same key.
 """
 
 import json
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Mapping
 from datetime import datetime
 
 
+# Order fields hashed into the idempotency key, in canonical order
+IDEMPOTENCY_FIELDS = ("ts", "symbol", "side", "strategy_key", "entry_price", "sl", "tp")
+
+
+def idempotency_key(order: Mapping[str, Any]) -> str:
+    """
+    Deterministic idempotency key of an order intent.
+
+    sha256 over "ts|symbol|side|strategy_key|entry_price|sl|tp" (str() of
+    each value), truncated to 16 hex chars.
+    """
+    canonical = "|".join(str(order[k]) for k in IDEMPOTENCY_FIELDS)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
 class PlanWriter:
     """
     Deterministic plan.json writer for PrePaper.
@@ -0,0 +1,271 @@
+"""
+Pre-Paper Multi-Symbol Runtime
+
+Concurrent asyncio runtime: one feed for N symbols → per-symbol incremental
+InsideBar evaluation → batched signal writes.
+
+    feed task ──► evaluator[symbol].update(bar) ──► signal queue ──► writer task ──► write_signals()
+
+Each symbol owns an InsideBarSignalState (O(1) per bar). The writer flushes a
+batch when it reaches ``batch_size`` or its oldest signal waited
+``flush_interval_s``, so write latency never stalls evaluation.
+
+Backpressure: the signal queue is bounded. A slow writer blocks the feed (and
+thus the upstream service) instead of buffering without limit; the number of
+blocked puts is reported as ``writer_waits``.
+
+Latency: measured per bar from the moment the feed hands it over until its
+evaluation (and the enqueue of any signals) completes. Per-symbol
+count/mean/p50/p99/max are returned in RuntimeMetrics and logged at the end.
+
+The runtime only talks to PrePaperMarketDataPort (open_feed, write_signals);
+it does not import marketdata_service itself.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from pre_paper.plan_writer import idempotency_key
+from strategies.inside_bar import core_config_from_params
+from strategies.inside_bar.core import InsideBarCore
+from strategies.inside_bar.incremental import InsideBarSignalState
+from strategies.inside_bar.models import RawSignal
+
+logger = logging.getLogger(__name__)
+
+_LATENCY_SAMPLES = 4096  # recent samples kept per symbol for percentiles
+
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """Static settings of one runtime session."""
+
+    lab: str
+    run_id: str
+    source_tag: str = "prepaper_inside_bar"
+    strategy_key: str = "inside_bar"
+    signal_queue_size: int = 4096
+    batch_size: int = 256
+    flush_interval_s: float = 0.25
+
+    def __post_init__(self):
+        for name in ("signal_queue_size", "batch_size"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be > 0 (got {getattr(self, name)})")
+        if self.flush_interval_s <= 0:
+            raise ValueError(f"flush_interval_s must be > 0 (got {self.flush_interval_s})")
+
+
+@dataclass
+class SymbolMetrics:
+    """Per-symbol counters and bar-to-signal latency samples (seconds)."""
+
+    bars: int = 0
+    signals: int = 0
+    latency_total_s: float = 0.0
+    latency_max_s: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=_LATENCY_SAMPLES))
+
+    def record(self, latency_s: float, signals: int) -> None:
+        self.bars += 1
+        self.signals += signals
+        self.latency_total_s += latency_s
+        self.latency_max_s = max(self.latency_max_s, latency_s)
+        self.samples.append(latency_s)
+
+    def to_dict(self) -> Dict[str, Any]:
+        p50, p99 = np.percentile(self.samples, [50, 99]) if self.samples else (0.0, 0.0)
+        return {
+            "bars": self.bars,
+            "signals": self.signals,
+            "latency_mean_ms": 1000 * self.latency_total_s / self.bars if self.bars else 0.0,
+            "latency_p50_ms": 1000 * float(p50),
+            "latency_p99_ms": 1000 * float(p99),
+            "latency_max_ms": 1000 * self.latency_max_s,
+        }
+
+
+@dataclass
+class RuntimeMetrics:
+    """Result of PrePaperRuntime.run()."""
+
+    symbols: Dict[str, SymbolMetrics] = field(default_factory=dict)
+    events: int = 0
+    skipped_events: int = 0
+    batches_written: int = 0
+    signals_written: int = 0
+    duplicates_skipped: int = 0
+    writer_waits: int = 0
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        per_symbol = {symbol: m.to_dict() for symbol, m in sorted(self.symbols.items())}
+        return {
+            "events": self.events,
+            "skipped_events": self.skipped_events,
+            "batches_written": self.batches_written,
+            "signals_written": self.signals_written,
+            "duplicates_skipped": self.duplicates_skipped,
+            "writer_waits": self.writer_waits,
+            "elapsed_s": self.elapsed_s,
+            "max_latency_p99_ms": max((m["latency_p99_ms"] for m in per_symbol.values()), default=0.0),
+            "symbols": per_symbol,
+        }
+
+
+def signal_record(signal: RawSignal, symbol: str, strategy_key: str) -> Dict[str, Any]:
+    """
+    Order-intent dict for write_signals() with a deterministic idempotency_key.
+
+    Keyed with plan_writer.idempotency_key, like the replay CLI.
+    """
+    record = {
+        "ts": pd.Timestamp(signal.timestamp).isoformat(),
+        "symbol": symbol,
+        "side": signal.side,
+        "strategy_key": strategy_key,
+        "entry_price": signal.entry_price,
+        "sl": signal.stop_loss,
+        "tp": signal.take_profit,
+    }
+    record["idempotency_key"] = idempotency_key(record)
+    return record
+
+
+class PrePaperRuntime:
+    """
+    asyncio runtime evaluating InsideBar on one feed for many symbols.
+
+    Usage:
+        runtime = PrePaperRuntime(port, symbols, strategy_params, RuntimeConfig(lab="PREPAPER", run_id=run_id))
+        metrics = await runtime.run(mode="replay", start=start, end=end, timeframe="M5")
+
+    ``strategy_params`` are InsideBar SSOT params (timeframe_minutes required);
+    the feed timeframe must match them. ``history`` ({symbol: OHLCV frame},
+    e.g. SQLiteCache.get_bars_many()) seeds indicator and session state.
+    """
+
+    def __init__(
+        self,
+        port,
+        symbols: List[str],
+        strategy_params: Mapping[str, Any],
+        config: RuntimeConfig,
+        history: Optional[Mapping[str, pd.DataFrame]] = None,
+    ):
+        if not symbols:
+            raise ValueError("symbols must not be empty")
+        self.port = port
+        self.symbols = list(dict.fromkeys(symbols))
+        self.config = config
+        core = InsideBarCore(core_config_from_params(dict(strategy_params)))
+        history = history or {}
+        self.states: Dict[str, InsideBarSignalState] = {}
+        for symbol in self.symbols:
+            seed = history.get(symbol)
+            self.states[symbol] = core.signal_state(symbol, seed if seed is not None and not seed.empty else None)
+
+    async def run(
+        self,
+        mode: str = "replay",
+        start=None,
+        end=None,
+        timeframe: str = "M1",
+        session_mode: str = "rth",
+    ) -> RuntimeMetrics:
+        """Consume the feed until it ends; return metrics after the final flush."""
+        metrics = RuntimeMetrics(symbols={symbol: SymbolMetrics() for symbol in self.symbols})
+        signal_queue: asyncio.Queue = asyncio.Queue(self.config.signal_queue_size)
+        started = time.perf_counter()
+
+        async def feed() -> None:
+            # Evaluation never awaits, so bars are dispatched inline: a queue hop
+            # per bar would cost more than the O(1) evaluator update itself.
+            async for event in self.port.open_feed(
+                self.symbols, mode, start=start, end=end, timeframe=timeframe, session_mode=session_mode
+            ):
+                received = time.perf_counter()
+                metrics.events += 1
+                symbol = getattr(event, "symbol", None)
+                state = self.states.get(symbol)
+                try:
+                    bar = {"timestamp": event.ts, "open": event.open, "high": event.high, "low": event.low, "close": event.close}
+                except AttributeError:  # ticks and other non-bar events
+                    bar = None
+                if state is None or bar is None:
+                    metrics.skipped_events += 1
+                    continue
+                signals = state.update(bar)
+                for signal in signals:
+                    if signal_queue.full():
+                        metrics.writer_waits += 1
+                    await signal_queue.put(signal_record(signal, symbol, self.config.strategy_key))
+                metrics.symbols[symbol].record(time.perf_counter() - received, len(signals))
+            await signal_queue.put(None)
+
+        async def write() -> None:
+            # Flush when the batch is full or its oldest record waited flush_interval_s
+            loop = asyncio.get_running_loop()
+            batch: List[Dict[str, Any]] = []
+            deadline = 0.0
+            while True:
+                timeout = max(0.0, deadline - loop.time()) if batch else None
+                try:
+                    record = await asyncio.wait_for(signal_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    await self._flush(batch, metrics)
+                    batch = []
+                    continue
+                if record is None:
+                    if batch:
+                        await self._flush(batch, metrics)
+                    return
+                if not batch:
+                    deadline = loop.time() + self.config.flush_interval_s
+                batch.append(record)
+                if len(batch) >= self.config.batch_size:
+                    await self._flush(batch, metrics)
+                    batch = []
+
+        # A failing task cancels the other (the feed is never left blocked on a dead writer)
+        tasks = [asyncio.ensure_future(write()), asyncio.ensure_future(feed())]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        metrics.elapsed_s = time.perf_counter() - started
+        summary = metrics.to_dict()
+        logger.info(
+            "actions: prepaper_runtime_done run_id=%s symbols=%d events=%d signals=%d batches=%d "
+            "p99_max_ms=%.3f writer_waits=%d elapsed_s=%.3f",
+            self.config.run_id,
+            len(self.symbols),
+            metrics.events,
+            metrics.signals_written,
+            metrics.batches_written,
+            summary["max_latency_p99_ms"],
+            metrics.writer_waits,
+            metrics.elapsed_s,
+        )
+        return metrics
+
+    async def _flush(self, batch: List[Dict[str, Any]], metrics: RuntimeMetrics) -> None:
+        result = await self.port.write_signals(
+            lab=self.config.lab,
+            run_id=self.config.run_id,
+            source_tag=self.config.source_tag,
+            signals=batch,
+        )
+        metrics.batches_written += 1
+        metrics.signals_written += int(getattr(result, "written", len(batch)))
+        metrics.duplicates_skipped += int(getattr(result, "duplicates_skipped", 0))
@@ -6,19 +6,35 @@ Ensures runtime history is sufficient for strategy execution.
 CRITICAL CONTRACT:
 - Strategy execution ONLY if ensure_history() returns SUFFICIENT
 - Otherwise: NO-SIGNALS with logged reason
+
+Gap detection compares the cached bar timestamps against the expected-bar
+calendar (pre_paper.bar_calendar) in one array pass, so holes inside the
+cached range are found as well as missing edges. All gaps are backfilled
+concurrently (bounded) and written in a single cache transaction.
+ensure_history() does this on a thread pool and never starts an event loop;
+ensure_history_async() is the awaitable variant.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+from pre_paper.bar_calendar import expected_bar_seconds
 from pre_paper.history_status import HistoryStatus, HistoryCheckResult, DateRange
 from pre_paper.historical_provider import HistoricalProvider
-from pre_paper.cache.sqlite_cache import SQLiteCache
+from pre_paper.cache.sqlite_cache import MARKET_TZ, SQLiteCache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BACKFILL_CONCURRENCY = 4
+
+# (gap, fetched bars or None, fetch error or None)
+GapFetch = Tuple[DateRange, Optional[pd.DataFrame], Optional[Exception]]
+
 
 def ensure_history(
     symbol: str,
@@ -28,19 +44,24 @@ def ensure_history(
     required_end_ts: pd.Timestamp,
     cache_db_path: Path,
     historical_provider: Optional[HistoricalProvider] = None,
-    auto_backfill: bool = False
+    auto_backfill: bool = False,
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY
 ) -> HistoryCheckResult:
     """
     Ensure runtime history is sufficient for strategy execution.
 
     Workflow:
-    1. Check pre_paper_cache.db for required window
-    2. If complete → SUFFICIENT
+    1. Find every missing expected bar in the required window
+    2. If none → SUFFICIENT
     3. If gaps:
-       - If auto_backfill=True: fetch missing ranges
+       - If auto_backfill=True: fetch all gaps concurrently, store, re-check
        - Else: DEGRADED
     4. Return HistoryCheckResult
 
+    Gaps are fetched on a thread pool, so no event loop is started and this
+    is safe to call from inside one; async code can await
+    ensure_history_async() instead.
+
     Args:
         symbol: Stock symbol
         tf: Target timeframe (M5/M15)
@@ -50,252 +71,293 @@ def ensure_history(
         cache_db_path: Path to pre_paper_cache.db
         historical_provider: Provider for backfilling
         auto_backfill: Enable automatic backfill
+        max_concurrency: Max gap fetches in flight
 
     Returns:
         HistoryCheckResult with status
     """
-    # Open cache
-    cache = SQLiteCache(cache_db_path)
+    # Shared WAL connection: repeated per-symbol checks reuse it
+    cache = SQLiteCache(cache_db_path, pooled=True)
+    try:
+        check = _HistoryCheck(cache, symbol, tf, base_tf_used, required_start_ts, required_end_ts)
+        done = check.before_backfill(historical_provider, auto_backfill, max_concurrency)
+        if done is not None:
+            return done
+        return check.after_backfill(
+            backfill_gaps_threaded(historical_provider, symbol, tf, check.gaps, max_concurrency)
+        )
+    finally:
+        cache.close()
+
 
+async def ensure_history_async(
+    symbol: str,
+    tf: str,
+    base_tf_used: str,
+    required_start_ts: pd.Timestamp,
+    required_end_ts: pd.Timestamp,
+    cache_db_path: Path,
+    historical_provider: Optional[HistoricalProvider] = None,
+    auto_backfill: bool = False,
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY
+) -> HistoryCheckResult:
+    """Async variant of ensure_history() (same arguments and contract)."""
+    cache = SQLiteCache(cache_db_path, pooled=True)
     try:
-        # Get cached range
-        cached_range = cache.get_range(symbol, tf)
-
-        if cached_range is None:
-            # No data in cache
-            logger.warning(f"No cached data for {symbol} {tf}")
-
-            if auto_backfill and historical_provider:
-                # Attempt backfill
-                logger.info(f"Backfilling {symbol} {tf}: {required_start_ts} → {required_end_ts}")
-
-                try:
-                    df = historical_provider.fetch_bars(symbol, tf, required_start_ts, required_end_ts)
-
-                    if len(df) > 0:
-                        # Store in cache
-                        cache.append_bars(symbol, tf, df, source="backfill")
-                        logger.info(f"Backfilled {len(df)} bars for {symbol} {tf}")
-
-                        # Re-check cache
-                        cached_range = cache.get_range(symbol, tf)
-
-                        if cached_range:
-                            cached_start_ts, cached_end_ts = cached_range
-
-                            # Check if now sufficient
-                            if cached_start_ts <= required_start_ts and cached_end_ts >= required_end_ts:
-                                return HistoryCheckResult(
-                                    status=HistoryStatus.SUFFICIENT,
-                                    symbol=symbol,
-                                    tf=tf,
-                                    base_tf_used=base_tf_used,
-                                    required_start_ts=required_start_ts,
-                                    required_end_ts=required_end_ts,
-                                    cached_start_ts=cached_start_ts,
-                                    cached_end_ts=cached_end_ts,
-                                    gaps=[],
-                                    fetch_attempted=True,
-                                    fetch_success=True,
-                                    reason=None
-                                )
-                            else:
-                                # Still gaps after backfill
-                                gaps = _calculate_gaps(required_start_ts, required_end_ts, cached_start_ts, cached_end_ts)
-
-                                return HistoryCheckResult(
-                                    status=HistoryStatus.LOADING,
-                                    symbol=symbol,
-                                    tf=tf,
-                                    base_tf_used=base_tf_used,
-                                    required_start_ts=required_start_ts,
-                                    required_end_ts=required_end_ts,
-                                    cached_start_ts=cached_start_ts,
-                                    cached_end_ts=cached_end_ts,
-                                    gaps=gaps,
-                                    fetch_attempted=True,
-                                    fetch_success=True,
-                                    reason=f"Partial backfill complete, gaps remain: {gaps[0].start} → {gaps[0].end}"
-                                )
-                    else:
-                        # Fetch returned empty
-                        logger.warning(f"Backfill returned no data for {symbol} {tf}")
-
-                        return HistoryCheckResult(
-                            status=HistoryStatus.DEGRADED,
-                            symbol=symbol,
-                            tf=tf,
-                            base_tf_used=base_tf_used,
-                            required_start_ts=required_start_ts,
-                            required_end_ts=required_end_ts,
-                            cached_start_ts=None,
-                            cached_end_ts=None,
-                            gaps=[DateRange(required_start_ts, required_end_ts)],
-                            fetch_attempted=True,
-                            fetch_success=False,
-                            reason="Backfill returned no data"
-                        )
-
-                except Exception as e:
-                    logger.error(f"Backfill failed for {symbol} {tf}: {e}")
-
-                    return HistoryCheckResult(
-                        status=HistoryStatus.DEGRADED,
-                        symbol=symbol,
-                        tf=tf,
-                        base_tf_used=base_tf_used,
-                        required_start_ts=required_start_ts,
-                        required_end_ts=required_end_ts,
-                        cached_start_ts=None,
-                        cached_end_ts=None,
-                        gaps=[DateRange(required_start_ts, required_end_ts)],
-                        fetch_attempted=True,
-                        fetch_success=False,
-                        reason=f"Backfill error: {str(e)}"
-                    )
-            else:
-                # No backfill, degraded
-                return HistoryCheckResult(
-                    status=HistoryStatus.DEGRADED,
-                    symbol=symbol,
-                    tf=tf,
-                    base_tf_used=base_tf_used,
-                    required_start_ts=required_start_ts,
-                    required_end_ts=required_end_ts,
-                    cached_start_ts=None,
-                    cached_end_ts=None,
-                    gaps=[DateRange(required_start_ts, required_end_ts)],
-                    fetch_attempted=False,
-                    fetch_success=False,
-                    reason="No cached data, auto_backfill disabled"
-                )
-
-        # Cache has data - check coverage
-        cached_start_ts, cached_end_ts = cached_range
-
-        # Check if cache covers required window
-        if cached_start_ts <= required_start_ts and cached_end_ts >= required_end_ts:
-            # SUFFICIENT
+        check = _HistoryCheck(cache, symbol, tf, base_tf_used, required_start_ts, required_end_ts)
+        done = check.before_backfill(historical_provider, auto_backfill, max_concurrency)
+        if done is not None:
+            return done
+        return check.after_backfill(
+            await backfill_gaps(historical_provider, symbol, tf, check.gaps, max_concurrency)
+        )
+    finally:
+        cache.close()
+
+
+class _HistoryCheck:
+    """The cache-side steps of one ensure_history() call, around the backfill."""
+
+    def __init__(
+        self,
+        cache: SQLiteCache,
+        symbol: str,
+        tf: str,
+        base_tf_used: str,
+        required_start_ts: pd.Timestamp,
+        required_end_ts: pd.Timestamp
+    ):
+        self.cache = cache
+        self.symbol = symbol
+        self.tf = tf
+        self.base_tf_used = base_tf_used
+        self.required_start_ts = required_start_ts
+        self.required_end_ts = required_end_ts
+        self.gaps: List[DateRange] = []
+
+    def result(self, status, gaps, fetch_attempted=False, fetch_success=False, reason=None) -> HistoryCheckResult:
+        cached_range = self.cache.get_range(self.symbol, self.tf)
+        return HistoryCheckResult(
+            status=status,
+            symbol=self.symbol,
+            tf=self.tf,
+            base_tf_used=self.base_tf_used,
+            required_start_ts=self.required_start_ts,
+            required_end_ts=self.required_end_ts,
+            cached_start_ts=cached_range[0] if cached_range else None,
+            cached_end_ts=cached_range[1] if cached_range else None,
+            gaps=gaps,
+            fetch_attempted=fetch_attempted,
+            fetch_success=fetch_success,
+            reason=reason
+        )
+
+    def find_gaps(self) -> List[DateRange]:
+        return find_gaps(self.cache, self.symbol, self.tf, self.required_start_ts, self.required_end_ts)
+
+    def before_backfill(
+        self,
+        historical_provider: Optional[HistoricalProvider],
+        auto_backfill: bool,
+        max_concurrency: int
+    ) -> Optional[HistoryCheckResult]:
+        """Final result if no backfill is needed or allowed, else None (gaps in self.gaps)."""
+        symbol, tf = self.symbol, self.tf
+        gaps = self.gaps = self.find_gaps()
+
+        if not gaps:
             logger.info(f"History SUFFICIENT for {symbol} {tf}")
+            return self.result(HistoryStatus.SUFFICIENT, [])
 
-            return HistoryCheckResult(
-                status=HistoryStatus.SUFFICIENT,
-                symbol=symbol,
-                tf=tf,
-                base_tf_used=base_tf_used,
-                required_start_ts=required_start_ts,
-                required_end_ts=required_end_ts,
-                cached_start_ts=cached_start_ts,
-                cached_end_ts=cached_end_ts,
-                gaps=[],
-                fetch_attempted=False,
-                fetch_success=False,
-                reason=None
+        logger.warning(f"History gaps for {symbol} {tf}: {len(gaps)} gap(s), first {gaps[0].start} → {gaps[0].end}")
+
+        if not (auto_backfill and historical_provider):
+            if self.cache.get_range(symbol, tf) is None:
+                reason = "No cached data, auto_backfill disabled"
+            else:
+                reason = f"History gaps exist, auto_backfill disabled: {gaps[0].start} → {gaps[0].end}"
+            return self.result(HistoryStatus.DEGRADED, gaps, reason=reason)
+
+        logger.info(f"Backfilling {len(gaps)} gap(s) for {symbol} {tf} (concurrency={max_concurrency})")
+        return None
+
+    def after_backfill(self, fetched: List[GapFetch]) -> HistoryCheckResult:
+        """Store the fetched bars in one transaction and re-check."""
+        cache, symbol, tf = self.cache, self.symbol, self.tf
+
+        with cache.transaction():
+            for _, df, _ in fetched:
+                if df is not None and len(df) > 0:
+                    cache.append_bars(symbol, tf, df, source="backfill")
+
+        errors = [(gap, exc) for gap, _, exc in fetched if exc is not None]
+        fetched_bars = sum(len(df) for _, df, _ in fetched if df is not None)
+        fetch_success = not errors and fetched_bars > 0
+
+        if errors:
+            gap, exc = errors[0]
+            logger.error(f"Backfill failed for {symbol} {tf} ({gap.start} → {gap.end}): {exc}")
+            return self.result(
+                HistoryStatus.DEGRADED,
+                self.find_gaps(),
+                fetch_attempted=True,
+                reason=f"Backfill error: {str(exc)}"
             )
-        else:
-            # Gaps exist
-            gaps = _calculate_gaps(required_start_ts, required_end_ts, cached_start_ts, cached_end_ts)
-
-            logger.warning(f"History gaps for {symbol} {tf}: {gaps}")
-
-            # Attempt backfill if enabled
-            if auto_backfill and historical_provider and len(gaps) > 0:
-                # Backfill first gap (simplified for PoC)
-                gap = gaps[0]
-
-                logger.info(f"Backfilling gap: {symbol} {tf}: {gap.start} → {gap.end}")
-
-                try:
-                    df = historical_provider.fetch_bars(symbol, tf, gap.start, gap.end)
-
-                    if len(df) > 0:
-                        cache.append_bars(symbol, tf, df, source="backfill")
-                        logger.info(f"Backfilled {len(df)} bars")
-
-                        # Return LOADING (gap being filled)
-                        return HistoryCheckResult(
-                            status=HistoryStatus.LOADING,
-                            symbol=symbol,
-                            tf=tf,
-                            base_tf_used=base_tf_used,
-                            required_start_ts=required_start_ts,
-                            required_end_ts=required_end_ts,
-                            cached_start_ts=cached_start_ts,
-                            cached_end_ts=cached_end_ts,
-                            gaps=gaps,
-                            fetch_attempted=True,
-                            fetch_success=True,
-                            reason=f"Backfilling gap: {gap.start} → {gap.end}"
-                        )
-                    else:
-                        return HistoryCheckResult(
-                            status=HistoryStatus.DEGRADED,
-                            symbol=symbol,
-                            tf=tf,
-                            base_tf_used=base_tf_used,
-                            required_start_ts=required_start_ts,
-                            required_end_ts=required_end_ts,
-                            cached_start_ts=cached_start_ts,
-                            cached_end_ts=cached_end_ts,
-                            gaps=gaps,
-                            fetch_attempted=True,
-                            fetch_success=False,
-                            reason=f"Backfill returned no data for gap: {gap.start} → {gap.end}"
-                        )
-
-                except Exception as e:
-                    logger.error(f"Backfill failed: {e}")
-
-                    return HistoryCheckResult(
-                        status=HistoryStatus.DEGRADED,
-                        symbol=symbol,
-                        tf=tf,
-                        base_tf_used=base_tf_used,
-                        required_start_ts=required_start_ts,
-                        required_end_ts=required_end_ts,
-                        cached_start_ts=cached_start_ts,
-                        cached_end_ts=cached_end_ts,
-                        gaps=gaps,
-                        fetch_attempted=True,
-                        fetch_success=False,
-                        reason=f"Backfill error: {str(e)}"
-                    )
+
+        remaining, empty = _unresolved_gaps(
+            cache, symbol, tf, self.required_start_ts, self.required_end_ts, fetched
+        )
+
+        if not remaining:
+            logger.info(f"Backfilled {fetched_bars} bars, history SUFFICIENT for {symbol} {tf}")
+            return self.result(HistoryStatus.SUFFICIENT, [], fetch_attempted=True, fetch_success=fetch_success)
+
+        if empty:
+            if fetched_bars == 0:
+                reason = "Backfill returned no data"
             else:
-                # No backfill - DEGRADED
-                return HistoryCheckResult(
-                    status=HistoryStatus.DEGRADED,
-                    symbol=symbol,
-                    tf=tf,
-                    base_tf_used=base_tf_used,
-                    required_start_ts=required_start_ts,
-                    required_end_ts=required_end_ts,
-                    cached_start_ts=cached_start_ts,
-                    cached_end_ts=cached_end_ts,
-                    gaps=gaps,
-                    fetch_attempted=False,
-                    fetch_success=False,
-                    reason=f"History gaps exist, auto_backfill disabled: {gaps[0].start} → {gaps[0].end}"
-                )
+                reason = f"Backfill returned no data for gap: {empty[0].start} → {empty[0].end}"
+            logger.warning(f"{reason} ({symbol} {tf})")
+            return self.result(
+                HistoryStatus.DEGRADED,
+                remaining,
+                fetch_attempted=True,
+                fetch_success=fetch_success,
+                reason=reason
+            )
 
-    finally:
-        cache.close()
+        return self.result(
+            HistoryStatus.LOADING,
+            remaining,
+            fetch_attempted=True,
+            fetch_success=fetch_success,
+            reason=f"Partial backfill complete, gaps remain: {remaining[0].start} → {remaining[0].end}"
+        )
 
 
-def _calculate_gaps(
+def find_gaps(
+    cache: SQLiteCache,
+    symbol: str,
+    tf: str,
+    required_start: pd.Timestamp,
+    required_end: pd.Timestamp
+) -> List[DateRange]:
+    """
+    Missing runs of expected bars in [required_start, required_end].
+
+    Each gap spans the first to the last missing bar open (inclusive), so it
+    can be passed to HistoricalProvider.fetch_bars() unchanged. Bars inside
+    ranges the provider already confirmed empty are not missing.
+    """
+    expected = expected_bar_seconds(tf, required_start, required_end)
+    if len(expected) == 0:
+        return []
+    cached = cache.get_timestamps(symbol, tf, required_start, required_end)
+    missing = ~np.isin(expected, cached, assume_unique=True)
+    for lo, hi in cache.get_empty_ranges(symbol, tf, required_start, required_end):
+        missing[np.searchsorted(expected, lo, side="left"):np.searchsorted(expected, hi, side="right")] = False
+    return _missing_runs(expected, missing)
+
+
+def _missing_runs(expected: np.ndarray, missing: np.ndarray) -> List[DateRange]:
+    """Group consecutive missing calendar slots into DateRanges."""
+    positions = np.flatnonzero(missing)
+    if len(positions) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(positions) > 1)
+    firsts = positions[np.r_[0, breaks + 1]]
+    lasts = positions[np.r_[breaks, len(positions) - 1]]
+    return [DateRange(_market_ts(expected[a]), _market_ts(expected[b])) for a, b in zip(firsts, lasts)]
+
+
+def _market_ts(seconds) -> pd.Timestamp:
+    return pd.Timestamp(int(seconds), unit="s", tz="UTC").tz_convert(MARKET_TZ)
+
+
+def _unresolved_gaps(
+    cache: SQLiteCache,
+    symbol: str,
+    tf: str,
     required_start: pd.Timestamp,
     required_end: pd.Timestamp,
-    cached_start: pd.Timestamp,
-    cached_end: pd.Timestamp
-) -> list[DateRange]:
-    """Calculate gaps between required and cached ranges."""
-    gaps = []
+    fetched: List[GapFetch]
+) -> Tuple[List[DateRange], List[DateRange]]:
+    """
+    Gaps still blocking after a backfill, and the subset the provider
+    returned nothing for.
 
-    # Gap before cached range
-    if cached_start > required_start:
-        gaps.append(DateRange(required_start, cached_start))
+    An interior gap (cached bars on both sides) that the provider confirms
+    empty is a closure the calendar does not know about (halt, new ad-hoc
+    holiday). It is persisted in the cache so later checks skip it instead
+    of fetching it again. Empty edge gaps still block.
+    """
+    remaining = find_gaps(cache, symbol, tf, required_start, required_end)
+    if not remaining:
+        return [], []
+
+    cached_range = cache.get_range(symbol, tf)
+    empty_fetches = [gap for gap, df, _ in fetched if df is not None and len(df) == 0]
+    blocking, empty = [], []
+    for gap in remaining:
+        source = next((g for g in empty_fetches if g.start <= gap.start and gap.end <= g.end), None)
+        if source is None:
+            blocking.append(gap)
+            continue
+        interior = cached_range is not None and cached_range[0] < gap.start and gap.end < cached_range[1]
+        if interior:
+            logger.info(f"Provider has no bars for {symbol} {tf} {gap.start} → {gap.end}, treating as market closure")
+            cache.mark_empty(symbol, tf, gap.start, gap.end)
+            continue
+        blocking.append(gap)
+        empty.append(gap)
+    return blocking, empty
+
+
+async def backfill_gaps(
+    historical_provider: HistoricalProvider,
+    symbol: str,
+    tf: str,
+    gaps: List[DateRange],
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY
+) -> List[GapFetch]:
+    """
+    Fetch all gaps concurrently, at most ``max_concurrency`` at a time.
+
+    fetch_bars() is blocking, so each call runs in a worker thread. Errors
+    are returned per gap instead of cancelling the other fetches.
+    """
+    _check_concurrency(max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(gap: DateRange) -> GapFetch:
+        async with semaphore:
+            return await asyncio.to_thread(_fetch_gap, historical_provider, symbol, tf, gap)
+
+    return list(await asyncio.gather(*(fetch(gap) for gap in gaps)))
 
-    # Gap after cached range
-    if cached_end < required_end:
-        gaps.append(DateRange(cached_end, required_end))
 
-    return gaps
+def backfill_gaps_threaded(
+    historical_provider: HistoricalProvider,
+    symbol: str,
+    tf: str,
+    gaps: List[DateRange],
+    max_concurrency: int = DEFAULT_BACKFILL_CONCURRENCY
+) -> List[GapFetch]:
+    """backfill_gaps() on a plain thread pool, for callers without an event loop."""
+    _check_concurrency(max_concurrency)
+    if not gaps:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(gaps))) as pool:
+        return list(pool.map(lambda gap: _fetch_gap(historical_provider, symbol, tf, gap), gaps))
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency <= 0:
+        raise ValueError(f"max_concurrency must be > 0 (got {max_concurrency})")
+
+
+def _fetch_gap(historical_provider: HistoricalProvider, symbol: str, tf: str, gap: DateRange) -> GapFetch:
+    try:
+        return gap, historical_provider.fetch_bars(symbol, tf, gap.start, gap.end), None
+    except Exception as e:
+        return gap, None, e
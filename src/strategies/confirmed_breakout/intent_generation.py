@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
 from dataclasses import dataclass
 
 import pandas as pd
 
 from trade.session_windows import session_window_end_for_ts
+from axiom_bt.artifacts.frame_hash import hash_frame
 from axiom_bt.artifacts.intent_contract import sanitize_intent
 
 logger = logging.getLogger(__name__)
@@ -51,11 +51,6 @@ class IntentArtifacts:
     intent_hash: str
 
 
-def _hash_dataframe(df: pd.DataFrame) -> str:
-    data = df.to_csv(index=False).encode("utf-8")
-    return hashlib.sha256(data).hexdigest()
-
-
 def _canonicalize_events_intent(events_intent: pd.DataFrame) -> pd.DataFrame:
     sort_cols = [c for c in ("signal_ts", "template_id", "side") if c in events_intent.columns]
     if sort_cols:
@@ -185,7 +180,7 @@ def generate_intent(
         events_intent = pd.DataFrame(intents)
 
     events_intent = _canonicalize_events_intent(events_intent)
-    intent_hash = _hash_dataframe(events_intent)
+    intent_hash = hash_frame(events_intent)
     logger.info(
         "actions: intent_frozen strategy=%s version=%s intent_hash=%s events=%d",
         strategy_id,
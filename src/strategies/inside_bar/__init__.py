@@ -17,7 +17,8 @@ from .intent_generation import generate_intent
 
 logger = logging.getLogger(__name__)
 
-def _core_config_from_params(params: dict) -> InsideBarConfig:
+def core_config_from_params(params: dict) -> InsideBarConfig:
+    """Build the InsideBarCore config from flat pipeline/SSOT strategy params."""
     # Keep mapping consistent with InsideBarStrategy.generate_signals()
     if "inside_bar_definition_mode" not in params:
         raise ValueError(
@@ -63,11 +64,54 @@ def _core_config_from_params(params: dict) -> InsideBarConfig:
     return InsideBarConfig(**core_params)
 
 
+_ENRICH_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def _materialize_legs(df: pd.DataFrame, rows: list, values: list):
+    """Signal legs as a frame: base rows taken once, overrides set per column."""
+    if not rows:
+        return None
+    legs = df.iloc[rows].reset_index(drop=True)
+    columns: dict = {}
+    for pos, overrides in enumerate(values):
+        for key, value in overrides.items():
+            columns.setdefault(key, ([], []))
+            columns[key][0].append(pos)
+            columns[key][1].append(value)
+    for key, (positions, column_values) in columns.items():
+        if key in legs:
+            data = legs[key].to_numpy(dtype=object, copy=True)
+        else:
+            data = np.full(len(legs), pd.NA, dtype=object)
+        data[positions] = column_values
+        legs[key] = pd.Series(data, index=legs.index).infer_objects()
+    return legs
+
+
+def _apply_marks(df: pd.DataFrame, marks: dict) -> None:
+    """Write IB row markings back into the frame, one assignment per column."""
+    columns: dict = {}
+    for row, mark in marks.items():
+        for key, value in mark.items():
+            columns.setdefault(key, ([], []))
+            columns[key][0].append(row)
+            columns[key][1].append(value)
+    for key, (rows, column_values) in columns.items():
+        df.loc[rows, key] = column_values
+
+
 def extend_insidebar_signal_frame_from_core(
     bars,
     params: dict,
+    *,
+    enrich_cache: dict | None = None,
 ):
-    """Build SignalFrame from core.process_data (single SSOT)."""
+    """Build SignalFrame from core.process_data (single SSOT).
+
+    ``enrich_cache`` lets callers that rebuild the frame for the same bars with
+    different params (parameter sweeps) share indicator work; see
+    InsideBarCore.enrich().
+    """
     version = params.get("strategy_version", "1.0.0")
     schema = get_signal_frame_schema(version)
     from axiom_bt.utils.trace import trace_ui
@@ -122,16 +166,17 @@ def extend_insidebar_signal_frame_from_core(
     df["inside_body_fraction"] = np.nan
     df["inside_bar_reject_reason"] = pd.NA
 
-    core = InsideBarCore(_core_config_from_params(params))
-    # Mirror pattern-level diagnostics into the frame for audit artifacts.
-    analysis_df = core.calculate_atr(df.copy())
-    analysis_df = core.detect_inside_bars(analysis_df)
+    core = InsideBarCore(core_config_from_params(params))
+    # Enrich once (ATR + pattern columns) on the OHLC view; the same frame
+    # feeds the audit diagnostics and signal generation.
+    enriched = core.enrich(df[[c for c in _ENRICH_COLUMNS if c in df.columns]], cache=enrich_cache)
     for col in ("mother_body_fraction", "inside_body_fraction", "inside_bar_reject_reason"):
-        if col in analysis_df.columns:
-            df[col] = analysis_df[col].values
+        if col in enriched.columns:
+            df[col] = enriched[col].values
 
-    # Core SSOT: generate signals only via process_data()
-    signals = core.process_data(df, params.get("symbol", "UNKNOWN"))
+    # Core SSOT: generate signals only via the core pipeline
+    signals = core.process_enriched(enriched, params.get("symbol", "UNKNOWN"))
+    del enriched
     trace_ui(
         step="insidebar_core_done",
         run_id=params.get("run_id"),
@@ -142,8 +187,16 @@ def extend_insidebar_signal_frame_from_core(
         extra={"signals": len(signals)},
     )
 
-    # Map signals into frame (allow multiple legs per bar via row append)
-    appended_rows = []
+    # Map signals into frame (allow multiple legs per bar via row append).
+    # Legs are built column-wise from a single take of their base rows; IB
+    # markings are tracked in ``marks`` so each leg sees the frame exactly as
+    # it was when its signal was processed.
+    timestamps = df["timestamp"]
+    symbol_value = df.at[0, "symbol"] if len(df) else "UNKNOWN"
+    strategy_id = df.at[0, "strategy_id"] if len(df) else "insidebar_intraday"
+    leg_rows: list = []
+    leg_values: list = []
+    marks: dict = {}
     for sig in signals:
         ts = pd.to_datetime(sig.timestamp, utc=True)
         meta = sig.metadata or {}
@@ -151,91 +204,79 @@ def extend_insidebar_signal_frame_from_core(
         if isinstance(sig_idx, (int, float)) and 0 <= int(sig_idx) < len(df):
             idx = int(sig_idx)
         else:
-            match_idx = df.index[df["timestamp"] == ts]
+            match_idx = df.index[timestamps == ts]
             if match_idx.empty:
                 logger.warning(
                     "InsideBarCore signal timestamp not found in frame (symbol=%s, ts=%s)",
-                    df.at[0, "symbol"] if len(df) else "UNKNOWN",
+                    symbol_value,
                     ts,
                 )
                 continue
             idx = int(match_idx[0])
 
-        base_template_id = f"ib_{df.at[idx, 'symbol']}_{ts.strftime('%Y%m%d_%H%M%S')}"
-        oco_group_id = f"{df.at[idx, 'symbol']}_{ts.isoformat()}_{df.at[idx, 'strategy_id']}_{df.at[idx, 'strategy_version']}_{base_template_id}"
+        base_template_id = f"ib_{symbol_value}_{ts.strftime('%Y%m%d_%H%M%S')}"
+        oco_group_id = f"{symbol_value}_{ts.isoformat()}_{strategy_id}_{version}_{base_template_id}"
         leg_suffix = "BUY" if sig.side == "BUY" else "SELL"
 
-        row = df.loc[idx].copy()
-        row["signal_side"] = sig.side
-        row["signal_reason"] = "inside_bar"
-        row["entry_price"] = sig.entry_price
-        row["stop_price"] = sig.stop_loss
-        row["take_profit_price"] = sig.take_profit
-        row["template_id"] = f"{base_template_id}_{leg_suffix}"
-        row["oco_group_id"] = oco_group_id
-        # Debug-only: trigger timestamp uses the signal bar timestamp
-        row["trigger_ts"] = ts
-        # Debug-only: breakout_level is entry basis if no explicit level exists
-        row["breakout_level"] = sig.entry_price
-        row["order_expired"] = False
-        row["order_expire_reason"] = pd.NA
-
-        if sig.side == "BUY":
-            row["breakout_long"] = True
-            row["breakout_short"] = False
-        else:
-            row["breakout_long"] = False
-            row["breakout_short"] = True
-
-        if "mother_high" in meta:
-            row["mother_high"] = meta["mother_high"]
-        if "mother_low" in meta:
-            row["mother_low"] = meta["mother_low"]
-        if "atr" in meta:
-            row["atr"] = meta["atr"]
-        if "mother_body_fraction" in meta:
-            row["mother_body_fraction"] = meta["mother_body_fraction"]
-        if "inside_body_fraction" in meta:
-            row["inside_body_fraction"] = meta["inside_body_fraction"]
+        values = dict(marks.get(idx, {}))
+        values.update(
+            signal_side=sig.side,
+            signal_reason="inside_bar",
+            entry_price=sig.entry_price,
+            stop_price=sig.stop_loss,
+            take_profit_price=sig.take_profit,
+            template_id=f"{base_template_id}_{leg_suffix}",
+            oco_group_id=oco_group_id,
+            # Debug-only: trigger timestamp uses the signal bar timestamp
+            trigger_ts=ts,
+            # Debug-only: breakout_level is entry basis if no explicit level exists
+            breakout_level=sig.entry_price,
+            order_expired=False,
+            order_expire_reason=pd.NA,
+            breakout_long=sig.side == "BUY",
+            breakout_short=sig.side != "BUY",
+        )
+        for key in ("mother_high", "mother_low", "atr", "mother_body_fraction", "inside_body_fraction"):
+            if key in meta:
+                values[key] = meta[key]
 
         ib_idx = meta.get("ib_idx")
         if isinstance(ib_idx, (int, float)) and 0 <= int(ib_idx) < len(df):
             ib_idx = int(ib_idx)
             # Mark the IB row itself for indicators
-            df.at[ib_idx, "inside_bar"] = True
-            if "mother_high" in meta:
-                df.at[ib_idx, "mother_high"] = meta["mother_high"]
-            if "mother_low" in meta:
-                df.at[ib_idx, "mother_low"] = meta["mother_low"]
-            if "atr" in meta:
-                df.at[ib_idx, "atr"] = meta["atr"]
+            mark = marks.setdefault(ib_idx, {})
+            mark["inside_bar"] = True
+            for key in ("mother_high", "mother_low", "atr"):
+                if key in meta:
+                    mark[key] = meta[key]
             # Debug-only: inside/mother timestamps from bar indices
-            inside_ts = df.at[ib_idx, "timestamp"]
-            df.at[ib_idx, "inside_ts"] = inside_ts
-            row["inside_ts"] = inside_ts
+            mark["inside_ts"] = values["inside_ts"] = timestamps.iat[ib_idx]
             if ib_idx > 0:
-                mother_ts = df.at[ib_idx - 1, "timestamp"]
-                df.at[ib_idx, "mother_ts"] = mother_ts
-                row["mother_ts"] = mother_ts
+                mark["mother_ts"] = values["mother_ts"] = timestamps.iat[ib_idx - 1]
 
-        appended_rows.append(row)
+        leg_rows.append(idx)
+        leg_values.append(values)
 
-    if appended_rows:
-        df = pd.concat([df, pd.DataFrame(appended_rows)], ignore_index=True)
+    legs = _materialize_legs(df, leg_rows, leg_values)
+    _apply_marks(df, marks)
+    if legs is not None:
+        df = pd.concat([df, legs], ignore_index=True)
 
     return df
 
 
 class InsideBarPlugin:
     strategy_id = "insidebar_intraday"
+    # Params whose values decide the enriched frame; sweeps group combos by them.
+    enrich_params = InsideBarCore.ENRICH_FIELDS
 
     @staticmethod
     def get_schema(version: str):
         return get_signal_frame_schema(version)
 
     @staticmethod
-    def extend_signal_frame(bars, params: dict):
-        return extend_insidebar_signal_frame_from_core(bars, params)
+    def extend_signal_frame(bars, params: dict, *, enrich_cache: dict | None = None):
+        return extend_insidebar_signal_frame_from_core(bars, params, enrich_cache=enrich_cache)
 
     @staticmethod
     def generate_intent(signals_frame, strategy_id: str, strategy_version: str, params: dict):
@@ -250,6 +291,7 @@ __all__ = [
     "InsideBarCore",
     "InsideBarConfig",
     "RawSignal",
+    "core_config_from_params",
     "load_config",
     "get_default_config_path",
     "load_default_config",
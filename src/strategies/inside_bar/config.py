@@ -11,8 +11,37 @@ from typing import List, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import time
 
+import numpy as np
 import pandas as pd
 
+_NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+def _time_to_ns(t: time) -> int:
+    seconds = t.hour * 3600 + t.minute * 60 + t.second
+    return seconds * 1_000_000_000 + t.microsecond * 1_000
+
+
+@dataclass(frozen=True)
+class SessionArrays:
+    """Per-bar session lookup produced by SessionFilter.session_arrays.
+
+    ``session_index`` is -1 for bars outside every window; ``session_start``
+    and ``session_end`` are NaT there and tz-aware (session tz) elsewhere.
+    """
+    session_index: np.ndarray
+    session_start: pd.DatetimeIndex
+    session_end: pd.DatetimeIndex
+
+    @property
+    def in_session(self) -> np.ndarray:
+        return self.session_index >= 0
+
+    def index_at(self, pos: int) -> Optional[int]:
+        """Scalar view matching get_session_index (None outside sessions)."""
+        value = int(self.session_index[pos])
+        return value if value >= 0 else None
+
 
 @dataclass
 class SessionFilter:
@@ -101,6 +130,53 @@ class SessionFilter:
 
         return False
 
+    def session_arrays(self, timestamps, tz: str = "Europe/Berlin") -> SessionArrays:
+        """Vectorized get_session_index/get_session_start/get_session_end.
+
+        Converts the whole timestamp column once (naive values are UTC, as in
+        the scalar methods) and resolves windows with time-of-day comparisons
+        on int64 nanoseconds. The first matching window wins.
+
+        Args:
+            timestamps: Sequence/Series/Index of timestamps
+            tz: Target timezone for session check
+
+        Returns:
+            SessionArrays aligned positionally with ``timestamps``
+        """
+        local = pd.DatetimeIndex(pd.to_datetime(timestamps, utc=True)).tz_convert(tz)
+        n = len(local)
+        session_index = np.full(n, -1, dtype=np.int64)
+        nat = pd.DatetimeIndex(np.full(n, np.datetime64("NaT"), dtype="datetime64[ns]")).tz_localize(tz)
+        if not self.windows or n == 0:
+            return SessionArrays(session_index=session_index, session_start=nat, session_end=nat)
+
+        wall_ns = local.tz_localize(None).to_numpy(dtype="datetime64[ns]").view("int64")
+        valid = ~local.isna()
+        day_ns = (wall_ns // _NS_PER_DAY) * _NS_PER_DAY
+        tod = wall_ns - day_ns
+        start_ns = np.array([_time_to_ns(start) for start, _ in self.windows], dtype=np.int64)
+        end_ns = np.array([_time_to_ns(end) for _, end in self.windows], dtype=np.int64)
+        # Assign in reverse so the first matching window wins (scalar loop order).
+        for idx in range(len(self.windows) - 1, -1, -1):
+            mask = valid & (tod >= start_ns[idx]) & (tod < end_ns[idx])
+            session_index[mask] = idx
+
+        hit = session_index >= 0
+        pick = np.where(hit, session_index, 0)
+
+        def _localize(offsets: np.ndarray) -> pd.DatetimeIndex:
+            wall = np.where(hit, day_ns + offsets[pick], np.iinfo(np.int64).min)
+            naive = pd.DatetimeIndex(wall.view("datetime64[ns]"))
+            # fold=0 semantics of Timestamp.replace on ambiguous wall times.
+            return naive.tz_localize(tz, ambiguous=np.ones(n, dtype=bool), nonexistent="shift_forward")
+
+        return SessionArrays(
+            session_index=session_index,
+            session_start=_localize(start_ns),
+            session_end=_localize(end_ns),
+        )
+
     def get_session_index(self, timestamp: pd.Timestamp, tz: str = "Europe/Berlin") -> Optional[int]:
         """Return session index (0, 1, ...) or None if outside all sessions.
 
@@ -15,15 +15,21 @@ from typing import List, Optional, Dict, Any, Callable
 from datetime import datetime
 from pathlib import Path
 import hashlib
+import logging
 import pandas as pd
 
 # Import config classes from config module
 from .config import InsideBarConfig
 from .models import RawSignal
+from .incremental import InsideBarIndicatorState, InsideBarSignalState
 from .indicators import calculate_atr as _calculate_atr
+from .indicators import calculate_true_range as _calculate_true_range
+from .indicators import rolling_atr as _rolling_atr
 from .pattern_detection import detect_inside_bars as _detect_inside_bars
 from .session_logic import generate_signals as _generate_signals
 
+logger = logging.getLogger(__name__)
+
 
 # ══════════════════════════════════════════════════════════════════════
 # VERSION METADATA
@@ -77,6 +83,16 @@ class InsideBarCore:
         signals = core.process_data(df, symbol='APP')
     """
 
+    # Config fields that determine enrich() output (ATR + pattern detection).
+    ENRICH_FIELDS = (
+        "atr_period",
+        "inside_bar_definition_mode",
+        "inside_bar_mode",
+        "min_mother_bar_size",
+        "min_mother_body_fraction",
+        "min_inside_body_fraction",
+    )
+
     def __init__(self, config: InsideBarConfig):
         """
         Initialize with validated config.
@@ -154,6 +170,36 @@ class InsideBarCore:
         """
         return _detect_inside_bars(df, self.config)
 
+    def indicator_state(self, history: Optional[pd.DataFrame] = None) -> InsideBarIndicatorState:
+        """
+        Streaming indicator state (ATR + inside bar columns), O(1) per new bar.
+
+        Args:
+            history: Optional bars (sorted) used to seed the state
+
+        Returns:
+            InsideBarIndicatorState matching calculate_atr + detect_inside_bars
+            for a frame starting at the first history bar
+        """
+        if history is None:
+            return InsideBarIndicatorState(self.config)
+        return InsideBarIndicatorState.from_history(history, self.config)
+
+    def signal_state(self, symbol: str, history: Optional[pd.DataFrame] = None) -> InsideBarSignalState:
+        """
+        Streaming signal evaluator, O(1) per new bar.
+
+        Args:
+            symbol: Trading symbol
+            history: Optional bars (sorted) used to seed indicators and session state
+
+        Returns:
+            InsideBarSignalState yielding the signals process_data() would
+        """
+        if history is None:
+            return InsideBarSignalState(self.config, symbol)
+        return InsideBarSignalState.from_history(history, self.config, symbol)
+
     def generate_signals(
         self,
         df: pd.DataFrame,
@@ -209,53 +255,65 @@ class InsideBarCore:
         df = df.sort_values('timestamp').reset_index(drop=True)
 
         # Pipeline: Calculate ATR, detect patterns, generate signals
-        df = self.calculate_atr(df)
-        df = self.detect_inside_bars(df)
+        return self.process_enriched(self.enrich(df), symbol, tracer=tracer)
+
+    def enrich(self, df: pd.DataFrame, cache: Optional[Dict[Any, pd.DataFrame]] = None) -> pd.DataFrame:
+        """
+        ATR + inside bar columns for a timestamp-sorted frame.
+
+        Equivalent to detect_inside_bars(calculate_atr(df)); the result can be
+        shared between diagnostics and process_enriched().
+
+        With ``cache`` (a dict owned by the caller and tied to one ``df``), the
+        true range is computed once and enriched frames are reused across
+        configs with equal ENRICH_FIELDS. Cached frames must not be mutated.
+        """
+        if cache is None:
+            return self.detect_inside_bars(self.calculate_atr(df))
+        key = ("enriched",) + tuple(getattr(self.config, name) for name in self.ENRICH_FIELDS)
+        if key not in cache:
+            if "true_range" not in cache:
+                cache["true_range"] = _calculate_true_range(df)
+            with_atr = cache["true_range"].copy()
+            with_atr["atr"] = _rolling_atr(with_atr["true_range"], self.config.atr_period)
+            cache[key] = self.detect_inside_bars(with_atr)
+        return cache[key]
+
+    def process_enriched(
+        self,
+        df: pd.DataFrame,
+        symbol: str,
+        tracer: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[RawSignal]:
+        """
+        Signals from a frame already passed through enrich() (sorted, 0..n-1 index).
+
+        Runs signal generation and session filtering exactly as process_data()
+        does, without recomputing indicators.
+        """
         signals = self.generate_signals(df, symbol, tracer=tracer)
 
         # Apply session filtering if configured
         if self.config.session_filter is not None:
             session_tz = getattr(self.config, 'session_timezone', None) or "Europe/Berlin"
 
-            # DEBUG: Print final filter application
-            print("\n" + "="*70)
-            print("[FINAL_FILTER_APPLY]")
-            print(f"  signals_before: {len(signals)}")
-            print(f"  session_tz: {session_tz}")
-            print(f"  session_windows: {self.config.session_filter.to_strings()}")
-            print("="*70)
-
-            # DEBUG: Log final filter application
-            if tracer:
+            tracing = tracer is not None
+            session_filter = self.config.session_filter
+            if tracing:
                 tracer({
                     'event': 'final_filter_apply',
                     'signals_before': len(signals),
                     'session_tz': session_tz,
-                    'session_windows': self.config.session_filter.to_strings()
+                    'session_windows': session_filter.to_strings()
                 })
 
             filtered_signals = []
             for sig in signals:
                 # Ensure timestamp is a pd.Timestamp
                 ts = pd.to_datetime(sig.timestamp)
+                in_session = session_filter.is_in_session(ts, session_tz)
 
-                # DEBUG: Print timestamp details BEFORE filter check
-                print(f"\n[FILTER_CHECK] Checking signal:")
-                print(f"  sig.timestamp: {sig.timestamp} (type={type(sig.timestamp).__name__})")
-                print(f"  after pd.to_datetime: {ts} (tz={ts.tz})")
-                if ts.tz:
-                    ts_local = ts.tz_convert(session_tz)
-                    print(f"  converted to {session_tz}: {ts_local} (time={ts_local.time()})")
-                else:
-                    print(f"  WARNING: Timestamp has no timezone!")
-
-                in_session = self.config.session_filter.is_in_session(ts, session_tz)
-
-                print(f"  in_session result: {in_session}")
-                print(f"  side: {sig.side}")
-
-                # DEBUG: Log each filter decision
-                if tracer:
+                if tracing:
                     ts_local = ts.tz_convert(session_tz).strftime('%H:%M')
                     tracer({
                         'event': 'final_filter_check',
@@ -267,18 +325,14 @@ class InsideBarCore:
 
                 if in_session:
                     filtered_signals.append(sig)
-                    print(f"  ✅ ACCEPTED")
-                else:
-                    print(f"  ❌ REJECTED (outside session)")
-
-            # DEBUG: Print final filter result
-            print("\n" + "="*70)
-            print("[FINAL_FILTER_RESULT]")
-            print(f"  signals_after: {len(filtered_signals)}")
-            print(f"  filtered_out: {len(signals) - len(filtered_signals)}")
-            print("="*70 + "\n")
-
-            if tracer:
+
+            logger.debug(
+                "final_filter: session_tz=%s signals_before=%d signals_after=%d",
+                session_tz,
+                len(signals),
+                len(filtered_signals),
+            )
+            if tracing:
                 tracer({
                     'event': 'final_filter_result',
                     'signals_after': len(filtered_signals),
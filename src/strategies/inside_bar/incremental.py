@@ -0,0 +1,387 @@
+"""
+Incremental (streaming) indicator state for InsideBar.
+
+Produces, one bar at a time, the same columns as ``calculate_atr`` followed by
+``detect_inside_bars``, bit-for-bit. Live/pre-paper paths append a single bar
+per update, so each call is O(1) instead of re-running the batch functions on
+the whole lookback window.
+
+Bit-for-bit parity with the batch ATR requires replaying the pandas
+``rolling(...).mean()`` kernel exactly: a Kahan-compensated running sum that
+is carried from the first bar of the frame. A state seeded from history
+therefore matches the batch output of a frame that starts at the same bar.
+
+``InsideBarSignalState`` layers the first-inside-bar-per-session state machine
+of ``session_logic.generate_signals`` (plus the final session filter of
+``InsideBarCore.process_enriched``) on top, so a live feed can be evaluated
+bar by bar with the same RawSignals as ``InsideBarCore.process_data``.
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from .config import InsideBarConfig
+from .models import RawSignal
+from .rules import eval_scalar
+
+NAN = float("nan")
+
+
+def _isnan(value: float) -> bool:
+    return value != value
+
+
+class _RollingMean:
+    """Fixed-window mean replicating pandas' Cython ``roll_mean`` state machine."""
+
+    def __init__(self, window: int) -> None:
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = int(window)
+        self._values: Deque[float] = deque()
+        self._count = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._nobs = 0
+        self._neg_ct = 0
+        self._sum = 0.0
+        self._comp_add = 0.0
+        self._comp_remove = 0.0
+        self._same_ct = 0
+        self._prev_value = NAN
+
+    def _add(self, val: float) -> None:
+        if _isnan(val):
+            return
+        self._nobs += 1
+        y = val - self._comp_add
+        t = self._sum + y
+        self._comp_add = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, val) < 0:
+            self._neg_ct += 1
+        if val == self._prev_value:
+            self._same_ct += 1
+        else:
+            self._same_ct = 1
+        self._prev_value = val
+
+    def _remove(self, val: float) -> None:
+        if _isnan(val):
+            return
+        self._nobs -= 1
+        y = -val - self._comp_remove
+        t = self._sum + y
+        self._comp_remove = t - self._sum - y
+        self._sum = t
+        if math.copysign(1.0, val) < 0:
+            self._neg_ct -= 1
+
+    def update(self, val: float) -> float:
+        val = float(val)
+        if self._count == 0 or self.window == 1:
+            # pandas re-seeds whenever the new window does not overlap the old one
+            self._reset()
+            self._prev_value = val
+            self._values.clear()
+        elif len(self._values) == self.window:
+            self._remove(self._values.popleft())
+        self._values.append(val)
+        self._add(val)
+        self._count += 1
+
+        if self._nobs >= self.window and self._nobs > 0:
+            result = self._sum / self._nobs
+            if self._same_ct >= self._nobs:
+                result = self._prev_value
+            elif self._neg_ct == 0 and result < 0:
+                result = 0.0
+            elif self._neg_ct == self._nobs and result > 0:
+                result = 0.0
+            return result
+        return NAN
+
+
+class InsideBarIndicatorState:
+    """
+    Streaming twin of ``calculate_atr`` + ``detect_inside_bars``.
+
+    Usage:
+        state = InsideBarIndicatorState.from_history(history_df, config)
+        row = state.update({"timestamp": ts, "open": o, "high": h, "low": l, "close": c})
+        # row carries the batch columns (atr, is_inside_bar, mother_bar_high, ...)
+    """
+
+    def __init__(self, config: InsideBarConfig):
+        self.config = config
+        self._atr = _RollingMean(config.atr_period)
+        self._strict = config.inside_bar_mode == "strict"
+        self._prev: Optional[Dict[str, float]] = None
+        self.bars_seen = 0
+
+    @classmethod
+    def from_history(
+        cls,
+        df: pd.DataFrame,
+        config: InsideBarConfig,
+    ) -> "InsideBarIndicatorState":
+        """Seed a state by replaying ``df`` (one O(1) update per row)."""
+        state = cls(config)
+        for o, h, l, c in zip(
+            df["open"].to_numpy(dtype="float64"),
+            df["high"].to_numpy(dtype="float64"),
+            df["low"].to_numpy(dtype="float64"),
+            df["close"].to_numpy(dtype="float64"),
+        ):
+            state._step(float(o), float(h), float(l), float(c))
+        return state
+
+    def update(self, bar: Mapping[str, Any]) -> Dict[str, Any]:
+        """Consume one bar; return it extended with the batch indicator columns."""
+        row = dict(bar)
+        row.update(
+            self._step(
+                float(bar["open"]),
+                float(bar["high"]),
+                float(bar["low"]),
+                float(bar["close"]),
+            )
+        )
+        return row
+
+    def update_many(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Consume rows of ``df`` in order; return them with indicator columns."""
+        rows: List[Dict[str, Any]] = [self.update(bar) for bar in df.to_dict("records")]
+        out = pd.DataFrame(rows, index=df.index)
+        out["is_inside_bar"] = out["is_inside_bar"].astype(bool)
+        out["inside_bar_reject_reason"] = out["inside_bar_reject_reason"].astype(object)
+        return out
+
+    def _step(self, o: float, h: float, l: float, c: float) -> Dict[str, Any]:
+        cfg = self.config
+        prev = self._prev
+        if prev is None:
+            po = ph = pl = pc = NAN
+            prev_atr = NAN
+        else:
+            po, ph, pl, pc = prev["open"], prev["high"], prev["low"], prev["close"]
+            prev_atr = prev["atr"]
+
+        # === calculate_atr ===
+        tr1 = h - l
+        tr2 = abs(h - pc)
+        tr3 = abs(l - pc)
+        finite = [v for v in (tr1, tr2, tr3) if not _isnan(v)]
+        true_range = max(finite) if finite else NAN
+        atr = self._atr.update(true_range)
+
+        # === detect_inside_bars ===
+        prev_range = ph - pl
+        prev_body = abs(pc - po)
+        inside_range = h - l
+        inside_body = abs(c - o)
+        mother_body_fraction = prev_body / prev_range if prev_range > 0 else 0.0
+        inside_body_fraction = inside_body / inside_range if inside_range > 0 else 0.0
+        if _isnan(mother_body_fraction):
+            mother_body_fraction = 0.0
+        if _isnan(inside_body_fraction):
+            inside_body_fraction = 0.0
+
+        inside = prev is not None and not any(_isnan(v) for v in (po, pc, ph, pl)) and eval_scalar(
+            mb_open=po,
+            mb_close=pc,
+            mb_high=ph,
+            mb_low=pl,
+            ib_open=o,
+            ib_close=c,
+            ib_high=h,
+            ib_low=l,
+            mode=cfg.inside_bar_definition_mode,
+            strict=self._strict,
+        )
+        inside = bool(inside)
+
+        if cfg.min_mother_bar_size > 0:
+            inside = inside and prev_atr > 0 and prev_range >= cfg.min_mother_bar_size * prev_atr
+
+        reject_reason: Any = pd.NA
+        if inside and not mother_body_fraction >= cfg.min_mother_body_fraction:
+            reject_reason = "MB_BODY_FRACTION"
+            inside = False
+        if inside and not inside_body_fraction >= cfg.min_inside_body_fraction:
+            reject_reason = "IB_BODY_FRACTION"
+            inside = False
+
+        self._prev = {"open": o, "high": h, "low": l, "close": c, "atr": atr}
+        self.bars_seen += 1
+
+        return {
+            "prev_close": pc,
+            "tr1": tr1,
+            "tr2": tr2,
+            "tr3": tr3,
+            "true_range": true_range,
+            "atr": atr,
+            "prev_high": ph,
+            "prev_low": pl,
+            "prev_open": po,
+            "prev_range": prev_range,
+            "prev_body": prev_body,
+            "inside_range": inside_range,
+            "inside_body": inside_body,
+            "mother_body_fraction": mother_body_fraction,
+            "inside_body_fraction": inside_body_fraction,
+            "inside_bar_reject_reason": reject_reason,
+            "is_inside_bar": inside,
+            "mother_bar_high": ph if inside else NAN,
+            "mother_bar_low": pl if inside else NAN,
+        }
+
+
+class InsideBarSignalState:
+    """
+    Streaming twin of ``InsideBarCore.process_data`` for one symbol.
+
+    Usage:
+        state = InsideBarSignalState.from_history(history_df, config, "AAPL")
+        signals = state.update({"timestamp": ts, "open": o, "high": h, "low": l, "close": c})
+
+    Feeding the bars of a frame one by one yields the signals (same order and
+    values) that ``process_data`` returns for that frame. Bars must arrive in
+    timestamp order; naive timestamps are UTC.
+    """
+
+    def __init__(self, config: InsideBarConfig, symbol: str):
+        self.config = config
+        self.symbol = symbol
+        self.indicators = InsideBarIndicatorState(config)
+        self._windows = list(config.session_filter.windows) if config.session_filter is not None else []
+        self._session_tz = getattr(config, "session_timezone", "Europe/Berlin")
+        self._final_tz = getattr(config, "session_timezone", None) or "Europe/Berlin"
+        self._bar_duration = pd.Timedelta(minutes=int(config.timeframe_minutes))
+        self._max_risk = getattr(config, "stop_distance_cap_ticks", 40) * getattr(config, "tick_size", 0.01)
+        self._max_trades = getattr(config, "max_trades_per_session", 1)
+        self._entry_mode = getattr(config, "entry_level_mode", "mother_bar")
+        # (session_idx, session_start) of the current session and whether it traded
+        self._session: Optional[Tuple[int, pd.Timestamp]] = None
+        self._session_done = False
+        self._prev_session_idx: Optional[int] = None
+        self._prev_bar: Optional[Tuple[float, float, float]] = None  # high, low, atr
+        self._window_cache: Optional[Tuple[int, int, int, pd.Timestamp]] = None
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, config: InsideBarConfig, symbol: str) -> "InsideBarSignalState":
+        """Seed indicators and session state from ``df`` (signals are discarded)."""
+        state = cls(config, symbol)
+        state.update_many(df)
+        return state
+
+    def update_many(self, df: pd.DataFrame) -> List[RawSignal]:
+        """Consume rows of ``df`` (``timestamp`` column or DatetimeIndex) in order."""
+        if "timestamp" not in df.columns:
+            df = df.rename_axis("timestamp").reset_index()
+        signals: List[RawSignal] = []
+        for bar in df[["timestamp", "open", "high", "low", "close"]].to_dict("records"):
+            signals.extend(self.update(bar))
+        return signals
+
+    def _session_of(self, ts: pd.Timestamp) -> Tuple[Optional[int], Optional[pd.Timestamp]]:
+        # Bars inside the last resolved window skip the tz conversion entirely
+        cached = self._window_cache
+        if cached is not None and cached[0] <= ts.value < cached[1]:
+            return cached[2], cached[3]
+        if not self._windows:
+            return None, None
+        local = ts.tz_convert(self._session_tz)
+        t = local.time()
+        for idx, (start, end) in enumerate(self._windows):
+            if start <= t < end:
+                session_start = local.replace(hour=start.hour, minute=start.minute, second=0, microsecond=0)
+                session_end = local.replace(hour=end.hour, minute=end.minute, second=0, microsecond=0)
+                self._window_cache = (session_start.value, session_end.value, idx, session_start)
+                return idx, session_start
+        return None, None
+
+    def update(self, bar: Mapping[str, Any]) -> List[RawSignal]:
+        """Consume one bar; return the signals it completes (usually none)."""
+        ts = pd.Timestamp(bar["timestamp"])
+        if ts.tzinfo is None:
+            ts = ts.tz_localize("UTC")
+        row = self.indicators._step(float(bar["open"]), float(bar["high"]), float(bar["low"]), float(bar["close"]))
+        prev_bar, prev_session_idx = self._prev_bar, self._prev_session_idx
+        high, low = float(bar["high"]), float(bar["low"])
+        self._prev_bar = (high, low, row["atr"])
+
+        session_idx, session_start = self._session_of(ts)
+        self._prev_session_idx = session_idx
+        if session_idx is None:
+            return []
+        if self._session != (session_idx, session_start):
+            self._session = (session_idx, session_start)
+            self._session_done = False
+        if self._session_done or not row["is_inside_bar"] or prev_bar is None:
+            return []
+        if prev_session_idx != session_idx:
+            return []
+
+        # First inside bar of the session: arm once, emit both OCO legs
+        self._session_done = True
+        if self._max_trades <= 0:
+            return []
+        mother_high, mother_low, mother_atr = prev_bar
+        levels = {
+            "mother_high": mother_high,
+            "mother_low": mother_low,
+            "mother_body_fraction": float(row["mother_body_fraction"]),
+            "inside_body_fraction": float(row["inside_body_fraction"]),
+            "atr": 0.0 if _isnan(mother_atr) else float(mother_atr),
+        }
+        if self._entry_mode == "mother_bar":
+            entry_long, entry_short = mother_high, mother_low
+        else:
+            entry_long, entry_short = high, low
+
+        legs = []
+        for side, entry, stop in (("BUY", entry_long, mother_low), ("SELL", entry_short, mother_high)):
+            direction = 1.0 if side == "BUY" else -1.0
+            initial_risk = (entry - stop) * direction
+            if initial_risk <= 0:
+                return []
+            effective_risk = initial_risk
+            stop_cap_applied = initial_risk > self._max_risk
+            if stop_cap_applied:
+                stop = entry - direction * self._max_risk
+                effective_risk = self._max_risk
+            legs.append((side, entry, stop, entry + direction * effective_risk * self.config.risk_reward_ratio,
+                         stop_cap_applied, initial_risk, effective_risk))
+
+        signal_ts = ts + self._bar_duration
+        if self.config.session_filter is not None and not self.config.session_filter.is_in_session(signal_ts, self._final_tz):
+            return []
+
+        return [
+            RawSignal(
+                timestamp=signal_ts,
+                side=side,
+                entry_price=entry,
+                stop_loss=stop,
+                take_profit=target,
+                metadata={
+                    "pattern": "inside_bar_breakout",
+                    "session_key": str(self._session),
+                    "ib_idx": self.indicators.bars_seen - 1,
+                    "entry_mode": self._entry_mode,
+                    "stop_cap_applied": stop_cap_applied,
+                    "initial_risk": initial_risk,
+                    "effective_risk": effective_risk,
+                    **levels,
+                    "symbol": self.symbol,
+                },
+            )
+            for side, entry, stop, target, stop_cap_applied, initial_risk, effective_risk in legs
+        ]
@@ -4,20 +4,18 @@ import numpy as np
 import pandas as pd
 
 
-def calculate_atr(df: pd.DataFrame, atr_period: int) -> pd.DataFrame:
+def calculate_true_range(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Calculate Average True Range (ATR).
+    Add True Range columns (independent of the ATR period).
 
     Args:
         df: DataFrame with columns: open, high, low, close
-        atr_period: rolling window for ATR
 
     Returns:
-        DataFrame with added columns:
+        DataFrame copy with added columns:
         - prev_close: Previous candle close
         - tr1, tr2, tr3: True Range components
         - true_range: Maximum of tr1, tr2, tr3
-        - atr: Rolling average of true_range
     """
     df = df.copy()
 
@@ -37,10 +35,29 @@ def calculate_atr(df: pd.DataFrame, atr_period: int) -> pd.DataFrame:
     # True Range = max(TR1, TR2, TR3)
     df["true_range"] = df[["tr1", "tr2", "tr3"]].max(axis=1)
 
-    # ATR = Simple Moving Average of True Range
-    df["atr"] = df["true_range"].rolling(
-        window=atr_period,
-        min_periods=atr_period
-    ).mean()
+    return df
+
+
+def rolling_atr(true_range: pd.Series, atr_period: int) -> pd.Series:
+    """ATR = Simple Moving Average of True Range."""
+    return true_range.rolling(window=atr_period, min_periods=atr_period).mean()
+
+
+def calculate_atr(df: pd.DataFrame, atr_period: int) -> pd.DataFrame:
+    """
+    Calculate Average True Range (ATR).
+
+    Args:
+        df: DataFrame with columns: open, high, low, close
+        atr_period: rolling window for ATR
 
+    Returns:
+        DataFrame with added columns:
+        - prev_close: Previous candle close
+        - tr1, tr2, tr3: True Range components
+        - true_range: Maximum of tr1, tr2, tr3
+        - atr: Rolling average of true_range
+    """
+    df = calculate_true_range(df)
+    df["atr"] = rolling_atr(df["true_range"], atr_period)
     return df
@@ -1,13 +1,42 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import SessionFilter, InsideBarConfig
 from .models import RawSignal
 
+logger = logging.getLogger(__name__)
+
+
+def _float_column(df: pd.DataFrame, column: str, default: float = 0.0) -> np.ndarray:
+    if column not in df.columns:
+        return np.full(len(df), default, dtype="float64")
+    return df[column].to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _timestamp_getter(column: pd.Series) -> Callable[[int], pd.Timestamp]:
+    """Positional timestamp accessor; naive values are treated as UTC."""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        index = pd.DatetimeIndex(column)
+        if index.tz is None:
+            index = index.tz_localize('UTC')
+        return index.__getitem__
+
+    values = column.to_numpy(dtype=object)
+
+    def _get(pos: int) -> pd.Timestamp:
+        ts = pd.to_datetime(values[pos])
+        if ts.tzinfo is None:
+            ts = ts.tz_localize('UTC')
+        return ts
+
+    return _get
+
 
 def generate_signals(
     df: pd.DataFrame,
@@ -34,16 +63,9 @@ def generate_signals(
     """
     signals: List[RawSignal] = []
 
-    def emit(event: Dict[str, Any]) -> None:
-        if tracer is not None:
-            tracer(event)
-
-    def _session_key_for(ts: pd.Timestamp, session_idx: int) -> tuple:
-        try:
-            return session_filter.get_session_key(ts, session_tz)  # type: ignore[attr-defined]
-        except AttributeError:
-            session_start = session_filter.get_session_start(ts, session_tz)
-            return (session_idx, session_start)
+    # Tracer events are only materialized when a tracer is attached.
+    tracing = tracer is not None
+    emit = tracer if tracing else None
 
     # Get session configuration
     session_filter = config.session_filter
@@ -53,21 +75,18 @@ def generate_signals(
 
     session_tz = getattr(config, 'session_timezone', 'Europe/Berlin')
 
-    # DEBUG: Print session config (guaranteed visible)
-    print("\n" + "="*70)
-    print("[SESSION_FILTER_CONFIG]")
-    print(f"  session_tz: {session_tz}")
-    print(f"  windows: {session_filter.to_strings() if session_filter and hasattr(session_filter, 'to_strings') else 'empty'}")
-    print(f"  windows_count: {len(session_filter.windows) if session_filter else 0}")
-    print("="*70 + "\n")
-
-    # DEBUG: Log session filter configuration
-    emit({
-        'event': 'session_filter_config',
-        'session_tz': session_tz,
-        'session_windows': session_filter.to_strings() if session_filter and hasattr(session_filter, 'to_strings') else 'empty',
-        'windows_count': len(session_filter.windows) if session_filter else 0
-    })
+    logger.debug(
+        "session_filter_config: session_tz=%s windows=%s",
+        session_tz,
+        session_filter.to_strings(),
+    )
+    if tracing:
+        emit({
+            'event': 'session_filter_config',
+            'session_tz': session_tz,
+            'session_windows': session_filter.to_strings() if session_filter and hasattr(session_filter, 'to_strings') else 'empty',
+            'windows_count': len(session_filter.windows) if session_filter else 0
+        })
 
     # Session state machine: {session_key: state_dict}
     session_states: Dict[tuple, Dict[str, Any]] = {}
@@ -102,76 +121,85 @@ def generate_signals(
     # Risk management
     max_risk = getattr(config, 'stop_distance_cap_ticks', 40) * getattr(config, 'tick_size', 0.01)
 
-    # Main loop
-    for idx, current in df.iterrows():
-        ts = pd.to_datetime(current['timestamp'])
-        if ts.tzinfo is None:
-            ts = ts.tz_localize('UTC')
-
-        session_idx = session_filter.get_session_index(ts, session_tz)
-
-        # Skip if not in any session
-        if session_idx is None:
-            continue
-        session_key = _session_key_for(ts, session_idx)
+    # Session lookup for every bar at once (single tz conversion)
+    sessions = session_filter.session_arrays(df['timestamp'], session_tz)
+    session_start_ns = sessions.session_start.asi8
+
+    # Pre-extracted columns for the state machine (positional access)
+    labels = df.index
+    ts_at = _timestamp_getter(df['timestamp'])
+    high = _float_column(df, 'high')
+    low = _float_column(df, 'low')
+    atr = _float_column(df, 'atr')
+    is_inside_bar = df['is_inside_bar'].to_numpy()
+    mother_body_fraction = _float_column(df, 'mother_body_fraction')
+    inside_body_fraction = _float_column(df, 'inside_body_fraction')
+
+    # Main loop (bars outside every session are never visited)
+    for pos in np.flatnonzero(sessions.in_session):
+        pos = int(pos)
+        session_idx = int(sessions.session_index[pos])
 
         # Initialize session state
-        if session_key not in session_states:
-            session_states[session_key] = {
+        state_key = (session_idx, int(session_start_ns[pos]))
+        state = session_states.get(state_key)
+        if state is None:
+            state = session_states[state_key] = {
                 'armed': False,
                 'done': False,
                 'ib_idx': None,
                 'levels': {},
             }
+        if state['done']:
+            continue
 
-        state = session_states[session_key]
+        idx = labels[pos]
+        ts = ts_at(pos)
+        session_key = (session_idx, sessions.session_start[pos])
 
         # === STATE: WAITING (look for FIRST inside bar) ===
         if not state['armed'] and not state['done']:
             # Only accept inside bars where mother bar is in same session
-            if current['is_inside_bar']:
-                prev = df.iloc[idx - 1] if idx > 0 else None
-                if prev is None:
+            if is_inside_bar[pos]:
+                if pos == 0:
                     continue
 
                 # Check if previous bar (mother) is in same session
-                prev_ts = pd.to_datetime(prev['timestamp'])
-                if prev_ts.tzinfo is None:
-                    prev_ts = prev_ts.tz_localize('UTC')
-
-                prev_session_idx = session_filter.get_session_index(prev_ts, session_tz)
+                prev_session_idx = sessions.index_at(pos - 1)
                 if prev_session_idx != session_idx:
-                    emit({
-                        'event': 'ib_rejected',
-                        'reason': 'mother_bar_outside_session',
-                        'idx': int(idx),
-                        'current_session': session_idx,
-                        'prev_session': prev_session_idx,
-                        'session_key': str(session_key)
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'ib_rejected',
+                            'reason': 'mother_bar_outside_session',
+                            'idx': int(idx),
+                            'current_session': session_idx,
+                            'prev_session': prev_session_idx,
+                            'session_key': str(session_key)
+                        })
                     continue
 
                 # FIRST IB FOUND - ARM SESSION (SSOT: rely on is_inside_bar)
-                atr_val = prev['atr'] if 'atr' in prev and pd.notna(prev['atr']) else 0.0
+                atr_val = atr[pos - 1] if pd.notna(atr[pos - 1]) else 0.0
                 state['armed'] = True
                 state['ib_idx'] = idx
                 state['levels'] = {
-                    'mother_high': float(prev['high']),
-                    'mother_low': float(prev['low']),
-                    'ib_high': float(current['high']),
-                    'ib_low': float(current['low']),
+                    'mother_high': float(high[pos - 1]),
+                    'mother_low': float(low[pos - 1]),
+                    'ib_high': float(high[pos]),
+                    'ib_low': float(low[pos]),
                     'atr': float(atr_val),
-                    'mother_body_fraction': float(current.get('mother_body_fraction', 0.0)),
-                    'inside_body_fraction': float(current.get('inside_body_fraction', 0.0)),
+                    'mother_body_fraction': float(mother_body_fraction[pos]),
+                    'inside_body_fraction': float(inside_body_fraction[pos]),
                 }
 
-                emit({
-                    'event': 'ib_armed',
-                    'session_key': str(session_key),
-                    'ib_idx': int(idx),
-                    'ib_ts': ts.isoformat(),
-                    'levels': state['levels']
-                })
+                if tracing:
+                    emit({
+                        'event': 'ib_armed',
+                        'session_key': str(session_key),
+                        'ib_idx': int(idx),
+                        'ib_ts': ts.isoformat(),
+                        'levels': state['levels']
+                    })
                 # NEW: Two-leg OCO signals created at IB detection (no breakout gating here)
                 levels = state['levels']
                 timeframe_minutes = getattr(config, "timeframe_minutes", None)
@@ -190,12 +218,13 @@ def generate_signals(
 
                 # === MAX TRADES CHECK (hard limit) ===
                 if signals_per_session.get(session_key, 0) >= max_trades:
-                    emit({
-                        'event': 'signal_rejected',
-                        'reason': 'max_trades_reached',
-                        'session_key': str(session_key),
-                        'count': signals_per_session[session_key]
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'signal_rejected',
+                            'reason': 'max_trades_reached',
+                            'session_key': str(session_key),
+                            'count': signals_per_session[session_key]
+                        })
                     state['done'] = True
                     continue
 
@@ -205,14 +234,15 @@ def generate_signals(
                 sl_long = levels['mother_low']
                 initial_risk_long = entry_long - sl_long
                 if initial_risk_long <= 0:
-                    emit({
-                        'event': 'signal_rejected',
-                        'reason': 'non_positive_risk',
-                        'idx': int(idx),
-                        'entry': entry_long,
-                        'sl': sl_long,
-                        'side': 'BUY'
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'signal_rejected',
+                            'reason': 'non_positive_risk',
+                            'idx': int(idx),
+                            'entry': entry_long,
+                            'sl': sl_long,
+                            'side': 'BUY'
+                        })
                     state['done'] = True
                     continue
                 effective_risk_long = initial_risk_long
@@ -227,14 +257,15 @@ def generate_signals(
                 sl_short = levels['mother_high']
                 initial_risk_short = sl_short - entry_short
                 if initial_risk_short <= 0:
-                    emit({
-                        'event': 'signal_rejected',
-                        'reason': 'non_positive_risk',
-                        'idx': int(idx),
-                        'entry': entry_short,
-                        'sl': sl_short,
-                        'side': 'SELL'
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'signal_rejected',
+                            'reason': 'non_positive_risk',
+                            'idx': int(idx),
+                            'entry': entry_short,
+                            'sl': sl_short,
+                            'side': 'SELL'
+                        })
                     state['done'] = True
                     continue
                 effective_risk_short = initial_risk_short
@@ -299,16 +330,17 @@ def generate_signals(
 
                 # Netting open window tracked in fill_model; no strategy-level suppression.
 
-                emit({
-                    'event': 'signal_generated_oco',
-                    'session_key': str(session_key),
-                    'entry_long': entry_long,
-                    'entry_short': entry_short,
-                    'sl_long': sl_long,
-                    'tp_long': tp_long,
-                    'sl_short': sl_short,
-                    'tp_short': tp_short
-                })
+                if tracing:
+                    emit({
+                        'event': 'signal_generated_oco',
+                        'session_key': str(session_key),
+                        'entry_long': entry_long,
+                        'entry_short': entry_short,
+                        'sl_long': sl_long,
+                        'tp_long': tp_long,
+                        'sl_short': sl_short,
+                        'tp_short': tp_short
+                    })
                 continue
 
         # === STATE: ARMED (watch for breakout of THE FIRST IB) ===
@@ -325,12 +357,13 @@ def generate_signals(
 
             # === MAX TRADES CHECK (hard limit) ===
             if signals_per_session.get(session_key, 0) >= max_trades:
-                emit({
-                    'event': 'signal_rejected',
-                    'reason': 'max_trades_reached',
-                    'session_key': str(session_key),
-                    'count': signals_per_session[session_key]
-                })
+                if tracing:
+                    emit({
+                        'event': 'signal_rejected',
+                        'reason': 'max_trades_reached',
+                        'session_key': str(session_key),
+                        'count': signals_per_session[session_key]
+                    })
                 state['done'] = True  # Mark session done
                 continue
 
@@ -338,47 +371,50 @@ def generate_signals(
             if netting_mode == "one_position_per_symbol" and netting_open_until is not None:
                 # Check if trigger_ts overlaps with existing position window
                 if ts < netting_open_until:
-                    emit({
-                        'event': 'signal_rejected',
-                        'reason': 'netting_blocked_position_open',
-                        'netting_mode': netting_mode,
-                        'symbol': symbol,
-                        'trigger_ts': ts.isoformat(),
-                        'open_until': netting_open_until.isoformat()
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'signal_rejected',
+                            'reason': 'netting_blocked_position_open',
+                            'netting_mode': netting_mode,
+                            'symbol': symbol,
+                            'trigger_ts': ts.isoformat(),
+                            'open_until': netting_open_until.isoformat()
+                        })
                     continue
                 # else: ts >= netting_open_until, previous position window closed
 
             # Check LONG breakout (intraday: trigger on high)
-            if current['high'] > entry_long:
+            if high[pos] > entry_long:
                 # === MVP: TRIGGER MUST BE WITHIN SESSION ===
                 if trigger_must_be_in_session:
                     # Trigger timestamp = current bar timestamp (breakout confirmed on close)
                     trigger_ts = ts
-                    trigger_in_session = session_filter.is_in_session(trigger_ts, session_tz)
+                    trigger_in_session = bool(sessions.in_session[pos])
 
                     if not trigger_in_session:
-                        emit({
-                            'event': 'signal_rejected',
-                            'reason': 'trigger_outside_session',
-                            'idx': int(idx),
-                            'trigger_ts': trigger_ts.isoformat(),
-                            'trigger_ts_local': trigger_ts.tz_convert(session_tz).strftime('%H:%M'),
-                            'side': 'BUY'
-                        })
+                        if tracing:
+                            emit({
+                                'event': 'signal_rejected',
+                                'reason': 'trigger_outside_session',
+                                'idx': int(idx),
+                                'trigger_ts': trigger_ts.isoformat(),
+                                'trigger_ts_local': trigger_ts.tz_convert(session_tz).strftime('%H:%M'),
+                                'side': 'BUY'
+                            })
                         continue
                 # Calculate SL with cap
                 sl = levels['mother_low']
                 initial_risk = entry_long - sl
 
                 if initial_risk <= 0:
-                    emit({
-                        'event': 'signal_rejected',
-                        'reason': 'non_positive_risk',
-                        'idx': int(idx),
-                        'entry': entry_long,
-                        'sl': sl
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'signal_rejected',
+                            'reason': 'non_positive_risk',
+                            'idx': int(idx),
+                            'entry': entry_long,
+                            'sl': sl
+                        })
                     continue
 
                 # === SL CAP ===
@@ -418,7 +454,7 @@ def generate_signals(
 
                 # === NETTING: Calculate position open_until (conservative) ===
                 if validity_policy == 'session_end':
-                    netting_open_until = session_filter.get_session_end(ts, session_tz)
+                    netting_open_until = sessions.session_end[pos]
                 elif validity_policy == 'one_bar':
                     # Assume M5 timeframe (5 minutes)
                     # TODO: Make timeframe configurable if needed
@@ -426,52 +462,55 @@ def generate_signals(
                 elif validity_policy == 'fixed_minutes':
                     netting_open_until = ts + pd.Timedelta(minutes=validity_minutes)
                     # Clamp to session_end (don't extend beyond session)
-                    session_end = session_filter.get_session_end(ts, session_tz)
+                    session_end = sessions.session_end[pos]
                     if session_end and netting_open_until > session_end:
                         netting_open_until = session_end
                 else:
                     # Fallback: session_end
-                    netting_open_until = session_filter.get_session_end(ts, session_tz)
-
-                emit({
-                    'event': 'signal_generated',
-                    'side': 'BUY',
-                    'session_key': str(session_key),
-                    'entry': entry_long,
-                    'sl': sl,
-                    'tp': tp,
-                    'stop_cap_applied': stop_cap_applied
-                })
+                    netting_open_until = sessions.session_end[pos]
+
+                if tracing:
+                    emit({
+                        'event': 'signal_generated',
+                        'side': 'BUY',
+                        'session_key': str(session_key),
+                        'entry': entry_long,
+                        'sl': sl,
+                        'tp': tp,
+                        'stop_cap_applied': stop_cap_applied
+                    })
 
             # Check SHORT breakout (intraday: trigger on low)
-            elif current['low'] < entry_short:
+            elif low[pos] < entry_short:
                 # === MVP: TRIGGER MUST BE WITHIN SESSION ===
                 if trigger_must_be_in_session:
                     trigger_ts = ts
-                    trigger_in_session = session_filter.is_in_session(trigger_ts, session_tz)
+                    trigger_in_session = bool(sessions.in_session[pos])
 
                     if not trigger_in_session:
-                        emit({
-                            'event': 'signal_rejected',
-                            'reason': 'trigger_outside_session',
-                            'idx': int(idx),
-                            'trigger_ts': trigger_ts.isoformat(),
-                            'trigger_ts_local': trigger_ts.tz_convert(session_tz).strftime('%H:%M'),
-                            'side': 'SELL'
-                        })
+                        if tracing:
+                            emit({
+                                'event': 'signal_rejected',
+                                'reason': 'trigger_outside_session',
+                                'idx': int(idx),
+                                'trigger_ts': trigger_ts.isoformat(),
+                                'trigger_ts_local': trigger_ts.tz_convert(session_tz).strftime('%H:%M'),
+                                'side': 'SELL'
+                            })
                         continue
                 # Calculate SL with cap
                 sl = levels['mother_high']
                 initial_risk = sl - entry_short
 
                 if initial_risk <= 0:
-                    emit({
-                        'event': 'signal_rejected',
-                        'reason': 'non_positive_risk',
-                        'idx': int(idx),
-                        'entry': entry_short,
-                        'sl': sl
-                    })
+                    if tracing:
+                        emit({
+                            'event': 'signal_rejected',
+                            'reason': 'non_positive_risk',
+                            'idx': int(idx),
+                            'entry': entry_short,
+                            'sl': sl
+                        })
                     continue
 
                 # === SL CAP ===
@@ -511,14 +550,15 @@ def generate_signals(
 
                 # Netting open window tracked in fill_model; no strategy-level suppression.
 
-                emit({
-                    'event': 'signal_generated',
-                    'side': 'SELL',
-                    'session_key': str(session_key),
-                    'entry': entry_short,
-                    'sl': sl,
-                    'tp': tp,
-                    'stop_cap_applied': stop_cap_applied
-                })
+                if tracing:
+                    emit({
+                        'event': 'signal_generated',
+                        'side': 'SELL',
+                        'session_key': str(session_key),
+                        'entry': entry_short,
+                        'sl': sl,
+                        'tp': tp,
+                        'stop_cap_applied': stop_cap_applied
+                    })
 
     return signals
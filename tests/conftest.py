@@ -0,0 +1,25 @@
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+SAMPLES = Path(__file__).resolve().parents[1] / "data" / "samples" / "m5_candles"
+
+
+@pytest.fixture
+def sample_m5_bars() -> Callable[[str], pd.DataFrame]:
+    """Loader for sample M5 candles: lowercase columns, index moved to ``timestamp``."""
+
+    def _load(symbol: str) -> pd.DataFrame:
+        df = pd.read_parquet(SAMPLES / f"{symbol}.parquet")
+        df.columns = [c.lower() for c in df.columns]
+        df["timestamp"] = df.index
+        return df.reset_index(drop=True)
+
+    return _load
+
+
+@pytest.fixture
+def tsla_m5_bars(sample_m5_bars) -> pd.DataFrame:
+    return sample_m5_bars("TSLA")
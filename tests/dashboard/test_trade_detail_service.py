@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import pandas as pd
 
@@ -40,3 +41,96 @@ def test_trade_detail_service_returns_detail(tmp_path: Path):
     assert detail is not None
     assert detail.exec_bars is not None
     assert detail.trade_row.get("symbol") == "TSLA"
+
+
+def _write_run(root: Path, n_trades: int = 50, n_bars: int = 5000) -> Path:
+    run_dir = root / "big"
+    (run_dir / "bars").mkdir(parents=True)
+    index = pd.date_range("2024-01-02 14:30", periods=n_bars, freq="1min", tz="UTC")
+    close = pd.Series(range(n_bars), dtype=float) + 100.0
+    bars = pd.DataFrame(
+        {"open": close.values, "high": close.values + 1, "low": close.values - 1, "close": close.values},
+        index=index,
+    )
+    # Shuffled on disk: the session sorts once
+    bars.sample(frac=1.0, random_state=3).to_parquet(run_dir / "bars" / "bars_exec_M1_rth.parquet")
+    entries = index[100 : 100 + n_trades * 90 : 90] + pd.Timedelta(seconds=20)
+    pd.DataFrame(
+        {
+            "symbol": "TSLA",
+            "side": "BUY",
+            "entry_ts": entries.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "exit_ts": (entries + pd.Timedelta(minutes=5)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "entry_price": 100.0,
+            "exit_price": 101.0,
+            "pnl": 1.5,
+        }
+    ).to_csv(run_dir / "trades.csv", index=False)
+    pd.DataFrame({"trade_id": range(n_trades), "proof_status": "PROVEN"}).to_csv(
+        run_dir / "trade_evidence.csv", index=False
+    )
+    return run_dir
+
+
+def test_session_loads_run_once_and_windows_like_nearest(tmp_path: Path, monkeypatch):
+    _write_run(tmp_path)
+    repo = TradeRepository(artifacts_root=tmp_path)
+    loads = []
+    original = repo.load_all
+    monkeypatch.setattr(repo, "load_all", lambda run_id: loads.append(run_id) or original(run_id))
+    service = TradeDetailService(repo)
+
+    bars = repo.load_bars_exec("big").sort_index()
+    for trade_id in range(50):
+        detail = service.get_trade_detail("big", trade_id, window_bars=40)
+        entry = pd.Timestamp(detail.trade_row["entry_ts"])
+        pos = bars.index.get_indexer([entry], method="nearest")[0]
+        pd.testing.assert_frame_equal(detail.exec_bars, bars.iloc[max(pos - 20, 0) : pos + 20])
+        assert detail.evidence_row["trade_id"] == trade_id
+
+    assert loads == ["big"]
+    assert (service.hits, service.misses) == (49, 1)
+    assert service.get_trade_detail("big", 50) is None
+
+    options = service.trade_options("big")
+    assert len(options) == 50
+    assert options[0] == {"label": "#0 TSLA 2024-01-02T16:10:20Z BUY PnL=1.5", "value": 0}
+    assert loads == ["big"]
+
+
+def test_session_reloads_when_run_changes_and_evicts_lru(tmp_path: Path):
+    run_dir = _write_run(tmp_path)
+    repo = TradeRepository(artifacts_root=tmp_path)
+    service = TradeDetailService(repo, max_sessions=1)
+
+    assert service.get_trade_detail("big", 0).trade_row["symbol"] == "TSLA"
+    trades = pd.read_csv(run_dir / "trades.csv")
+    trades["symbol"] = "NVDA"
+    trades.to_csv(run_dir / "trades.csv", index=False)
+    stat = (run_dir / "trades.csv").stat()
+    os.utime(run_dir / "trades.csv", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert service.get_trade_detail("big", 0).trade_row["symbol"] == "NVDA"
+    assert service.misses == 2
+
+    other = tmp_path / "run"
+    other.mkdir()
+    trades.iloc[:1].to_csv(other / "trades.csv", index=False)
+    service.get_trade_detail("run", 0)
+    service.get_trade_detail("big", 0)
+    assert (service.hits, service.misses) == (0, 4)
+
+
+def test_nearest_bar_breaks_ties_like_get_indexer(tmp_path: Path):
+    run_dir = _write_run(tmp_path, n_trades=1, n_bars=300)
+    trades = pd.read_csv(run_dir / "trades.csv")
+    trades["entry_ts"] = "2024-01-02T14:31:30Z"  # exactly between the 14:31 and 14:32 bars
+    trades.to_csv(run_dir / "trades.csv", index=False)
+
+    repo = TradeRepository(artifacts_root=tmp_path)
+    bars = repo.load_bars_exec("big").sort_index()
+    pos = bars.index.get_indexer([pd.Timestamp("2024-01-02T14:31:30Z")], method="nearest")[0]
+    assert pos == 2
+
+    detail = TradeDetailService(repo).get_trade_detail("big", 0, window_bars=10)
+    pd.testing.assert_frame_equal(detail.exec_bars, bars.iloc[0 : pos + 5])
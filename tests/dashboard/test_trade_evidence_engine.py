@@ -35,3 +35,26 @@ def test_generate_trade_evidence_proven(tmp_path: Path):
     evidence = generate_trade_evidence(run_dir)
     assert evidence is not None
     assert evidence.loc[0, "proof_status"] == ProofStatus.PROVEN.value
+
+
+def test_generate_trade_evidence_reads_parquet_trades(tmp_path: Path):
+    run_dir = tmp_path / "run"
+    (run_dir / "bars").mkdir(parents=True)
+    pd.DataFrame(
+        {
+            "symbol": ["TSLA"],
+            "side": ["BUY"],
+            "entry_ts": ["2024-01-01T10:00:00Z"],
+            "exit_ts": ["2024-01-01T10:05:00Z"],
+            "entry_price": [100.0],
+            "exit_price": [101.0],
+        }
+    ).to_parquet(run_dir / "trades.parquet", index=False)
+    pd.DataFrame(
+        {"open": [99.5, 100.5], "high": [100.5, 101.5], "low": [99.0, 100.0], "close": [100.4, 101.0]},
+        index=pd.to_datetime(["2024-01-01T10:00:00Z", "2024-01-01T10:05:00Z"], utc=True),
+    ).to_parquet(run_dir / "bars" / "bars_exec_M5_rth.parquet")
+
+    evidence = generate_trade_evidence(run_dir)
+    assert evidence is not None
+    assert evidence.loc[0, "proof_status"] == ProofStatus.PROVEN.value
@@ -0,0 +1,58 @@
+from pathlib import Path
+from typing import Callable, Dict
+
+import pytest
+
+from axiom_bt.pipeline.strategy_config_loader import load_strategy_params_from_ssot
+
+
+@pytest.fixture
+def write_sample_snapshots(tmp_path: Path, sample_m5_bars) -> Callable[..., Dict[str, Path]]:
+    """Write UTC bars snapshots of sample M5 symbols to ``tmp_path/<SYMBOL>.parquet``."""
+
+    def _write(*symbols: str) -> Dict[str, Path]:
+        paths = {}
+        for symbol in symbols:
+            df = sample_m5_bars(symbol)
+            df["timestamp"] = df["timestamp"].dt.tz_convert("UTC")
+            path = tmp_path / f"{symbol}.parquet"
+            df.to_parquet(path)
+            paths[symbol] = path
+        return paths
+
+    return _write
+
+
+@pytest.fixture
+def tsla_snapshot(write_sample_snapshots) -> Path:
+    return write_sample_snapshots("TSLA")["TSLA"]
+
+
+@pytest.fixture
+def insidebar_ssot() -> dict:
+    return load_strategy_params_from_ssot("insidebar_intraday", "1.0.0")
+
+
+@pytest.fixture
+def insidebar_base_params(insidebar_ssot) -> dict:
+    """SSOT core + tunable params over the sample window (no symbol)."""
+    return {
+        **insidebar_ssot.get("core", {}),
+        **insidebar_ssot.get("tunable", {}),
+        "timeframe": "M5",
+        "requested_end": "2024-11-28",
+        "lookback_days": 10,
+    }
+
+
+@pytest.fixture
+def insidebar_params(insidebar_base_params) -> dict:
+    """Single-symbol TSLA params with a session filter that yields trades on the sample."""
+    return {
+        **insidebar_base_params,
+        "symbol": "TSLA",
+        "inside_bar_definition_mode": "mb_range_hl__ib_hl",
+        "session_filter": ["09:30-11:00", "11:00-16:00"],
+        "min_mother_bar_size": 0.0,
+        "stop_distance_cap_ticks": 50,
+    }
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from axiom_bt.pipeline.artifacts import ArtifactError, write_artifacts
+
+
+def _frames() -> dict:
+    events_intent = pd.DataFrame(
+        [
+            {
+                "template_id": "t1",
+                "signal_ts": pd.Timestamp("2025-01-01T14:00:00Z"),
+                "symbol": "TEST",
+                "side": "BUY",
+                "entry_price": 100.0,
+                "stop_price": 99.0,
+                "take_profit_price": 102.0,
+            }
+        ]
+    )
+    fills = pd.DataFrame(
+        [
+            {"template_id": "t1", "symbol": "TEST", "fill_ts": pd.Timestamp("2025-01-01T14:05:00Z"), "fill_price": 100.0, "reason": "signal_fill"},
+            {"template_id": "t1", "symbol": "TEST", "fill_ts": pd.Timestamp("2025-01-01T15:00:00Z"), "fill_price": 102.0, "reason": "take_profit"},
+        ]
+    )
+    trades = pd.DataFrame([{"template_id": "t1", "symbol": "TEST", "qty": 10, "pnl": 20.0, "reason": "take_profit"}])
+    equity = pd.DataFrame([{"ts": pd.Timestamp("2025-01-01T15:00:00Z"), "equity": 10020.0}])
+    return dict(
+        signals_frame=pd.DataFrame({"timestamp": [pd.Timestamp("2025-01-01T14:00:00Z")], "inside_bar_reject_reason": [None]}),
+        events_intent=events_intent,
+        fills=fills,
+        trades=trades,
+        equity_curve=equity,
+        ledger=pd.DataFrame([{"ts": pd.Timestamp("2025-01-01T15:00:00Z"), "cash": 10020.0}]),
+    )
+
+
+def _write(out_dir: Path, artifact_format: str) -> dict:
+    manifest_fields = {
+        "run_id": out_dir.name,
+        "params": {},
+        "artifacts_index": ["signals_frame.csv", "events_intent.csv", "fills.csv", "trades.csv", "metrics.json"],
+    }
+    write_artifacts(
+        out_dir,
+        **_frames(),
+        manifest_fields=manifest_fields,
+        result_fields={"run_id": out_dir.name, "status": "success", "details": {}},
+        metrics={},
+        artifact_format=artifact_format,
+    )
+    return json.loads((out_dir / "run_manifest.json").read_text())
+
+
+def test_parquet_artifacts_round_trip_and_manifest_records_format(tmp_path):
+    manifest = _write(tmp_path / "run_pq", "parquet")
+
+    assert manifest["artifact_format"] == "parquet"
+    assert manifest["artifacts_index"] == [
+        "signals_frame.parquet",
+        "events_intent.parquet",
+        "fills.parquet",
+        "trades.parquet",
+        "metrics.json",
+    ]
+    out = tmp_path / "run_pq"
+    assert not (out / "fills.csv").exists()
+    pd.testing.assert_frame_equal(pd.read_parquet(out / "fills.parquet"), _frames()["fills"])
+
+    meta = pq.ParquetFile(out / "fills.parquet").metadata
+    columns = {meta.row_group(0).column(i).path_in_schema: meta.row_group(0).column(i) for i in range(meta.num_columns)}
+    assert columns["symbol"].compression == "ZSTD"
+    assert any("DICTIONARY" in enc for enc in columns["symbol"].encodings)
+    assert not any("DICTIONARY" in enc for enc in columns["fill_price"].encodings)
+
+
+def test_unknown_artifact_format_is_rejected(tmp_path):
+    with pytest.raises(ArtifactError, match="artifact_format"):
+        _write(tmp_path / "bad", "feather")
+
+
+def test_dashboard_reads_parquet_and_legacy_csv_runs_alike(tmp_path, monkeypatch):
+    from trading_dashboard.repositories import backtests
+    from trading_dashboard.repositories.trade_repository import TradeRepository
+
+    _write(tmp_path / "run_csv", "csv")
+    _write(tmp_path / "run_pq", "parquet")
+    monkeypatch.setattr(backtests, "BACKTESTS_DIR", tmp_path)
+
+    legacy = backtests.get_backtest_orders("run_csv")
+    columnar = backtests.get_backtest_orders("run_pq")
+    for key in ("orders", "fills", "trades"):
+        assert not columnar[key].empty
+        assert list(columnar[key].columns) == list(legacy[key].columns)
+        assert len(columnar[key]) == len(legacy[key])
+    assert len(backtests.get_backtest_equity("run_pq")) == 1
+
+    repo = TradeRepository(artifacts_root=tmp_path)
+    assert len(repo.load_trades("run_pq")) == len(repo.load_trades("run_csv")) == 1
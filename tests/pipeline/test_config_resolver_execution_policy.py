@@ -39,3 +39,22 @@ def test_execution_policy_rejects_non_m1_probe_timeframe():
             overrides={},
             defaults={},
         )
+
+
+def test_execution_policy_accepts_numpy_fill_engine():
+    result = resolve_config(
+        base={"execution": {"fill_engine": "numpy"}},
+        overrides={},
+        defaults={},
+    )
+    assert result.resolved["execution"]["fill_engine"] == "numpy"
+    assert "execution.fill_engine" not in result.unknown_keys
+
+
+def test_execution_policy_rejects_unknown_fill_engine():
+    with pytest.raises(ValueError, match="fill_engine"):
+        resolve_config(
+            base={"execution": {"fill_engine": "numba"}},
+            overrides={},
+            defaults={},
+        )
@@ -0,0 +1,113 @@
+import math
+
+import pandas as pd
+
+from axiom_bt.pipeline.execution import _build_fill_audit, _compound_qtys, execute
+
+
+def test_compound_recurrence_sizes_from_running_cash():
+    qtys = _compound_qtys([100.0, 50.0, 40.0], [110.0, 45.0, 41.0], [True, False, True], 1000.0, 0.0, 0.0)
+    # 1000 -> +100 (10 @ 100→110) -> 1100 -> +110 (22 short @ 50→45) -> 1210
+    assert qtys == [10, 22, 30]
+
+
+def test_compound_recurrence_charges_slippage_and_commission():
+    qtys = _compound_qtys([100.0, 100.0], [100.0, 100.0], [True, True], 1000.0, 10.0, 5.0)
+    entry, exit_ = 100.0 * (1 + 5e-4), 100.0 * (1 - 5e-4)
+    cash = 1000.0 + (exit_ - entry) * 10 - 10 * (entry + exit_) * 1e-3
+    assert qtys == [10, math.floor(cash // 100.0)]
+
+
+def test_compound_ledger_reserves_cash_for_open_trades():
+    # A: 10 @ 100 held t0→t2 (+100); B enters at t1 while A is open; C enters when A exits.
+    qtys = _compound_qtys(
+        [100.0, 50.0, 40.0],
+        [110.0, 50.0, 40.0],
+        [True, True, True],
+        1000.0,
+        0.0,
+        0.0,
+        entry_ns=[0, 1, 2],
+        exit_ns=[2, 3, 4],
+    )
+    # B: all cash reserved by A (min qty 1); C: 1100 realized - 50 reserved by B
+    assert qtys == [10, 1, 26]
+
+
+def test_portfolio_execute_orders_ledger_by_event_time():
+    t = [pd.Timestamp("2025-04-03 14:30", tz="UTC") + pd.Timedelta(minutes=5 * i) for i in range(4)]
+    bars = pd.DataFrame(
+        {
+            "timestamp": t * 2,
+            "symbol": ["AAA"] * 4 + ["BBB"] * 4,
+            "open": 100.0,
+            "high": 100.0,
+            "low": 100.0,
+            "close": 100.0,
+            "volume": 1.0,
+        }
+    )
+    # AAA t0→t2 and BBB t1→t3 overlap; AAA's exit comes after BBB's entry.
+    fills = pd.DataFrame(
+        [
+            {"template_id": "a", "symbol": "AAA", "fill_ts": t[0], "fill_price": 100.0, "reason": "signal_fill"},
+            {"template_id": "b", "symbol": "BBB", "fill_ts": t[1], "fill_price": 50.0, "reason": "signal_fill"},
+            {"template_id": "a", "symbol": "AAA", "fill_ts": t[2], "fill_price": 110.0, "reason": "take_profit"},
+            {"template_id": "b", "symbol": "BBB", "fill_ts": t[3], "fill_price": 55.0, "reason": "take_profit"},
+        ]
+    )
+    intents = pd.DataFrame([{"template_id": "a", "side": "BUY"}, {"template_id": "b", "side": "BUY"}])
+
+    art = execute(fills, intents, bars, initial_cash=1500.0, compound_enabled=True, event_ledger=True)
+
+    trades = art.trades.set_index("template_id")
+    assert trades.loc["a", "qty"] == 15
+    # Sized from the 0 left after A's reservation, not from A's unrealized +150
+    assert trades.loc["b", "qty"] == 1
+
+    ledger = art.portfolio_ledger
+    assert ledger["event"].tolist() == ["ENTRY", "ENTRY", "EXIT", "EXIT"]
+    assert ledger["template_id"].tolist() == ["a", "b", "a", "b"]
+    assert ledger["timestamp"].tolist() == t
+    assert ledger["cash"].tolist() == [1500.0, 1500.0, 1650.0, 1655.0]
+    assert ledger["reserved"].tolist() == [1500.0, 1550.0, 50.0, 0.0]
+    assert ledger["available"].tolist() == [0.0, -50.0, 1600.0, 1655.0]
+    assert ledger["seq"].tolist() == [0, 1, 2, 3]
+
+    # Single-symbol runs keep the sequential recurrence and the equity-curve ledger
+    art = execute(fills, intents, bars, initial_cash=1500.0, compound_enabled=True)
+    assert art.trades.set_index("template_id").loc["b", "qty"] == 1650 // 50
+    assert list(art.portfolio_ledger.columns) == ["timestamp", "cash", "seq"]
+
+
+def test_fill_audit_joins_fills_against_trades():
+    ts = pd.Timestamp("2025-01-02 15:00", tz="UTC")
+    fills = pd.DataFrame(
+        {
+            "template_id": ["a", "a", "a", "ghost", None],
+            "fill_ts": [ts] * 5,
+            "fill_price": [100.0, 101.0, 99.5, 7.0, float("nan")],
+            "reason": ["signal_fill", "order_expired", "take_profit", "take_profit", "signal_fill"],
+            "side": ["BUY", "BUY", "BUY", "SELL", None],
+        }
+    )
+    trades = pd.DataFrame(
+        {
+            "template_id": ["a"],
+            "qty": [3],
+            "side": ["sell"],
+            "entry_price": [100.0],
+            "entry_exec_price": [99.9],
+            "exit_price": [99.5],
+            "exit_exec_price": [99.6],
+        }
+    )
+
+    audit = _build_fill_audit(fills, trades, commission_bps=10.0, slippage_bps=10.0)
+
+    assert list(audit["fill_side"]) == ["SELL", "BUY", "BUY", "SELL", None]
+    assert list(audit["fill_qty"]) == [3.0, 0.0, 3.0, 0.0, 0.0]
+    assert list(audit["fill_price_exec"][:4]) == [99.9, 101.0, 99.6, 7.0]
+    assert audit["commission_cost"].tolist()[:4] == [3 * 99.9 * 1e-3, 0.0, 3 * 99.6 * 1e-3, 0.0]
+    assert audit["slippage_cost"].iloc[0] == 3 * abs(99.9 - 100.0)
+    assert list(audit["effective_commission_bps"]) == [10.0, 10.0, 10.0, 0.0, 0.0]
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from axiom_bt.pipeline.fill_model import FillModelError, generate_fills
+
+
+def _random_bars(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range("2025-03-03 14:30:00", periods=n, freq="5min", tz="UTC")
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.4, size=n))
+    open_ = close + rng.normal(0.0, 0.2, size=n)
+    high = np.maximum(open_, close) + rng.uniform(0.0, 0.6, size=n)
+    low = np.minimum(open_, close) - rng.uniform(0.0, 0.6, size=n)
+    return pd.DataFrame(
+        {"timestamp": ts, "open": open_, "high": high, "low": low, "close": close, "volume": 1.0}
+    )
+
+
+def _random_intents(bars: pd.DataFrame, count: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(count):
+        pos = int(rng.integers(0, len(bars) - 10))
+        ref = float(bars["close"].iloc[pos])
+        signal_ts = bars["timestamp"].iloc[pos]
+        valid_to = bars["timestamp"].iloc[min(pos + int(rng.integers(3, 40)), len(bars) - 1)]
+        valid_to = valid_to + pd.Timedelta(minutes=int(rng.integers(0, 4)))
+        width = float(rng.uniform(0.2, 1.0))
+        for leg, side in enumerate(("BUY", "SELL")):
+            entry = ref + width if side == "BUY" else ref - width
+            stop = ref - width if side == "BUY" else ref + width
+            tp = entry + 2 * width if side == "BUY" else entry - 2 * width
+            rows.append(
+                {
+                    "template_id": f"ib_{i:04d}_{leg}",
+                    "signal_ts": signal_ts,
+                    "symbol": "TEST",
+                    "side": side,
+                    "entry_price": entry,
+                    "stop_price": stop,
+                    "take_profit_price": tp,
+                    "oco_group_id": f"g_{i:04d}",
+                    "order_valid_to_ts": valid_to,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+@pytest.mark.parametrize("allow_same_bar_exit", [False, True])
+@pytest.mark.parametrize("mode", ["no_fill", "legacy", "m1_probe_then_no_fill"])
+def test_numpy_engine_matches_pandas_fills_hash(allow_same_bar_exit, mode):
+    bars = _random_bars(600, seed=7)
+    intents = _random_intents(bars, 80, seed=11)
+
+    kwargs = dict(allow_same_bar_exit=allow_same_bar_exit, same_bar_resolution_mode=mode)
+    ref = generate_fills(intents, bars, fill_engine="pandas", **kwargs)
+    fast = generate_fills(intents, bars, fill_engine="numpy", **kwargs)
+
+    assert len(ref.fills) > 0
+    assert fast.fills_hash == ref.fills_hash
+    pd.testing.assert_frame_equal(fast.fills, ref.fills)
+    assert fast.gap_stats == ref.gap_stats
+
+
+def test_numpy_engine_session_end_snap_parity():
+    bars = _random_bars(60, seed=3)
+    # Drop a block of bars so valid_to falls into a gap and must snap back.
+    bars = bars.drop(index=range(20, 30)).reset_index(drop=True)
+    intents = _random_intents(bars, 10, seed=5)
+    intents["take_profit_price"] = intents.apply(
+        lambda r: r["entry_price"] + 1000.0 if r["side"] == "BUY" else r["entry_price"] - 1000.0,
+        axis=1,
+    )
+    intents["stop_price"] = intents.apply(
+        lambda r: r["entry_price"] - 1000.0 if r["side"] == "BUY" else r["entry_price"] + 1000.0,
+        axis=1,
+    )
+
+    ref = generate_fills(intents, bars, fill_engine="pandas")
+    fast = generate_fills(intents, bars, fill_engine="numpy")
+
+    assert "session_end" in set(ref.fills["reason"])
+    assert fast.fills_hash == ref.fills_hash
+    assert fast.gap_stats == ref.gap_stats
+
+
+def test_unknown_fill_engine_rejected():
+    bars = _random_bars(30, seed=1)
+    intents = _random_intents(bars, 1, seed=1)
+    with pytest.raises(FillModelError, match="fill_engine"):
+        generate_fills(intents, bars, fill_engine="numba")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from axiom_bt.artifacts.frame_hash import FRAME_HASH_VERSION, hash_frame
+
+
+def _frame(n: int = 1000) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    return pd.DataFrame(
+        {
+            "template_id": [f"t{i}" for i in range(n)],
+            "symbol": rng.choice(["AAPL", "MSFT", None], n),
+            "fill_ts": pd.date_range("2025-01-02 14:30", periods=n, freq="5min", tz="UTC"),
+            "fill_price": rng.normal(100, 1, n),
+            "qty": rng.integers(1, 100, n),
+            "flag": rng.random(n) < 0.5,
+        }
+    )
+
+
+def test_hash_is_deterministic_and_chunk_independent():
+    df = _frame()
+    assert hash_frame(df) == hash_frame(df.copy())
+    assert hash_frame(df, chunk_rows=7) == hash_frame(df, chunk_rows=100_000)
+    assert hash_frame(df.set_index("template_id", drop=False)) == hash_frame(df)
+
+
+def test_hash_is_width_stable_but_value_type_aware():
+    df = _frame()
+    narrowed = df.astype({"qty": "int32", "fill_price": "float64"})
+    assert hash_frame(narrowed) == hash_frame(df)
+    assert hash_frame(df.assign(fill_ts=df["fill_ts"].dt.as_unit("us"))) == hash_frame(df)
+
+    assert hash_frame(df.assign(qty=df["qty"].astype(float))) != hash_frame(df)
+    assert hash_frame(df.assign(fill_ts=df["fill_ts"].dt.tz_convert("America/New_York"))) != hash_frame(df)
+
+
+def test_hash_is_column_order_and_value_sensitive():
+    df = _frame()
+    assert hash_frame(df[list(reversed(df.columns))]) != hash_frame(df)
+    changed = df.copy()
+    changed.loc[500, "fill_price"] += 1e-9
+    assert hash_frame(changed) != hash_frame(df)
+
+
+@pytest.mark.parametrize(
+    "left,right",
+    [
+        (pd.DataFrame({"x": [0.0, np.nan]}), pd.DataFrame({"x": [-0.0, float("nan")]})),
+        (pd.DataFrame({"x": pd.array([1, None], dtype="Int64")}), pd.DataFrame({"x": pd.array([1, None], dtype="Int32")})),
+    ],
+)
+def test_hash_canonicalizes_signed_zero_nan_and_nullable_widths(left, right):
+    assert hash_frame(left) == hash_frame(right)
+
+
+def test_empty_frames_hash_by_schema():
+    cols = ["template_id", "symbol", "fill_ts", "fill_price", "reason"]
+    assert hash_frame(pd.DataFrame(columns=cols)) != hash_frame(pd.DataFrame(columns=cols[:-1]))
+    assert FRAME_HASH_VERSION.startswith("frame_sha256_")
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from axiom_bt.pipeline.runner import PipelineError
+from axiom_bt.pipeline.sweep import _dispatch_order, _results_table, expand_grid, run_parameter_sweep
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GRID = {"atr_period": [10, 14], "risk_reward_ratio": [1.0, 1.5, 2.0]}
+
+
+@pytest.fixture
+def sweep(tmp_path: Path, tsla_snapshot: Path, insidebar_params: dict, insidebar_ssot: dict):
+    def _sweep(out_name: str, max_workers: int, top_k: int = 1) -> pd.DataFrame:
+        return run_parameter_sweep(
+            run_id=out_name,
+            out_dir=tmp_path / out_name,
+            bars_path=tsla_snapshot,
+            strategy_id="insidebar_intraday",
+            strategy_version="1.0.0",
+            strategy_params=insidebar_params,
+            strategy_meta=insidebar_ssot,
+            grid=GRID,
+            compound_enabled=True,
+            compound_equity_basis="cash_only",
+            initial_cash=10000.0,
+            max_workers=max_workers,
+            top_k=top_k,
+        )
+
+    return _sweep
+
+
+def test_expand_grid_is_ordered_product():
+    assert expand_grid({"a": [1, 2], "b": ["x"]}) == [{"a": 1, "b": "x"}, {"a": 2, "b": "x"}]
+    with pytest.raises(PipelineError, match="non-empty list"):
+        expand_grid({"a": []})
+
+
+def test_dispatch_order_groups_combos_by_enrichment_params():
+    combos = expand_grid({"risk_reward_ratio": [1.0, 2.0], "atr_period": [10, 14]})
+    order = _dispatch_order(combos, "insidebar_intraday")
+    assert [combo["atr_period"] for _, combo in order] == [10, 10, 14, 14]
+    assert sorted(combo_id for combo_id, _ in order) == [0, 1, 2, 3]
+
+
+def test_results_rank_direction_and_nan_metrics_last():
+    rows = [
+        {
+            "combo_id": combo_id,
+            "params": {"atr_period": combo_id},
+            "metrics": {"net_pnl": pnl, "max_drawdown_pct": dd},
+            "intents": 0,
+            "fills": 0,
+            "intent_hash": "",
+            "fills_hash": "",
+        }
+        for combo_id, pnl, dd in [(0, 10.0, 0.30), (1, float("nan"), float("nan")), (2, 50.0, 0.05)]
+    ]
+
+    assert list(_results_table(rows, ["atr_period"], "net_pnl")["rank"]) == [2, 3, 1]
+    assert list(_results_table(rows, ["atr_period"], "max_drawdown_pct", rank_ascending=True)["rank"]) == [2, 3, 1]
+    assert list(_results_table(rows, ["atr_period"], "max_drawdown_pct")["rank"]) == [1, 3, 2]
+
+
+def test_sweep_results_and_full_run_for_top_k(tmp_path, sweep):
+    results = sweep("sweep", max_workers=1)
+
+    assert len(results) == 6
+    assert list(results["combo_id"]) == list(range(6))
+    assert sorted(results["rank"]) == list(range(1, 7))
+    assert results.loc[results["risk_reward_ratio"] == 1.0, "intent_hash"].nunique() == 2
+
+    out = tmp_path / "sweep"
+    assert (out / "sweep_results.csv").exists()
+    manifest = json.loads((out / "sweep_manifest.json").read_text())
+    assert manifest["combinations"] == 6
+    [top] = manifest["top"]
+    best = results.loc[results["rank"] == 1].iloc[0]
+    assert top["combo_id"] == best["combo_id"]
+
+    full = json.loads((out / top["out_dir"] / "run_manifest.json").read_text())
+    assert full["hashes"]["intent_hash"] == best["intent_hash"]
+    assert full["hashes"]["fills_hash"] == best["fills_hash"]
+    metrics = json.loads((out / top["out_dir"] / "metrics.json").read_text())
+    assert metrics["net_pnl"] == pytest.approx(best["net_pnl"])
+    assert not (out / "top" / f"combo_{int(results.loc[results['rank'] == 2, 'combo_id'].iloc[0]):04d}").exists()
+
+
+def test_sweep_process_pool_matches_inline(sweep):
+    inline = sweep("inline", max_workers=1, top_k=0)
+    pooled = sweep("pooled", max_workers=2, top_k=0)
+    pd.testing.assert_frame_equal(pooled, inline)
+
+
+def test_sweep_cli_parses_param_axes(tmp_path, tsla_snapshot):
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "axiom_bt.pipeline.cli", "sweep",
+            "--run-id", "cli",
+            "--out-dir", str(tmp_path / "cli"),
+            "--strategy-id", "insidebar_intraday",
+            "--strategy-version", "1.0.0",
+            "--timeframe", "M5",
+            "--requested-end", "2024-11-28",
+            "--lookback-days", "10",
+            "--bars-path", str(tsla_snapshot),
+            "--symbol", "TSLA",
+            "--param", "risk_reward_ratio=1.5,2",
+            "--top-k", "0",
+            "--max-workers", "1",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={"PYTHONPATH": f"{REPO_ROOT / 'src'}:{REPO_ROOT}"},
+    )
+    assert result.returncode == 0, result.stderr
+    results = pd.read_csv(tmp_path / "cli" / "sweep_results.csv")
+    assert list(results["risk_reward_ratio"]) == [1.5, 2]
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from axiom_bt.pipeline.portfolio_runner import (
+    SymbolTask,
+    _run_symbol_task,
+    run_portfolio_pipeline,
+)
+from axiom_bt.pipeline.runner import PipelineError
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SYMBOLS = ["AAPL", "MSFT", "TSLA"]
+
+
+@pytest.fixture
+def snapshot_paths(write_sample_snapshots) -> dict[str, Path]:
+    return write_sample_snapshots(*SYMBOLS)
+
+
+@pytest.fixture
+def run(tmp_path: Path, snapshot_paths: dict[str, Path], insidebar_base_params: dict, insidebar_ssot: dict):
+    def _run(out_name: str, max_workers: int) -> dict:
+        return run_portfolio_pipeline(
+            run_id=out_name,
+            out_dir=tmp_path / out_name,
+            symbols=SYMBOLS,
+            bars_paths=snapshot_paths,
+            strategy_id="insidebar_intraday",
+            strategy_version="1.0.0",
+            strategy_params=insidebar_base_params,
+            strategy_meta=insidebar_ssot,
+            compound_enabled=True,
+            compound_equity_basis="cash_only",
+            initial_cash=10000.0,
+            max_workers=max_workers,
+        )
+
+    return _run
+
+
+def test_portfolio_writes_one_consolidated_artifact_set(tmp_path, run, snapshot_paths, insidebar_ssot):
+    manifest = run("pf", max_workers=1)
+
+    out = tmp_path / "pf"
+    for name in manifest["artifacts_index"]:
+        assert (out / name).exists(), name
+    assert manifest["run_mode"] == "portfolio"
+    assert manifest["params"]["symbols"] == SYMBOLS
+    assert set(manifest["hashes"]["bars_hash_by_symbol"]) == set(SYMBOLS)
+
+    intents = pd.read_csv(out / "events_intent.csv")
+    assert set(intents["symbol"]) <= set(SYMBOLS)
+    assert intents["signal_ts"].is_monotonic_increasing
+
+    # Merged intents equal the union of independent single-symbol intents.
+    params = manifest["params"]["strategy_params"]
+    expected_ids = set()
+    for symbol in SYMBOLS:
+        res = _run_symbol_task(
+            SymbolTask(
+                run_id="single",
+                symbol=symbol,
+                bars_path=snapshot_paths[symbol],
+                strategy_id="insidebar_intraday",
+                strategy_version="1.0.0",
+                strategy_params={**insidebar_ssot.get("core", {}), **params},
+            )
+        )
+        expected_ids |= set(res.events_intent["template_id"])
+    assert set(intents["template_id"]) == expected_ids
+
+
+def test_portfolio_process_pool_matches_inline(tmp_path, run):
+    inline = run("inline", max_workers=1)
+    pooled = run("pooled", max_workers=2)
+
+    assert pooled["hashes"]["intent_hash"] == inline["hashes"]["intent_hash"]
+    assert pooled["hashes"]["fills_hash"] == inline["hashes"]["fills_hash"]
+    assert (tmp_path / "pooled" / "trades.csv").read_text() == (
+        tmp_path / "inline" / "trades.csv"
+    ).read_text()
+    result = json.loads((tmp_path / "pooled" / "run_result.json").read_text())
+    assert result["details"]["symbols"] == len(SYMBOLS)
+
+
+def test_portfolio_rejects_duplicate_symbols(tmp_path):
+    with pytest.raises(PipelineError, match="duplicate"):
+        run_portfolio_pipeline(
+            run_id="dup",
+            out_dir=tmp_path / "dup",
+            symbols=["AAPL", "aapl"],
+            strategy_id="insidebar_intraday",
+            strategy_version="1.0.0",
+            strategy_params={},
+            strategy_meta={},
+            compound_enabled=False,
+            compound_equity_basis="cash_only",
+            initial_cash=10000.0,
+        )
+
+
+def test_portfolio_cli_writes_consolidated_artifacts(tmp_path, snapshot_paths):
+    out = tmp_path / "cli"
+    result = subprocess.run(
+        [
+            sys.executable, "-m", "axiom_bt.pipeline.cli", "portfolio",
+            "--run-id", "cli",
+            "--out-dir", str(out),
+            "--strategy-id", "insidebar_intraday",
+            "--strategy-version", "1.0.0",
+            "--timeframe", "M5",
+            "--requested-end", "2024-11-28",
+            "--lookback-days", "10",
+            "--symbols", ",".join(SYMBOLS),
+            "--bars-dir", str(tmp_path),
+            "--compound-enabled",
+            "--max-workers", "1",
+        ],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env={"PYTHONPATH": f"{REPO_ROOT / 'src'}:{REPO_ROOT}"},
+    )
+    assert result.returncode == 0, result.stderr
+
+    manifest = json.loads((out / "run_manifest.json").read_text())
+    assert manifest["run_mode"] == "portfolio"
+    assert manifest["params"]["symbols"] == SYMBOLS
+    assert set(manifest["hashes"]["bars_hash_by_symbol"]) == set(SYMBOLS)
+    for name in manifest["artifacts_index"]:
+        assert (out / name).exists(), name
+
+    trades = pd.read_csv(out / "trades.csv")
+    assert set(trades["symbol"]) <= set(SYMBOLS)
+    ledger = pd.read_csv(out / "portfolio_ledger.csv")
+    assert len(ledger) == 2 * len(trades)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from axiom_bt.pipeline.runner import run_pipeline
+from axiom_bt.pipeline.stage_cache import StageCache, stage_key
+
+
+@pytest.fixture
+def run(tmp_path: Path, tsla_snapshot: Path, insidebar_params: dict, insidebar_ssot: dict):
+    def _run(name: str, cache: StageCache | None, commission_bps: float) -> dict:
+        run_pipeline(
+            run_id=name,
+            out_dir=tmp_path / name,
+            bars_path=tsla_snapshot,
+            strategy_id="insidebar_intraday",
+            strategy_version="1.0.0",
+            strategy_params=insidebar_params,
+            strategy_meta=insidebar_ssot,
+            compound_enabled=False,
+            compound_equity_basis="cash_only",
+            initial_cash=10000.0,
+            fees_bps=commission_bps,
+            slippage_bps=0.0,
+            config_overrides={"cli": {"costs": {"commission_bps": commission_bps, "slippage_bps": 0.0}}},
+            stage_cache=cache,
+        )
+        return json.loads((tmp_path / name / "run_manifest.json").read_text())
+
+    return _run
+
+
+def test_fee_only_rerun_reuses_upstream_stages(tmp_path, run):
+    cache = StageCache(tmp_path / "cache")
+
+    first = run("first", cache, commission_bps=0.0)
+    assert first["stage_cache"]["hits"] == []
+    assert set(first["stage_cache"]["misses"]) == {"signal_frame", "intent", "fills", "execute"}
+
+    rerun = run("rerun", cache, commission_bps=5.0)
+    assert set(rerun["stage_cache"]["hits"]) == {"signal_frame", "intent", "fills"}
+    assert rerun["stage_cache"]["misses"] == ["execute"]
+    assert rerun["hashes"] == first["hashes"]
+
+    # Cached results produce the same artifacts as an uncached run.
+    uncached = run("uncached", None, commission_bps=5.0)
+    assert "stage_cache" not in uncached
+    for name in ("signals_frame.csv", "events_intent.csv", "fills.csv", "trades.csv", "equity_curve.csv"):
+        assert (tmp_path / "rerun" / name).read_text() == (tmp_path / "uncached" / name).read_text(), name
+
+    again = run("again", cache, commission_bps=5.0)
+    assert set(again["stage_cache"]["hits"]) == {"signal_frame", "intent", "fills", "execute"}
+
+
+def test_stage_key_depends_on_inputs():
+    assert stage_key("fills", intent="a", fill_engine="numpy") == stage_key("fills", fill_engine="numpy", intent="a")
+    assert stage_key("fills", intent="a") != stage_key("fills", intent="b")
+    assert stage_key("fills", intent="a") != stage_key("execute", intent="a")
+    with pytest.raises(ValueError, match="unknown stage"):
+        stage_key("metrics")
+
+
+def test_lru_eviction_keeps_recently_used_entries(tmp_path):
+    cache = StageCache(tmp_path, max_bytes=3 * 1100)
+    payload = b"x" * 1000
+    keys = [stage_key("fills", n=n) for n in range(3)]
+    for age, key in enumerate(keys):
+        cache.put("fills", key, payload)
+        path = cache._path("fills", key)
+        os.utime(path, ns=(age * 10**9, age * 10**9))
+
+    assert cache.get("fills", keys[0]) == payload  # refreshes keys[0]
+    cache.put("fills", stage_key("fills", n=3), payload)
+
+    assert cache.get("fills", keys[1]) is None
+    assert cache.get("fills", keys[0]) == payload
+    assert cache.size_bytes() <= cache.max_bytes
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = StageCache(tmp_path)
+    key = stage_key("intent", n=1)
+    cache.put("intent", key, {"ok": True})
+    cache._path("intent", key).write_bytes(b"not a pickle")
+
+    value, hit = cache.memoize("intent", key, lambda: {"ok": "recomputed"})
+    assert (value, hit) == ({"ok": "recomputed"}, False)
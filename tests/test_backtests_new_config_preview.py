@@ -1,8 +1,13 @@
 from trading_dashboard.layouts.backtests import create_backtests_layout
+from trading_dashboard.repositories import backtests as backtests_repo
+from trading_dashboard.services import run_index
 from trading_dashboard.ui_ids import RUN
 
 
-def test_new_backtest_config_preview_shows_base_yaml_parameters():
+def test_new_backtest_config_preview_shows_base_yaml_parameters(tmp_path, monkeypatch):
+    # Keep run discovery off the repo's artifacts/ tree
+    monkeypatch.setattr(backtests_repo, "BACKTESTS_DIR", tmp_path)
+    monkeypatch.setattr(run_index, "_INDEXES", {})
     layout = create_backtests_layout()
     text = str(layout)
 
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from axiom_bt.pipeline import data_fetcher, data_prep
+from axiom_bt.pipeline.data_fetcher import ensure_and_snapshot_bars
+from axiom_bt.pipeline.data_prep import load_bars_snapshot
+
+
+@pytest.fixture
+def derived(monkeypatch, tmp_path: Path) -> Path:
+    from core.settings.runtime_config import reset_runtime_config_for_tests
+
+    cfg = tmp_path / "trading.yaml"
+    cfg.write_text(
+        f"""
+paths:
+  marketdata_data_root: {tmp_path}
+  trading_artifacts_root: {tmp_path / "artifacts"}
+""".strip()
+    )
+    reset_runtime_config_for_tests()
+    monkeypatch.setenv("TRADING_CONFIG", str(cfg))
+    path = tmp_path / "derived" / "tf_m5" / "HOOD.parquet"
+    path.parent.mkdir(parents=True)
+    ts = pd.date_range("2025-11-01", "2026-01-31", freq="5min", tz="UTC")
+    pd.DataFrame(
+        {"ts": ts.asi8 // 10**9, "open": 1.0, "high": 1.1, "low": 0.9, "close": 1.0, "volume": 10}
+    ).to_parquet(path, row_group_size=5000)
+    yield path
+    reset_runtime_config_for_tests()
+
+
+def _snapshot(run_dir: Path) -> dict:
+    return ensure_and_snapshot_bars(
+        run_dir=run_dir,
+        symbol="HOOD",
+        timeframe="M5",
+        requested_end="2026-01-14",
+        lookback_days=3,
+        market_tz="America/New_York",
+    )
+
+
+def test_runs_share_one_stored_slice_via_hardlinks(derived, tmp_path, monkeypatch):
+    first = _snapshot(tmp_path / "run1")
+
+    hashed = []
+    original = data_prep._sha256_file
+    monkeypatch.setattr(data_prep, "_sha256_file", lambda path: hashed.append(path) or original(path))
+    monkeypatch.setattr(data_fetcher, "_sha256_file", lambda path: hashed.append(path) or original(path))
+    second = _snapshot(tmp_path / "run2")
+
+    assert second["bars_hash"] == first["bars_hash"]
+    exec1, exec2 = Path(first["exec_path"]), Path(second["exec_path"])
+    signal2 = Path(second["signal_path"])
+    assert exec1.stat().st_ino == exec2.stat().st_ino == signal2.stat().st_ino
+    stored = list((tmp_path / "artifacts" / "bars_snapshots" / "HOOD" / "M5").glob("*.parquet"))
+    assert len(stored) == 1 and stored[0].stat().st_ino == exec1.stat().st_ino
+
+    bars, bars_hash = load_bars_snapshot(exec2)
+    assert bars_hash == first["bars_hash"]
+    assert hashed == []
+    assert bars["timestamp"].min() == pd.Timestamp("2026-01-11", tz="UTC")
+    assert bars["timestamp"].max() == pd.Timestamp("2026-01-14", tz="UTC")
+
+
+def test_source_change_creates_new_entry_and_reads_only_window_row_groups(derived, tmp_path, monkeypatch):
+    first = _snapshot(tmp_path / "run1")
+    frame = pd.read_parquet(derived)
+    frame.loc[frame["ts"] == pd.Timestamp("2026-01-13 15:00", tz="UTC").value // 10**9, "close"] = 2.0
+    frame.to_parquet(derived, row_group_size=5000)
+
+    read = []
+    original = pq.read_table
+    monkeypatch.setattr(data_fetcher.pq, "read_table", lambda path, **kw: read.append(kw) or original(path, **kw))
+    second = _snapshot(tmp_path / "run2")
+
+    assert second["bars_hash"] != first["bars_hash"]
+    assert read and read[0]["filters"][0][0] == "ts"
+    assert Path(first["exec_path"]).stat().st_ino != Path(second["exec_path"]).stat().st_ino
+
+
+def test_superseded_source_entries_are_pruned(derived, tmp_path):
+    store = tmp_path / "artifacts" / "bars_snapshots" / "HOOD" / "M5"
+    first = _snapshot(tmp_path / "run1")
+    ensure_and_snapshot_bars(
+        run_dir=tmp_path / "run_other_window",
+        symbol="HOOD",
+        timeframe="M5",
+        requested_end="2026-01-20",
+        lookback_days=3,
+        market_tz="America/New_York",
+    )
+    assert len(list(store.glob("*.parquet"))) == 2
+
+    frame = pd.read_parquet(derived)
+    frame["close"] = 2.0
+    frame.to_parquet(derived, row_group_size=5000)
+    second = _snapshot(tmp_path / "run2")
+
+    # Both entries cut from the old file are gone; the new one and its sidecars remain
+    stored = list(store.glob("*.parquet"))
+    assert len(stored) == 1 and stored[0].stat().st_ino == Path(second["exec_path"]).stat().st_ino
+    assert sorted(p.name for p in store.iterdir()) == sorted(
+        [stored[0].name, f"{stored[0].name}.sha256.json", f"{stored[0].stem}.source.json"]
+    )
+    # The earlier run keeps its hardlinked bars
+    bars, bars_hash = load_bars_snapshot(Path(first["exec_path"]))
+    assert bars_hash == first["bars_hash"]
+    assert (bars["close"] == 1.0).all()
+
+
+def test_hash_sidecar_is_ignored_after_file_changes(tmp_path):
+    path = tmp_path / "bars.parquet"
+    pd.DataFrame({"x": [1]}).to_parquet(path)
+    data_prep.write_hash_sidecar(path, "stale")
+    assert data_prep.file_sha256(path) == "stale"
+
+    pd.DataFrame({"x": [1, 2]}).to_parquet(path)
+    assert data_prep.file_sha256(path) == data_prep._sha256_file(path)
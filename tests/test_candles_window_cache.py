@@ -0,0 +1,101 @@
+"""Tests for row-group-pruned, LRU-cached candle loading."""
+
+import os
+from datetime import date
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from trading_dashboard.repositories import candles
+from trading_dashboard.repositories.candles import CANDLE_COLUMNS, CandleCache, _read_candle_window
+
+
+def _write_candles(path, days=5, tz="America/New_York", row_group_size=78):
+    index = pd.DatetimeIndex(
+        [ts for day in pd.date_range("2025-03-03", periods=days, freq="D")
+         for ts in pd.date_range(day + pd.Timedelta(hours=9, minutes=30), periods=78, freq="5min")],
+        tz=tz,
+        name="timestamp",
+    )
+    df = pd.DataFrame(
+        {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": range(len(index)), "Volume": 100},
+        index=index,
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, row_group_size=row_group_size)
+    return df
+
+
+def _full_read_filtered(path, day):
+    """Reference: the previous full-file read followed by a pandas day filter."""
+    df = pd.read_parquet(path).reset_index()
+    df.columns = [col.lower() for col in df.columns]
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    df = df[df["timestamp"].dt.date == day]
+    return df[CANDLE_COLUMNS].reset_index(drop=True)
+
+
+@pytest.mark.parametrize("tz", ["America/New_York", None])
+def test_window_read_matches_full_read(tmp_path, tz):
+    path = tmp_path / "AAPL.parquet"
+    _write_candles(path, tz=tz)
+
+    for day in [date(2025, 3, 3), date(2025, 3, 5), date(2025, 3, 7), date(2025, 3, 9)]:
+        pd.testing.assert_frame_equal(_read_candle_window(path, day), _full_read_filtered(path, day))
+    assert len(_read_candle_window(path, None)) == 5 * 78
+
+
+def test_window_filter_is_pushed_down_to_pyarrow(tmp_path, monkeypatch):
+    path = tmp_path / "AAPL.parquet"
+    _write_candles(path)
+    calls = []
+    original = pq.read_table
+    monkeypatch.setattr(pq, "read_table", lambda *a, **kw: calls.append(kw.get("filters")) or original(*a, **kw))
+
+    assert len(_read_candle_window(path, date(2025, 3, 4))) == 78
+    assert len(calls) == 1 and calls[0] is not None
+
+
+def test_cache_hits_skip_disk_and_mtime_change_invalidates(tmp_path, monkeypatch):
+    path = tmp_path / "artifacts" / "data_m5" / "AAPL.parquet"
+    _write_candles(path)
+    monkeypatch.setattr("trading_dashboard.config.TRADERUNNER_DIR", tmp_path)
+    cache = CandleCache(stat_ttl_s=0.0)
+    monkeypatch.setattr(candles, "_CANDLE_CACHE", cache)
+    reads = []
+    original = candles._read_candle_window
+    monkeypatch.setattr(candles, "_read_candle_window", lambda p, d: reads.append(d) or original(p, d))
+
+    first = candles.get_candle_data("AAPL", timeframe="M5", reference_date=date(2025, 3, 4))
+    # Callers convert timezones in place; the cached frame must not change
+    first["timestamp"] = first["timestamp"].dt.tz_convert("UTC")
+    again = candles.get_candle_data("AAPL", timeframe="M5", reference_date=date(2025, 3, 4))
+    h1 = candles.get_candle_data("AAPL", timeframe="H1", reference_date=date(2025, 3, 4))
+
+    assert reads == [date(2025, 3, 4)]
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert str(again["timestamp"].dt.tz) == "America/New_York"
+    pd.testing.assert_frame_equal(again, h1)
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    candles.get_candle_data("AAPL", timeframe="M5", reference_date=date(2025, 3, 4))
+    assert len(reads) == 2
+    assert len(cache) == 1  # stale generation dropped
+
+
+def test_cache_evicts_least_recently_used_over_budget(tmp_path):
+    path = tmp_path / "AAPL.parquet"
+    _write_candles(path)
+    mtime = path.stat().st_mtime_ns
+    one_day = CandleCache().get(path, mtime, date(2025, 3, 3))
+    budget = int(one_day.memory_usage(index=True, deep=True).sum()) * 2
+
+    cache = CandleCache(max_bytes=budget)
+    for day in (3, 4, 3, 5):
+        cache.get(path, mtime, date(2025, 3, day))
+
+    assert len(cache) == 2
+    assert cache.size_bytes <= budget
+    assert {key[2] for key in cache._entries} == {date(2025, 3, 3), date(2025, 3, 5)}
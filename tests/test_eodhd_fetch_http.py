@@ -0,0 +1,146 @@
+"""EODHD fetch engine against a local HTTP stub (no external network)."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+import requests
+
+from axiom_bt.data import eodhd_fetch
+from axiom_bt.data.eodhd_fetch import TokenBucket, configure_http, fetch_intraday_1m_to_parquet
+
+
+class _StubEODHD(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        with server.lock:
+            server.calls.append((url.path, query, self.client_address[1]))
+            status = server.fail_statuses.pop(0) if server.fail_statuses else 200
+        if status == 200:
+            start = int(query["from"])
+            end = min(int(query["to"]), start + 3 * 86400)
+            rows = [
+                {"timestamp": ts, "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10}
+                for ts in range(start, end, 3600)
+            ]
+            body = json.dumps(rows).encode()
+        else:
+            body = b'{"error": "stub"}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubEODHD)
+    server.lock = threading.Lock()
+    server.calls = []
+    server.fail_statuses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("EODHD_API_TOKEN", "stub-token")
+    monkeypatch.delenv("EODHD_OFFLINE", raising=False)
+    configure_http(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        retry_initial_delay_s=0.0,
+        requests_per_minute=60_000,
+    )
+    yield server
+    configure_http()
+    server.shutdown()
+    server.server_close()
+
+
+def _fetch(tmp_path, start="2024-01-01", end="2024-10-27", **kwargs):
+    return fetch_intraday_1m_to_parquet(
+        symbol="TEST",
+        exchange="US",
+        start_date=start,
+        end_date=end,
+        out_dir=tmp_path,
+        tz="America/New_York",
+        filter_rth=False,
+        allow_legacy_http_backfill=True,
+        **kwargs,
+    )
+
+
+def test_chunks_are_fetched_and_written_in_order(stub, tmp_path):
+    path = _fetch(tmp_path)
+
+    assert len(stub.calls) == 3
+    assert {call[0] for call in stub.calls} == {"/intraday/TEST.US"}
+    df = pd.read_parquet(path)
+    assert df.index.is_monotonic_increasing and df.index.is_unique
+    assert len(df) == 3 * 72
+    assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "TEST_raw.parquet"), df)
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_requests_reuse_one_keep_alive_connection(stub, tmp_path):
+    configure_http(base_url=eodhd_fetch.http_settings().base_url, max_workers=1, retry_initial_delay_s=0.0)
+
+    _fetch(tmp_path)
+
+    assert len(stub.calls) == 3
+    assert len({call[2] for call in stub.calls}) == 1
+
+
+def test_transient_status_is_retried(stub, tmp_path):
+    stub.fail_statuses = [503, 429]
+
+    path = _fetch(tmp_path, start="2024-01-01", end="2024-01-31")
+
+    assert len(stub.calls) == 3
+    assert len(pd.read_parquet(path)) == 72
+
+
+def test_client_error_is_not_retried_and_leaves_no_file(stub, tmp_path):
+    stub.fail_statuses = [404]
+
+    with pytest.raises(requests.HTTPError):
+        _fetch(tmp_path, start="2024-01-01", end="2024-01-31")
+
+    assert len(stub.calls) == 1
+    assert not (tmp_path / "TEST.parquet").exists()
+    assert not list(tmp_path.glob(".*.tmp"))
+
+
+def test_circuit_opens_after_repeated_exhausted_retries(stub, tmp_path):
+    configure_http(
+        base_url=eodhd_fetch.http_settings().base_url,
+        max_retries=0,
+        circuit_failure_threshold=2,
+    )
+    stub.fail_statuses = [500, 500]
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            _fetch(tmp_path, start="2024-01-01", end="2024-01-31")
+
+    with pytest.raises(RuntimeError, match="Circuit breaker 'eodhd' is OPEN"):
+        _fetch(tmp_path, start="2024-01-01", end="2024-01-31")
+    assert len(stub.calls) == 2
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = TokenBucket(rate=50.0, capacity=2)
+    started = time.monotonic()
+    waits = [bucket.acquire() for _ in range(7)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert time.monotonic() - started >= 5 / 50.0 * 0.9
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.inside_bar.config import InsideBarConfig
+from strategies.inside_bar.incremental import InsideBarIndicatorState
+from strategies.inside_bar.indicators import calculate_atr
+from strategies.inside_bar.pattern_detection import detect_inside_bars
+
+
+def _bars(n: int = 600, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.4, n).cumsum()
+    open_ = close + rng.normal(0, 0.2, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 0.5, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 0.5, n)
+    # Flat stretch exercises the rolling-mean "same value" branch.
+    high[200:240] = low[200:240] = open_[200:240] = close[200:240] = 101.25
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-02 14:30", periods=n, freq="5min", tz="UTC"),
+            "open": np.round(open_, 2),
+            "high": np.round(high, 2),
+            "low": np.round(low, 2),
+            "close": np.round(close, 2),
+            "volume": rng.integers(100, 1000, n),
+        }
+    )
+
+
+def _batch(df: pd.DataFrame, config: InsideBarConfig) -> pd.DataFrame:
+    return detect_inside_bars(calculate_atr(df, atr_period=config.atr_period), config)
+
+
+@pytest.mark.parametrize(
+    "mode", ["mb_range_hl__ib_hl", "mb_body_oc__ib_hl", "mb_body_oc__ib_body", "mb_high__ib_high_and_close_in_mb_range"]
+)
+@pytest.mark.parametrize("inside_bar_mode", ["inclusive", "strict"])
+@pytest.mark.parametrize("atr_period", [1, 14])
+def test_streaming_matches_batch_bit_for_bit(mode, inside_bar_mode, atr_period):
+    config = InsideBarConfig(
+        inside_bar_definition_mode=mode,
+        inside_bar_mode=inside_bar_mode,
+        atr_period=atr_period,
+        min_mother_bar_size=0.3,
+    )
+    df = _bars()
+
+    expected = _batch(df, config)
+    streamed = InsideBarIndicatorState(config).update_many(df)
+
+    pd.testing.assert_frame_equal(streamed, expected, check_exact=True)
+
+
+def test_seeded_state_continues_like_batch():
+    config = InsideBarConfig(inside_bar_definition_mode="mb_range_hl__ib_hl")
+    df = _bars(seed=9)
+    expected = _batch(df, config)
+
+    state = InsideBarIndicatorState.from_history(df.iloc[:500], config)
+    for pos in range(500, len(df)):
+        row = state.update(df.iloc[pos].to_dict())
+        for column in ("atr", "true_range", "mother_body_fraction", "mother_bar_high", "mother_bar_low"):
+            np.testing.assert_array_equal(row[column], expected[column].iloc[pos])
+        assert row["is_inside_bar"] == bool(expected["is_inside_bar"].iloc[pos])
+    assert state.bars_seen == len(df)
+
+
+def test_core_indicator_state_is_seeded_from_history():
+    from strategies.inside_bar.core import InsideBarCore
+
+    config = InsideBarConfig(inside_bar_definition_mode="mb_range_hl__ib_hl")
+    df = _bars(n=50)
+    state = InsideBarCore(config).indicator_state(df)
+    assert state.bars_seen == 50
+    assert InsideBarCore(config).indicator_state().bars_seen == 0
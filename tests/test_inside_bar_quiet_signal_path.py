@@ -0,0 +1,28 @@
+from strategies.inside_bar.config import InsideBarConfig
+from strategies.inside_bar.core import InsideBarCore
+
+def _config() -> InsideBarConfig:
+    return InsideBarConfig(
+        inside_bar_definition_mode="mb_range_hl__ib_hl",
+        session_timezone="America/New_York",
+        session_windows=["09:30-11:00", "11:00-16:00"],
+        min_mother_bar_size=0.0,
+    )
+
+
+def test_process_data_writes_nothing_to_stdout(capsys, tsla_m5_bars):
+    signals = InsideBarCore(_config()).process_data(tsla_m5_bars, symbol="TSLA")
+
+    assert signals
+    assert capsys.readouterr().out == ""
+
+
+def test_tracer_does_not_change_signals(tsla_m5_bars):
+    bars = tsla_m5_bars
+    events = []
+    quiet = InsideBarCore(_config()).process_data(bars, symbol="TSLA")
+    traced = InsideBarCore(_config()).process_data(bars, symbol="TSLA", tracer=events.append)
+
+    assert [repr(s) for s in traced] == [repr(s) for s in quiet]
+    kinds = {e["event"] for e in events}
+    assert {"session_filter_config", "ib_armed", "final_filter_result"} <= kinds
@@ -0,0 +1,67 @@
+import pandas as pd
+
+from strategies.inside_bar import core_config_from_params, extend_insidebar_signal_frame_from_core
+from strategies.inside_bar.core import InsideBarCore
+
+PARAMS = {
+    "symbol": "TSLA",
+    "timeframe": "M5",
+    "timeframe_minutes": 5,
+    "inside_bar_definition_mode": "mb_range_hl__ib_hl",
+    "session_timezone": "America/New_York",
+    "session_filter": ["09:30-11:00", "11:00-16:00"],
+    "min_mother_bar_size": 0.0,
+    "stop_distance_cap_ticks": 50,
+}
+
+
+def test_indicators_are_computed_once(monkeypatch, tsla_m5_bars):
+    calls = []
+    original = InsideBarCore.calculate_atr
+    monkeypatch.setattr(InsideBarCore, "calculate_atr", lambda self, df: calls.append(len(df)) or original(self, df))
+
+    extend_insidebar_signal_frame_from_core(tsla_m5_bars, PARAMS)
+
+    assert calls == [len(tsla_m5_bars)]
+
+
+def test_enriched_path_matches_process_data(tsla_m5_bars):
+    core = InsideBarCore(core_config_from_params(PARAMS))
+    bars = tsla_m5_bars
+    expected = core.process_data(bars, "TSLA")
+
+    assert expected
+    assert [repr(s) for s in core.process_enriched(core.enrich(bars), "TSLA")] == [repr(s) for s in expected]
+
+
+def test_signal_legs_are_appended_with_leg_values_and_ib_marks(tsla_m5_bars):
+    bars = tsla_m5_bars
+    frame = extend_insidebar_signal_frame_from_core(bars, PARAMS)
+
+    legs = frame.iloc[len(bars):]
+    assert len(legs) > 0
+    assert legs["template_id"].str.endswith(("_BUY", "_SELL")).all()
+    assert (legs["breakout_long"] == (legs["signal_side"] == "BUY")).all()
+    assert (legs["breakout_level"] == legs["entry_price"]).all()
+    assert (legs["trigger_ts"] == legs["timestamp"]).all()
+
+    marked = frame.iloc[: len(bars)]
+    marked = marked[marked["inside_bar"]]
+    assert set(legs["inside_ts"]) == set(marked["inside_ts"])
+    assert marked["mother_ts"].notna().all()
+
+
+def test_enrich_cache_shares_true_range_across_configs(monkeypatch, tsla_m5_bars):
+    import strategies.inside_bar.core as core_module
+    calls = []
+    original = core_module._calculate_true_range
+    monkeypatch.setattr(core_module, "_calculate_true_range", lambda df: calls.append(len(df)) or original(df))
+
+    bars = tsla_m5_bars
+    cache: dict = {}
+    for atr_period, rr in ((10, 1.0), (10, 2.0), (14, 1.0)):
+        core = InsideBarCore(core_config_from_params({**PARAMS, "atr_period": atr_period, "risk_reward_ratio": rr}))
+        pd.testing.assert_frame_equal(core.enrich(bars, cache=cache), core.enrich(bars))
+
+    assert calls == [len(bars)]
+    assert len([key for key in cache if key != "true_range"]) == 2
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import axiom_bt.intraday as intraday
+from axiom_bt.data.m1_partitions import M1PartitionStore, canonical_m1_frame
+
+
+def _bars(start: str, end: str) -> pd.DataFrame:
+    index = pd.date_range(start, end, freq="1h", tz="UTC", name="timestamp")
+    rng = np.random.default_rng(len(index))
+    close = 100 + rng.normal(0, 0.5, len(index)).cumsum()
+    return pd.DataFrame(
+        {"Open": close, "High": close + 1, "Low": close - 1, "Close": close, "Volume": rng.integers(1, 500, len(index))},
+        index=index,
+    )
+
+
+def test_append_rewrites_only_touched_months(tmp_path):
+    store = M1PartitionStore(tmp_path / "AAPL_rth")
+    assert store.append(_bars("2024-10-01", "2024-12-31 23:00")) == ["2024-10", "2024-11", "2024-12"]
+    october_mtime = (store.root / "2024-10.parquet").stat().st_mtime_ns
+
+    update = _bars("2024-12-31", "2025-01-02 23:00")
+    update["Close"] = -1.0
+    assert store.append(update) == ["2024-12", "2025-01"]
+
+    assert (store.root / "2024-10.parquet").stat().st_mtime_ns == october_mtime
+    coverage = store.coverage()
+    assert coverage.partitions == ("2024-10", "2024-11", "2024-12", "2025-01")
+    assert coverage.first_ts == pd.Timestamp("2024-10-01", tz="UTC")
+    assert coverage.last_ts == pd.Timestamp("2025-01-02 23:00", tz="UTC")
+
+    full = store.load()
+    assert full.index.is_unique and full.index.is_monotonic_increasing
+    assert coverage.rows == len(full) == len(pd.date_range("2024-10-01", "2025-01-02 23:00", freq="1h"))
+    assert (full.loc["2024-12-31":, "Close"] == -1.0).all()
+    assert len(pd.read_parquet(store.root)) == len(full)
+
+
+def test_load_window_opens_only_overlapping_partitions(tmp_path, monkeypatch):
+    store = M1PartitionStore(tmp_path / "AAPL_rth")
+    source = _bars("2024-10-01", "2024-12-31 23:00")
+    store.append(source)
+
+    opened = []
+    original = M1PartitionStore._read_partition
+    monkeypatch.setattr(
+        M1PartitionStore, "_read_partition", lambda self, name: opened.append(name) or original(self, name)
+    )
+
+    window = store.load("2024-11-10 05:00", pd.Timestamp("2024-11-20 12:00", tz="UTC"))
+    assert opened == ["2024-11.parquet"]
+    expected = canonical_m1_frame(source.loc["2024-11-10 05:00":"2024-11-20 12:00"]).set_index("timestamp")
+    pd.testing.assert_frame_equal(window, expected)
+    assert store.load("2023-01-01", "2023-02-01").empty
+
+
+def test_coverage_and_load_go_through_partitions(tmp_path, monkeypatch):
+    monkeypatch.setattr(intraday, "DATA_M1", tmp_path)
+    store = intraday.IntradayStore(default_tz="America/New_York")
+    store.partitions_for("aapl").append(_bars("2024-11-01", "2024-11-30 23:00"))
+    assert store.path_for("AAPL", timeframe=intraday.Timeframe.M1) == tmp_path / "AAPL_rth"
+
+    def _no_full_reads(*args, **kwargs):
+        raise AssertionError("coverage must not read parquet data")
+
+    monkeypatch.setattr(intraday.pd, "read_parquet", _no_full_reads)
+    result = intraday.check_local_m1_coverage("AAPL", "2024-10-01", "2024-12-31")
+    assert result["earliest_data"] == "2024-11-01"
+    assert result["latest_data"] == "2024-11-30"
+    assert [gap["reason"] for gap in result["gaps"]] == ["before_existing_data", "after_existing_data"]
+
+
+@pytest.mark.parametrize("end", ["2024-11-05", pd.Timestamp("2024-11-05 23:59")])
+def test_intraday_store_load_window(tmp_path, monkeypatch, end):
+    monkeypatch.setattr(intraday, "DATA_M1", tmp_path)
+    store = intraday.IntradayStore(default_tz="America/New_York")
+    store.partitions_for("AAPL", session_mode="all").append(_bars("2024-10-01", "2024-12-31 23:00"))
+
+    df = store.load("AAPL", timeframe=intraday.Timeframe.M1, session_mode="all", start="2024-11-04", end=end)
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert str(df.index.tz) == "America/New_York"
+    assert df.index[0] == pd.Timestamp("2024-11-04 00:00", tz="America/New_York")
+    assert df.index[-1] == pd.Timestamp("2024-11-05 23:00", tz="America/New_York")
+
+
+def test_replace_drops_uncovered_months_and_advances_seq(tmp_path):
+    store = M1PartitionStore(tmp_path / "AAPL_rth")
+    store.append(_bars("2024-10-01", "2024-12-31 23:00"))
+    seq = store.read_index()["seq"]
+
+    assert store.replace(_bars("2024-11-15", "2024-12-10 23:00")) == ["2024-11", "2024-12"]
+
+    assert store.read_index()["seq"] == seq + 1
+    assert not (store.root / "2024-10.parquet").exists()
+    assert store.coverage().first_ts == pd.Timestamp("2024-11-15", tz="UTC")
+    assert store.changed_since(seq) == pd.Timestamp("2024-11-15", tz="UTC")
+    assert len(pd.read_parquet(store.root)) == store.coverage().rows
+
+
+@pytest.fixture
+def m1_store(tmp_path, monkeypatch):
+    """IntradayStore on tmp dirs with a legacy AAPL_rth.parquet, a fake fetch and a recording resample."""
+    for name in ("DATA_M1", "DATA_M5", "DATA_M15"):
+        (tmp_path / name.lower()).mkdir()
+        monkeypatch.setattr(intraday, name, tmp_path / name.lower())
+    legacy = tmp_path / "data_m1" / "AAPL_rth.parquet"
+    _bars("2024-10-01", "2024-10-31 23:00").to_parquet(legacy)
+
+    fetched = {}
+
+    def _fake_fetch(symbol, exchange, start_date, end_date, out_dir, **kwargs):
+        path = out_dir / f"{symbol}.parquet"
+        frame = _bars(start_date, f"{end_date} 23:00")
+        frame["Close"] = -1.0
+        frame.to_parquet(path)
+        fetched[(start_date, end_date)] = len(frame)
+        return path
+
+    resampled = []
+    monkeypatch.setattr(intraday, "fetch_intraday_1m_to_parquet", _fake_fetch)
+    monkeypatch.setattr(intraday, "resample_m1", lambda path, *a, **k: resampled.append(path))
+    store = intraday.IntradayStore(default_tz="America/New_York")
+    return store, legacy, fetched, resampled
+
+
+def test_force_fetch_lands_in_partitions_and_retires_legacy_file(m1_store):
+    store, legacy, fetched, resampled = m1_store
+    spec = intraday.IntradaySpec(symbols=["AAPL"], start="2024-11-01", end="2024-11-30", timeframe=intraday.Timeframe.M5)
+
+    actions = store.ensure(spec, force=True, max_workers=1)
+
+    partitions = store.partitions_for("AAPL")
+    assert actions["AAPL"][0] == "fetch_m1"
+    assert not legacy.exists()
+    assert store.path_for("AAPL", timeframe=intraday.Timeframe.M1) == partitions.root
+    assert resampled == [partitions.root]
+    assert partitions.coverage().partitions == ("2024-11",)
+    assert (partitions.load()["Close"] == -1.0).all()
+
+
+def test_gap_fill_migrates_legacy_file_once(m1_store, monkeypatch):
+    store, legacy, fetched, resampled = m1_store
+    monkeypatch.setattr(
+        intraday,
+        "check_local_m1_coverage",
+        lambda **kwargs: {
+            "has_gap": True,
+            "available_days": 31,
+            "requested_days": 61,
+            "gaps": [{"gap_start": "2024-11-01", "gap_end": "2024-11-30", "gap_days": 30, "reason": "after_existing_data"}],
+        },
+    )
+    spec = intraday.IntradaySpec(symbols=["AAPL"], start="2024-10-01", end="2024-11-30", timeframe=intraday.Timeframe.M5)
+
+    store.ensure(spec, max_workers=1)
+
+    partitions = store.partitions_for("AAPL")
+    assert not legacy.exists()
+    assert partitions.coverage().partitions == ("2024-10", "2024-11")
+    assert resampled == [partitions.root]
+
+
+def test_replay_resolves_partitions_before_legacy_file(tmp_path):
+    from axiom_bt.engines.ohlcv_cache import OhlcvCache
+    from axiom_bt.engines.replay_engine import _resolve_symbol_path
+
+    m1_dir = tmp_path / "data_m1"
+    m1_dir.mkdir()
+    _bars("2024-10-01", "2024-10-31 23:00").to_parquet(m1_dir / "AAPL_rth.parquet")
+    store = M1PartitionStore(m1_dir / "AAPL_rth")
+    store.append(_bars("2024-10-01", "2024-11-30 23:00"))
+
+    path, is_m1 = _resolve_symbol_path("AAPL", m1_dir, tmp_path)
+    assert (path, is_m1) == (store.root, True)
+
+    cache = OhlcvCache()
+    arrays = cache.get(path, "America/New_York")
+    assert arrays.n_valid == store.coverage().rows
+    assert cache.get(path, "America/New_York") is arrays
+
+    store.append(_bars("2024-12-01", "2024-12-02 23:00"))
+    assert cache.get(path, "America/New_York").n_valid == store.coverage().rows
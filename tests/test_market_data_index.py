@@ -0,0 +1,146 @@
+"""Tests for the footer-statistics market data index."""
+
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from trading_dashboard.services import market_data_index
+from trading_dashboard.services.market_data_index import MarketDataIndex
+from trading_dashboard.utils import parquet_meta_reader
+
+
+def _write_bars(root, timeframe_dir, symbol, start="2025-03-03 09:30", periods=78, freq="5min"):
+    index = pd.date_range(start, periods=periods, freq=freq, tz="America/New_York", name="timestamp")
+    path = root / timeframe_dir / f"{symbol}.parquet"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame({"Open": 1.0, "Close": 2.0}, index=index).to_parquet(path)
+    return path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    _write_bars(tmp_path, "data_m5", "AAPL")
+    _write_bars(tmp_path, "data_m5", "MSFT")
+    _write_bars(tmp_path, "data_m1", "AAPL", periods=390, freq="1min")
+    (tmp_path / "data_m1" / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+def _count_footer_reads(monkeypatch):
+    calls = []
+    original = parquet_meta_reader.read_parquet_metadata_fast
+    monkeypatch.setattr(
+        market_data_index, "read_parquet_metadata_fast", lambda path: calls.append(path.name) or original(path)
+    )
+    return calls
+
+
+def test_footer_metadata_without_loading_bars(data_root, monkeypatch):
+    monkeypatch.setattr(pd, "read_parquet", lambda *a, **k: pytest.fail("bar data was loaded"))
+    index = MarketDataIndex(data_root)
+
+    meta = index.get("AAPL", "M5")
+    assert meta.rows == 78
+    assert meta.used_stats
+    assert meta.last_ts == pd.Timestamp("2025-03-03 15:55", tz="America/New_York")
+    assert str(meta.last_ts.tz) == "America/New_York"
+    assert index.get("aapl", "m1").rows == 390
+    assert index.get("TSLA", "M5") is None
+
+    assert index.symbols_by_timeframe() == {"M1": ["AAPL"], "M5": ["AAPL", "MSFT"]}
+    assert index.symbols() == ["AAPL", "MSFT"]
+
+
+def test_refresh_rereads_only_changed_files(data_root, monkeypatch):
+    calls = _count_footer_reads(monkeypatch)
+    index = MarketDataIndex(data_root)
+
+    assert index.refresh() == {"scanned": 3, "updated": 3, "removed": 0}
+    assert index.refresh() == {"scanned": 3, "updated": 0, "removed": 0}
+
+    _write_bars(data_root, "data_m5", "MSFT", start="2025-03-04 09:30")
+    _bump_mtime(data_root / "data_m5" / "MSFT.parquet")
+    (data_root / "data_m1" / "AAPL.parquet").unlink()
+
+    assert index.refresh() == {"scanned": 2, "updated": 1, "removed": 1}
+    assert calls[-1] == "MSFT.parquet" and len(calls) == 4
+    assert index.get("MSFT", "M5").first_ts.day == 4
+    assert index.get("AAPL", "M1") is None
+
+
+def test_validate_picks_up_a_write_without_full_refresh(data_root, monkeypatch):
+    index = MarketDataIndex(data_root)
+    index.refresh()
+    calls = _count_footer_reads(monkeypatch)
+
+    assert index.get("AAPL", "M5", validate=True).rows == 78
+    assert calls == []
+
+    path = _write_bars(data_root, "data_m5", "AAPL", periods=100)
+    _bump_mtime(path)
+    assert index.get("AAPL", "M5").rows == 78  # snapshot until refreshed/validated
+    assert index.get("AAPL", "M5", validate=True).rows == 100
+    assert calls == ["AAPL.parquet"]
+
+    path.unlink()
+    assert index.get("AAPL", "M5", validate=True) is None
+    assert index.symbols("M5") == ["MSFT"]
+
+
+def test_background_refresh(data_root):
+    index = MarketDataIndex(data_root, refresh_interval_s=0.01)
+    index.start()
+    try:
+        _write_bars(data_root, "data_m15", "NVDA", freq="15min", periods=26)
+        for _ in range(200):
+            if index.get("NVDA", "M15") is not None:
+                break
+            time.sleep(0.01)
+        assert index.get("NVDA", "M15").rows == 26
+    finally:
+        index.stop()
+
+
+def test_symbol_cache_for_custom_dir_starts_no_thread(data_root):
+    from trading_dashboard.utils import symbol_cache
+
+    before = {t.name for t in threading.enumerate()}
+    assert symbol_cache.get_symbols_for_timeframe("M5", str(data_root)) == ["AAPL", "MSFT"]
+    assert "market-data-index" not in {t.name for t in threading.enumerate()} - before
+    assert str(data_root.resolve()) not in {str(k) for k in market_data_index._INDEXES}
+
+
+def test_cached_availability_invalidated_by_rewrite(data_root, monkeypatch):
+    from trading_dashboard.catalog import data_catalog
+    from trading_dashboard.services import data_availability_service
+    from trading_dashboard.utils import availability_cache
+
+    index = MarketDataIndex(data_root)
+    index.refresh()
+    monkeypatch.setattr(data_catalog, "get_market_data_index", lambda root: index)
+    fetches = []
+    monkeypatch.setattr(
+        data_catalog.BacktestingDataCatalog, "__init__", lambda self, universe_path=None: None
+    )
+    monkeypatch.setattr(
+        data_catalog.BacktestingDataCatalog, "get_symbol_info", lambda self, symbol: fetches.append(symbol) or {}
+    )
+    availability_cache.clear_all()
+    try:
+        assert not data_availability_service.get_availability("AAPL").cached
+        assert data_availability_service.get_availability("AAPL").cached
+
+        # No index refresh in between: the signature check must see the write
+        _bump_mtime(_write_bars(data_root, "data_m5", "AAPL", periods=100))
+        assert not data_availability_service.get_availability("AAPL").cached
+        assert fetches == ["AAPL", "AAPL"]
+    finally:
+        availability_cache.clear_all()
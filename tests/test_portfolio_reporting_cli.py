@@ -218,3 +218,32 @@ def test_cli_calculates_correct_totals(tmp_path):
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def test_cli_reads_parquet_trades(tmp_path):
+    """Runs written with artifact_format=parquet report the same as CSV runs."""
+    summaries = []
+    for artifact_format in ("csv", "parquet"):
+        run_dir = tmp_path / artifact_format
+        run_dir.mkdir()
+        trades = create_sample_trades_csv(tmp_path / "trades.csv")
+        if artifact_format == "parquet":
+            trades.to_parquet(run_dir / "trades.parquet", index=False)
+        else:
+            trades.to_csv(run_dir / "trades.csv", index=False)
+
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "axiom_bt.portfolio.reporting",
+                "--run-dir", str(run_dir),
+                "--initial-cash", "10000"
+            ],
+            capture_output=True,
+            text=True,
+            cwd=Path.cwd(),
+            env={"PYTHONPATH": str(Path.cwd() / "src")}
+        )
+        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        summaries.append(json.loads((run_dir / "portfolio_summary.json").read_text()))
+
+    assert summaries[0] == summaries[1]
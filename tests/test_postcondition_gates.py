@@ -0,0 +1,28 @@
+"""Tests for the equity postcondition gate (CSV and Parquet runs)."""
+
+import pandas as pd
+import pytest
+
+from backtest.services.postcondition_gates import check_equity_postcondition
+
+EQUITY = pd.DataFrame({"ts": ["2025-01-02T10:00:00Z", "2025-01-02T10:05:00Z"], "equity": [10000.0, 10050.0]})
+
+
+@pytest.mark.parametrize("artifact_format", ["csv", "parquet"])
+def test_equity_postcondition_passes_for_either_format(tmp_path, artifact_format):
+    path = tmp_path / f"equity_curve.{artifact_format}"
+    if artifact_format == "parquet":
+        EQUITY.to_parquet(path, index=False)
+    else:
+        EQUITY.to_csv(path, index=False)
+
+    result = check_equity_postcondition(tmp_path, "full_backtest")
+    assert result.status == "pass"
+    assert result.equity_file_exists
+    assert result.equity_rows == 2
+
+
+def test_equity_postcondition_fails_without_equity_curve(tmp_path):
+    result = check_equity_postcondition(tmp_path, "full_backtest")
+    assert result.status == "fail"
+    assert "equity_curve" in result.error_message
@@ -0,0 +1,143 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pre_paper.runtime import PrePaperRuntime, RuntimeConfig, signal_record
+from strategies.inside_bar import core_config_from_params
+from strategies.inside_bar.core import InsideBarCore
+
+PARAMS = {
+    "timeframe_minutes": 5,
+    "inside_bar_definition_mode": "mb_range_hl__ib_hl",
+    "session_timezone": "America/New_York",
+    "session_filter": ["09:30-11:00", "11:00-16:00"],
+    "min_mother_bar_size": 0.0,
+    "min_mother_body_fraction": 0.0,
+    "min_inside_body_fraction": 0.0,
+    "stop_distance_cap_ticks": 50,
+}
+
+
+def _bars(seed: int, days: str = "2025-03-03/2025-03-07") -> pd.DataFrame:
+    start, end = days.split("/")
+    index = pd.date_range(start, f"{end} 23:59", freq="5min", tz="America/New_York")
+    index = index[index.dayofweek < 5]
+    index = index[index.indexer_between_time("09:30", "15:55")]
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 0.3, len(index)).cumsum()
+    open_ = close + rng.normal(0, 0.15, len(index))
+    return pd.DataFrame(
+        {
+            "timestamp": index.tz_convert("UTC"),
+            "open": open_.round(2),
+            "high": (np.maximum(open_, close) + rng.uniform(0, 0.4, len(index))).round(2),
+            "low": (np.minimum(open_, close) - rng.uniform(0, 0.4, len(index))).round(2),
+            "close": close.round(2),
+        }
+    )
+
+
+class FakeReplayPort:
+    """Replays bars timestamp-major across symbols; records signal batches."""
+
+    def __init__(self, bars: dict, write_delay: float = 0.0, ticks: bool = False):
+        self.bars = bars
+        self.write_delay = write_delay
+        self.ticks = ticks
+        self.batches = []
+
+    async def open_feed(self, symbols, mode, start=None, end=None, timeframe="M1", session_mode="rth"):
+        frames = [self.bars[s].assign(symbol=s) for s in symbols]
+        merged = pd.concat(frames).sort_values(["timestamp", "symbol"], kind="stable")
+        for row in merged.itertuples(index=False):
+            if self.ticks:
+                yield SimpleNamespace(symbol=row.symbol, ts=row.timestamp, price=row.open)
+            yield SimpleNamespace(
+                symbol=row.symbol, ts=row.timestamp, open=row.open, high=row.high, low=row.low, close=row.close
+            )
+            await asyncio.sleep(0)
+
+    async def write_signals(self, lab, run_id, source_tag, signals):
+        if self.write_delay:
+            await asyncio.sleep(self.write_delay)
+        self.batches.append(list(signals))
+        return SimpleNamespace(written=len(signals), duplicates_skipped=0)
+
+
+def _expected(bars: dict) -> list:
+    core = InsideBarCore(core_config_from_params(PARAMS))
+    return [
+        signal_record(signal, symbol, "inside_bar")
+        for symbol, frame in bars.items()
+        for signal in core.process_data(frame, symbol)
+    ]
+
+
+def _key(record):
+    return record["symbol"], record["ts"], record["side"]
+
+
+@pytest.mark.asyncio
+async def test_runtime_writes_the_batch_signals_in_batches():
+    bars = {f"S{i:02d}": _bars(i) for i in range(12)}
+    port = FakeReplayPort(bars, ticks=True)
+    config = RuntimeConfig(lab="PREPAPER", run_id="rt", batch_size=8)
+
+    metrics = await PrePaperRuntime(port, list(bars), PARAMS, config).run(timeframe="M5")
+
+    written = [record for batch in port.batches for record in batch]
+    expected = _expected(bars)
+    assert expected
+    assert sorted(written, key=_key) == sorted(expected, key=_key)
+    assert all(len(batch) <= 8 for batch in port.batches)
+    assert metrics.signals_written == len(expected)
+    assert metrics.skipped_events == sum(len(f) for f in bars.values())
+    summary = metrics.to_dict()
+    assert summary["symbols"]["S00"]["bars"] == len(bars["S00"])
+    assert summary["max_latency_p99_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_slow_writer_applies_backpressure_without_losing_signals():
+    bars = {f"S{i}": _bars(i) for i in range(4)}
+    port = FakeReplayPort(bars, write_delay=0.01)
+    config = RuntimeConfig(lab="PREPAPER", run_id="rt", batch_size=1, signal_queue_size=1)
+
+    metrics = await PrePaperRuntime(port, list(bars), PARAMS, config).run(timeframe="M5")
+
+    assert metrics.writer_waits > 0
+    assert len(port.batches) == metrics.batches_written == len(_expected(bars))
+
+
+@pytest.mark.asyncio
+async def test_failing_writer_stops_the_feed():
+    class BrokenPort(FakeReplayPort):
+        async def write_signals(self, lab, run_id, source_tag, signals):
+            raise RuntimeError("store down")
+
+    bars = {f"S{i}": _bars(i) for i in range(4)}
+    config = RuntimeConfig(lab="PREPAPER", run_id="rt", batch_size=1, signal_queue_size=1)
+
+    with pytest.raises(RuntimeError, match="store down"):
+        await asyncio.wait_for(PrePaperRuntime(BrokenPort(bars), list(bars), PARAMS, config).run(timeframe="M5"), 10)
+
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_history_seeds_session_state():
+    full = _bars(7)
+    cut = len(full) // 2
+    core = InsideBarCore(core_config_from_params(PARAMS))
+    expected = [
+        signal_record(s, "S7", "inside_bar") for s in core.process_data(full, "S7") if s.metadata["ib_idx"] >= cut
+    ]
+    port = FakeReplayPort({"S7": full.iloc[cut:]})
+    history = {"S7": full.iloc[:cut].set_index("timestamp")}
+
+    await PrePaperRuntime(port, ["S7"], PARAMS, RuntimeConfig(lab="PREPAPER", run_id="rt"), history=history).run()
+
+    assert [r for batch in port.batches for r in batch] == expected
@@ -0,0 +1,71 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from pre_paper.cache import sqlite_cache
+from pre_paper.cache.sqlite_cache import SQLiteCache, close_pool
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    yield
+    close_pool()
+
+
+def _bars(start: str, periods: int, base: float = 100.0) -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq="1min", tz="America/New_York")
+    close = base + pd.Series(range(periods), dtype="float64").to_numpy()
+    return pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1000},
+        index=index,
+    )
+
+
+def test_wal_journal_and_pooled_connection_is_shared(tmp_path):
+    first = SQLiteCache(tmp_path / "cache.db", pooled=True)
+    second = SQLiteCache(tmp_path / "cache.db", pooled=True)
+
+    assert first.conn is second.conn
+    assert first.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    first.close()
+    first.append_bars("AAPL", "M1", _bars("2025-01-02 09:30", 3))
+    assert len(second.get_bars("AAPL", "M1")) == 3
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    reader = sqlite3.connect(str(tmp_path / "cache.db"))
+    bars = _bars("2025-01-02 09:30", 3)
+
+    with cache.transaction():
+        for ts, row in bars.iterrows():
+            cache.append_bar("AAPL", "M1", ts, row.to_dict())
+        assert reader.execute("SELECT COUNT(*) FROM bars").fetchone()[0] == 0
+    assert reader.execute("SELECT COUNT(*) FROM bars").fetchone()[0] == 3
+
+    with pytest.raises(RuntimeError):
+        with cache.transaction():
+            cache.append_bars("MSFT", "M1", bars)
+            raise RuntimeError("boom")
+    assert cache.get_range("MSFT", "M1") is None
+    cache.close()
+
+
+def test_get_bars_many_matches_get_bars(tmp_path, monkeypatch):
+    monkeypatch.setattr(sqlite_cache, "_MAX_SYMBOLS_PER_QUERY", 2)
+    cache = SQLiteCache(tmp_path / "cache.db")
+    for offset, symbol in enumerate(["AAPL", "MSFT", "TSLA"]):
+        cache.append_bars(symbol, "M1", _bars("2025-01-02 09:30", 10 + offset, base=100.0 * (offset + 1)))
+    start = pd.Timestamp("2025-01-02 09:33", tz="America/New_York")
+    end = pd.Timestamp("2025-01-02 09:40", tz="America/New_York")
+
+    many = cache.get_bars_many(["TSLA", "NOPE", "AAPL", "MSFT"], "M1", start, end)
+
+    assert list(many) == ["TSLA", "NOPE", "AAPL", "MSFT"]
+    for symbol in ("AAPL", "MSFT", "TSLA"):
+        pd.testing.assert_frame_equal(many[symbol], cache.get_bars(symbol, "M1", start, end))
+    assert many["NOPE"].empty
+    assert list(many["NOPE"].columns) == ["open", "high", "low", "close", "volume"]
+    cache.close()
@@ -159,3 +159,36 @@ def test_plan_schema_version_present(tmp_path):
     
     assert "schema_version" in plan
     assert plan["schema_version"] == "1.0.0"
+
+
+def test_idempotency_key_is_shared_by_cli_and_runtime():
+    """Replay CLI and runtime must key the same order intent identically."""
+    import hashlib
+
+    import pandas as pd
+
+    from pre_paper.plan_writer import idempotency_key
+    from pre_paper.runtime import signal_record
+    from strategies.inside_bar.models import RawSignal
+
+    order = {
+        "ts": "2025-01-02T10:00:00-05:00",
+        "symbol": "AAPL",
+        "side": "BUY",
+        "strategy_key": "inside_bar",
+        "entry_price": 101.5,
+        "sl": 100.5,
+        "tp": 103.5,
+    }
+    legacy = "2025-01-02T10:00:00-05:00|AAPL|BUY|inside_bar|101.5|100.5|103.5"
+    assert idempotency_key(order) == hashlib.sha256(legacy.encode()).hexdigest()[:16]
+
+    signal = RawSignal(
+        timestamp=pd.Timestamp(order["ts"]),
+        side="BUY",
+        entry_price=101.5,
+        stop_loss=100.5,
+        take_profit=103.5,
+    )
+    record = signal_record(signal, "AAPL", "inside_bar")
+    assert record["idempotency_key"] == idempotency_key(order)
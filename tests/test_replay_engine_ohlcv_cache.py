@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from axiom_bt.engines.ohlcv_cache import OhlcvArrays, OhlcvCache
+from axiom_bt.engines.replay_engine import (
+    _compute_market_close_deadline,
+    _compute_market_close_deadline_arrays,
+    _ensure_dtindex_and_ohlcv,
+    _exit_after_entry,
+    _exit_after_entry_arrays,
+    _first_touch_entry,
+    _first_touch_entry_arrays,
+)
+
+
+def _bars(n: int = 400, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Two sessions of 5m bars (UTC), with an overnight gap.
+    day1 = pd.date_range("2025-01-02 14:30", periods=n // 2, freq="5min", tz="UTC")
+    day2 = pd.date_range("2025-01-03 14:30", periods=n - n // 2, freq="5min", tz="UTC")
+    close = 100 + rng.normal(0, 0.5, n).cumsum()
+    spread = rng.uniform(0.05, 0.6, n)
+    return pd.DataFrame(
+        {
+            "timestamp": day1.append(day2),
+            "open": close + rng.normal(0, 0.1, n),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(100, 1000, n),
+        }
+    )
+
+
+@pytest.mark.parametrize("tz", ["America/New_York", "Europe/Berlin"])
+def test_array_helpers_match_frame_helpers(tz):
+    raw = _bars()
+    df = _ensure_dtindex_and_ohlcv(raw.copy(), tz)
+    arrays = OhlcvArrays.from_frame(df, path=None, tz=tz)
+    rng = np.random.default_rng(11)
+
+    for _ in range(200):
+        i = int(rng.integers(0, len(df) - 5))
+        j = int(rng.integers(i, len(df)))
+        start, end = df.index[i], df.index[j]
+        side = "BUY" if rng.random() < 0.5 else "SELL"
+        price = float(df["Close"].iloc[i] + rng.normal(0, 1.0))
+        expected = _first_touch_entry(df, side, price, start, end)
+        assert _first_touch_entry_arrays(arrays, side, price, start, end) == expected
+        if expected is None:
+            continue
+
+        deadline = _compute_market_close_deadline(df, expected, "America/New_York", "16:00")
+        assert _compute_market_close_deadline_arrays(arrays, expected, "America/New_York", "16:00") == deadline
+
+        sl = price - 1.0 if side == "BUY" else price + 1.0
+        tp = price + 1.0 if side == "BUY" else price - 1.0
+        for stop_loss, take_profit in [(sl, tp), (None, tp), (sl, None), (None, None)]:
+            assert _exit_after_entry_arrays(
+                arrays, side, expected, stop_loss, take_profit, deadline
+            ) == _exit_after_entry(df, side, expected, stop_loss, take_profit, deadline)
+
+
+def test_cache_loads_once_and_invalidates_on_mtime(tmp_path):
+    path = tmp_path / "AAPL.parquet"
+    _bars().to_parquet(path)
+    cache = OhlcvCache(max_entries=2)
+
+    first = cache.get(path, "America/New_York")
+    assert cache.get(path, "America/New_York") is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    _bars(seed=8).to_parquet(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    refreshed = cache.get(path, "America/New_York")
+    assert refreshed is not first
+    assert cache.misses == 2
+    assert len(cache) == 1
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from axiom_bt.data import eodhd_fetch
+from axiom_bt.data.eodhd_fetch import RESAMPLE_STATE_KEY, resample_m1
+from axiom_bt.data.m1_partitions import M1PartitionStore
+
+
+def _m1(start: str, end: str) -> pd.DataFrame:
+    index = pd.date_range(start, end, freq="1min", tz="UTC", name="timestamp")
+    rng = np.random.default_rng(len(index))
+    close = 100 + rng.normal(0, 0.1, len(index)).cumsum()
+    return pd.DataFrame(
+        {"Open": close, "High": close + 0.1, "Low": close - 0.1, "Close": close, "Volume": rng.integers(1, 100, len(index))},
+        index=index,
+    )
+
+
+def _full(m1_path, interval, tz) -> pd.DataFrame:
+    df = eodhd_fetch._standardize_ohlcv(pd.read_parquet(m1_path), tz=tz)
+    return df.resample(interval).agg(eodhd_fetch._RESAMPLE_AGG).dropna(how="any")
+
+
+def test_incremental_resample_recomputes_only_the_tail(tmp_path, monkeypatch):
+    store = M1PartitionStore(tmp_path / "AAPL_rth")
+    store.append(_m1("2024-10-01", "2024-11-30 23:59"))
+    out_dir = tmp_path / "m5"
+    out = resample_m1(store.root, out_dir, interval="5min", tz="America/New_York")
+
+    loads = []
+    original = M1PartitionStore.load
+    monkeypatch.setattr(M1PartitionStore, "load", lambda self, start=None, end=None: loads.append(start) or original(self, start, end))
+
+    store.append(_m1("2024-11-30 23:30", "2024-12-02 23:59"))
+    resample_m1(store.root, out_dir, interval="5min", tz="America/New_York", validate=True)
+    assert loads == [pd.Timestamp("2024-11-30 23:30", tz="UTC")]
+
+    # Backfill before the existing history re-aggregates from the new start.
+    store.append(_m1("2024-09-25", "2024-09-30 23:59").assign(Close=1.0))
+    resample_m1(store.root, out_dir, interval="5min", tz="America/New_York", validate=True)
+    assert loads[-1] == pd.Timestamp("2024-09-25", tz="UTC")
+
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(out), _full(store.root, "5min", "America/New_York"), check_freq=False
+    )
+
+
+def test_unchanged_source_is_a_no_op_and_interval_change_rebuilds(tmp_path):
+    m1_path = tmp_path / "AAPL_rth.parquet"
+    _m1("2024-11-01", "2024-11-03 23:59").to_parquet(m1_path)
+    out = resample_m1(m1_path, tmp_path / "m15", interval="15min", tz="America/New_York")
+    written = out.stat().st_mtime_ns
+
+    assert resample_m1(m1_path, tmp_path / "m15", interval="15min", tz="America/New_York") == out
+    assert out.stat().st_mtime_ns == written
+
+    resample_m1(m1_path, tmp_path / "m15", interval="5min", tz="America/New_York")
+    assert b'"interval": "5min"' in pq.read_schema(out).metadata[RESAMPLE_STATE_KEY]
+    pd.testing.assert_frame_equal(pd.read_parquet(out), _full(m1_path, "5min", "America/New_York"), check_freq=False)
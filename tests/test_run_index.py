@@ -0,0 +1,151 @@
+"""Tests for the persistent, incrementally refreshed run index."""
+
+import json
+import os
+from datetime import date
+
+import pytest
+
+from core.settings.runtime_config import reset_runtime_config_for_tests
+from trading_dashboard.services import run_index as run_index_module
+from trading_dashboard.services.run_discovery_service import RunDiscoveryService
+from trading_dashboard.services.run_index import RunIndex, get_run_index
+
+
+def _write_run(root, run_id, started_at, strategy="inside_bar", symbol="AAPL", status="success", metrics=None):
+    run_dir = root / run_id
+    run_dir.mkdir()
+    manifest = {
+        "identity": {"run_id": run_id, "timestamp_utc": started_at},
+        "strategy": {"key": strategy},
+        "data": {"symbol": symbol, "requested_tf": "M5"},
+        "result": {"run_status": status},
+    }
+    (run_dir / "run_manifest.json").write_text(json.dumps(manifest))
+    if metrics is not None:
+        (run_dir / "metrics.json").write_text(json.dumps(metrics))
+    return run_dir
+
+
+@pytest.fixture
+def runs_root(tmp_path):
+    _write_run(tmp_path, "r1", "2025-12-01T10:00:00+00:00", symbol="AAPL", metrics={"net_pnl": 50.0, "num_trades": 3})
+    _write_run(tmp_path, "r2", "2025-12-02T10:00:00+00:00", symbol="MSFT", metrics={"net_pnl": -20.0, "num_trades": 1})
+    _write_run(tmp_path, "r3", "2025-12-03T10:00:00+00:00", strategy="rudometkin", symbol="AAPL", status="error")
+    return tmp_path
+
+
+def _count_parses(monkeypatch):
+    calls = []
+    original = RunDiscoveryService.parse_run_dir
+    monkeypatch.setattr(
+        RunDiscoveryService, "parse_run_dir", lambda self, run_dir: calls.append(run_dir.name) or original(self, run_dir)
+    )
+    return calls
+
+
+def test_refresh_parses_only_changed_directories(runs_root, monkeypatch):
+    calls = _count_parses(monkeypatch)
+    index = RunIndex(runs_root)
+
+    assert index.refresh() == {"scanned": 3, "updated": 3, "removed": 0}
+    assert index.refresh() == {"scanned": 3, "updated": 0, "removed": 0}
+    assert sorted(calls) == ["r1", "r2", "r3"]
+
+    # In-place manifest rewrite: directory mtime unchanged, file mtime bumped
+    manifest = runs_root / "r2" / "run_manifest.json"
+    payload = json.loads(manifest.read_text())
+    payload["result"]["run_status"] = "error"
+    manifest.write_text(json.dumps(payload))
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert index.refresh()["updated"] == 1
+    assert calls[-1] == "r2"
+    assert [run.status for run in index.query() if run.run_id == "r2"] == ["ERROR"]
+
+
+def test_index_persists_across_instances_and_drops_deleted_runs(runs_root, tmp_path_factory, monkeypatch):
+    db_path = tmp_path_factory.mktemp("cache") / "run_index.sqlite3"
+    RunIndex(runs_root, db_path=db_path).refresh()
+    (runs_root / "r3" / "run_manifest.json").unlink()
+    (runs_root / "r3").rmdir()
+
+    calls = _count_parses(monkeypatch)
+    index = RunIndex(runs_root, db_path=db_path)
+    assert index.refresh() == {"scanned": 2, "updated": 0, "removed": 1}
+    assert calls == []
+    assert [run.run_id for run in index.query()] == ["r2", "r1"]
+
+
+def test_query_filters_sorts_and_paginates_in_sql(runs_root):
+    index = RunIndex(runs_root)
+    index.refresh()
+
+    assert [run.run_id for run in index.query()] == ["r3", "r2", "r1"]
+    assert [run.run_id for run in index.query(symbol="AAPL")] == ["r3", "r1"]
+    assert [run.run_id for run in index.query(strategy="inside_bar", status="success")] == ["r2", "r1"]
+    assert [run.run_id for run in index.query(start_date=date(2025, 12, 2), end_date=date(2025, 12, 2))] == ["r2"]
+    assert [run.run_id for run in index.query(order_by="net_pnl")] == ["r1", "r2", "r3"]
+    assert [run.run_id for run in index.query(limit=2, offset=1)] == ["r2", "r1"]
+    assert index.count(symbol="AAPL") == 2
+
+    r1 = index.query(order_by="run_id", descending=False, limit=1)[0]
+    assert r1.metrics == {"net_pnl": 50.0, "num_trades": 3}
+    assert r1.symbols == ["AAPL"]
+
+    with pytest.raises(ValueError):
+        index.query(order_by="run_dir; DROP TABLE run_index")
+
+
+def test_skipped_directories_with_trades_are_listed_for_trade_inspector(runs_root):
+    legacy = runs_root / "run_20251204_legacy"
+    legacy.mkdir()
+    (legacy / "trades.csv").write_text("symbol,pnl\nAAPL,1.0\n")
+    (runs_root / "r1" / "trades.parquet").write_bytes(b"")
+    (runs_root / "no_artifacts").mkdir()
+
+    index = RunIndex(runs_root)
+    index.refresh()
+
+    assert [run.run_id for run in index.query()] == ["r3", "r2", "r1"]
+    assert {run.run_id for run in index.query(has_trades=True, include_skipped=True)} == {"run_20251204_legacy", "r1"}
+    diagnostics = index.diagnostics()
+    assert diagnostics["discovered_count"] == 3
+    assert diagnostics["skipped_count"] == 2
+
+
+def test_missing_artifacts_root_yields_empty_index(tmp_path):
+    index = RunIndex(tmp_path / "missing")
+
+    assert index.refresh() == {"scanned": 0, "updated": 0, "removed": 0}
+    assert index.query() == []
+    assert index.count() == 0
+    assert not (tmp_path / "missing").exists()
+
+
+def test_default_index_is_in_memory_and_writes_nothing_under_artifacts_root(runs_root):
+    before = sorted(p.name for p in runs_root.iterdir())
+    index = RunIndex(runs_root)
+    index.refresh()
+
+    assert index.count() == 3
+    assert index._connection() is index._connection()
+    assert sorted(p.name for p in runs_root.iterdir()) == before
+
+
+def test_get_run_index_persists_under_runtime_cache_root(runs_root, tmp_path_factory, monkeypatch):
+    cache_root = tmp_path_factory.mktemp("dashboard_cache")
+    monkeypatch.setenv("DASHBOARD_CACHE_ROOT", str(cache_root))
+    monkeypatch.setattr(run_index_module, "_INDEXES", {})
+    reset_runtime_config_for_tests()
+    try:
+        index = get_run_index(runs_root)
+        index.refresh()
+        index.close()
+    finally:
+        reset_runtime_config_for_tests()
+
+    assert index.db_path.parent == cache_root
+    assert index.db_path.exists()
+    assert not any(p.name.startswith("run_index") for p in runs_root.iterdir())
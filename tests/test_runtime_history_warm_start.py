@@ -49,7 +49,7 @@ class TestRuntimeHistoryWarmStart:
         GIVEN: Cache has bars for 2025-01-01 to 2025-01-05
         WHEN: Required window is 2024-12-20 to 2025-01-10
         AND: Provider returns missing bars (before + after)
-        THEN: Status becomes SUFFICIENT after backfill
+        THEN: Status becomes SUFFICIENT after a single ensure_history() call
         """
         # Setup cache with partial data
         cache_path = tmp_path / "test_cache.db"
@@ -96,7 +96,7 @@ class TestRuntimeHistoryWarmStart:
         required_start = pd.Timestamp('2024-12-20 09:30', tz='America/New_York')
         required_end = pd.Timestamp('2025-01-10 16:00', tz='America/New_York')
 
-        # First check: Should be LOADING (gaps exist, backfill triggered)
+        # One check backfills both edge gaps concurrently
         result = ensure_history(
             symbol='HOOD',
             tf='M5',
@@ -108,14 +108,15 @@ class TestRuntimeHistoryWarmStart:
             auto_backfill=True
         )
 
-        assert result.status == HistoryStatus.LOADING, \
-            f"Expected LOADING during backfill, got {result.status.value}"
+        assert result.status == HistoryStatus.SUFFICIENT, \
+            f"Expected SUFFICIENT after backfill, got {result.status.value}"
         assert result.fetch_attempted
         assert result.fetch_success
-        assert len(provider.fetch_calls) > 0, "Provider should be called for backfill"
+        assert result.gaps == []
+        assert len(provider.fetch_calls) == 2, "Both gaps (before + after) should be fetched"
+        assert result.cached_start_ts <= required_start
 
-        # Second check: Still LOADING (PoC fills one gap at a time)
-        # In production, this would loop until all gaps filled
+        # Second check: nothing left to fetch
         result2 = ensure_history(
             symbol='HOOD',
             tf='M5',
@@ -127,14 +128,9 @@ class TestRuntimeHistoryWarmStart:
             auto_backfill=True
         )
 
-        # PoC behavior: Second gap still exists (after cached range)
-        # Production would loop to fill remaining gaps
-        assert result2.status in [HistoryStatus.LOADING, HistoryStatus.SUFFICIENT], \
-            f"Expected LOADING or SUFFICIENT, got {result2.status.value}"
-
-        # Verifythat backfill made progress (before gap should be filled)
-        assert result2.cached_start_ts <= required_start, \
-            "Backfill should have filled gap before cached range"
+        assert result2.status == HistoryStatus.SUFFICIENT
+        assert not result2.fetch_attempted
+        assert len(provider.fetch_calls) == 2
 
     def test_incomplete_history_keeps_degraded_and_no_signals(self, tmp_path):
         """
@@ -333,3 +329,143 @@ class TestRuntimeHistoryWarmStart:
         assert result2.status == HistoryStatus.SUFFICIENT, \
             f"Expected SUFFICIENT after WebSocket append, got {result2.status.value}"
         assert len(result2.gaps) == 0
+
+
+def _rth_bars(start: str, end: str, freq: str = '5min') -> pd.DataFrame:
+    """Regular-session bars (09:30-15:55 open times) on weekdays."""
+    index = pd.date_range(start, end, freq=freq, tz='America/New_York')
+    index = index[index.dayofweek < 5]
+    index = index[index.indexer_between_time('09:30', '15:55')]
+    return pd.DataFrame({'open': 100.0, 'high': 101.0, 'low': 99.0, 'close': 100.0, 'volume': 1000}, index=index)
+
+
+class TestInteriorGaps:
+    """Gaps inside the cached range and concurrent multi-gap backfill."""
+
+    START = pd.Timestamp('2025-01-06 09:30', tz='America/New_York')
+    END = pd.Timestamp('2025-01-10 15:55', tz='America/New_York')
+
+    def _seed(self, cache_path, holes):
+        full = _rth_bars('2025-01-06', '2025-01-11')
+        cached = full
+        for start, end in holes:
+            cached = cached[(cached.index < pd.Timestamp(start, tz='America/New_York'))
+                            | (cached.index > pd.Timestamp(end, tz='America/New_York'))]
+        cache = SQLiteCache(cache_path)
+        cache.append_bars('HOOD', 'M5', cached, source='historical')
+        cache.close()
+        return full
+
+    def _check(self, cache_path, provider=None, **kwargs):
+        return ensure_history(
+            symbol='HOOD', tf='M5', base_tf_used='M5',
+            required_start_ts=self.START, required_end_ts=self.END,
+            cache_db_path=cache_path, historical_provider=provider,
+            auto_backfill=provider is not None, **kwargs
+        )
+
+    def test_interior_hole_is_detected_and_backfilled(self, tmp_path):
+        cache_path = tmp_path / "test_cache.db"
+        full = self._seed(cache_path, [('2025-01-08 10:00', '2025-01-08 10:55')])
+
+        degraded = self._check(cache_path)
+        assert degraded.status == HistoryStatus.DEGRADED
+        assert [(g.start, g.end) for g in degraded.gaps] == [(
+            pd.Timestamp('2025-01-08 10:00', tz='America/New_York'),
+            pd.Timestamp('2025-01-08 10:55', tz='America/New_York'),
+        )]
+
+        provider = FakeHistoricalProvider(data={('HOOD', 'M5'): full})
+        result = self._check(cache_path, provider)
+        assert result.status == HistoryStatus.SUFFICIENT
+        assert [(c[2], c[3]) for c in provider.fetch_calls] == [(degraded.gaps[0].start, degraded.gaps[0].end)]
+
+    def test_all_gaps_are_fetched_with_bounded_concurrency(self, tmp_path):
+        import threading
+        import time
+
+        cache_path = tmp_path / "test_cache.db"
+        holes = [('2025-01-06 09:30', '2025-01-06 10:00'), ('2025-01-07 12:00', '2025-01-07 12:30'),
+                 ('2025-01-08 14:00', '2025-01-08 14:30'), ('2025-01-10 15:00', '2025-01-10 15:55')]
+        full = self._seed(cache_path, holes)
+
+        class SlowProvider(FakeHistoricalProvider):
+            active = peak = 0
+            lock = threading.Lock()
+
+            def fetch_bars(self, *args):
+                with self.lock:
+                    SlowProvider.active += 1
+                    SlowProvider.peak = max(SlowProvider.peak, SlowProvider.active)
+                time.sleep(0.05)
+                with self.lock:
+                    SlowProvider.active -= 1
+                return super().fetch_bars(*args)
+
+        provider = SlowProvider(data={('HOOD', 'M5'): full})
+        result = self._check(cache_path, provider, max_concurrency=2)
+
+        assert result.status == HistoryStatus.SUFFICIENT
+        assert len(provider.fetch_calls) == 4
+        assert SlowProvider.peak == 2
+
+    def test_empty_interior_gap_is_a_closure_but_empty_edge_gap_degrades(self, tmp_path):
+        cache_path = tmp_path / "test_cache.db"
+        self._seed(cache_path, [('2025-01-08 00:00', '2025-01-08 23:59')])
+        closed = FakeHistoricalProvider(data={})
+
+        assert self._check(cache_path, closed).status == HistoryStatus.SUFFICIENT
+        assert len(closed.fetch_calls) == 1
+
+        # The confirmed closure is persisted: no re-fetch, even without a provider
+        assert self._check(cache_path, closed).status == HistoryStatus.SUFFICIENT
+        assert len(closed.fetch_calls) == 1
+        assert self._check(cache_path).status == HistoryStatus.SUFFICIENT
+
+        edge_path = tmp_path / "edge_cache.db"
+        self._seed(edge_path, [('2025-01-10 00:00', '2025-01-10 23:59')])
+        result = self._check(edge_path, closed)
+        assert result.status == HistoryStatus.DEGRADED
+        assert "no data" in result.reason.lower()
+
+    def test_sync_check_works_inside_running_loop(self, tmp_path):
+        import asyncio
+
+        cache_path = tmp_path / "test_cache.db"
+        full = self._seed(cache_path, [('2025-01-08 10:00', '2025-01-08 10:55')])
+        provider = FakeHistoricalProvider(data={('HOOD', 'M5'): full})
+
+        async def caller():
+            return self._check(cache_path, provider)
+
+        assert asyncio.run(caller()).status == HistoryStatus.SUFFICIENT
+
+
+class TestCalendarSessions:
+    """Early closes and ad-hoc closures need no provider round-trip."""
+
+    def test_early_close_and_adhoc_closure_are_not_gaps(self, tmp_path):
+        cache_path = tmp_path / "test_cache.db"
+        bars = _rth_bars('2024-11-27', '2024-12-03')
+        # Thanksgiving closed, the day after closes at 13:00
+        bars = bars[(bars.index.date != pd.Timestamp('2024-11-28').date())
+                    & ~((bars.index.date == pd.Timestamp('2024-11-29').date()) & (bars.index.hour >= 13))]
+        cache = SQLiteCache(cache_path)
+        cache.append_bars('HOOD', 'M5', bars, source='historical')
+        cache.close()
+
+        result = ensure_history(
+            symbol='HOOD', tf='M5', base_tf_used='M5',
+            required_start_ts=pd.Timestamp('2024-11-27 09:30', tz='America/New_York'),
+            required_end_ts=pd.Timestamp('2024-12-02 15:55', tz='America/New_York'),
+            cache_db_path=cache_path,
+        )
+        assert result.status == HistoryStatus.SUFFICIENT, result.reason
+
+        from pre_paper.bar_calendar import expected_bar_seconds
+        carter = expected_bar_seconds(
+            'M5',
+            pd.Timestamp('2025-01-09 00:00', tz='America/New_York'),
+            pd.Timestamp('2025-01-09 23:59', tz='America/New_York'),
+        )
+        assert len(carter) == 0
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.inside_bar.config import SessionFilter
+
+
+def _timestamps(tz):
+    rng = np.random.default_rng(5)
+    # Spans both 2025 DST transitions in EU and US.
+    base = pd.Timestamp("2025-03-01", tz="UTC").value
+    span = pd.Timedelta(days=270).value
+    values = base + rng.integers(0, span // 300_000_000_000, 2000) * 300_000_000_000
+    idx = pd.DatetimeIndex(np.sort(values).view("datetime64[ns]")).tz_localize("UTC")
+    return idx if tz is None else idx.tz_convert(tz)
+
+
+@pytest.mark.parametrize("column_tz", [None, "UTC", "America/New_York"])
+@pytest.mark.parametrize("session_tz", ["Europe/Berlin", "America/New_York"])
+def test_session_arrays_match_scalar_methods(column_tz, session_tz):
+    sf = SessionFilter.from_strings(["09:30-11:00", "10:30-12:00", "15:00-16:00"])
+    ts = _timestamps("UTC")
+    column = pd.Series(ts.tz_localize(None) if column_tz is None else ts.tz_convert(column_tz))
+
+    arrays = sf.session_arrays(column, session_tz)
+
+    for pos, value in enumerate(column):
+        value = pd.Timestamp(value)
+        expected_idx = sf.get_session_index(value, session_tz)
+        assert arrays.index_at(pos) == expected_idx
+        assert bool(arrays.in_session[pos]) == sf.is_in_session(value, session_tz)
+        if expected_idx is None:
+            assert pd.isna(arrays.session_start[pos])
+            assert pd.isna(arrays.session_end[pos])
+            continue
+        start = sf.get_session_start(value, session_tz)
+        end = sf.get_session_end(value, session_tz)
+        assert arrays.session_start[pos] == start
+        assert arrays.session_end[pos] == end
+        # Session keys are stringified into signal metadata.
+        assert str((expected_idx, arrays.session_start[pos])) == str((expected_idx, start))
+
+
+def test_session_arrays_without_windows_rejects_all():
+    arrays = SessionFilter(windows=[]).session_arrays(_timestamps("UTC")[:10], "Europe/Berlin")
+    assert (arrays.session_index == -1).all()
+    assert arrays.session_start.isna().all()
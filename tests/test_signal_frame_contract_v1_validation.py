@@ -97,3 +97,76 @@ def test_timestamp_naive_fails():
     df["timestamp"] = pd.date_range("2025-01-01", periods=3, freq="5min")  # naive
     with pytest.raises(SignalFrameContractError):
         validate_signal_frame_v1(df, _schema())
+
+
+def test_report_lists_checks_and_coerced_columns():
+    report = validate_signal_frame_v1(_frame(), _schema())
+    assert report.ok
+    assert set(report.coerced_columns) == {"open", "high", "low", "close", "volume"}
+    assert [c.name for c in report.checks][:2] == ["required_columns", "dtypes"]
+    assert all(c.seconds >= 0 for c in report.checks)
+
+    typed = _frame().astype({"open": float, "high": float, "low": float, "close": float, "volume": float})
+    assert validate_signal_frame_v1(typed, _schema()).coerced_columns == ()
+
+
+def test_violations_report_first_offending_rows():
+    df = pd.concat([_frame()] * 4, ignore_index=True)
+    df.loc[[4, 7, 10], "sig_side"] = "FLAT"
+    df.loc[[4, 7, 10], "sig_long"] = True
+
+    report = validate_signal_frame_v1(df, _schema(), strict=False, max_offenders=2)
+    assert not report.ok
+    assert report.first_failure.name == "sig_side_flat_consistent"
+    assert report.first_failure.offending_rows == (4, 7)
+
+    with pytest.raises(SignalFrameContractError, match=r"first offending rows: \[4, 7, 10\]"):
+        validate_signal_frame_v1(df, _schema())
+
+
+def test_undeclared_signal_columns_are_still_checked():
+    schema = _schema()
+    schema = SignalFrameSchemaV1(
+        strategy_id=schema.strategy_id,
+        strategy_tag=schema.strategy_tag,
+        version=schema.version,
+        required_base=schema.required_base,
+        required_generic=schema.required_generic,
+        required_strategy=[c for c in schema.required_strategy if c.name not in {"sig_long", "sig_short", "sig_side"}],
+    )
+    assert validate_signal_frame_v1(_frame(), schema).ok
+
+    df = _frame()
+    df.loc[1, "sig_side"] = "SIDEWAYS"
+    with pytest.raises(SignalFrameContractError, match="sig_side contains invalid values"):
+        validate_signal_frame_v1(df, schema)
+
+    df = _frame()
+    df.loc[0, "sig_short"] = True
+    with pytest.raises(SignalFrameContractError, match="cannot both be true"):
+        validate_signal_frame_v1(df, schema)
+
+
+@pytest.mark.parametrize("declared", [True, False])
+def test_na_in_sig_long_fails_report(declared):
+    schema = _schema()
+    if not declared:
+        schema = SignalFrameSchemaV1(
+            strategy_id=schema.strategy_id,
+            strategy_tag=schema.strategy_tag,
+            version=schema.version,
+            required_base=schema.required_base,
+            required_generic=schema.required_generic,
+            required_strategy=[c for c in schema.required_strategy if c.name != "sig_long"],
+        )
+    df = _frame()
+    df["sig_long"] = pd.array([True, pd.NA, False], dtype="boolean")
+
+    report = validate_signal_frame_v1(df, schema, strict=False)
+    assert not report.ok
+    if not declared:
+        assert report.first_failure.name == "non_null:sig_long"
+        assert report.first_failure.offending_rows == (1,)
+
+    with pytest.raises(SignalFrameContractError, match="sig_long"):
+        validate_signal_frame_v1(df, schema)
@@ -0,0 +1,156 @@
+"""
+Unit tests for server-side chart downsampling.
+"""
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+from dash import no_update
+
+from trading_dashboard.plots.trade_inspector_plot import build_trade_chart
+from trading_dashboard.utils import chart_resampling
+from visualization.downsample import (
+    downsample_line,
+    downsample_ohlcv,
+    lttb_indices,
+    slice_x_range,
+    target_points,
+    x_range_from_relayout,
+)
+from visualization.plotly.config import PriceChartConfig
+from visualization.plotly.price_chart import build_price_chart
+
+
+@pytest.fixture
+def m1_bars():
+    """Three months of M1 bars (24h, tz-aware)."""
+    index = pd.date_range("2024-01-01", periods=130_000, freq="1min", tz="America/New_York")
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.standard_normal(len(index)) * 0.05)
+    return pd.DataFrame(
+        {
+            "open": close + rng.standard_normal(len(index)) * 0.01,
+            "high": close + 0.2,
+            "low": close - 0.2,
+            "close": close,
+            "volume": rng.integers(100, 1000, len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+class TestDownsampleOhlcv:
+    def test_buckets_preserve_extremes_and_volume(self, m1_bars):
+        out = downsample_ohlcv(m1_bars, 1000)
+
+        assert len(out) <= 1000
+        assert out.index[0] == m1_bars.index[0]
+        assert out["open"].iloc[0] == m1_bars["open"].iloc[0]
+        assert out["close"].iloc[-1] == m1_bars["close"].iloc[-1]
+        assert out["high"].max() == m1_bars["high"].max()
+        assert out["low"].min() == m1_bars["low"].min()
+        assert out["volume"].sum() == pytest.approx(m1_bars["volume"].sum())
+
+    def test_within_budget_is_unchanged(self, m1_bars):
+        small = m1_bars.iloc[:50]
+        assert downsample_ohlcv(small, 100) is small
+
+
+class TestLttb:
+    def test_keeps_endpoints_and_spikes(self):
+        y = np.zeros(10_000)
+        y[4321] = 50.0
+        idx = lttb_indices(np.arange(len(y)), y, 100)
+
+        assert len(idx) == 100
+        assert idx[0] == 0 and idx[-1] == len(y) - 1
+        assert np.all(np.diff(idx) > 0)
+        assert 4321 in idx
+
+    def test_downsample_line_drops_nan_and_caps(self, m1_bars):
+        series = m1_bars["close"].rolling(20).mean()
+        out = downsample_line(series, 500)
+
+        assert len(out) == 500
+        assert out.notna().all()
+
+
+class TestRelayout:
+    def test_zoom_on_shared_axis(self):
+        assert x_range_from_relayout(
+            {"xaxis2.range[0]": "2024-02-01 10:00", "xaxis2.range[1]": "2024-02-01 12:00"}
+        ) == (pd.Timestamp("2024-02-01 10:00"), pd.Timestamp("2024-02-01 12:00"))
+
+    def test_autorange_and_unrelated_events(self):
+        assert x_range_from_relayout({"xaxis.autorange": True, "yaxis.autorange": True}) is None
+        assert x_range_from_relayout({"autosize": True}) is False
+        assert x_range_from_relayout({"yaxis.range[0]": 1, "yaxis.range[1]": 2}) is False
+
+    def test_slice_keeps_neighbouring_bars(self, m1_bars):
+        window = slice_x_range(m1_bars, (pd.Timestamp("2024-02-01 10:00"), pd.Timestamp("2024-02-01 11:00")))
+
+        assert len(window) == 61 + 2
+        assert str(window.index.tz) == "America/New_York"
+
+
+class TestBuilders:
+    def test_price_chart_payload_is_capped(self, m1_bars):
+        indicators = {"ma_20": m1_bars["close"].rolling(20).mean()}
+        fig = build_price_chart(m1_bars, indicators, PriceChartConfig(session_mode="all"))
+
+        assert all(len(trace.x) <= 2000 for trace in fig.data)
+        assert fig.data[0].high.max() == m1_bars["high"].max()
+
+    def test_pixel_width_tightens_budget(self, m1_bars):
+        fig = build_price_chart(m1_bars, {}, PriceChartConfig(session_mode="all", width_px=800))
+
+        assert len(fig.data[0].x) <= target_points(800, px_per_point=2)
+
+    def test_zoom_re_aggregates_visible_range_only(self, m1_bars):
+        config = PriceChartConfig(session_mode="all", show_volume=False)
+        x_range = (pd.Timestamp("2024-02-01 10:00"), pd.Timestamp("2024-02-01 11:00"))
+        fig = build_price_chart(m1_bars, {}, replace(config, x_range=x_range))
+
+        # One hour of M1 fits the budget: every bar comes back
+        assert len(fig.data[0].x) == 63
+        assert list(fig.layout.xaxis.range) == ["2024-02-01 10:00:00", "2024-02-01 11:00:00"]
+
+    def test_max_points_none_sends_every_bar(self, m1_bars):
+        bars = m1_bars.iloc[:5000]
+        fig = build_price_chart(bars, {}, PriceChartConfig(session_mode="all", max_points=None))
+
+        assert len(fig.data[0].x) == 5000
+
+    def test_trade_chart_markers_stay_exact(self, m1_bars):
+        bars = m1_bars.tz_convert("UTC")
+        trade = pd.Series({
+            "entry_ts": "2024-02-01T15:03:00Z",
+            "exit_ts": "2024-02-01T15:17:00Z",
+            "entry_price": 101.23,
+            "exit_price": 101.87,
+        })
+        fig = build_trade_chart(trade, bars)
+
+        assert len(fig.data[0].x) <= 2000
+        entry, exit_ = fig.data[1], fig.data[2]
+        assert pd.Timestamp(entry.x[0]) == pd.Timestamp("2024-02-01T15:03:00Z")
+        assert (entry.y[0], exit_.y[0]) == (101.23, 101.87)
+
+
+def test_relayout_rebuilds_from_the_session_query():
+    calls = []
+
+    def rebuild(query, x_range):
+        calls.append((query["symbol"], x_range))
+        return f"figure-{query['symbol']}"
+
+    zoom = {"xaxis.range[0]": "2024-02-01 15:00", "xaxis.range[1]": "2024-02-01 16:00"}
+    assert chart_resampling.resample_for_relayout(rebuild, {"symbol": "AAPL"}, {"autosize": True}) is no_update
+    assert chart_resampling.resample_for_relayout(rebuild, None, {"xaxis.autorange": True}) is no_update
+    assert chart_resampling.resample_for_relayout(rebuild, {"symbol": "AAPL"}, {"xaxis.autorange": True}) == "figure-AAPL"
+    # Two sessions zooming the same graph each rebuild their own chart
+    assert chart_resampling.resample_for_relayout(rebuild, {"symbol": "MSFT"}, zoom) == "figure-MSFT"
+    assert [symbol for symbol, _ in calls] == ["AAPL", "MSFT"]
+    assert calls[0][1] is None and calls[1][1] is not None
+    assert chart_resampling.zoom_store("test-graph").id == "test-graph-zoom-query"
@@ -4,12 +4,14 @@ Chart callback - Updates candlestick chart based on symbol selection
 REFACTORED: Uses visualization layer builder pattern.
 No direct Plotly imports - all chart building delegated to visualization/plotly/.
 """
-from dash import Input, Output, State
+from dash import Input, Output, State, no_update
+from dataclasses import replace
 import pandas as pd
 import logging
 
 # Import visualization layer (clean separation)
 from visualization.plotly import build_price_chart, PriceChartConfig
+from ..utils.chart_resampling import register_zoom_resampling, zoom_store_id
 
 logger = logging.getLogger(__name__)
 
@@ -47,9 +49,182 @@ def _determine_session_mode(include_pre: bool, include_after: bool) -> str:
         return "rth"  # 9:30-16:00 ET
 
 
+def _chart_inputs(query: dict):
+    """
+    Load and prepare one chart query: (ohlcv, indicators, config), or None
+    if there is no data.
+
+    The query is JSON (it is kept in the chart's zoom store), so zoom
+    rebuilds reload through the candle cache instead of holding frames.
+    """
+    from datetime import date
+    import pytz
+    from ..repositories.candles import get_candle_data, get_live_candle_data
+
+    symbol = query["symbol"]
+    timeframe = query["timeframe"]
+    timezone = pytz.timezone(query["timezone"])
+    tz_label = query["tz_label"]
+    selected_date = date.fromisoformat(query["date"]) if query["date"] else None
+    d1_day_range = query["d1_day_range"]
+    session_toggles = query["session_toggles"]
+    indicator_strategy = query["indicator_strategy"]
+    indicator_toggles = query["indicator_toggles"]
+
+    # === 4. Fetch OHLCV data (domain layer) ===
+    if query["source"] == "database":
+        # Active Patterns mode: load from websocket database
+        logger.info(f"   → Loading from DATABASE for {symbol}")
+        df = get_live_candle_data(symbol, timeframe, selected_date, limit=500)
+    else:
+        # Symbol selector mode: load from parquet files
+        logger.info(f"   → Loading from PARQUET for {symbol}")
+
+        # Use days_back for D1, hours for other timeframes
+        if timeframe == "D1":
+            logger.info(f"🔍 CHART CALLBACK: D1 timeframe selected")
+            logger.info(f"   Symbol: {symbol}")
+            logger.info(f"   Days range: {d1_day_range or 180}")
+            logger.info(f"   Reference date: {selected_date}")
+
+            df = get_candle_data(
+                symbol,
+                timeframe=timeframe,
+                days_back=d1_day_range or 180,  # Use UI selection or default
+                reference_date=selected_date
+            )
+
+            logger.info(f"🔍 CHART CALLBACK: After get_candle_data")
+            logger.info(f"   DataFrame shape: {df.shape if not df.empty else 'EMPTY'}")
+            if not df.empty:
+                logger.info(f"   Columns: {list(df.columns)}")
+                logger.info(f"   Index: {df.index[:3].tolist() if len(df) > 0 else 'N/A'}")
+        else:
+            df = get_candle_data(
+                symbol,
+                timeframe=timeframe,
+                hours=24,
+                reference_date=selected_date
+            )
+
+    # === 5. No data: caller renders the empty state ===
+    if df.empty:
+        return None
+
+    # === 6. Prepare data: Convert to DataFrame with datetime index ===
+    if 'timestamp' in df.columns:
+        # Convert to requested timezone
+        # Note: Parquet data is stored in Berlin time by default
+        if df['timestamp'].dt.tz is None:
+            # Localize naive timestamps as Berlin time (source timezone)
+            df['timestamp'] = df['timestamp'].dt.tz_localize('Europe/Berlin')
+
+        # Now convert to the requested display timezone
+        df['timestamp'] = df['timestamp'].dt.tz_convert(timezone)
+
+        # Set as index for builder
+        ohlcv = df.set_index('timestamp')[['open', 'high', 'low', 'close', 'volume']]
+
+        # CRITICAL: Drop NaN rows (after-hours/pre-market bars with no data)
+        # Plotly Candlestick cannot handle NaN values
+        rows_before = len(ohlcv)
+        ohlcv = ohlcv.dropna(subset=['open', 'high', 'low', 'close'])
+        rows_after = len(ohlcv)
+
+        if rows_before > rows_after:
+            logger.info(f"🧹 Dropped {rows_before - rows_after} NaN rows ({rows_after} valid bars remaining)")
+    else:
+        # Fallback if no timestamp column
+        ohlcv = df[['open', 'high', 'low', 'close', 'volume']]
+
+    # === 7. Apply session filtering for indicator computation ===
+    # We need to filter data BEFORE computing indicators, but builder also filters
+    # So we do it here inline to avoid importing private functions
+    include_pre = 'pre' in (session_toggles or [])
+    include_after = 'after' in (session_toggles or [])
+    session_mode = _determine_session_mode(include_pre, include_after)
+
+    # Filter data for indicator computation (inline, not importing private _filter_session)
+    if session_mode == "all":
+        ohlcv_for_indicators = ohlcv
+    else:
+        # Simple inline filtering logic
+        ny_tz = pytz.timezone('America/New_York')
+
+        # Convert to NY time for filtering
+        df_temp = ohlcv.copy()
+        if df_temp.index.tz is None:
+            df_temp.index = df_temp.index.tz_localize('UTC')
+        df_temp.index = df_temp.index.tz_convert(ny_tz)
+
+        hour = df_temp.index.hour
+        minute = df_temp.index.minute
+
+        if session_mode == "rth":
+            mask = ((hour == 9) & (minute >= 30)) | ((hour >= 10) & (hour < 16))
+        elif session_mode == "premarket_rth":
+            mask = (hour >= 4) & (hour < 16)
+        elif session_mode == "rth_afterhours":
+            mask = ((hour == 9) & (minute >= 30)) | ((hour >= 10) & (hour < 20))
+        elif session_mode == "all_extended":
+            mask = (hour >= 4) & (hour < 20)
+        else:
+            mask = pd.Series([True] * len(ohlcv), index=ohlcv.index)
+
+        ohlcv_for_indicators = ohlcv[mask]
+
+    logger.info(f"📊 Session filter for indicators: {session_mode} ({len(ohlcv)} → {len(ohlcv_for_indicators)} bars)")
+
+    # === 8. Compute indicators on FILTERED data ===
+    from ..services.strategy_indicators import compute_strategy_indicators
+
+    indicators = {}
+
+    # Compute strategy indicators if selected
+    if indicator_strategy and indicator_strategy != "none" and indicator_toggles:
+        try:
+            indicators = compute_strategy_indicators(
+                indicator_strategy,
+                ohlcv_for_indicators,  # Use filtered data!
+                indicator_toggles
+            )
+            logger.info(f"🎨 Computed {len(indicators)} indicators: {list(indicators.keys())}")
+        except Exception as e:
+            logger.error(f"Error computing indicators: {e}")
+            # Continue without indicators
+
+    # === 9. Build chart configuration ===
+    # IMPORTANT: Daily data (D1) has no session concept - always show all data
+    chart_session_mode = "all" if timeframe == "D1" else session_mode
+
+    # Builder will do its own filtering
+    config = PriceChartConfig(
+        show_volume=True,
+        show_grid=True,
+        show_rangeslider=False,
+        session_mode=chart_session_mode,  # Use 'all' for daily data
+        theme_mode="dark",
+        title=f"{symbol} - {timeframe} ({tz_label} Time)",
+        height=680,
+    )
+
+    return ohlcv, indicators, config
+
+
+def _zoomed_chart(query: dict, x_range):
+    inputs = _chart_inputs(query)
+    if inputs is None:
+        return no_update
+    ohlcv, indicators, config = inputs
+    return build_price_chart(ohlcv, indicators, replace(config, x_range=x_range))
+
+
 def register_chart_callbacks(app):
     """Register callbacks for chart interactivity."""
 
+    # Zooming re-aggregates the visible range at full resolution
+    register_zoom_resampling(app, "candlestick-chart", _zoomed_chart)
+
     @app.callback(
         Output("indicator-toggles", "options"),
         Input("indicator-strategy-selector", "value")
@@ -75,6 +250,7 @@ def register_chart_callbacks(app):
 
     @app.callback(
         Output("candlestick-chart", "figure"),
+        Output(zoom_store_id("candlestick-chart"), "data"),
         Input("chart-symbol-selector", "value"),
         Input("chart-refresh-btn", "n_clicks"),
         Input("tf-m1", "n_clicks"),
@@ -107,11 +283,7 @@ def register_chart_callbacks(app):
         5. Returns figure + live data status
         """
         from dash import ctx
-        from ..repositories.candles import (
-            get_candle_data,
-            get_live_candle_data,
-            check_live_data_availability  # This is the actual function used on line 139
-        )
+        from ..repositories.candles import check_live_data_availability
         import dash_bootstrap_components as dbc
         from dash import html
         from datetime import datetime
@@ -195,43 +367,22 @@ def register_chart_callbacks(app):
 
         logger.info(f"   Final: source={new_mode}, trigger={triggered_id}, tf={timeframe}")
 
-        if new_mode == "database":
-            # Active Patterns mode: load from websocket database
-            logger.info(f"   → Loading from DATABASE for {symbol}")
-            df = get_live_candle_data(symbol, timeframe, selected_date, limit=500)
-        else:
-            # Symbol selector mode: load from parquet files
-            logger.info(f"   → Loading from PARQUET for {symbol}")
-
-            # Use days_back for D1, hours for other timeframes
-            if timeframe == "D1":
-                logger.info(f"🔍 CHART CALLBACK: D1 timeframe selected")
-                logger.info(f"   Symbol: {symbol}")
-                logger.info(f"   Days range: {d1_day_range or 180}")
-                logger.info(f"   Reference date: {selected_date}")
-
-                df = get_candle_data(
-                    symbol,
-                    timeframe=timeframe,
-                    days_back=d1_day_range or 180,  # Use UI selection or default
-                    reference_date=selected_date
-                )
-
-                logger.info(f"🔍 CHART CALLBACK: After get_candle_data")
-                logger.info(f"   DataFrame shape: {df.shape if not df.empty else 'EMPTY'}")
-                if not df.empty:
-                    logger.info(f"   Columns: {list(df.columns)}")
-                    logger.info(f"   Index: {df.index[:3].tolist() if len(df) > 0 else 'N/A'}")
-            else:
-                df = get_candle_data(
-                    symbol,
-                    timeframe=timeframe,
-                    hours=24,
-                    reference_date=selected_date
-                )
+        query = {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "timezone": timezone.zone,
+            "tz_label": tz_label,
+            "date": selected_date.isoformat() if selected_date else None,
+            "source": new_mode,
+            "d1_day_range": d1_day_range,
+            "session_toggles": list(session_toggles or []),
+            "indicator_strategy": indicator_strategy,
+            "indicator_toggles": list(indicator_toggles or []),
+        }
+        inputs = _chart_inputs(query)
 
         # === 5. Handle empty data early ===
-        if df.empty:
+        if inputs is None:
             logger.warning(f"⚠️  No data for {symbol} on {selected_date}")
 
             # Use builder to create empty chart
@@ -262,107 +413,10 @@ def register_chart_callbacks(app):
                 font=dict(size=18)
             )
 
-            return fig
-
-        # === 6. Prepare data: Convert to DataFrame with datetime index ===
-        if 'timestamp' in df.columns:
-            # Convert to requested timezone
-            # Note: Parquet data is stored in Berlin time by default
-            if df['timestamp'].dt.tz is None:
-                # Localize naive timestamps as Berlin time (source timezone)
-                df['timestamp'] = df['timestamp'].dt.tz_localize('Europe/Berlin')
-
-            # Now convert to the requested display timezone
-            df['timestamp'] = df['timestamp'].dt.tz_convert(timezone)
-
-            # Set as index for builder
-            ohlcv = df.set_index('timestamp')[['open', 'high', 'low', 'close', 'volume']]
-
-            # CRITICAL: Drop NaN rows (after-hours/pre-market bars with no data)
-            # Plotly Candlestick cannot handle NaN values
-            rows_before = len(ohlcv)
-            ohlcv = ohlcv.dropna(subset=['open', 'high', 'low', 'close'])
-            rows_after = len(ohlcv)
-
-            if rows_before > rows_after:
-                logger.info(f"🧹 Dropped {rows_before - rows_after} NaN rows ({rows_after} valid bars remaining)")
-        else:
-            # Fallback if no timestamp column
-            ohlcv = df[['open', 'high', 'low', 'close', 'volume']]
-
-        # === 7. Apply session filtering for indicator computation ===
-        # We need to filter data BEFORE computing indicators, but builder also filters
-        # So we do it here inline to avoid importing private functions
-        include_pre = 'pre' in (session_toggles or [])
-        include_after = 'after' in (session_toggles or [])
-        session_mode = _determine_session_mode(include_pre, include_after)
-
-        # Filter data for indicator computation (inline, not importing private _filter_session)
-        if session_mode == "all":
-            ohlcv_for_indicators = ohlcv
-        else:
-            # Simple inline filtering logic
-            import pytz
-            ny_tz = pytz.timezone('America/New_York')
-
-            # Convert to NY time for filtering
-            df_temp = ohlcv.copy()
-            if df_temp.index.tz is None:
-                df_temp.index = df_temp.index.tz_localize('UTC')
-            df_temp.index = df_temp.index.tz_convert(ny_tz)
-
-            hour = df_temp.index.hour
-            minute = df_temp.index.minute
-
-            if session_mode == "rth":
-                mask = ((hour == 9) & (minute >= 30)) | ((hour >= 10) & (hour < 16))
-            elif session_mode == "premarket_rth":
-                mask = (hour >= 4) & (hour < 16)
-            elif session_mode == "rth_afterhours":
-                mask = ((hour == 9) & (minute >= 30)) | ((hour >= 10) & (hour < 20))
-            elif session_mode == "all_extended":
-                mask = (hour >= 4) & (hour < 20)
-            else:
-                mask = pd.Series([True] * len(ohlcv), index=ohlcv.index)
-
-            ohlcv_for_indicators = ohlcv[mask]
-
-        logger.info(f"📊 Session filter for indicators: {session_mode} ({len(ohlcv)} → {len(ohlcv_for_indicators)} bars)")
-
-        # === 8. Compute indicators on FILTERED data ===
-        from ..services.strategy_indicators import compute_strategy_indicators
-
-        indicators = {}
-
-        # Compute strategy indicators if selected
-        if indicator_strategy and indicator_strategy != "none" and indicator_toggles:
-            try:
-                indicators = compute_strategy_indicators(
-                    indicator_strategy,
-                    ohlcv_for_indicators,  # Use filtered data!
-                    indicator_toggles
-                )
-                logger.info(f"🎨 Computed {len(indicators)} indicators: {list(indicators.keys())}")
-            except Exception as e:
-                logger.error(f"Error computing indicators: {e}")
-                # Continue without indicators
-
-        # === 9. Build chart configuration ===
-        # IMPORTANT: Daily data (D1) has no session concept - always show all data
-        chart_session_mode = "all" if timeframe == "D1" else session_mode
-
-        # Builder will do its own filtering
-        config = PriceChartConfig(
-            show_volume=True,
-            show_grid=True,
-            show_rangeslider=False,
-            session_mode=chart_session_mode,  # Use 'all' for daily data
-            theme_mode="dark",
-            title=f"{symbol} - {timeframe} ({tz_label} Time)",
-            height=680,
-        )
+            return fig, None
 
         # === 10. Build chart (visualization layer) ===
+        ohlcv, indicators, config = inputs
         logger.info(f"🎨 Building chart with config: {config.session_mode}, volume={config.show_volume}")
         fig = build_price_chart(ohlcv, indicators, config)  # Builder filters OHLCV
 
@@ -370,7 +424,7 @@ def register_chart_callbacks(app):
         # TODO: Add pattern markers from get_recent_patterns()
         # This would be added as annotations after builder returns
 
-        return fig
+        return fig, query
 
     @app.callback(
         Output("pattern-details", "children"),
@@ -16,11 +16,13 @@ Data Flow:
 5. Row count MUST stay identical across TZ conversion
 """
 
-from dash import Input, Output, State, callback_context
+from dash import Input, Output, State, callback_context, no_update
+from dataclasses import dataclass
 import plotly.graph_objs as go
 import pandas as pd
 import logging
 from datetime import date
+from typing import Optional
 
 from axiom_bt.intraday import IntradayStore
 from trading_dashboard.resolvers.timeframe_resolver import BacktestingTimeframeResolver
@@ -37,19 +39,124 @@ from trading_dashboard.utils.date_filtering import (
     apply_d1_window,
     apply_intraday_exact_day,
 )
+from trading_dashboard.utils.chart_resampling import register_zoom_resampling, zoom_store_id
 from visualization.plotly import build_price_chart, PriceChartConfig
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _ChartFrame:
+    """Bars of one backtesting chart query after each filtering stage."""
+
+    df: pd.DataFrame  # after date filtering (market TZ)
+    df_processed: pd.DataFrame  # after display preprocessing
+    rows_before: int  # rows loaded before date filtering
+    meta: Optional[dict] = None
+    requested_date: Optional[date] = None
+    effective_date: Optional[pd.Timestamp] = None
+    date_filter_mode: str = "NONE"
+
+
 def register_charts_backtesting_callbacks(app):
     """Register all callbacks for Backtesting Charts tab."""
 
     # Initialize resolver (replaces IntradayStore)
     resolver = BacktestingTimeframeResolver()
 
+    def _load_chart_frame(query: dict) -> "_ChartFrame":
+        """Resolver load, date filtering and display preprocessing for one chart query."""
+        symbol, timeframe_str = query["symbol"], query["timeframe"]
+
+        # === LOAD DATA VIA RESOLVER ===
+        # Resolver routes: M1/M5/M15→IntradayStore, D1→Universe, H1→Resample
+        df = resolver.load(symbol, timeframe=timeframe_str, tz="America/New_York")
+
+        # Track initial row count
+        frame = _ChartFrame(df=df, df_processed=df, rows_before=len(df))
+        if df.empty:
+            return frame
+
+        # === APPLY DATE FILTERING (P0.2) ===
+        # Convert selected_date string to date object if provided
+        if query["date"]:
+            frame.requested_date = pd.to_datetime(query["date"]).date()
+
+        # Calculate effective date (with clamping/rollback)
+        frame.effective_date, _ = calculate_effective_date(frame.requested_date, df)
+
+        # Apply timeframe-specific filtering
+        window = query["window"]
+        if timeframe_str == "D1":
+            # D1: Window-based filtering
+            df = apply_d1_window(df, frame.effective_date, window=window or "12M")
+            frame.date_filter_mode = f"D1_WINDOW_{window or '12M'}"
+        else:
+            # Intraday (M1/M5/M15/H1): Exact-day filtering
+            if frame.requested_date:
+                df = apply_intraday_exact_day(df, frame.effective_date, market_tz="America/New_York")
+                frame.date_filter_mode = "INTRADAY_EXACT_DAY"
+            else:
+                # No date filter - show recent data (last N days)
+                frame.date_filter_mode = "INTRADAY_RECENT"
+
+        frame.df = frame.df_processed = df
+        if df.empty:
+            return frame
+
+        # === USE HELPER FOR ALL TRANSFORMATIONS ===
+        # Note: ref_date=None here because we already applied date filtering above
+        frame.df_processed, frame.meta = preprocess_for_chart(
+            df=df,
+            source="BACKTEST_PARQUET",
+            ref_date=None,  # Already filtered above
+            display_tz=query["display_tz"],
+            market_tz="America/New_York"
+        )
+        return frame
+
+    def _backtesting_chart(frame: "_ChartFrame", query: dict, x_range=None):
+        symbol, timeframe_str = query["symbol"], query["timeframe"]
+        effective_date = frame.effective_date
+
+        # === BUILD CHART ===
+        # For D1 (EOD data), use 'all' session mode since daily bars don't have intraday timestamps
+        # For intraday (M1/M5/M15/H1), use 'rth' to filter regular trading hours
+        session_mode = "all" if timeframe_str == "D1" else "rth"
+
+        # Calculate uirevision for persistent zoom
+        # Zoom resets only when these change: symbol, tf, effective_date, window, display_tz, sessions
+        session_hash = f"{query['sessions']}"
+        window = query["window"]
+        uirevision = f"{symbol}|{timeframe_str}|{effective_date.date() if effective_date else 'none'}|{window if timeframe_str == 'D1' else 'na'}|{query['display_tz']}|{session_hash}"
+
+        config = PriceChartConfig(
+            title=f"{symbol} {timeframe_str} - Backtesting",
+            show_volume=True,
+            session_mode=session_mode,  # Critical: D1 must use 'all' to avoid empty charts
+            show_rangeslider=(timeframe_str == "D1"),  # Rangeslider only for D1
+            x_range=x_range,
+        )
+        fig = build_price_chart(frame.df_processed, indicators=[], config=config)
+        # Apply uirevision and dragmode to layout
+        fig.update_layout(
+            uirevision=uirevision,  # Persistent zoom state
+            dragmode='zoom',  # Default interaction mode
+        )
+        return fig
+
+    def _zoomed_backtesting_chart(query: dict, x_range):
+        frame = _load_chart_frame(query)
+        if len(frame.df_processed) == 0:
+            return no_update
+        return _backtesting_chart(frame, query, x_range)
+
+    # Zooming re-aggregates the visible range at full resolution
+    register_zoom_resampling(app, "bt-candlestick-chart", _zoomed_backtesting_chart)
+
     @app.callback(
         Output("bt-candlestick-chart", "figure"),
+        Output(zoom_store_id("bt-candlestick-chart"), "data"),
         [
             Input("bt-symbol-selector", "value"),
             Input("bt-tf-m1", "n_clicks"),
@@ -109,17 +216,21 @@ def register_charts_backtesting_callbacks(app):
                 x=0.5, y=0.5, showarrow=False,
                 font=dict(size=16, color="orange")
             )
-            return empty_fig
+            return empty_fig, None
 
         try:
-            # === LOAD DATA VIA RESOLVER ===
-            # Resolver routes: M1/M5/M15→IntradayStore, D1→Universe, H1→Resample
-            df = resolver.load(symbol, timeframe=timeframe_str, tz="America/New_York")
-
-            # Track initial row count
-            rows_before = len(df)
-
-            if df.empty:
+            query = {
+                "symbol": symbol,
+                "timeframe": timeframe_str,
+                "date": selected_date,
+                "window": window,
+                "display_tz": display_tz,
+                "sessions": list(session_toggles or []),
+            }
+            frame = _load_chart_frame(query)
+            df = frame.df
+
+            if frame.rows_before == 0:
                 # === EMPTY STATE WITH CLEAR MESSAGE ===
                 empty_fig = go.Figure()
                 empty_fig.add_annotation(
@@ -135,53 +246,19 @@ def register_charts_backtesting_callbacks(app):
                     f"reason=NO_ROWS rows=0"
                 )
 
-                return empty_fig
-
-            # === APPLY DATE FILTERING (P0.2) ===
-            # Convert selected_date string to date object if provided
-            requested_date = None
-            if selected_date:
-                requested_date = pd.to_datetime(selected_date).date()
-
-            # Calculate effective date (with clamping/rollback)
-            effective_date, date_reason = calculate_effective_date(requested_date, df)
-
-            # Apply timeframe-specific filtering
-            date_filter_mode = "NONE"
-            if timeframe_str == "D1":
-                # D1: Window-based filtering
-                df = apply_d1_window(df, effective_date, window=window or "12M")
-                date_filter_mode = f"D1_WINDOW_{window or '12M'}"
-            else:
-                # Intraday (M1/M5/M15/H1): Exact-day filtering
-                if requested_date:
-                    df = apply_intraday_exact_day(df, effective_date, market_tz="America/New_York")
-                    date_filter_mode = "INTRADAY_EXACT_DAY"
-                else:
-                    # No date filter - show recent data (last N days)
-                    date_filter_mode = "INTRADAY_RECENT"
+                return empty_fig, None
 
             # Check if filtering removed all data
             if df.empty:
                 empty_fig = go.Figure()
                 empty_fig.add_annotation(
-                    text=f"📭 No data for {symbol} {timeframe_str} on {effective_date.date()}<br>" +
-                         f"<sub>Date filter removed all rows | Available range: {rows_before} rows total</sub>",
+                    text=f"📭 No data for {symbol} {timeframe_str} on {frame.effective_date.date()}<br>" +
+                         f"<sub>Date filter removed all rows | Available range: {frame.rows_before} rows total</sub>",
                     xref="paper", yref="paper",
                     x=0.5, y=0.5, showarrow=False,
                     font=dict(size=16)
                 )
-                return empty_fig
-
-            # === USE HELPER FOR ALL TRANSFORMATIONS ===
-            # Note: ref_date=None here because we already applied date filtering above
-            df_processed, meta = preprocess_for_chart(
-                df=df,
-                source="BACKTEST_PARQUET",
-                ref_date=None,  # Already filtered above
-                display_tz=display_tz,
-                market_tz="America/New_York"
-            )
+                return empty_fig, None
 
             # === BUILD AND LOG COMPREHENSIVE CHART METADATA ===
             # Determine data path based on timeframe
@@ -190,6 +267,8 @@ def register_charts_backtesting_callbacks(app):
             else:
                 data_path = f"artifacts/data_{timeframe_str.lower()}/{symbol}.parquet"
 
+            requested_date = frame.requested_date
+            effective_date = frame.effective_date
             chart_meta = build_chart_meta(
                 source="BACKTEST_PARQUET",
                 symbol=symbol,
@@ -197,10 +276,10 @@ def register_charts_backtesting_callbacks(app):
                 requested_date=str(requested_date) if requested_date else None,
                 effective_date=str(effective_date.date()) if effective_date else None,
                 window_mode=window if timeframe_str == "D1" else None,
-                rows_before=rows_before,
+                rows_before=frame.rows_before,
                 rows_after=len(df),  # After date filtering
-                dropped_rows=rows_before - len(df),
-                date_filter_mode=date_filter_mode,
+                dropped_rows=frame.rows_before - len(df),
+                date_filter_mode=frame.date_filter_mode,
                 min_ts=df.index.min() if len(df) > 0 else None,
                 max_ts=df.index.max() if len(df) > 0 else None,
                 market_tz="America/New_York",
@@ -211,44 +290,19 @@ def register_charts_backtesting_callbacks(app):
 
             log_chart_meta(chart_meta)
 
-            if len(df_processed) == 0:
+            if len(frame.df_processed) == 0:
                 # Empty after preprocessing
                 empty_fig = go.Figure()
                 empty_fig.add_annotation(
                     text=f"📭 No data after filters for {symbol} {timeframe_str}<br>" +
-                         f"<sub>Date filter may have removed all rows | rows_after={meta['rows_after']}</sub>",
+                         f"<sub>Date filter may have removed all rows | rows_after={frame.meta['rows_after']}</sub>",
                     xref="paper", yref="paper",
                     x=0.5, y=0.5, showarrow=False,
                     font=dict(size=16)
                 )
-                return empty_fig
-
-            # === BUILD CHART ===
-            # For D1 (EOD data), use 'all' session mode since daily bars don't have intraday timestamps
-            # For intraday (M1/M5/M15/H1), use 'rth' to filter regular trading hours
-            session_mode = "all" if timeframe_str == "D1" else "rth"
-
-            # Calculate uirevision for persistent zoom
-            # Zoom resets only when these change: symbol, tf, effective_date, window, display_tz, sessions
-            session_hash = f"{session_toggles or []}"
-            uirevision = f"{symbol}|{timeframe_str}|{effective_date.date() if effective_date else 'none'}|{window if timeframe_str == 'D1' else 'na'}|{display_tz}|{session_hash}"
-
-            config = PriceChartConfig(
-                title=f"{symbol} {timeframe_str} - Backtesting",
-                show_volume=True,
-                session_mode=session_mode,  # Critical: D1 must use 'all' to avoid empty charts
-                show_rangeslider=(timeframe_str == "D1"),  # Rangeslider only for D1
-            )
-
-            fig = build_price_chart(df_processed, indicators=[], config=config)
-
-            # Apply uirevision and dragmode to layout
-            fig.update_layout(
-                uirevision=uirevision,  # Persistent zoom state
-                dragmode='zoom',  # Default interaction mode
-            )
+                return empty_fig, None
 
-            return fig
+            return _backtesting_chart(frame, query), query
 
         except Exception as e:
             # Generate error_id for correlation
@@ -288,7 +342,7 @@ def register_charts_backtesting_callbacks(app):
                 font=dict(size=16, color="red")
             )
 
-            return error_fig
+            return error_fig, None
 
 
     @app.callback(
@@ -17,13 +17,14 @@ Data Flow:
 6. Row count MUST stay identical across TZ conversion
 """
 
-from dash import Input, Output, State, callback_context
+from dash import Input, Output, State, callback_context, no_update
 import plotly.graph_objs as go
 import pandas as pd
 import logging
 
 from trading_dashboard.repositories.live_candles import LiveCandlesRepository
 from trading_dashboard.utils.chart_preprocess import preprocess_for_chart
+from trading_dashboard.utils.chart_resampling import register_zoom_resampling, zoom_store_id
 from visualization.plotly import build_price_chart, PriceChartConfig
 
 logger = logging.getLogger(__name__)
@@ -35,11 +36,30 @@ def register_charts_live_callbacks(app):
     # Initialize repository
     live_repo = LiveCandlesRepository()
 
+    def _live_chart(df, symbol, timeframe, x_range=None):
+        config = PriceChartConfig(
+            title=f"{symbol} {timeframe} - Live",
+            show_volume=True,
+            x_range=x_range,
+        )
+        # Chart builder expects data with timestamp index
+        return build_price_chart(df, indicators=[], config=config)
+
+    def _zoomed_live_chart(query, x_range):
+        df = live_repo.load_candles(symbol=query["symbol"], timeframe=query["timeframe"], limit=500)
+        if df.empty:
+            return no_update
+        return _live_chart(df, query["symbol"], query["timeframe"], x_range)
+
+    # Zooming re-aggregates the visible range at full resolution
+    register_zoom_resampling(app, "live-candlestick-chart", _zoomed_live_chart)
+
     @app.callback(
         [
             Output("live-candlestick-chart", "figure"),
             Output("live-freshness-text", "children"),
             Output("live-freshness-badge", "children"),
+            Output(zoom_store_id("live-candlestick-chart"), "data"),
         ],
         [
             Input("live-symbol-selector", "value"),
@@ -87,7 +107,7 @@ def register_charts_live_callbacks(app):
                 x=0.5, y=0.5, showarrow=False,
                 font=dict(size=16, color="orange")
             )
-            return empty_fig, "No symbol", "⚠️"
+            return empty_fig, "No symbol", "⚠️", None
 
         # === CRITICAL LOGGING ===
         logger.info(
@@ -120,7 +140,7 @@ def register_charts_live_callbacks(app):
                     f"rows=0"
                 )
 
-                return empty_fig, "No data", "🔴"
+                return empty_fig, "No data", "🔴", None
 
             # === USE HELPER FOR ALL TRANSFORMATIONS ===
             df_processed, meta = preprocess_for_chart(
@@ -144,7 +164,7 @@ def register_charts_live_callbacks(app):
                     x=0.5, y=0.5, showarrow=False,
                     font=dict(size=16)
                 )
-                return empty_fig, "No valid data", "🔴"
+                return empty_fig, "No valid data", "🔴", None
 
             # === GET FRESHNESS ===
             freshness = live_repo.get_freshness(symbol, timeframe)
@@ -168,13 +188,7 @@ def register_charts_live_callbacks(app):
                 fresh_text = f"{last_ts.strftime('%H:%M')} ({int(age_minutes)}m ago)"
 
             # === BUILD CHART ===
-            config = PriceChartConfig(
-                title=f"{symbol} {timeframe} - Live",
-                show_volume=True,
-            )
-
-            # Chart builder expects data with timestamp index
-            fig = build_price_chart(df, indicators=[], config=config)
+            fig = _live_chart(df, symbol, timeframe)
 
             # === FINAL LOGGING ===
             first_ts = df.index[0] if len(df) > 0 else None
@@ -186,7 +200,7 @@ def register_charts_live_callbacks(app):
                 f"market_tz=America/New_York display_tz={display_tz}"
             )
 
-            return fig, fresh_text, badge
+            return fig, fresh_text, badge, {"symbol": symbol, "timeframe": timeframe}
 
         except Exception as e:
             logger.error(f"Error loading live chart: {e}", exc_info=True)
@@ -200,7 +214,7 @@ def register_charts_live_callbacks(app):
                 font=dict(size=16, color="red")
             )
 
-            return error_fig, "Error", "❌"
+            return error_fig, "Error", "❌", None
 
 
     @app.callback(
@@ -1,5 +1,8 @@
 """
 Data freshness callback - shows M1/M5 data age with colored status indicators.
+
+Last timestamps come from the market data index (parquet footer statistics),
+so no bar data is loaded.
 """
 from dash import Input, Output
 import logging
@@ -30,10 +33,10 @@ def register_freshness_callback(app):
         Returns:
             Tuple of (m1_text, m1_badge, m1_style, m5_text, m5_badge, m5_style)
         """
-        from datetime import datetime, timezone
         import pandas as pd
-        from ..repositories.candles import get_candle_data
-        from core.settings.intraday_paths import get_intraday_parquet_path
+        from ..services.market_data_index import get_market_data_index
+
+        index = get_market_data_index()
 
         def check_freshness(timeframe):
             """Check freshness of data for a timeframe.
@@ -42,28 +45,32 @@ def register_freshness_callback(app):
                 (text, badge, style) tuple
             """
             try:
-                # Get file path
-                file_path = get_intraday_parquet_path(symbol, timeframe)
+                # Footer metadata (one stat; footer re-read only if the file changed)
+                meta = index.get(symbol, timeframe, validate=True)
 
-                if not file_path.exists():
+                if meta is None:
                     return (
                         "No file",
                         "🔴",
                         {"fontSize": "1rem", "marginLeft": "5px"}
                     )
 
-                # Load data to get last timestamp
-                df = pd.read_parquet(file_path)
-
-                if df.empty:
+                if meta.rows == 0:
                     return (
                         "Empty file",
                         "🔴",
                         {"fontSize": "1rem", "marginLeft": "5px"}
                     )
 
+                if meta.last_ts is None:
+                    return (
+                        "No timestamps",
+                        "⚠️",
+                        {"fontSize": "1rem", "marginLeft": "5px"}
+                    )
+
                 # Get last timestamp
-                last_ts = df.index[-1]
+                last_ts = meta.last_ts
 
                 # Calculate age
                 now = pd.Timestamp.now(tz=last_ts.tz if hasattr(last_ts, 'tz') and last_ts.tz else None)
@@ -4,47 +4,41 @@ from pathlib import Path
 from dash import Input, Output, State, html, dcc, no_update
 import dash_bootstrap_components as dbc
 
-from trading_dashboard.repositories.trade_repository import TradeRepository
+from trading_dashboard.repositories.trade_repository import ArtifactMissing, TradeRepository
+from trading_dashboard.services.run_index import get_run_index
 from trading_dashboard.services.trade_detail_service import TradeDetailService
 from trading_dashboard.plots.trade_inspector_plot import build_trade_chart
 from trading_dashboard.config import BACKTESTS_DIR
+from trading_dashboard.utils.chart_resampling import register_zoom_resampling, zoom_store_id
 
 
 ARTIFACTS_ROOT = Path(BACKTESTS_DIR)
 
 
 def _list_runs() -> list[dict]:
+    """Runs with a trades artifact (any run directory), most recent first."""
     if not ARTIFACTS_ROOT.exists():
         return []
 
-    def _started_at(p: Path) -> float:
-        meta = p / "run_meta.json"
-        if meta.exists():
-            try:
-                import json
-                data = json.loads(meta.read_text())
-                ts = data.get("started_at") or data.get("started_at_utc")
-                if ts:
-                    return pd.to_datetime(ts, utc=True, errors="coerce").timestamp()
-            except Exception:
-                pass
-        return p.stat().st_mtime
-
-    candidates = []
-    for path in ARTIFACTS_ROOT.iterdir():
-        if not path.is_dir():
-            continue
-        if (path / "trades.csv").exists():
-            candidates.append((path, _started_at(path)))
-
-    candidates.sort(key=lambda x: x[1], reverse=True)
-    return [{"label": p.name, "value": p.name} for p, _ in candidates]
+    index = get_run_index(ARTIFACTS_ROOT)
+    index.refresh()
+    runs = index.query(has_trades=True, include_skipped=True)
+    return [{"label": run.run_id, "value": run.run_id} for run in runs]
 
 
 def register_trade_inspector_callbacks(app):
     repo = TradeRepository(artifacts_root=ARTIFACTS_ROOT)
     service = TradeDetailService(repo)
 
+    def _trade_chart(query, x_range=None):
+        detail = service.get_trade_detail(query["run_id"], int(query["trade_id"]))
+        if detail is None:
+            return {}
+        return build_trade_chart(detail.trade_row, detail.exec_bars, x_range=x_range)
+
+    # Zooming re-aggregates the visible range at full resolution
+    register_zoom_resampling(app, "ti-trade-chart", _trade_chart)
+
     @app.callback(
         Output("ti-run-dropdown", "options"),
         Input("main-tabs", "active_tab"),
@@ -61,20 +55,18 @@ def register_trade_inspector_callbacks(app):
     def _load_trades(run_id):
         if not run_id:
             return []
-        trades = repo.load_trades(run_id)
-        if trades is None or trades.empty:
+        # Loads the run session the trade selections below are served from
+        try:
+            return service.trade_options(run_id)
+        except ArtifactMissing:
             return []
-        options = []
-        for idx, row in trades.iterrows():
-            label = f"#{idx} {row.get('symbol', '')} {row.get('entry_ts', '')} {row.get('side', '')} PnL={row.get('pnl', '')}"
-            options.append({"label": label, "value": idx})
-        return options
 
     @app.callback(
         Output("ti-trade-chart", "figure"),
         Output("ti-trade-summary", "children"),
         Output("ti-evidence-status", "children"),
         Output("ti-resize-request", "data"),
+        Output(zoom_store_id("ti-trade-chart"), "data"),
         Input("ti-run-dropdown", "value"),
         Input("ti-trade-dropdown", "value"),
         State("ti-resize-request", "data"),
@@ -84,13 +76,15 @@ def register_trade_inspector_callbacks(app):
             resize_state = {"req": 0}
 
         if not run_id or trade_id is None:
-            return {}, html.Div("Select a run and trade"), "", resize_state
+            return {}, html.Div("Select a run and trade"), "", resize_state, None
 
         detail = service.get_trade_detail(run_id, int(trade_id))
         if detail is None:
-            return {}, html.Div("Trade not found"), "", resize_state
+            return {}, html.Div("Trade not found"), "", resize_state, None
 
         fig = build_trade_chart(detail.trade_row, detail.exec_bars)
+        # Zoom rebuilds reload the trade from the service's run sessions
+        zoom_query = {"run_id": run_id, "trade_id": int(trade_id)}
         summary = dbc.Card(
             dbc.CardBody(
                 [
@@ -116,7 +110,7 @@ def register_trade_inspector_callbacks(app):
             )
 
         new_req = {"req": int(resize_state.get("req", 0)) + 1}
-        return fig, summary, evidence_status, new_req
+        return fig, summary, evidence_status, new_req, zoom_query
 
     # One-shot clientside resize per selection
     app.clientside_callback(
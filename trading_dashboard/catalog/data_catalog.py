@@ -13,7 +13,7 @@ from typing import Optional, Dict, List, Tuple
 import pandas as pd
 
 from trading_dashboard.repositories.daily_universe import DailyUniverseRepository
-from trading_dashboard.utils.parquet_meta_reader import read_parquet_metadata_fast
+from trading_dashboard.services.market_data_index import get_market_data_index
 from axiom_bt.intraday import IntradayStore
 from axiom_bt.intraday import DATA_M1, DATA_M5, DATA_M15
 
@@ -56,6 +56,22 @@ class BacktestingDataCatalog:
         """
         self.daily_repo = DailyUniverseRepository(universe_path=universe_path)
 
+    @staticmethod
+    def data_signature(symbol: str, validate: bool = False) -> Tuple:
+        """
+        (timeframe, mtime_ns, size) of the symbol's intraday files.
+
+        Changes whenever one of them is written, so cached availability can
+        be validated without reading any file. ``validate`` stats the files
+        instead of trusting the last background refresh.
+        """
+        symbol = symbol.strip().upper()
+        signature = []
+        for tf, path_base in [('M1', DATA_M1), ('M5', DATA_M5), ('M15', DATA_M15)]:
+            entry = get_market_data_index(path_base.parent).get(symbol, tf, validate=validate)
+            signature.append((tf, entry.mtime_ns, entry.size) if entry else (tf, None, None))
+        return tuple(signature)
+
     def get_symbol_info(self, symbol: str) -> Dict[str, TimeframeInfo]:
         """
         Get complete availability info for a symbol.
@@ -91,14 +107,11 @@ class BacktestingDataCatalog:
         """
         Check intraday parquet file availability.
 
-        PERFORMANCE: Uses PyArrow metadata reads (no DataFrame load).
+        PERFORMANCE: Footer statistics from the market data index (no file I/O).
         """
-        file_path = path_base / f"{symbol}.parquet"
-
-        # Fast metadata read (O(1), no DataFrame)
-        meta = read_parquet_metadata_fast(file_path)
+        meta = get_market_data_index(path_base.parent).get(symbol, timeframe)
 
-        if not meta.exists:
+        if meta is None:
             return TimeframeInfo(exists=False)
 
         if meta.rows == 0:
@@ -15,6 +15,8 @@ import plotly.express as px
 import pandas as pd
 import yaml
 
+from visualization.downsample import DEFAULT_MAX_POINTS, downsample_line
+
 from ..repositories.backtests import list_backtests
 from ..ui_ids import Nav, BT, SSOT, RUN
 from ..components.row_inspector import (
@@ -280,12 +282,16 @@ def create_backtest_detail(
         df_chart["ts"] = pd.to_datetime(df_chart["ts"], errors="coerce")
         df_chart = df_chart.dropna(subset=["ts"]).sort_values("ts")
 
-        equity_fig = px.line(df_chart, x="ts", y="equity", title="Equity curve")
+        # LTTB keeps the curve's shape with a bounded payload on long runs
+        df_chart = df_chart.set_index("ts")
+        equity_points = downsample_line(df_chart["equity"], DEFAULT_MAX_POINTS).reset_index()
+        equity_fig = px.line(equity_points, x="ts", y="equity", title="Equity curve")
         equity_fig.update_layout(margin=dict(l=40, r=20, t=40, b=40))
 
         dd_fig = None
         if "drawdown_pct" in df_chart.columns:
-            dd_fig = px.line(df_chart, x="ts", y="drawdown_pct", title="Drawdown (pct)")
+            dd_points = downsample_line(df_chart["drawdown_pct"], DEFAULT_MAX_POINTS).reset_index()
+            dd_fig = px.line(dd_points, x="ts", y="drawdown_pct", title="Drawdown (pct)")
             dd_fig.update_layout(margin=dict(l=40, r=20, t=40, b=40))
 
         charts_row_children = [
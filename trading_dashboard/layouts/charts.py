@@ -7,6 +7,7 @@ from datetime import datetime
 
 from ..components.candlestick import get_chart_config
 from ..repositories import get_available_symbols
+from ..utils.chart_resampling import zoom_store
 
 
 def create_charts_layout():
@@ -249,7 +250,8 @@ def create_charts_layout():
                                 style={"height": "680px"}
                             )
                         ]
-                    )
+                    ),
+                    zoom_store("candlestick-chart"),
                 ])
             ], width=10)
         ])
@@ -14,6 +14,8 @@ from dash import html, dcc
 import dash_bootstrap_components as dbc
 from datetime import datetime, date
 
+from trading_dashboard.utils.chart_resampling import zoom_store
+
 from trading_dashboard.repositories import get_available_symbols
 
 
@@ -201,7 +203,8 @@ def create_charts_backtesting_layout():
                                     'displaylogo': False,  # Remove Plotly logo
                                     'displayModeBar': True,  # Show mode bar with zoom tools
                                 }
-                            )
+                            ),
+                            zoom_store("bt-candlestick-chart"),
                         ]
                     )
                 ])
@@ -13,6 +13,8 @@ CRITICAL ARCHITECTURE RULE:
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 from datetime import datetime
+
+from trading_dashboard.utils.chart_resampling import zoom_store
 import os
 
 def create_charts_live_layout():
@@ -136,7 +138,8 @@ def create_charts_live_layout():
                             style={"height": "700px"}
                         )
                     ]
-                )
+                ),
+                zoom_store("live-candlestick-chart"),
             ], width=10),
         ]),
     ], style={"padding": "20px"})
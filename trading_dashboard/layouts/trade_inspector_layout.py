@@ -3,6 +3,8 @@ from __future__ import annotations
 from dash import html, dcc
 import dash_bootstrap_components as dbc
 
+from trading_dashboard.utils.chart_resampling import zoom_store
+
 
 def get_trade_inspector_content():
     return html.Div(
@@ -21,6 +23,7 @@ def get_trade_inspector_content():
                         html.Div(id="ti-trades-table"),
                         dcc.Store(id="ti-resize-request", data={"req": 0}),
                         dcc.Store(id="ti-resize-ack", data={"req_seen": 0}),
+                        zoom_store("ti-trade-chart"),
                     ],
                     width=4,
                 ),
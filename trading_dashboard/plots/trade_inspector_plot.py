@@ -3,8 +3,22 @@ from __future__ import annotations
 import pandas as pd
 import plotly.graph_objects as go
 
+from visualization.downsample import DEFAULT_MAX_POINTS, XRange, downsample_ohlcv, slice_x_range
 
-def build_trade_chart(trade_row: pd.Series, exec_bars: pd.DataFrame | None) -> go.Figure:
+
+def build_trade_chart(
+    trade_row: pd.Series,
+    exec_bars: pd.DataFrame | None,
+    max_points: int | None = DEFAULT_MAX_POINTS,
+    x_range: XRange | None = None,
+) -> go.Figure:
+    """
+    Candles around one trade with exact entry/exit markers and SL/TP lines.
+
+    Bars are OHLC-aggregated to ``max_points`` candles (None = all bars);
+    ``x_range`` restricts them to a zoomed window. Markers are never
+    downsampled.
+    """
     fig = go.Figure()
     if exec_bars is None or exec_bars.empty:
         fig.update_layout(title="No bars available for proof", template="plotly_dark")
@@ -14,6 +28,11 @@ def build_trade_chart(trade_row: pd.Series, exec_bars: pd.DataFrame | None) -> g
     if "timestamp" in df.columns:
         df.index = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
     df = df.sort_index()
+    df = slice_x_range(df, x_range)
+    if max_points is not None:
+        df = downsample_ohlcv(
+            df[[c for c in ("open", "high", "low", "close", "volume") if c in df.columns]], max_points
+        )
 
     fig.add_trace(
         go.Candlestick(
@@ -65,7 +84,7 @@ def build_trade_chart(trade_row: pd.Series, exec_bars: pd.DataFrame | None) -> g
         xaxis=dict(
             fixedrange=False,  # Enable zoom/pan on x-axis
             rangeslider=dict(visible=False),
-            autorange=True,
+            autorange=x_range is None,
             rangebreaks=[
                 dict(bounds=["sat", "mon"]),  # Hide weekends
                 dict(bounds=[16, 9.5], pattern="hour"),  # Hide non-RTH (4pm-9:30am ET)
@@ -90,4 +109,8 @@ def build_trade_chart(trade_row: pd.Series, exec_bars: pd.DataFrame | None) -> g
         updatemenus=[],
     )
 
+    if x_range is not None:
+        # Keep the zoomed window in view (bars outside it were not sent)
+        fig.update_xaxes(range=[str(pd.Timestamp(ts).tz_localize(None)) for ts in x_range])
+
     return fig
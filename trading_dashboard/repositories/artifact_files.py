@@ -0,0 +1,25 @@
+"""Tabular artifact reading for dashboard views.
+
+Runs written with ``artifact_format=parquet`` store ``<stem>.parquet``;
+older runs store ``<stem>.csv``. Lookup and reading are shared with the
+pipeline (axiom_bt.pipeline.artifacts); dashboard views additionally treat
+an unreadable artifact as empty.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from axiom_bt.pipeline.artifacts import read_frame
+
+TABULAR_SUFFIXES = (".parquet", ".csv")
+
+
+def read_tabular_artifact(path: Path) -> pd.DataFrame:
+    """Read a CSV/Parquet artifact by suffix; empty frame if unreadable."""
+    try:
+        return read_frame(path)
+    except (pd.errors.EmptyDataError, pd.errors.ParserError, OSError, ValueError):
+        return pd.DataFrame()
@@ -17,6 +17,8 @@ from typing import Any, Dict, List, Optional
 import pandas as pd
 
 from ..config import BACKTESTS_DIR
+from axiom_bt.pipeline.artifacts import find_tabular_artifact
+from .artifact_files import TABULAR_SUFFIXES, read_tabular_artifact
 
 
 @dataclass
@@ -99,12 +101,20 @@ def _iter_run_logs_legacy() -> List[BacktestRun]:
     return runs
 
 
-def _iter_run_logs() -> List[BacktestRun]:
+def _iter_run_logs(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    strategy: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[BacktestRun]:
     """
-    Iterate over all backtest runs using RunDiscoveryService.
+    Iterate over backtest runs using the shared run index (RunDiscoveryService).
 
-    New-pipeline runs (run_meta.json/run_manifest.json) now visible.
-    Falls back to legacy discovery if USE_LEGACY_DISCOVERY=1.
+    New-pipeline runs (run_meta.json/run_manifest.json) now visible. Filters,
+    ordering (started_at descending) and pagination run in SQL.
+    Falls back to legacy discovery if USE_LEGACY_DISCOVERY=1 (filters and
+    pagination are then applied by list_backtests).
     """
 
     # Legacy fallback for emergency rollback
@@ -114,11 +124,18 @@ def _iter_run_logs() -> List[BacktestRun]:
         logger.warning("⚠️ Using LEGACY run discovery (USE_LEGACY_DISCOVERY=1)")
         return _iter_run_logs_legacy()
 
-    # Use new RunDiscoveryService (manifest-based discovery)
-    from trading_dashboard.services.run_discovery_service import RunDiscoveryService
+    # Manifest-based discovery, served from the incremental run index
+    from trading_dashboard.services.run_index import get_run_index
 
-    service = RunDiscoveryService()
-    summaries = service.discover()
+    index = get_run_index(BACKTESTS_DIR)
+    index.refresh()
+    summaries = index.query(
+        strategy=strategy,
+        start_date=start_date,
+        end_date=end_date,
+        limit=limit,
+        offset=offset,
+    )
 
     # Convert BacktestRunSummary to BacktestRun for compatibility
     runs: List[BacktestRun] = []
@@ -138,33 +155,42 @@ def _iter_run_logs() -> List[BacktestRun]:
     return runs
 
 
+_BACKTEST_COLUMNS = [
+    "run_name",
+    "created_at",
+    "finished_at",
+    "duration_seconds",
+    "strategy",
+    "timeframe",
+    "symbols",
+    "status",
+    "created_at_display",
+]
+
+
 def list_backtests(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     strategy: Optional[str] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
 ) -> pd.DataFrame:
     """Return a DataFrame of backtest runs for the dashboard.
 
+    Most recent first; ``limit``/``offset`` page through the filtered runs.
+
     Columns:
         run_name, created_at, finished_at, duration_seconds, strategy,
         timeframe, symbols, status, created_at_display
     """
 
-    runs = _iter_run_logs()
+    legacy = os.getenv("USE_LEGACY_DISCOVERY", "0") == "1"
+    if legacy:
+        runs = _iter_run_logs()
+    else:
+        runs = _iter_run_logs(start_date, end_date, strategy, limit, offset)
     if not runs:
-        return pd.DataFrame(
-            columns=[
-                "run_name",
-                "created_at",
-                "finished_at",
-                "duration_seconds",
-                "strategy",
-                "timeframe",
-                "symbols",
-                "status",
-                "created_at_display",
-            ]
-        )
+        return pd.DataFrame(columns=_BACKTEST_COLUMNS)
 
     records: List[Dict[str, Any]] = []
     for run in runs:
@@ -195,23 +221,13 @@ def list_backtests(
         )
 
     if not records:
-        return pd.DataFrame(
-            columns=[
-                "run_name",
-                "created_at",
-                "finished_at",
-                "duration_seconds",
-                "strategy",
-                "timeframe",
-                "symbols",
-                "status",
-                "created_at_display",
-            ]
-        )
+        return pd.DataFrame(columns=_BACKTEST_COLUMNS)
 
     df = pd.DataFrame.from_records(records)
-    if not df.empty and "created_at" in df.columns:
+    if legacy:
         df = df.sort_values("created_at", ascending=False)
+        end = None if limit is None else offset + limit
+        df = df.iloc[offset:end]
     return df
 
 
@@ -408,7 +424,7 @@ def get_backtest_summary(run_name: str) -> Dict[str, Any]:
 
 
 def get_backtest_equity(run_name: str) -> pd.DataFrame:
-    """Return equity_curve.csv as DataFrame if available."""
+    """Return equity_curve (Parquet or CSV) as DataFrame if available."""
 
     runner_dir = _find_runner_dir(run_name)
     if runner_dir is None:
@@ -430,19 +446,14 @@ def get_backtest_equity(run_name: str) -> pd.DataFrame:
         except (OSError, json.JSONDecodeError):
             equity_path = None
 
-    # Legacy fallback: direct equity_curve.csv lookup
+    # Fallback: equity_curve.parquet, then legacy equity_curve.csv
     if equity_path is None:
-        equity_path = runner_dir / "equity_curve.csv"
-
-    if not equity_path.exists():
-        return pd.DataFrame()
+        equity_path = find_tabular_artifact(runner_dir, "equity_curve")
 
-    try:
-        df = pd.read_csv(equity_path)
-    except (pd.errors.EmptyDataError, pd.errors.ParserError, OSError):
+    if equity_path is None or not equity_path.exists():
         return pd.DataFrame()
 
-    return df
+    return read_tabular_artifact(equity_path)
 
 
 def get_backtest_orders(run_name: str) -> Dict[str, pd.DataFrame]:
@@ -476,9 +487,11 @@ def get_backtest_orders(run_name: str) -> Dict[str, pd.DataFrame]:
             with open(manifest_path, "r", encoding="utf-8") as handle:
                 payload = json.load(handle)
             # Manifest has a simple list of filenames in artifacts_index
+            # (.parquet when the run used artifact_format=parquet)
             for filename in payload.get("artifacts_index", []):
-                if filename.endswith(".csv"):
-                    kind = filename.replace(".csv", "")
+                suffix = Path(filename).suffix
+                if suffix in TABULAR_SUFFIXES:
+                    kind = filename[: -len(suffix)]
                     kind_to_path[kind] = runner_dir / filename
                 elif filename.endswith(".json"):
                     kind = filename.replace(".json", "")
@@ -486,23 +499,20 @@ def get_backtest_orders(run_name: str) -> Dict[str, pd.DataFrame]:
         except (OSError, json.JSONDecodeError):
             pass
 
-    def _read_csv(kind: str, legacy_name: str) -> pd.DataFrame:
+    def _read_frame(kind: str) -> pd.DataFrame:
         path = kind_to_path.get(kind) if kind_to_path else None
         if path is None:
-            path = runner_dir / legacy_name
-        if not path.exists():
-            return pd.DataFrame()
-        try:
-            return pd.read_csv(path)
-        except (pd.errors.EmptyDataError, pd.errors.ParserError, OSError):
+            path = find_tabular_artifact(runner_dir, kind)
+        if path is None or not path.exists():
             return pd.DataFrame()
+        return read_tabular_artifact(path)
 
     # NEW MODULAR PIPELINE Mapping:
-    # 1. Orders = events_intent.csv
-    # 2. Fills = fills.csv
-    # 3. Trades = trades.csv
+    # 1. Orders = events_intent.{parquet,csv}
+    # 2. Fills = fills.{parquet,csv}
+    # 3. Trades = trades.{parquet,csv}
     
-    orders = _read_csv("events_intent", "events_intent.csv")
+    orders = _read_frame("events_intent")
     if not orders.empty:
         # Align column names for Dashboard UI (layouts/backtests.py)
         # Expected: price, stop_loss, take_profit
@@ -516,14 +526,14 @@ def get_backtest_orders(run_name: str) -> Dict[str, pd.DataFrame]:
         if "signal_ts" in orders.columns and "timestamp" not in orders.columns:
             orders["timestamp"] = orders["signal_ts"]
 
-    fills = _read_csv("fills", "fills.csv")
+    fills = _read_frame("fills")
     if not fills.empty:
         # Dashboard expects entry_price and qty in fills for some calculations
         if "fill_price" in fills.columns and "entry_price" not in fills.columns:
             fills["entry_price"] = fills["fill_price"]
         # New pipeline fills don't have qty (sizing is in trades)
         # We try to join with trades if template_id is present
-        trades = _read_csv("trades", "trades.csv")
+        trades = _read_frame("trades")
         if not trades.empty and "template_id" in fills.columns and "template_id" in trades.columns:
             try:
                 # Add qty from trades to fills for visualization
@@ -534,7 +544,7 @@ def get_backtest_orders(run_name: str) -> Dict[str, pd.DataFrame]:
     return {
         "orders": orders,
         "fills": fills,
-        "trades": _read_csv("trades", "trades.csv"),
+        "trades": _read_frame("trades"),
     }
 
 
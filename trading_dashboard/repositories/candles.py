@@ -6,17 +6,183 @@ Centralized access to market data for charts and analysis.
 Uses central TradingSettings for all database paths.
 """
 
+import os
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import pandas as pd
 import logging
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from src.core.settings import get_settings
 from ..config import MARKETDATA_DIR
 
 
+CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# Memory budget of the candle window cache (DASHBOARD_CANDLE_CACHE_MB, default 256 MB)
+CANDLE_CACHE_MAX_BYTES = int(os.getenv("DASHBOARD_CANDLE_CACHE_MB", "256")) * 1024 * 1024
+
+
+class CandleCache:
+    """
+    Memory-budgeted LRU of normalized candle windows.
+
+    Keyed by (parquet path, file mtime, day or None for the whole file), so
+    H1 (read from the M5 file) and timezone toggles reuse what is loaded. A
+    rewritten file gets a new mtime and drops its stale windows. File mtimes
+    are re-checked at most every ``stat_ttl_s`` seconds, so repeated chart
+    interactions on a loaded window do not touch the disk.
+    """
+
+    def __init__(self, max_bytes: int = CANDLE_CACHE_MAX_BYTES, stat_ttl_s: float = 2.0):
+        self.max_bytes = max(1, int(max_bytes))
+        self.stat_ttl_s = stat_ttl_s
+        self._entries: "OrderedDict[Tuple[str, int, Optional[date]], pd.DataFrame]" = OrderedDict()
+        self._sizes: Dict[Tuple[str, int, Optional[date]], int] = {}
+        self._stats: Dict[str, Tuple[float, Optional[int]]] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def mtime_ns(self, path: Path) -> Optional[int]:
+        """File mtime (None if missing), cached for stat_ttl_s."""
+        key = str(path)
+        now = time.monotonic()
+        with self._lock:
+            cached = self._stats.get(key)
+            if cached is not None and now - cached[0] < self.stat_ttl_s:
+                return cached[1]
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._lock:
+            self._stats[key] = (now, mtime)
+        return mtime
+
+    def get(self, path: Path, mtime_ns: int, day: Optional[date]) -> pd.DataFrame:
+        """Candles of ``day`` (or the whole file); read from disk on a miss only."""
+        key = (str(path), mtime_ns, day)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached
+        df = _read_candle_window(path, day)
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            self.misses += 1
+            # Drop stale generations of the same file before inserting.
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1] != mtime_ns]:
+                self._evict(stale)
+            if key in self._entries:
+                self._evict(key)
+            self._entries[key] = df
+            self._sizes[key] = size
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                self._evict(next(iter(self._entries)))
+        return df
+
+    def _evict(self, key) -> None:
+        del self._entries[key]
+        self._bytes -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self._stats.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_CANDLE_CACHE = CandleCache()
+
+
+def get_candle_cache() -> CandleCache:
+    """Process-wide candle window cache shared by chart callbacks."""
+    return _CANDLE_CACHE
+
+
+def _read_candle_window(path: Path, day: Optional[date]) -> pd.DataFrame:
+    """
+    Read one day (or the whole file) of a candle parquet as CANDLE_COLUMNS.
+
+    The day window is pushed down to pyarrow as a timestamp filter, so row
+    groups whose statistics lie outside it are never decoded. Bounds are
+    midnight-to-midnight in the timestamp column's own timezone (same as
+    ``timestamp.dt.date == day``).
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    schema = pq.read_schema(path)
+    ts_field = _timestamp_field(schema)
+    if day is not None and ts_field is not None and pa.types.is_timestamp(ts_field.type):
+        lo = pd.Timestamp(day)
+        hi = lo + pd.Timedelta(days=1)
+        if ts_field.type.tz is not None:
+            lo, hi = lo.tz_localize(ts_field.type.tz), hi.tz_localize(ts_field.type.tz)
+        column = ds.field(ts_field.name)
+        window = (column >= pa.scalar(lo, type=ts_field.type)) & (column < pa.scalar(hi, type=ts_field.type))
+        df = pq.read_table(path, filters=window).to_pandas()
+        day = None  # already applied
+    else:
+        df = pd.read_parquet(path)
+
+    # Handle timestamp: it's typically the index
+    if df.index.name == 'timestamp' or isinstance(df.index, pd.DatetimeIndex):
+        df = df.reset_index()
+
+    # Ensure we have a timestamp column
+    if 'timestamp' not in df.columns:
+        # Try to find timestamp-like column
+        for col in df.columns:
+            if 'time' in col.lower() or 'date' in col.lower():
+                df = df.rename(columns={col: 'timestamp'})
+                break
+
+    # Normalize column names to lowercase
+    df.columns = [col.lower() if col != 'timestamp' else col for col in df.columns]
+
+    # Convert timestamp to datetime if needed
+    if 'timestamp' in df.columns:
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        if day is not None:
+            df = df[df['timestamp'].dt.date == day]
+
+    if not all(col in df.columns for col in CANDLE_COLUMNS):
+        return pd.DataFrame(columns=CANDLE_COLUMNS)
+    return df[CANDLE_COLUMNS].reset_index(drop=True)
+
+
+def _timestamp_field(schema):
+    """Parquet field that becomes the ``timestamp`` column after normalization."""
+    names = schema.names
+    if "timestamp" in names:
+        return schema.field("timestamp")
+    for name in names:
+        if 'time' in name.lower() or 'date' in name.lower():
+            return schema.field(name)
+    return None
+
+
 def get_candle_data(symbol: str, timeframe: str = "M5", hours: int = 24, reference_date = None, days_back: int = None) -> pd.DataFrame:
     """
     Get candle data for charting.
@@ -87,106 +253,64 @@ def get_candle_data(symbol: str, timeframe: str = "M5", hours: int = 24, referen
 
         # Special handling for D1 (Daily data from yearly universe files)
         if timeframe == "D1":
-            logger.info(f"=" * 80)
-            logger.info(f"📅 DAILY DATA (D1) LOADING FOR {symbol}")
-            logger.info(f"=" * 80)
-            logger.info(f"   days_back: {days_back}")
-            logger.info(f"   reference_date: {reference_date}")
+            logger.debug(f"📅 D1 load for {symbol}: days_back={days_back} reference_date={reference_date}")
 
             try:
                 from ..data_loading.loaders.daily_data_loader import DailyDataLoader
-                logger.info(f"   ✅ DailyDataLoader imported")
 
                 loader = DailyDataLoader()
-                logger.info(f"   ✅ Loader initialized: {loader.data_dir}")
-
-                # Check if data directory exists and has files
-                import os
-                if loader.data_dir.exists():
-                    files = os.listdir(loader.data_dir)
-                    logger.info(f"   ✅ Directory exists with {len(files)} files: {files}")
-                else:
-                    logger.error(f"   ❌ Directory does not exist: {loader.data_dir}")
-                    return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+                if not loader.data_dir.exists():
+                    logger.error(f"❌ Daily data directory does not exist: {loader.data_dir}")
+                    return pd.DataFrame(columns=CANDLE_COLUMNS)
 
                 # Use configurable days_back (default 180 if not specified)
                 days_to_load = days_back if days_back is not None else 180
-                logger.info(f"   Loading {days_to_load} days of daily data...")
-
                 df = loader.load_data(symbol, days_back=days_to_load)
 
                 if not df.empty:
-                    logger.info(f"   ✅ SUCCESS: Loaded {len(df)} daily candles for {symbol}")
-                    logger.info(f"   Columns: {list(df.columns)}")
-                    logger.info(f"   Index type: {type(df.index)}")
-                    logger.info(f"   First row: {df.iloc[0].to_dict() if len(df) > 0 else 'N/A'}")
-                    logger.info(f"   Date range: {df['timestamp'].min()} to {df['timestamp'].max()}")
-                    logger.info(f"=" * 80)
+                    logger.debug(
+                        f"✅ Loaded {len(df)} daily candles for {symbol} "
+                        f"({df['timestamp'].min()} to {df['timestamp'].max()})"
+                    )
                     return df
                 else:
-                    logger.warning(f"   ⚠️  DataFrame is EMPTY for {symbol}")
-                    logger.warning(f"=" * 80)
-                    return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+                    logger.warning(f"⚠️  No daily data for {symbol}")
+                    return pd.DataFrame(columns=CANDLE_COLUMNS)
             except Exception as e:
-                logger.error(f"   ❌ EXCEPTION in daily data loading:")
-                logger.error(f"   Error type: {type(e).__name__}")
-                logger.error(f"   Error message: {str(e)}")
-                import traceback
-                logger.error(f"   Traceback:\n{traceback.format_exc()}")
-                logger.error(f"=" * 80)
-                return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+                logger.exception(f"❌ Error loading daily data for {symbol}: {e}")
+                return pd.DataFrame(columns=CANDLE_COLUMNS)
 
         # For intraday (M1/M5/M15/H1), use parquet files
         parquet_path = TRADERUNNER_DIR / "artifacts" / data_dir / f"{symbol}.parquet"
 
-        if parquet_path.exists():
-            # Load parquet file
-            df = pd.read_parquet(parquet_path)
-
-            # Handle timestamp: it's typically the index
-            if df.index.name == 'timestamp' or isinstance(df.index, pd.DatetimeIndex):
-                df = df.reset_index()
-
-            # Ensure we have a timestamp column
-            if 'timestamp' not in df.columns:
-                # Try to find timestamp-like column
-                for col in df.columns:
-                    if 'time' in col.lower() or 'date' in col.lower():
-                        df = df.rename(columns={col: 'timestamp'})
-                        break
-
-            # Normalize column names to lowercase
-            df.columns = [col.lower() if col != 'timestamp' else col for col in df.columns]
-
-            # Convert timestamp to datetime if needed
-            if 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
-
+        cache = get_candle_cache()
+        mtime_ns = cache.mtime_ns(parquet_path)
+        if mtime_ns is not None:
             # Filter by reference_date for past dates; reject future dates.
+            day = None
             if reference_date is not None:
                 from datetime import date as date_type, datetime
-                if isinstance(reference_date, date_type):
+                if isinstance(reference_date, datetime):
+                    ref_date = reference_date.date()
+                elif isinstance(reference_date, date_type):
                     ref_date = reference_date
                 else:
                     ref_date = datetime.fromisoformat(str(reference_date)).date()
 
                 today = datetime.now().date()
-                if ref_date < today:
-                    # User wants historical data - filter to that date
-                    df = df[df['timestamp'].dt.date == ref_date]
-                    logger.info(f"📅 Filtered to historical date: {ref_date}")
-                elif ref_date > today:
+                if ref_date > today:
                     # Never show future data, even if parquet contains candles.
                     logger.warning(f"Requested future date {ref_date}, returning empty")
-                    return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+                    return pd.DataFrame(columns=CANDLE_COLUMNS)
+                if ref_date < today:
+                    # User wants historical data - only that date is read
+                    day = ref_date
                 # If ref_date == today, show all available data (no filtering)
 
-            # If we have data, return it
+            df = cache.get(parquet_path, mtime_ns, day)
+            # If we have data, return it (a copy: callers convert timezones in place)
             if not df.empty:
-                # Ensure required columns exist
-                required_cols = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                if all(col in df.columns for col in required_cols):
-                    return df[required_cols]
+                return df.copy()
 
     except Exception as e:
         print(f"Error loading candles from parquet: {e}")
@@ -239,7 +363,7 @@ def get_candle_data(symbol: str, timeframe: str = "M5", hours: int = 24, referen
 
     # If parquet file exists, don't generate mock data - return empty
     if parquet_path.exists():
-        logger.info(f"📁 Found parquet for {symbol} {timeframe}: {parquet_path}")
+        logger.debug(f"📁 Found parquet for {symbol} {timeframe}: {parquet_path}")
         return pd.DataFrame(columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
 
     # CRITICAL: Never generate mock data for future dates
@@ -7,6 +7,8 @@ from typing import Optional
 import pandas as pd
 
 from trading_dashboard.config import BACKTESTS_DIR
+from axiom_bt.pipeline.artifacts import find_tabular_artifact
+from trading_dashboard.repositories.artifact_files import read_tabular_artifact
 
 
 class ArtifactMissing(Exception):
@@ -32,10 +34,10 @@ class TradeRepository:
         return self.artifacts_root / run_id
 
     def load_trades(self, run_id: str) -> Optional[pd.DataFrame]:
-        path = self._run_dir(run_id) / "trades.csv"
-        if not path.exists():
+        path = find_tabular_artifact(self._run_dir(run_id), "trades")
+        if path is None:
             return None
-        return pd.read_csv(path)
+        return read_tabular_artifact(path)
 
     def load_orders(self, run_id: str) -> Optional[pd.DataFrame]:
         path = self._run_dir(run_id) / "orders.csv"
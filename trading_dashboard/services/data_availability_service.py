@@ -45,14 +45,18 @@ def get_availability(symbol: str, force_refresh: bool = False) -> AvailabilityRe
     """
     logger.debug(f"Getting availability for {symbol} (force_refresh={force_refresh})")
 
+    # Cached entries are only valid while the symbol's files are unchanged.
+    # validate=True stats the three files (the index snapshot may lag a write).
+    signature = BacktestingDataCatalog.data_signature(symbol, validate=True)
+
     # Check cache first
     if not force_refresh:
         cached = get_cached(symbol)
-        if cached is not None:
+        if cached is not None and cached['signature'] == signature:
             logger.debug(f"Cache hit for {symbol}")
             return AvailabilityResult(
                 symbol=symbol,
-                timeframes=cached,
+                timeframes=cached['timeframes'],
                 cached=True
             )
 
@@ -84,7 +88,7 @@ def get_availability(symbol: str, force_refresh: bool = False) -> AvailabilityRe
             }
 
     # Cache result
-    set_cached(symbol, result)
+    set_cached(symbol, {'signature': signature, 'timeframes': result})
 
     logger.debug(f"Availability for {symbol}: {len([k for k, v in result.items() if v['available']])} timeframes available")
 
@@ -0,0 +1,286 @@
+"""
+MarketDataIndex - In-memory footer-statistics index of market data parquet files.
+
+One entry per ``<artifacts_root>/data_<tf>/<SYMBOL>.parquet`` with row count
+and first/last timestamp, read from the parquet footer only (row-group
+statistics via read_parquet_metadata_fast; no column data is decoded).
+
+Freshness badges, data availability and symbol selectors look entries up in
+a dict instead of globbing directories or loading whole files.
+
+Refresh is incremental: a file's footer is re-read only when its mtime or
+size changed; deleted files are dropped. refresh() is cheap (one stat per
+file) and can run in a background thread (start()). get(..., validate=True)
+re-checks a single file for callers that must not lag behind a write.
+
+Entries are published as an immutable snapshot, so lookups take no lock.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from axiom_bt.data.m1_partitions import INDEX_NAME
+from trading_dashboard.utils.parquet_meta_reader import read_parquet_metadata_fast
+
+logger = logging.getLogger(__name__)
+
+# Timeframe → data directory under the artifacts root
+TIMEFRAME_DIRS = {
+    "M1": "data_m1",
+    "M5": "data_m5",
+    "M15": "data_m15",
+    "H1": "data_h1",
+    "D1": "data_d1",
+}
+
+DEFAULT_REFRESH_INTERVAL_S = float(os.getenv("DASHBOARD_METADATA_REFRESH_S", "30"))
+
+# Concurrent footer reads during a (cold) refresh
+_FOOTER_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class FileMetadata:
+    """Footer metadata of one market data file."""
+
+    symbol: str
+    timeframe: str
+    path: Path
+    mtime_ns: int
+    size: int
+    rows: int = 0
+    first_ts: Optional[pd.Timestamp] = None
+    last_ts: Optional[pd.Timestamp] = None
+    used_stats: bool = False
+
+
+class MarketDataIndex:
+    """
+    Footer-statistics index over all symbols and timeframes of one artifacts root.
+
+    Usage:
+        index = get_market_data_index()
+        meta = index.get("AAPL", "M5")          # dict lookup, no I/O
+        symbols = index.symbols("M1")
+    """
+
+    def __init__(
+        self,
+        artifacts_root: Path,
+        timeframe_dirs: Optional[Mapping[str, str]] = None,
+        refresh_interval_s: float = DEFAULT_REFRESH_INTERVAL_S,
+    ):
+        """
+        Args:
+            artifacts_root: Directory containing the data_<tf> directories
+            timeframe_dirs: Timeframe → directory name (default TIMEFRAME_DIRS)
+            refresh_interval_s: Background refresh period (start())
+        """
+        self.artifacts_root = Path(artifacts_root)
+        self.timeframe_dirs = dict(timeframe_dirs or TIMEFRAME_DIRS)
+        self.refresh_interval_s = refresh_interval_s
+        self._entries: Dict[Tuple[str, str], FileMetadata] = {}
+        self._refresh_lock = threading.Lock()
+        self._refreshed = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ===== Refresh =====
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index in line with the data directories.
+
+        Returns:
+            Counts: scanned files, updated (footer re-read) entries, removed entries
+        """
+        with self._refresh_lock:
+            current = self._entries
+            found: Dict[Tuple[str, str], Tuple[Path, int, int]] = {}
+            for timeframe, dir_name in self.timeframe_dirs.items():
+                for path, mtime_ns, size in _scan_parquet_files(self.artifacts_root / dir_name):
+                    found[(path.stem, timeframe)] = (path, mtime_ns, size)
+
+            changed = [
+                (key, stat) for key, stat in found.items()
+                if key not in current or (current[key].mtime_ns, current[key].size) != stat[1:]
+            ]
+            entries = {key: current[key] for key in found if key in current}
+            if changed:
+                with ThreadPoolExecutor(max_workers=min(_FOOTER_WORKERS, len(changed))) as pool:
+                    for entry in pool.map(lambda item: _read_entry(*item[0], *item[1]), changed):
+                        entries[(entry.symbol, entry.timeframe)] = entry
+
+            removed = len(current.keys() - found.keys())
+            self._entries = entries
+            self._refreshed = True
+
+        if changed or removed:
+            logger.debug(f"Market data index refreshed: {len(changed)} updated, {removed} removed")
+        return {"scanned": len(found), "updated": len(changed), "removed": removed}
+
+    def _ensure_loaded(self) -> None:
+        if not self._refreshed:
+            self.refresh()
+
+    def start(self) -> None:
+        """Refresh now, then every refresh_interval_s in a daemon thread."""
+        self._ensure_loaded()
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="market-data-index", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.refresh_interval_s):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning(f"Market data index refresh failed: {e}")
+
+    # ===== Lookups =====
+
+    def get(self, symbol: str, timeframe: str, validate: bool = False) -> Optional[FileMetadata]:
+        """
+        Metadata of ``symbol``'s ``timeframe`` file (None if there is none).
+
+        Args:
+            symbol: Symbol (file stem; also tried uppercased)
+            timeframe: M1, M5, M15, H1 or D1
+            validate: Stat the file and re-read its footer if it changed
+                since the last refresh (one stat; no directory scan)
+        """
+        self._ensure_loaded()
+        timeframe = timeframe.strip().upper()
+        key = (symbol, timeframe)
+        if key not in self._entries:
+            key = (symbol.strip().upper(), timeframe)
+        if validate:
+            return self._revalidate(key)
+        return self._entries.get(key)
+
+    def _revalidate(self, key: Tuple[str, str]) -> Optional[FileMetadata]:
+        symbol, timeframe = key
+        dir_name = self.timeframe_dirs.get(timeframe)
+        if dir_name is None:
+            return None
+        path = self.artifacts_root / dir_name / f"{symbol}.parquet"
+        stat = _stat(path)
+        with self._refresh_lock:
+            entries = self._entries
+            entry = entries.get(key)
+            if stat is None:
+                if entry is not None:
+                    self._entries = {k: v for k, v in entries.items() if k != key}
+                return None
+            if entry is not None and (entry.mtime_ns, entry.size) == stat:
+                return entry
+            entry = _read_entry(symbol, timeframe, path, *stat)
+            self._entries = {**entries, key: entry}
+            return entry
+
+    def symbols(self, timeframe: Optional[str] = None) -> List[str]:
+        """Sorted symbols with a file for ``timeframe`` (any timeframe if None)."""
+        self._ensure_loaded()
+        return sorted({symbol for symbol, tf in self._entries if timeframe is None or tf == timeframe})
+
+    def symbols_by_timeframe(self) -> Dict[str, List[str]]:
+        """Timeframe → sorted symbols, for timeframes with at least one file."""
+        self._ensure_loaded()
+        by_tf: Dict[str, List[str]] = {}
+        for symbol, timeframe in self._entries:
+            by_tf.setdefault(timeframe, []).append(symbol)
+        return {tf: sorted(by_tf[tf]) for tf in self.timeframe_dirs if tf in by_tf}
+
+    def entries(self, symbol: str) -> Dict[str, FileMetadata]:
+        """Timeframe → metadata for every file of ``symbol``."""
+        self._ensure_loaded()
+        return {tf: entry for (sym, tf), entry in self._entries.items() if sym == symbol}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _stat(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) signature; a partitioned M1 directory is tracked by its sidecar index."""
+    try:
+        if path.is_dir():
+            path = path / INDEX_NAME
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _scan_parquet_files(directory: Path):
+    """(path, mtime_ns, size) of every *.parquet entry in ``directory``."""
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".parquet"):
+                    continue
+                path = Path(entry.path)
+                stat = _stat(path) if entry.is_dir() else _entry_stat(entry)
+                if stat is not None:
+                    yield (path, *stat)
+    except FileNotFoundError:
+        return
+
+
+def _entry_stat(entry: os.DirEntry) -> Optional[Tuple[int, int]]:
+    try:
+        stat = entry.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_entry(symbol: str, timeframe: str, path: Path, mtime_ns: int, size: int) -> FileMetadata:
+    meta = read_parquet_metadata_fast(path)
+    return FileMetadata(
+        symbol=symbol,
+        timeframe=timeframe,
+        path=path,
+        mtime_ns=mtime_ns,
+        size=size,
+        rows=meta.rows,
+        first_ts=meta.first_ts,
+        last_ts=meta.last_ts,
+        used_stats=meta.used_stats,
+    )
+
+
+_INDEXES: Dict[Path, MarketDataIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_market_data_index(artifacts_root: Optional[Path] = None) -> MarketDataIndex:
+    """
+    Process-wide MarketDataIndex for ``artifacts_root`` (default: canonical
+    artifacts root), refreshed in the background once created.
+    """
+    if artifacts_root is None:
+        from core.settings.intraday_paths import INTRADAY_ROOT
+        artifacts_root = INTRADAY_ROOT
+    key = Path(artifacts_root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = MarketDataIndex(Path(artifacts_root))
+    index.start()
+    return index
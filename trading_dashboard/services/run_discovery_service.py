@@ -9,6 +9,9 @@ INVARIANTS:
 - Prefer run_manifest.json over run_meta.json
 - Include corrupt runs with parse_error (never silently drop)
 - Load steps from run_steps.jsonl if present
+
+discover() reads through the persistent RunIndex (services/run_index.py),
+which re-parses only directories whose mtime or discovery files changed.
 """
 
 import json
@@ -37,6 +40,8 @@ class BacktestRunSummary:
     parse_error: Optional[str] = None  # Only for CORRUPT runs
     has_steps: bool = False
     steps_count: int = 0
+    has_trades: bool = False  # Filled by RunIndex
+    metrics: Dict[str, float] = field(default_factory=dict)  # Headline metrics.json values (RunIndex)
 
 
 class RunDiscoveryService:
@@ -74,38 +79,33 @@ class RunDiscoveryService:
         """
         Discover all backtest runs from artifacts directory.
 
+        Refreshes the shared run index (only changed run directories are
+        parsed again) and reads the runs from it.
+
         Returns:
             List of BacktestRunSummary, sorted by started_at descending.
         """
+        from trading_dashboard.services.run_index import get_run_index
+
         # Reset diagnostics
         self._discovered_count = 0
         self._corrupt_count = 0
         self._skipped_count = 0
         self._skipped_reasons = []
 
-        runs: List[BacktestRunSummary] = []
-
         if not self.artifacts_root.exists():
             logger.warning(f"Artifacts root does not exist: {self.artifacts_root}")
-            return runs
-
-        logger.info(f"🔍 Discovering runs from: {self.artifacts_root}")
-
-        for entry in sorted(self.artifacts_root.iterdir()):
-            if not entry.is_dir():
-                continue
+            return []
 
-            # Skip legacy runner directories (run_*)
-            if entry.name.startswith("run_"):
-                self._skip(entry.name, "legacy_runner_dir")
-                continue
+        index = get_run_index(self.artifacts_root)
+        index.refresh()
+        runs = index.query()
 
-            run_summary = self._discover_run(entry)
-            if run_summary is not None:
-                runs.append(run_summary)
-
-        # Sort by started_at descending (most recent first)
-        runs.sort(key=lambda r: r.started_at, reverse=True)
+        diagnostics = index.diagnostics()
+        self._discovered_count = diagnostics["discovered_count"]
+        self._corrupt_count = diagnostics["corrupt_count"]
+        self._skipped_count = diagnostics["skipped_count"]
+        self._skipped_reasons = diagnostics["skipped_reasons"]
 
         logger.info(
             f"✅ Discovery complete: {self._discovered_count} discovered, "
@@ -114,6 +114,16 @@ class RunDiscoveryService:
 
         return runs
 
+    def parse_run_dir(self, run_dir: Path) -> Optional[BacktestRunSummary]:
+        """
+        Parse a single run directory (no index involved).
+
+        Returns:
+            BacktestRunSummary (status CORRUPT on parse errors), None if the
+            directory has no run artifacts
+        """
+        return self._discover_run(run_dir)
+
     def _discover_run(self, run_dir: Path) -> Optional[BacktestRunSummary]:
         """
         Discover a single run from its directory.
@@ -0,0 +1,422 @@
+"""
+RunIndex - Persistent SQLite index of backtest run directories.
+
+One row per directory under the artifacts root with the discovery summary
+(strategy, symbols, status, timestamps) and headline metrics, so the
+backtests tab, list_backtests() and the trade inspector query SQL instead of
+walking and JSON-parsing every run on each call.
+
+Refresh is incremental: a directory is re-parsed only when its own mtime or
+the mtime of one of its discovery files (run_manifest.json, run_meta.json,
+run_result.json, run_steps.jsonl, metrics.json) changed. Directories that
+disappeared are dropped. Parsing is delegated to RunDiscoveryService, so the
+discovery INVARIANTS (manifest over meta, CORRUPT instead of dropping) hold.
+
+Skipped directories (legacy run_* dirs, no artifacts) are indexed as well,
+with a skip_reason, because the trade inspector lists any run with trades.
+
+The database is in-memory (rebuilt once per process) unless the runtime
+config sets ``paths.dashboard_cache_root``; get_run_index() then persists it
+there, outside the artifacts tree, as ``run_index_<root hash>.sqlite3``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.settings.runtime_config import RuntimeConfigError, get_runtime_config
+from axiom_bt.pipeline.artifacts import find_tabular_artifact
+from trading_dashboard.services.run_discovery_service import BacktestRunSummary, RunDiscoveryService
+
+logger = logging.getLogger(__name__)
+
+RUN_INDEX_VERSION = 1
+
+# Files whose in-place rewrite (no directory mtime change) must trigger a re-parse
+WATCHED_FILES = ("run_manifest.json", "run_meta.json", "run_result.json", "run_steps.jsonl", "metrics.json")
+
+# metrics.json keys kept as columns (sortable/filterable in SQL)
+HEADLINE_METRICS = ("net_pnl", "num_trades", "win_rate", "profit_factor", "max_drawdown_pct", "sharpe_ratio")
+
+SORT_COLUMNS = {
+    "started_at": "started_ts",
+    "run_id": "run_id",
+    "strategy_key": "strategy_key",
+    "status": "status",
+    **{name: name for name in HEADLINE_METRICS},
+}
+
+RUN_INDEX_DDL = """
+CREATE TABLE IF NOT EXISTS run_index (
+    run_id            TEXT    PRIMARY KEY,
+    run_dir           TEXT    NOT NULL,
+    dir_mtime_ns      INTEGER NOT NULL,
+    files_mtime_ns    INTEGER NOT NULL,
+    skip_reason       TEXT,
+    strategy_key      TEXT    NOT NULL,
+    symbols           TEXT    NOT NULL,
+    requested_tf      TEXT    NOT NULL,
+    status            TEXT    NOT NULL,
+    failure_reason    TEXT,
+    parse_error       TEXT,
+    started_at        TEXT    NOT NULL,
+    started_ts        REAL    NOT NULL,
+    started_date      TEXT    NOT NULL,
+    finished_at       TEXT,
+    has_steps         INTEGER NOT NULL DEFAULT 0,
+    steps_count       INTEGER NOT NULL DEFAULT 0,
+    has_trades        INTEGER NOT NULL DEFAULT 0,
+    net_pnl           REAL,
+    num_trades        INTEGER,
+    win_rate          REAL,
+    profit_factor     REAL,
+    max_drawdown_pct  REAL,
+    sharpe_ratio      REAL
+)
+"""
+
+RUN_INDEX_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_run_index_started ON run_index(started_ts DESC, run_id)",
+    "CREATE INDEX IF NOT EXISTS idx_run_index_strategy ON run_index(strategy_key)",
+    "CREATE INDEX IF NOT EXISTS idx_run_index_status ON run_index(status)",
+]
+
+_COLUMNS = (
+    "run_id", "run_dir", "dir_mtime_ns", "files_mtime_ns", "skip_reason", "strategy_key", "symbols",
+    "requested_tf", "status", "failure_reason", "parse_error", "started_at", "started_ts", "started_date",
+    "finished_at", "has_steps", "steps_count", "has_trades", *HEADLINE_METRICS,
+)
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO run_index ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _COLUMNS)})"
+)
+
+
+class RunIndex:
+    """
+    Incrementally refreshed SQLite index over one artifacts root.
+
+    Usage:
+        index = get_run_index(BACKTESTS_DIR)
+        index.refresh()
+        runs = index.query(strategy="inside_bar", limit=50)
+    """
+
+    def __init__(self, artifacts_root: Path, db_path: Optional[Path] = None):
+        """
+        Args:
+            artifacts_root: Directory containing one sub-directory per run
+            db_path: SQLite file (default: None, an in-memory index)
+        """
+        self.artifacts_root = Path(artifacts_root)
+        self.db_path = Path(db_path) if db_path else None
+        self._parser = RunDiscoveryService(artifacts_root=self.artifacts_root)
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Shared connection (callbacks run on worker threads; access is serialized by _lock)."""
+        if self._conn is None:
+            if self.db_path is None:
+                conn = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != RUN_INDEX_VERSION:
+                # Schema/parse changes invalidate the index; it is rebuilt from disk
+                conn.execute("DROP TABLE IF EXISTS run_index")
+                conn.execute(f"PRAGMA user_version = {RUN_INDEX_VERSION}")
+            conn.execute(RUN_INDEX_DDL)
+            for index_ddl in RUN_INDEX_INDEXES:
+                conn.execute(index_ddl)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ===== Refresh =====
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index in line with the artifacts root.
+
+        Returns:
+            Counts: scanned directories, updated (re-parsed) rows, removed rows
+        """
+        if not self.artifacts_root.exists():
+            logger.warning(f"Artifacts root does not exist: {self.artifacts_root}")
+            return {"scanned": 0, "updated": 0, "removed": 0}
+
+        with self._lock:
+            conn = self._connection()
+            known = {
+                run_id: (dir_mtime, files_mtime)
+                for run_id, dir_mtime, files_mtime in conn.execute(
+                    "SELECT run_id, dir_mtime_ns, files_mtime_ns FROM run_index"
+                )
+            }
+
+            seen = set()
+            changed: List[Tuple[Path, int, int]] = []
+            with os.scandir(self.artifacts_root) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    seen.add(entry.name)
+                    signature = (entry.stat().st_mtime_ns, _files_mtime_ns(entry.path))
+                    if known.get(entry.name) != signature:
+                        changed.append((Path(entry.path), *signature))
+
+            rows = [self._row(run_dir, dir_mtime, files_mtime) for run_dir, dir_mtime, files_mtime in changed]
+            removed = [(run_id,) for run_id in known.keys() - seen]
+            with conn:
+                conn.executemany(_UPSERT_SQL, rows)
+                conn.executemany("DELETE FROM run_index WHERE run_id = ?", removed)
+
+        if rows or removed:
+            logger.info(
+                f"Run index refreshed: {len(seen)} dirs, {len(rows)} updated, {len(removed)} removed "
+                f"({self.artifacts_root})"
+            )
+        return {"scanned": len(seen), "updated": len(rows), "removed": len(removed)}
+
+    def _row(self, run_dir: Path, dir_mtime_ns: int, files_mtime_ns: int) -> tuple:
+        """Parse one run directory into a run_index row."""
+        summary = None
+        skip_reason = None
+        if run_dir.name.startswith("run_"):
+            skip_reason = "legacy_runner_dir"
+        else:
+            summary = self._parser.parse_run_dir(run_dir)
+            if summary is None:
+                skip_reason = "no_artifacts"
+
+        if summary is None:
+            started_at = datetime.fromtimestamp(dir_mtime_ns / 1e9, tz=timezone.utc)
+            summary = BacktestRunSummary(
+                run_id=run_dir.name,
+                run_dir=run_dir.absolute(),
+                strategy_key="unknown",
+                symbols=[],
+                requested_tf="unknown",
+                started_at=started_at,
+                finished_at=None,
+                status="SKIPPED",
+            )
+
+        metrics = _headline_metrics(run_dir / "metrics.json")
+        return (
+            summary.run_id,
+            str(summary.run_dir),
+            dir_mtime_ns,
+            files_mtime_ns,
+            skip_reason,
+            summary.strategy_key,
+            json.dumps(list(summary.symbols)),
+            summary.requested_tf,
+            summary.status,
+            summary.failure_reason,
+            summary.parse_error,
+            summary.started_at.isoformat(),
+            summary.started_at.timestamp(),
+            summary.started_at.date().isoformat(),
+            summary.finished_at.isoformat() if summary.finished_at else None,
+            int(summary.has_steps),
+            summary.steps_count,
+            int(find_tabular_artifact(run_dir, "trades") is not None),
+            *(metrics.get(name) for name in HEADLINE_METRICS),
+        )
+
+    # ===== Queries =====
+
+    def query(
+        self,
+        strategy: Optional[str] = None,
+        symbol: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        has_trades: Optional[bool] = None,
+        include_skipped: bool = False,
+        order_by: str = "started_at",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[BacktestRunSummary]:
+        """
+        Indexed runs matching all given filters (call refresh() first).
+
+        Args:
+            strategy: Exact strategy_key
+            symbol: Run must include this symbol
+            status: Status, case-insensitive (SUCCESS, ERROR, CORRUPT, ...)
+            start_date: First started_at date (inclusive, in the run's own tz)
+            end_date: Last started_at date (inclusive)
+            has_trades: Only runs with (True) / without (False) a trades artifact
+            include_skipped: Also return skipped directories (status SKIPPED)
+            order_by: started_at, run_id, strategy_key, status or a headline metric
+            descending: Sort direction (ties are broken by run_id ascending)
+            limit: Page size (None = all)
+            offset: Rows to skip
+
+        Returns:
+            List of BacktestRunSummary with has_trades and metrics filled
+        """
+        if order_by not in SORT_COLUMNS:
+            raise ValueError(f"order_by must be one of {sorted(SORT_COLUMNS)} (got {order_by!r})")
+        where, params = _where(strategy, symbol, status, start_date, end_date, has_trades, include_skipped)
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT {', '.join(_COLUMNS)} FROM run_index{where} "
+            f"ORDER BY {SORT_COLUMNS[order_by]} {direction} NULLS LAST, run_id ASC"
+        )
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        elif offset:
+            sql += " LIMIT -1 OFFSET ?"
+            params.append(int(offset))
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [_summary(row) for row in rows]
+
+    def count(self, **filters) -> int:
+        """Number of indexed runs matching query() filters (for pagination)."""
+        where, params = _where(
+            filters.get("strategy"),
+            filters.get("symbol"),
+            filters.get("status"),
+            filters.get("start_date"),
+            filters.get("end_date"),
+            filters.get("has_trades"),
+            filters.get("include_skipped", False),
+        )
+        with self._lock:
+            return self._connection().execute(f"SELECT COUNT(*) FROM run_index{where}", params).fetchone()[0]
+
+    def diagnostics(self) -> Dict[str, Any]:
+        """Counts in RunDiscoveryService.get_diagnostics() form (last 20 skip reasons by dir name)."""
+        with self._lock:
+            conn = self._connection()
+            discovered, corrupt = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(status = 'CORRUPT'), 0) FROM run_index WHERE skip_reason IS NULL"
+            ).fetchone()
+            skipped = conn.execute(
+                "SELECT run_id, skip_reason FROM run_index WHERE skip_reason IS NOT NULL ORDER BY run_id"
+            ).fetchall()
+        return {
+            "discovered_count": discovered,
+            "corrupt_count": corrupt,
+            "skipped_count": len(skipped),
+            "skipped_reasons": [{"dir_name": name, "reason": reason} for name, reason in skipped[-20:]],
+            "artifacts_root": str(self.artifacts_root),
+        }
+
+
+def _files_mtime_ns(run_dir: str) -> int:
+    latest = 0
+    for name in WATCHED_FILES:
+        try:
+            latest = max(latest, os.stat(os.path.join(run_dir, name)).st_mtime_ns)
+        except OSError:
+            continue
+    return latest
+
+
+def _headline_metrics(metrics_file: Path) -> Dict[str, float]:
+    if not metrics_file.exists():
+        return {}
+    try:
+        with open(metrics_file) as f:
+            payload = json.load(f)
+    except Exception as e:
+        logger.warning(f"Failed to parse {metrics_file}: {e}")
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {name: payload[name] for name in HEADLINE_METRICS if isinstance(payload.get(name), (int, float))}
+
+
+def _where(strategy, symbol, status, start_date, end_date, has_trades, include_skipped) -> Tuple[str, list]:
+    clauses: List[str] = []
+    params: list = []
+    if not include_skipped:
+        clauses.append("skip_reason IS NULL")
+    if strategy:
+        clauses.append("strategy_key = ?")
+        params.append(strategy)
+    if symbol:
+        clauses.append("EXISTS (SELECT 1 FROM json_each(run_index.symbols) WHERE value = ?)")
+        params.append(symbol)
+    if status:
+        clauses.append("status = ?")
+        params.append(status.upper())
+    if start_date:
+        clauses.append("started_date >= ?")
+        params.append(start_date.isoformat())
+    if end_date:
+        clauses.append("started_date <= ?")
+        params.append(end_date.isoformat())
+    if has_trades is not None:
+        clauses.append("has_trades = ?")
+        params.append(int(has_trades))
+    return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+
+def _summary(row: tuple) -> BacktestRunSummary:
+    record = dict(zip(_COLUMNS, row))
+    return BacktestRunSummary(
+        run_id=record["run_id"],
+        run_dir=Path(record["run_dir"]),
+        strategy_key=record["strategy_key"],
+        symbols=json.loads(record["symbols"]),
+        requested_tf=record["requested_tf"],
+        started_at=datetime.fromisoformat(record["started_at"]),
+        finished_at=datetime.fromisoformat(record["finished_at"]) if record["finished_at"] else None,
+        status=record["status"],
+        failure_reason=record["failure_reason"],
+        parse_error=record["parse_error"],
+        has_steps=bool(record["has_steps"]),
+        steps_count=record["steps_count"],
+        has_trades=bool(record["has_trades"]),
+        metrics={name: record[name] for name in HEADLINE_METRICS if record[name] is not None},
+    )
+
+
+_INDEXES: Dict[Path, RunIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def _default_db_path(artifacts_root: Path) -> Optional[Path]:
+    """Index file under runtime paths.dashboard_cache_root; None (in-memory) if unset."""
+    try:
+        cache_root = get_runtime_config().paths.dashboard_cache_root
+    except RuntimeConfigError:
+        return None
+    if cache_root is None:
+        return None
+    digest = hashlib.sha1(str(artifacts_root).encode("utf-8")).hexdigest()[:12]
+    return cache_root / f"run_index_{digest}.sqlite3"
+
+
+def get_run_index(artifacts_root: Path) -> RunIndex:
+    """Process-wide RunIndex for ``artifacts_root`` (shared by all call sites)."""
+    key = Path(artifacts_root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = RunIndex(Path(artifacts_root), db_path=_default_db_path(key))
+        return index
@@ -1,14 +1,35 @@
+"""
+Trade detail lookups for the Trade Inspector.
+
+A run's artifacts (trades, orders, evidence, exec/signal bars) are loaded
+once into a RunSession and kept in a small LRU, so stepping through the
+trades of a run only slices memory: exec bars are sorted once and windowed
+with searchsorted on an int64 (UTC ns) index, entry times are parsed once
+per run. A session is rebuilt when a file in the run directory (or its
+bars/ directory) is added, removed or rewritten.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from src.backtest.services.trade_evidence import generate_trade_evidence
 from trading_dashboard.repositories.trade_repository import TradeRepository, RunArtifacts
 
+# Runs kept loaded at once (each holds its bars in memory)
+DEFAULT_MAX_SESSIONS = 4
+
+_NAT = np.iinfo(np.int64).min
+
+Signature = Tuple[Tuple[str, int, int], ...]
+
 
 @dataclass
 class TradeDetail:
@@ -21,9 +42,105 @@ class TradeDetail:
     signal_bars: Optional[pd.DataFrame]
 
 
+@dataclass
+class RunSession:
+    """Artifacts of one run, loaded once and indexed for per-trade windowing."""
+
+    run_id: str
+    signature: Signature
+    artifacts: RunArtifacts
+    evidence: Optional[pd.DataFrame]
+    exec_bars: Optional[pd.DataFrame]
+    exec_ns: np.ndarray
+    entry_ns: np.ndarray
+    _options: Optional[List[dict]] = field(default=None, repr=False)
+
+    @classmethod
+    def build(cls, run_id: str, artifacts: RunArtifacts, evidence: Optional[pd.DataFrame]) -> "RunSession":
+        exec_bars = artifacts.bars_exec
+        exec_ns = np.empty(0, dtype=np.int64)
+        if exec_bars is not None and not exec_bars.empty:
+            ns = _utc_ns(exec_bars.index)
+            order = np.argsort(ns, kind="stable")
+            exec_bars = exec_bars.iloc[order]
+            exec_ns = ns[order]
+        trades = artifacts.trades
+        entry_ns = np.empty(0, dtype=np.int64)
+        if trades is not None and "entry_ts" in trades.columns:
+            entry_ns = _utc_ns(trades["entry_ts"])
+        elif trades is not None:
+            entry_ns = np.full(len(trades), _NAT, dtype=np.int64)
+        return cls(
+            run_id=run_id,
+            signature=_run_signature(artifacts.run_dir) or (),
+            artifacts=artifacts,
+            evidence=evidence,
+            exec_bars=exec_bars,
+            exec_ns=exec_ns,
+            entry_ns=entry_ns,
+        )
+
+    def nearest_bar(self, ts_ns: int) -> Optional[int]:
+        """Position of the exec bar closest to ``ts_ns`` (None if unknown)."""
+        n = len(self.exec_ns)
+        if n == 0 or ts_ns == _NAT:
+            return None
+        # NaT bars sort first; search only the valid tail
+        first = int(np.searchsorted(self.exec_ns, _NAT, side="right"))
+        if first == n:
+            return None
+        pos = int(np.searchsorted(self.exec_ns, ts_ns, side="left"))
+        if pos <= first:
+            return first
+        if pos == n:
+            return n - 1
+        before, after = self.exec_ns[pos - 1], self.exec_ns[pos]
+        # Ties go to the later bar, like get_indexer(method="nearest")
+        return pos - 1 if ts_ns - before < after - ts_ns else pos
+
+    def exec_window(self, trade_id: int, window_bars: int) -> Optional[pd.DataFrame]:
+        """Exec bars around the trade's entry (all bars if the entry is unknown)."""
+        if self.exec_bars is None or self.exec_bars.empty:
+            return self.exec_bars
+        pos = self.nearest_bar(int(self.entry_ns[trade_id]))
+        if pos is None:
+            return self.exec_bars
+        start = max(pos - window_bars // 2, 0)
+        end = min(pos + window_bars // 2, len(self.exec_bars))
+        return self.exec_bars.iloc[start:end]
+
+    def trade_options(self) -> List[dict]:
+        """Dropdown options (label/value) for every trade, built once."""
+        if self._options is None:
+            trades = self.artifacts.trades
+            if trades is None or trades.empty:
+                self._options = []
+            else:
+                def col(name: str) -> pd.Series:
+                    if name not in trades.columns:
+                        return pd.Series("", index=trades.index)
+                    return trades[name].astype(str)
+
+                labels = (
+                    "#" + pd.Series(trades.index.astype(str), index=trades.index)
+                    + " " + col("symbol") + " " + col("entry_ts") + " " + col("side")
+                    + " PnL=" + col("pnl")
+                )
+                self._options = [
+                    {"label": label, "value": value}
+                    for label, value in zip(labels.tolist(), trades.index.tolist())
+                ]
+        return self._options
+
+
 class TradeDetailService:
-    def __init__(self, repo: TradeRepository):
+    def __init__(self, repo: TradeRepository, max_sessions: int = DEFAULT_MAX_SESSIONS):
         self.repo = repo
+        self.max_sessions = max(1, int(max_sessions))
+        self._sessions: "OrderedDict[str, RunSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
 
     def _ensure_evidence(self, artifacts: RunArtifacts) -> Optional[pd.DataFrame]:
         if artifacts.evidence is not None:
@@ -32,38 +149,87 @@ class TradeDetailService:
         df = generate_trade_evidence(artifacts.run_dir)
         return df
 
-    def get_trade_detail(self, run_id: str, trade_id: int, *, window_bars: int = 80) -> Optional[TradeDetail]:
+    def session(self, run_id: str) -> RunSession:
+        """
+        Loaded session of ``run_id``; artifacts are read from disk only on the
+        first call or after the run directory changed.
+
+        Raises:
+            ArtifactMissing: If the run directory does not exist
+        """
+        signature = _run_signature(self.repo._run_dir(run_id))
+        with self._lock:
+            cached = self._sessions.get(run_id)
+            if cached is not None and signature is not None and cached.signature == signature:
+                self._sessions.move_to_end(run_id)
+                self.hits += 1
+                return cached
+            self._sessions.pop(run_id, None)
+
         artifacts = self.repo.load_all(run_id)
+        # Signature is taken after evidence generation, which writes into the run dir
+        session = RunSession.build(run_id, artifacts, self._ensure_evidence(artifacts))
+        with self._lock:
+            self.misses += 1
+            self._sessions[run_id] = session
+            self._sessions.move_to_end(run_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def invalidate(self, run_id: Optional[str] = None) -> None:
+        """Drop one run's session (all sessions if run_id is None)."""
+        with self._lock:
+            if run_id is None:
+                self._sessions.clear()
+            else:
+                self._sessions.pop(run_id, None)
+
+    def trade_options(self, run_id: str) -> List[dict]:
+        """Trade dropdown options of ``run_id`` ([] if it has no trades)."""
+        return self.session(run_id).trade_options()
+
+    def get_trade_detail(self, run_id: str, trade_id: int, *, window_bars: int = 80) -> Optional[TradeDetail]:
+        session = self.session(run_id)
+        artifacts = session.artifacts
         if artifacts.trades is None or trade_id >= len(artifacts.trades):
             return None
 
-        evidence_df = self._ensure_evidence(artifacts)
+        evidence_df = session.evidence
         evidence_row = None
         if evidence_df is not None and trade_id < len(evidence_df):
             evidence_row = evidence_df.iloc[trade_id]
 
-        trade_row = artifacts.trades.iloc[trade_id]
-        exec_bars = artifacts.bars_exec
-        if exec_bars is not None and not exec_bars.empty:
-            entry_ts = pd.to_datetime(trade_row.get("entry_ts"), utc=True, errors="coerce")
-            if entry_ts is not None and not pd.isna(entry_ts):
-                exec_bars = exec_bars.sort_index()
-                bars_idx = pd.to_datetime(exec_bars.index, utc=True, errors="coerce")
-                # find index position nearest entry
-                try:
-                    pos = bars_idx.get_indexer([entry_ts], method="nearest")[0]
-                    start = max(pos - window_bars // 2, 0)
-                    end = min(pos + window_bars // 2, len(exec_bars))
-                    exec_bars = exec_bars.iloc[start:end]
-                except Exception:
-                    pass
-
         return TradeDetail(
             run_id=run_id,
             trade_id=trade_id,
-            trade_row=trade_row,
+            trade_row=artifacts.trades.iloc[trade_id],
             orders=artifacts.orders,
             evidence_row=evidence_row,
-            exec_bars=exec_bars,
+            exec_bars=session.exec_window(trade_id, window_bars),
             signal_bars=artifacts.bars_signal,
         )
+
+
+def _utc_ns(values) -> np.ndarray:
+    """int64 UTC nanoseconds of timestamps (unparseable values → NaT sentinel)."""
+    parsed = pd.DatetimeIndex(pd.to_datetime(values, utc=True, errors="coerce"))
+    return parsed.asi8.copy()
+
+
+def _run_signature(run_dir: Path) -> Optional[Signature]:
+    """(name, mtime_ns, size) of every entry in the run dir and its bars/ dir."""
+    entries = []
+    for directory, prefix in ((run_dir, ""), (run_dir / "bars", "bars/")):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((prefix + entry.name, stat.st_mtime_ns, stat.st_size))
+        except (FileNotFoundError, NotADirectoryError):
+            if not prefix:
+                return None
+    return tuple(sorted(entries))
@@ -0,0 +1,83 @@
+"""
+Chart Zoom Resampling
+=====================
+
+Re-aggregates downsampled charts when the user zooms.
+
+Chart callbacks send at most a few thousand points per trace (see
+visualization.downsample). Each zoomable graph has a rebuild function,
+registered once at app setup, that reloads its data from a JSON query and
+builds the figure for an x-range. The chart callback writes that query into
+the graph's zoom store (a dcc.Store placed next to the graph); a
+relayoutData callback then rebuilds the figure for the visible x-range only,
+so detail returns as the window shrinks, and double-click (autorange)
+restores the overview.
+
+    # layout
+    dcc.Graph(id="candlestick-chart"), zoom_store("candlestick-chart")
+
+    # callbacks
+    register_zoom_resampling(app, "candlestick-chart", chart_figure)
+
+    @app.callback(Output("candlestick-chart", "figure"),
+                  Output(zoom_store_id("candlestick-chart"), "data"), ...)
+    def update_chart(...):
+        query = {"symbol": symbol, "timeframe": timeframe}
+        return chart_figure(query), query
+
+The query lives in the browser session that drew the chart, so concurrent
+sessions never rebuild each other's figures, and the server keeps no
+per-session frames: rebuilds reload through the repositories' caches.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from dash import Input, Output, State, dcc, no_update
+
+from visualization.downsample import XRange, x_range_from_relayout
+
+logger = logging.getLogger(__name__)
+
+Query = Dict[str, Any]
+Rebuild = Callable[[Query, Optional[XRange]], Any]
+
+
+def zoom_store_id(graph_id: str) -> str:
+    """Id of the dcc.Store holding ``graph_id``'s rebuild query."""
+    return f"{graph_id}-zoom-query"
+
+
+def zoom_store(graph_id: str) -> dcc.Store:
+    """Per-session store for ``graph_id``'s rebuild query (place in the layout)."""
+    return dcc.Store(id=zoom_store_id(graph_id), storage_type="memory", data=None)
+
+
+def resample_for_relayout(rebuild: Rebuild, query: Optional[Query], relayout_data: Optional[Dict[str, Any]]):
+    """
+    Figure for a relayout event, or ``no_update`` when nothing changes.
+
+    Resizes, y-only zooms and charts without a stored query (empty states)
+    are left alone.
+    """
+    x_range = x_range_from_relayout(relayout_data)
+    if x_range is False or query is None:
+        return no_update
+    try:
+        return rebuild(query, x_range)
+    except Exception as e:
+        logger.warning(f"Zoom resampling failed for {query}: {e}")
+        return no_update
+
+
+def register_zoom_resampling(app, graph_id: str, rebuild: Rebuild) -> None:
+    """Register the relayoutData → figure callback for one graph."""
+
+    @app.callback(
+        Output(graph_id, "figure", allow_duplicate=True),
+        Input(graph_id, "relayoutData"),
+        State(zoom_store_id(graph_id), "data"),
+        prevent_initial_call=True,
+    )
+    def _resample_on_zoom(relayout_data, query):
+        return resample_for_relayout(rebuild, query, relayout_data)
@@ -17,6 +17,7 @@ from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pandas as pd
 
@@ -64,6 +65,9 @@ def read_parquet_metadata_fast(
     if not path.exists():
         return ParquetMetadata(exists=False)
 
+    if path.is_dir():
+        return _read_partition_index(path)
+
     try:
         pf = pq.ParquetFile(path)
         rows = pf.metadata.num_rows
@@ -71,6 +75,8 @@ def read_parquet_metadata_fast(
         if rows == 0:
             return ParquetMetadata(exists=True, rows=0)
 
+        ts_col = _resolve_ts_column(pf.schema_arrow, ts_col)
+
         # Try RowGroup statistics (fastest path)
         first_ts, last_ts, used_stats = _try_rowgroup_stats(pf, ts_col)
 
@@ -101,6 +107,50 @@ def read_parquet_metadata_fast(
         return ParquetMetadata(exists=False)
 
 
+def _read_partition_index(path: Path) -> ParquetMetadata:
+    """Metadata for a month-partitioned M1 directory from its sidecar index."""
+    from axiom_bt.data.m1_partitions import M1PartitionStore
+
+    try:
+        coverage = M1PartitionStore(path).coverage()
+    except (OSError, ValueError) as e:
+        logger.warning(f"Error reading partition index for {path}: {e}")
+        return ParquetMetadata(exists=False)
+    if coverage is None:
+        return ParquetMetadata(exists=True, rows=0)
+    return ParquetMetadata(
+        exists=True,
+        rows=coverage.rows,
+        first_ts=coverage.first_ts,
+        last_ts=coverage.last_ts,
+        used_stats=True,
+    )
+
+
+def _resolve_ts_column(schema: pa.Schema, ts_col: str) -> str:
+    """
+    ``ts_col``, or the stored DatetimeIndex column if the file has none.
+
+    An unnamed DatetimeIndex is written as ``__index_level_0__``.
+    """
+    if ts_col in schema.names:
+        return ts_col
+    for name in (schema.pandas_metadata or {}).get("index_columns", []):
+        if isinstance(name, str) and name in schema.names and pa.types.is_timestamp(schema.field(name).type):
+            return name
+    return ts_col
+
+
+def _to_column_tz(ts: pd.Timestamp, field: pa.Field) -> pd.Timestamp:
+    """Statistics come back in UTC; express them in the column's own timezone."""
+    tz = getattr(field.type, "tz", None)
+    if tz is None:
+        return ts
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return ts.tz_convert(tz)
+
+
 def _try_rowgroup_stats(
     pf: pq.ParquetFile,
     ts_col: str
@@ -137,9 +187,10 @@ def _try_rowgroup_stats(
             mins.append(stats.min)
             maxs.append(stats.max)
 
-        # Convert to pandas timestamps
-        first_ts = pd.Timestamp(min(mins))
-        last_ts = pd.Timestamp(max(maxs))
+        # Convert to pandas timestamps (in the column's timezone, like the fallback)
+        field = schema.field(col_idx)
+        first_ts = _to_column_tz(pd.Timestamp(min(mins)), field)
+        last_ts = _to_column_tz(pd.Timestamp(max(maxs)), field)
 
         return first_ts, last_ts, True
 
@@ -1,8 +1,10 @@
-"""Utility to scan cached parquet files and return available symbols."""
+"""Utility to list cached parquet symbols (from the market data index, no globbing per call)."""
 
 from pathlib import Path
 from typing import List, Dict, Set
 
+from trading_dashboard.services.market_data_index import MarketDataIndex, get_market_data_index
+
 
 def get_cached_symbols(artifacts_dir: str = None) -> Dict[str, List[str]]:
     """Scan artifacts directory for cached symbol data.
@@ -14,37 +16,15 @@ def get_cached_symbols(artifacts_dir: str = None) -> Dict[str, List[str]]:
         Dictionary mapping timeframe to list of symbols
         Example: {"M5": ["AAPL", "TSLA", ...], "M1": [...], "D1": [...]}
     """
+    # Symbols are file stems (e.g., "AAPL.parquet" -> "AAPL")
     if artifacts_dir is None:
-        artifacts_dir = Path(__file__).parents[2] / "artifacts"
+        # Shared index of the canonical root, rescanned in the background
+        index = get_market_data_index()
     else:
-        artifacts_dir = Path(artifacts_dir)
-
-    cached_symbols = {}
-
-    # Scan common timeframe directories
-    timeframe_dirs = {
-        "M1": "data_m1",
-        "M5": "data_m5",
-        "M15": "data_m15",
-        "H1": "data_h1",
-        "D1": "data_d1",
-    }
-
-    for timeframe, dir_name in timeframe_dirs.items():
-        tf_dir = artifacts_dir / dir_name
-        if not tf_dir.exists():
-            continue
-
-        symbols = []
-        for parquet_file in tf_dir.glob("*.parquet"):
-            # Extract symbol from filename (e.g., "AAPL.parquet" -> "AAPL")
-            symbol = parquet_file.stem
-            symbols.append(symbol)
-
-        if symbols:
-            cached_symbols[timeframe] = sorted(symbols)
-
-    return cached_symbols
+        # Other directories (tests, tools) get a one-off index without a
+        # background refresh thread
+        index = MarketDataIndex(Path(artifacts_dir))
+    return index.symbols_by_timeframe()
 
 
 def get_symbols_for_timeframe(timeframe: str, artifacts_dir: str = None) -> List[str]:
@@ -0,0 +1,231 @@
+"""
+Server-side downsampling for chart payloads.
+
+Charts never need more points than the screen has pixels. Long windows are
+reduced before they are serialized into the figure JSON:
+
+- OHLC candles: consecutive bars are aggregated into buckets (first open,
+  max high, min low, last close, summed volume), so every wick extreme
+  survives and the candle count stays bounded.
+- Line series (equity, indicators): Largest-Triangle-Three-Buckets (LTTB)
+  keeps the points that preserve the visual shape.
+
+Zooming re-runs the reduction on the visible x-range only, so detail comes
+back as the window shrinks. Marker overlays (trades, signals) are never
+passed through here and stay exact.
+
+Pure pandas/numpy: usable by any chart library.
+"""
+import re
+from typing import Any, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "DEFAULT_MAX_POINTS",
+    "CANDLE_PX",
+    "XRange",
+    "target_points",
+    "slice_x_range",
+    "downsample_ohlcv",
+    "lttb_indices",
+    "downsample_line",
+    "x_range_from_relayout",
+]
+
+# Hard cap on points per trace, whatever the window length
+DEFAULT_MAX_POINTS = 2000
+
+# Horizontal pixels per candle (body plus gap) at which candles stay readable
+CANDLE_PX = 2
+
+XRange = Tuple[pd.Timestamp, pd.Timestamp]
+
+_XAXIS_KEY = re.compile(r"^(xaxis\d*)(\.autorange|\.range(?:\[[01]\])?)$")
+
+
+def target_points(
+    width_px: Optional[int] = None,
+    max_points: int = DEFAULT_MAX_POINTS,
+    px_per_point: float = 1.0,
+) -> int:
+    """
+    Point budget for a trace drawn ``width_px`` pixels wide.
+
+    Args:
+        width_px: Plot width in pixels (None = unknown, use max_points)
+        max_points: Hard cap
+        px_per_point: Pixels one point occupies (CANDLE_PX for candles)
+
+    Returns:
+        Number of points (>= 3)
+    """
+    budget = max_points if width_px is None else min(max_points, int(width_px / px_per_point))
+    return max(3, budget)
+
+
+def slice_x_range(data, x_range: Optional[XRange]):
+    """
+    Rows of a DatetimeIndex-ed frame/series inside ``x_range``.
+
+    One row beyond each edge is kept so lines and candles do not stop short
+    of the visible border.
+    """
+    if x_range is None or len(data) == 0 or not isinstance(data.index, pd.DatetimeIndex):
+        return data
+    index = data.index
+    lo, hi = (_align_ts(ts, index) for ts in x_range)
+    start = max(0, int(index.searchsorted(lo, side="left")) - 1)
+    stop = min(len(index), int(index.searchsorted(hi, side="right")) + 1)
+    return data.iloc[start:stop]
+
+
+def downsample_ohlcv(df: pd.DataFrame, max_bars: int) -> pd.DataFrame:
+    """
+    Aggregate consecutive bars into at most ``max_bars`` OHLC buckets.
+
+    Buckets hold equal bar counts (not equal time), so session gaps and
+    weekends never produce empty buckets. Each bucket is stamped with the
+    timestamp of its first bar. Frames already within budget are returned
+    unchanged.
+
+    Args:
+        df: Frame with open/high/low/close (and optionally volume) columns,
+            sorted by index
+        max_bars: Maximum number of output rows
+
+    Returns:
+        Aggregated frame with the same columns
+    """
+    n = len(df)
+    if max_bars <= 0 or n <= max_bars:
+        return df
+
+    size = -(-n // max_bars)  # ceil: bars per bucket
+    starts = np.arange(0, n, size)
+    ends = np.minimum(starts + size, n) - 1
+
+    out = {}
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if col == "open":
+            out[col] = values[starts]
+        elif col == "close":
+            out[col] = values[ends]
+        elif col == "high":
+            out[col] = np.fmax.reduceat(values, starts)
+        elif col == "low":
+            out[col] = np.fmin.reduceat(values, starts)
+        elif col == "volume":
+            out[col] = np.add.reduceat(np.nan_to_num(values.astype(float)), starts)
+        else:
+            out[col] = values[ends]
+    return pd.DataFrame(out, index=df.index[starts], columns=df.columns)
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: positions of the ``n_out`` points kept.
+
+    The first and last points are always kept; from every bucket in between
+    the point forming the largest triangle with the previously kept point
+    and the next bucket's average is chosen.
+
+    Args:
+        x: Monotonic x values (numeric)
+        y: y values (no NaN)
+        n_out: Number of points to keep (>= 3)
+
+    Returns:
+        Sorted integer positions into x/y
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Bucket boundaries over the interior points [1, n-1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0] = 0
+    kept[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+        else:
+            next_lo, next_hi = n - 1, n
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def downsample_line(series: pd.Series, max_points: int) -> pd.Series:
+    """
+    LTTB-reduce a line series to at most ``max_points`` points.
+
+    NaN points are dropped before reduction (only when reducing). Series
+    already within budget are returned unchanged.
+    """
+    if max_points <= 0 or len(series) <= max_points:
+        return series
+    clean = series.dropna()
+    if len(clean) <= max_points:
+        return clean
+    index = clean.index
+    if isinstance(index, pd.DatetimeIndex):
+        x = index.asi8.astype(float)
+    else:
+        x = np.arange(len(clean), dtype=float)
+    return clean.iloc[lttb_indices(x, clean.to_numpy(dtype=float), max_points)]
+
+
+def x_range_from_relayout(relayout_data: Optional[Mapping[str, Any]]):
+    """
+    Visible x-range from a Plotly relayout event.
+
+    Returns:
+        (start, end) Timestamps after a zoom/pan, None after an autorange
+        reset (double click), or False if the event did not touch the
+        x-axis (resize, y-only zoom, ...)
+    """
+    if not relayout_data:
+        return False
+    ranges = {}
+    for key, value in relayout_data.items():
+        match = _XAXIS_KEY.match(key)
+        if match is None:
+            continue
+        axis, prop = match.groups()
+        if prop == ".autorange" and value:
+            return None
+        if prop == ".range" and isinstance(value, (list, tuple)) and len(value) >= 2:
+            ranges.setdefault(axis, list(value[:2]))
+        elif prop in (".range[0]", ".range[1]"):
+            ranges.setdefault(axis, [None, None])[int(prop[-2])] = value
+    # Shared x-axes report the zoom on whichever subplot was dragged
+    bounds = next((pair for pair in ranges.values() if None not in pair), None)
+    if bounds is None:
+        return False
+    try:
+        lo, hi = (pd.Timestamp(bound) for bound in bounds)
+    except (TypeError, ValueError):
+        return False
+    return (lo, hi) if lo <= hi else (hi, lo)
+
+
+def _align_ts(ts, index: pd.DatetimeIndex) -> pd.Timestamp:
+    """Compare relayout timestamps (naive, display tz) against a tz-aware index."""
+    ts = pd.Timestamp(ts)
+    tz = getattr(index, "tz", None)
+    if tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(tz)
+    if tz is None and ts.tzinfo is not None:
+        return ts.tz_localize(None)
+    return ts
@@ -6,6 +6,8 @@ All chart configurations use frozen dataclasses for immutability and type safety
 from dataclasses import dataclass, field
 from typing import Literal, Optional
 
+from visualization.downsample import DEFAULT_MAX_POINTS, XRange
+
 # Type aliases for better readability
 SessionMode = Literal["all", "rth", "premarket_rth", "rth_afterhours", "all_extended"]
 ThemeMode = Literal["light", "dark"]
@@ -27,6 +29,10 @@ class PriceChartConfig:
         height: Chart height in pixels
         show_patterns: Overlay pattern markers (e.g., InsideBar)
         pattern_data: Optional pattern data to overlay
+        max_points: Cap on candles/points per trace (None = send every bar)
+        width_px: Plot width in pixels; tightens the budget on narrow charts
+        x_range: Visible (start, end) after a zoom; only that range is
+            sent, re-aggregated at full budget
     """
 
     # Display options
@@ -50,8 +56,16 @@ class PriceChartConfig:
     show_patterns: bool = False
     pattern_data: Optional[dict] = None
 
+    # Server-side downsampling (see visualization.downsample)
+    max_points: Optional[int] = DEFAULT_MAX_POINTS
+    width_px: Optional[int] = None
+    x_range: Optional[XRange] = None
+
     def __post_init__(self):
         """Validate configuration values."""
+        if self.max_points is not None and self.max_points < 10:
+            raise ValueError(f"max_points must be >= 10 or None, got {self.max_points}")
+
         if self.height < 100:
             raise ValueError(f"Chart height must be >= 100px, got {self.height}")
 
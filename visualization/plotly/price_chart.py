@@ -10,6 +10,14 @@ import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from visualization.downsample import (
+    CANDLE_PX,
+    downsample_line,
+    downsample_ohlcv,
+    slice_x_range,
+    target_points,
+)
+
 from .config import PriceChartConfig, SessionMode
 from .theme import get_default_theme, ChartTheme
 from .logging_utils import log_chart_build, log_data_preparation, is_debug_mode
@@ -113,6 +121,46 @@ def _filter_session(df: pd.DataFrame, mode: SessionMode) -> pd.DataFrame:
 
 
 
+def _downsample(
+    df: pd.DataFrame,
+    indicators: dict[str, pd.Series],
+    config: PriceChartConfig,
+) -> tuple[pd.DataFrame, dict[str, pd.Series]]:
+    """
+    Reduce OHLCV and indicators to the chart's point budget.
+
+    A zoomed chart (config.x_range) keeps only the visible range, so the
+    same budget yields finer buckets. Candles are OHLC-aggregated, indicator
+    lines LTTB-sampled.
+
+    Args:
+        df: Session-filtered OHLCV DataFrame
+        indicators: Dict of {name: Series}
+        config: Chart configuration (max_points, width_px, x_range)
+
+    Returns:
+        (ohlcv, indicators) ready for plotting
+    """
+    indicators = indicators or {}
+    if config.x_range is not None:
+        df = slice_x_range(df, config.x_range)
+        indicators = {name: slice_x_range(series, config.x_range) for name, series in indicators.items()}
+
+    if config.max_points is None:
+        return df, indicators
+
+    with log_data_preparation("Downsampling for display"):
+        bars = target_points(config.width_px, config.max_points, px_per_point=CANDLE_PX)
+        points = target_points(config.width_px, config.max_points)
+        reduced = downsample_ohlcv(df, bars)
+        indicators = {name: downsample_line(series, points) for name, series in indicators.items()}
+
+        if is_debug_mode() and len(reduced) < len(df):
+            logger.debug(f"  → Candles: {len(df)} → {len(reduced)} buckets (budget {bars})")
+
+    return reduced, indicators
+
+
 def _add_candlestick_trace(
     fig: go.Figure,
     df: pd.DataFrame,
@@ -312,6 +360,9 @@ def build_price_chart(
             template="plotly_dark" if config.theme_mode == "dark" else "plotly_white",
         )
 
+    # Downsample to the pixel budget (zoomed charts: visible range only)
+    df, indicators = _downsample(df, indicators, config)
+
     # Create subplots
     rows = 2 if config.show_volume else 1
     row_heights = [0.7, 0.3] if config.show_volume else [1.0]
@@ -367,6 +418,11 @@ def build_price_chart(
         fig.update_xaxes(showgrid=False)
         fig.update_yaxes(showgrid=False)
 
+    # Keep the zoomed window in view (data outside it was not sent)
+    if config.x_range is not None:
+        # Plotly draws wall-clock time, so ranges are passed without offset
+        fig.update_xaxes(range=[str(pd.Timestamp(ts).tz_localize(None)) for ts in config.x_range])
+
     # Axis styling
     fig.update_xaxes(
         showline=True,